@@ -11,6 +11,8 @@ El ejecutable se genera en dist/hidropluvial/
 import sys
 from pathlib import Path
 
+from PyInstaller.utils.hooks import collect_submodules
+
 # Ruta base del proyecto
 BASE_DIR = Path(SPECPATH)
 SRC_DIR = BASE_DIR / "src"
@@ -29,12 +31,12 @@ templates_dir = SRC_DIR / "hidropluvial" / "reports" / "templates"
 if templates_dir.exists():
     datas.append((str(templates_dir / "*"), "hidropluvial/reports/templates"))
 
-# Imports ocultos que PyInstaller podría no detectar
-hiddenimports = [
-    "hidropluvial",
-    "hidropluvial.cli",
-    "hidropluvial.cli.main",
-    "hidropluvial.cli.wizard",
+# Imports ocultos que PyInstaller podría no detectar.
+# Las sub-aplicaciones del CLI se importan en forma diferida (importlib,
+# ver hidropluvial/cli/lazy.py), por lo que el análisis estático no las ve:
+# se incluyen todos los submódulos del paquete.
+sys.path.insert(0, str(SRC_DIR))
+hiddenimports = collect_submodules("hidropluvial") + [
     "hidropluvial.core",
     "hidropluvial.config",
     "questionary",
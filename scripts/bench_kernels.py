@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Compara los backends de core/kernels.py (NumPy y Numba).
+
+Uso:
+    python scripts/bench_kernels.py [--repeat SEGUNDOS]
+
+Requisitos (para el backend compilado):
+    pip install hidropluvial[jit]
+
+Verifica además que ambos backends den resultados idénticos.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from hidropluvial.core import clark_uh, kernels
+from hidropluvial.core.calibration import clark_uh_batch
+from hidropluvial.core.temporal import _distribute_alternating_blocks
+
+
+def _time(func, seconds: float) -> float:
+    """Tiempo medio por llamada (µs)."""
+    func()  # compilación / calentamiento
+    n = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        func()
+        n += 1
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=float, default=1.0, help="Segundos por caso")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    increments = np.sort(rng.random(288))[::-1]
+    tc = rng.uniform(0.5, 2.0, 1000)
+    r = rng.uniform(0.2, 1.5, 1000)
+
+    cases = {
+        "clark_uh": lambda: clark_uh(12.0, 1.3, 0.8, 0.05)[1],
+        "clark_uh_batch (1000)": lambda: clark_uh_batch(12.0, tc, r, 0.05),
+        "bloques alternantes (288)": lambda: _distribute_alternating_blocks(increments, 288, 1 / 6),
+    }
+
+    backends = ["numpy"] + (["numba"] if kernels.NUMBA_AVAILABLE else [])
+    if len(backends) == 1:
+        print("Numba no está instalado: solo se mide el backend NumPy")
+
+    print(f"{'Caso':<28}" + "".join(f"{b:>14}" for b in backends))
+    for name, func in cases.items():
+        times = []
+        results = []
+        for backend in backends:
+            with kernels.use_backend(backend):
+                times.append(_time(func, args.repeat))
+                results.append(func())
+        identical = all(np.array_equal(results[0], res) for res in results[1:])
+        row = "".join(f"{t:>11.1f} µs" for t in times)
+        print(f"{name:<28}{row}" + ("" if identical else "   ¡DIFIEREN!"))
+
+
+if __name__ == "__main__":
+    main()
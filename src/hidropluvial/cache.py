@@ -0,0 +1,307 @@
+"""
+Caché persistente de resultados de análisis, direccionada por contenido.
+
+Cada resultado se guarda en un archivo cuyo nombre es el hash SHA-256 de
+todas las entradas del cálculo (datos físicos de la cuenca, coeficientes,
+parámetros de tormenta, dt) más las versiones de los algoritmos. Si algo
+cambia, cambia la clave: no hay invalidación explícita, las entradas
+viejas quedan sin uso y se eliminan por LRU al superar el tamaño máximo.
+
+Formato de cada entrada (binario compacto, lectura sin descompresión):
+
+    b"HPC2" | uint32 largo del encabezado | encabezado JSON | series
+
+El encabezado guarda los escalares y el nombre, largo y dtype de cada
+serie. Las series se guardan con la precisión de almacenamiento activa
+(float32 por defecto, ver hidropluvial.precision), que forma parte de la
+clave: cambiar de política no mezcla entradas.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from hidropluvial import __version__
+from hidropluvial.precision import get_series_precision, pack_series
+
+
+# Versiones de los algoritmos de core que determinan los resultados.
+# Incrementar la que corresponda al cambiar un cálculo: invalida la caché.
+ALGORITHM_VERSIONS = {
+    "hyetograph": 1,
+    "runoff": 1,
+    "unit_hydrograph": 1,
+    "convolution": 1,
+}
+
+# Tamaño máximo por defecto de la caché en disco (bytes)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_MAGIC = b"HPC2"
+_HEADER = struct.Struct("<I")
+_SUFFIX = ".bin"
+
+
+def _canonical(value: Any) -> Any:
+    """Normaliza un valor para el hash: números a float, secuencias a listas."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value)
+    return str(value)
+
+
+def result_key(kind: str, inputs: dict) -> str:
+    """
+    Clave de caché de un cálculo.
+
+    Los números se normalizan a float (Tr=10 y Tr=10.0 dan la misma
+    clave) y se incluyen la versión del paquete, de los algoritmos y la
+    precisión de almacenamiento de las series.
+
+    Args:
+        kind: Tipo de resultado (ej: 'analysis')
+        inputs: Todas las entradas que determinan el resultado
+
+    Returns:
+        Hash SHA-256 en hexadecimal
+    """
+    payload = {
+        "kind": kind,
+        "version": __version__,
+        "algorithms": ALGORITHM_VERSIONS,
+        "precision": get_series_precision(),
+        "inputs": _canonical(inputs),
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Caché en disco de series y escalares, con desalojo LRU por tamaño.
+
+    Los errores de disco nunca interrumpen un cálculo: una entrada ilegible
+    se trata como ausente y una escritura fallida se ignora. Es segura entre
+    procesos (escritura atómica con os.replace).
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directorio de la caché (se crea al escribir)
+            max_bytes: Tamaño máximo; al superarlo se eliminan las entradas
+                usadas hace más tiempo
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._dir = str(self.cache_dir)
+        self.hits = 0
+        self.misses = 0
+        # Tamaño total estimado (None hasta el primer recorrido del directorio)
+        self._size: Optional[int] = None
+
+    def _path(self, key: str) -> str:
+        # os.path en lugar de Path: se llama en cada análisis
+        return os.path.join(self._dir, key[:2], key + _SUFFIX)
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Lee una entrada y la marca como usada.
+
+        Returns:
+            Diccionario con escalares y series (arrays de solo lectura, en el
+            dtype con que se guardaron), o None si no existe o está dañada
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            result = _decode(data)
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, struct.error):
+            self.misses += 1
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, result: dict) -> None:
+        """
+        Guarda una entrada: los arrays como series binarias (con la precisión
+        de almacenamiento activa), el resto en JSON.
+
+        Args:
+            key: Clave (ver result_key)
+            result: Escalares (números, strings, None) y arrays 1D
+        """
+        data = _encode(result)
+        path = self._path(key)
+        try:
+            shard = os.path.dirname(path)
+            os.makedirs(shard, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=shard, suffix=".tmp", delete=False) as f:
+                f.write(data)
+            os.replace(f.name, path)
+        except OSError:
+            return
+
+        if self._size is None:
+            self._size = self.size_bytes()
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def get_or_compute(self, kind: str, inputs: dict, compute: Callable[[], dict]) -> dict:
+        """
+        Resultado de la caché o, si no está, calculado y guardado.
+
+        Args:
+            kind: Tipo de resultado
+            inputs: Entradas del cálculo (forman la clave)
+            compute: Función que calcula el resultado
+
+        Returns:
+            Resultado (los arrays leídos de la caché son de solo lectura)
+        """
+        key = result_key(kind, inputs)
+        result = self.get(key)
+        if result is None:
+            result = compute()
+            self.put(key, result)
+        return result
+
+    def _entries(self) -> list[os.DirEntry]:
+        """Archivos de la caché."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as shards:
+                for shard in shards:
+                    if not shard.is_dir():
+                        continue
+                    with os.scandir(shard.path) as files:
+                        entries.extend(e for e in files if e.name.endswith(_SUFFIX))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def size_bytes(self) -> int:
+        """Tamaño total de las entradas en disco."""
+        return sum(s.st_size for e in self._entries() if (s := _stat(e)))
+
+    def count(self) -> int:
+        """Cantidad de entradas en disco."""
+        return len(self._entries())
+
+    def evict(self) -> int:
+        """
+        Elimina las entradas usadas hace más tiempo hasta quedar en el 90%
+        del tamaño máximo.
+
+        Returns:
+            Cantidad de entradas eliminadas
+        """
+        stats = [(s.st_mtime, s.st_size, e.path) for e in self._entries() if (s := _stat(e))]
+        stats.sort()
+        total = sum(size for _, size, _ in stats)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in stats:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        self._size = total
+        return removed
+
+    def clear(self) -> int:
+        """Elimina todas las entradas. Retorna la cantidad eliminada."""
+        removed = 0
+        for entry in self._entries():
+            try:
+                os.unlink(entry.path)
+                removed += 1
+            except OSError:
+                pass
+        self._size = 0
+        return removed
+
+
+def _stat(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """stat de una entrada (None si otro proceso la eliminó)."""
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _encode(result: dict) -> bytes:
+    """Serializa escalares y series al formato binario de la caché."""
+    scalars = {}
+    series = []
+    chunks = []
+    for name, value in result.items():
+        if isinstance(value, np.ndarray):
+            array = pack_series(value).ravel()
+            array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+            series.append([name, array.size, array.dtype.str])
+            chunks.append(array.tobytes())
+        else:
+            scalars[name] = _canonical(value) if isinstance(value, (np.generic, tuple)) else value
+    header = json.dumps({"scalars": scalars, "series": series}).encode("utf-8")
+    return b"".join([_MAGIC, _HEADER.pack(len(header)), header, *chunks])
+
+
+def _decode(data: bytes) -> dict:
+    """Lee una entrada serializada por _encode."""
+    if data[:4] != _MAGIC:
+        raise ValueError("Entrada de caché inválida")
+    (n_header,) = _HEADER.unpack_from(data, 4)
+    start = 4 + _HEADER.size
+    header = json.loads(data[start:start + n_header])
+    result = dict(header["scalars"])
+    offset = start + n_header
+    for name, size, dtype in header["series"]:
+        dtype = np.dtype(dtype)
+        if dtype.kind != "f":
+            raise ValueError("Entrada de caché inválida")
+        result[name] = np.frombuffer(data, dtype, size, offset)
+        offset += size * dtype.itemsize
+    if offset != len(data):
+        raise ValueError("Entrada de caché truncada")
+    return result
+
+
+# Instancia global (directorio de datos del usuario)
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Retorna la caché de resultados global (~/.hidropluvial/cache/results)."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache(Path.home() / ".hidropluvial" / "cache" / "results")
+    return _result_cache
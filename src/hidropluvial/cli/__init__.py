@@ -11,40 +11,37 @@ Este módulo organiza los comandos CLI en sub-aplicaciones temáticas:
 - export: Exportación de datos
 - project: Gestión de proyectos
 - basin: Gestión de cuencas (export, report, preview)
+- batch: Ejecución batch de estudios desde archivos YAML/JSON
 - wizard: Asistente interactivo
 - commands: Lista de comandos disponibles
 """
 
 import typer
 
-from hidropluvial.cli.export import export_app
-from hidropluvial.cli.hydrograph import hydrograph_app
-from hidropluvial.cli.idf import idf_app
-from hidropluvial.cli.report import report_app
-from hidropluvial.cli.runoff import runoff_app
-from hidropluvial.cli.project import project_app
-from hidropluvial.cli.basin import basin_app
-from hidropluvial.cli.storm import storm_app
-from hidropluvial.cli.tc import tc_app
+from hidropluvial.cli.lazy import LazySubcommand, lazy_group
+
+# Sub-aplicaciones: se importan recién al invocar el subcomando
+SUBCOMMANDS = {
+    "idf": LazySubcommand("hidropluvial.cli.idf", "idf_app", "Análisis de curvas IDF"),
+    "storm": LazySubcommand("hidropluvial.cli.storm", "storm_app", "Generación de tormentas de diseño"),
+    "tc": LazySubcommand("hidropluvial.cli.tc", "tc_app", "Cálculo de tiempo de concentración"),
+    "runoff": LazySubcommand("hidropluvial.cli.runoff", "runoff_app", "Calculo de escorrentia"),
+    "hydrograph": LazySubcommand("hidropluvial.cli.hydrograph", "hydrograph_app", "Generación de hidrogramas"),
+    "report": LazySubcommand("hidropluvial.cli.report", "report_app", "Generación de reportes LaTeX"),
+    "export": LazySubcommand("hidropluvial.cli.export", "export_app", "Exportación de datos"),
+    "project": LazySubcommand("hidropluvial.cli.project", "project_app", "Gestión de proyectos hidrológicos"),
+    "basin": LazySubcommand("hidropluvial.cli.basin", "basin_app", "Gestión de cuencas hidrológicas"),
+    "batch": LazySubcommand("hidropluvial.cli.batch", "batch_app", "Ejecución batch de estudios"),
+}
 
 # Crear aplicación principal
 app = typer.Typer(
     name="hidropluvial",
     help="Herramienta de cálculos hidrológicos con generación de reportes LaTeX.",
     no_args_is_help=True,
+    cls=lazy_group(SUBCOMMANDS),
 )
 
-# Registrar sub-aplicaciones
-app.add_typer(idf_app, name="idf")
-app.add_typer(storm_app, name="storm")
-app.add_typer(tc_app, name="tc")
-app.add_typer(runoff_app, name="runoff")
-app.add_typer(hydrograph_app, name="hydrograph")
-app.add_typer(report_app, name="report")
-app.add_typer(export_app, name="export")
-app.add_typer(project_app, name="project")
-app.add_typer(basin_app, name="basin")
-
 
 @app.command()
 def commands():
@@ -71,6 +68,15 @@ def main():
     pass
 
 
+def __getattr__(name: str):
+    """Acceso diferido a las sub-aplicaciones (ej: `from hidropluvial.cli import idf_app`)."""
+    for spec in SUBCOMMANDS.values():
+        if spec.attr == name:
+            import importlib
+            return getattr(importlib.import_module(spec.module), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Exportar para uso externo
 __all__ = [
     "app",
@@ -83,4 +89,5 @@ __all__ = [
     "export_app",
     "project_app",
     "basin_app",
+    "batch_app",
 ]
@@ -14,6 +14,9 @@ from hidropluvial.cli.basin.commands import (
     basin_report,
     basin_preview,
     basin_compare,
+    basin_uncertainty,
+    basin_sensitivity,
+    basin_screen,
     analysis_list,
     analysis_delete,
     analysis_clear,
@@ -30,6 +33,9 @@ basin_app.command("export")(basin_export)
 basin_app.command("report")(basin_report)
 basin_app.command("preview")(basin_preview)
 basin_app.command("compare")(basin_compare)
+basin_app.command("uncertainty")(basin_uncertainty)
+basin_app.command("sensitivity")(basin_sensitivity)
+basin_app.command("screen")(basin_screen)
 
 # Registrar comandos de análisis
 basin_app.command("analysis-list")(analysis_list)
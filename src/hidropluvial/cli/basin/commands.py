@@ -23,15 +23,9 @@ def _find_basin(basin_id: str) -> tuple[Project, Basin]:
     Raises:
         typer.Exit si no se encuentra
     """
-    manager = get_project_manager()
-
-    # Buscar en todos los proyectos
-    for project_info in manager.list_projects():
-        project = manager.get_project(project_info["id"])
-        if project:
-            basin = project.get_basin(basin_id)
-            if basin:
-                return project, basin
+    found = get_project_manager().find_basin(basin_id)
+    if found:
+        return found
 
     typer.echo(f"Error: Cuenca '{basin_id}' no encontrada.")
     typer.echo("Use 'hp basin list' para ver cuencas disponibles.")
@@ -171,15 +165,18 @@ def basin_show(
 def basin_export(
     basin_id: Annotated[str, typer.Argument(help="ID de la cuenca")],
     output: Annotated[Optional[str], typer.Option("--output", "-o", help="Archivo de salida")] = None,
-    format: Annotated[str, typer.Option("--format", "-f", help="Formato: xlsx, csv")] = "xlsx",
+    format: Annotated[str, typer.Option("--format", "-f", help="Formato: xlsx, csv, parquet")] = "xlsx",
 ) -> None:
     """
-    Exporta los resultados de una cuenca a Excel o CSV.
+    Exporta los resultados de una cuenca a Excel, CSV o Parquet.
 
     Genera un archivo con la tabla resumen de todos los análisis,
     incluyendo datos de la cuenca y parámetros.
+
+    Con --format parquet, la salida es un directorio con analisis.parquet
+    y series.parquet (series temporales en formato largo).
     """
-    from hidropluvial.cli.basin.export import export_to_excel, export_to_csv
+    from hidropluvial.cli.basin.export import export_to_excel, export_to_csv, export_to_parquet
 
     project, basin = _find_basin(basin_id)
 
@@ -187,6 +184,16 @@ def basin_export(
     if output is None:
         output = basin.name.lower().replace(" ", "_")
 
+    if format == "parquet":
+        try:
+            files = export_to_parquet([basin], Path(output))
+        except ImportError as e:
+            typer.echo(f"Error: {e}")
+            raise typer.Exit(1)
+        for path in files.values():
+            typer.echo(f"Exportado: {path.absolute()}")
+        return
+
     # Agregar extensión si no tiene
     if not output.endswith(f".{format}"):
         output = f"{output}.{format}"
@@ -198,7 +205,7 @@ def basin_export(
     elif format == "csv":
         export_to_csv(basin, output_path)
     else:
-        typer.echo(f"Error: Formato '{format}' no soportado. Use 'xlsx' o 'csv'.")
+        typer.echo(f"Error: Formato '{format}' no soportado. Use 'xlsx', 'csv' o 'parquet'.")
         raise typer.Exit(1)
 
     typer.echo(f"Exportado: {output_path.absolute()}")
@@ -340,6 +347,212 @@ def basin_compare(
         typer.echo(f"\nExportado: {output_path.absolute()}")
 
 
+def basin_uncertainty(
+    basin_id: Annotated[str, typer.Argument(help="ID de la cuenca")],
+    dist: Annotated[Optional[list[str]], typer.Option("--dist", "-d", help="Distribución variable=tipo:parámetros (ej: p3_10=normal:83,8; cn=triangular:75,80,85)")] = None,
+    samples: Annotated[int, typer.Option("--samples", "-n", help="Cantidad de muestras")] = 10_000,
+    tc_method: Annotated[str, typer.Option("--tc", help="Método de Tc: kirpich, temez, desbordes")] = "kirpich",
+    storm: Annotated[str, typer.Option("--storm", "-s", help="Tormenta: gz, blocks, blocks24, scs_ii")] = "gz",
+    tr: Annotated[int, typer.Option("--tr", help="Período de retorno (años)")] = 10,
+    dt: Annotated[float, typer.Option("--dt", help="Paso de tiempo (min)")] = 5.0,
+    runoff: Annotated[Optional[str], typer.Option("--runoff", help="racional o scs-cn (por defecto según los datos de la cuenca)")] = None,
+    amc: Annotated[str, typer.Option("--amc", help="AMC: I, II, III")] = "II",
+    lambda_coef: Annotated[float, typer.Option("--lambda", help="Coeficiente lambda para Ia (SCS-CN)")] = 0.2,
+    seed: Annotated[Optional[int], typer.Option("--seed", help="Semilla (resultados reproducibles)")] = None,
+    workers: Annotated[int, typer.Option("--workers", "-w", help="Procesos de cálculo")] = 1,
+) -> None:
+    """
+    Bandas de incertidumbre de Qp, Tp y volumen por Monte Carlo.
+
+    Las variables sin --dist toman el valor de la cuenca (C ajustado por
+    Tr y CN por AMC, como en los análisis guardados). Variables:
+    p3_10, c, cn, x (factor X) y tc_factor (multiplica el Tc calculado).
+    Distribuciones: normal:media,desvío  lognormal:media,desvío
+    uniform:mín,máx  triangular:mín,moda,máx  o un valor constante.
+    """
+    from hidropluvial.cli.basin.uncertainty import basin_distributions, print_uncertainty
+    from hidropluvial.cli.theme import print_error
+    from hidropluvial.core.montecarlo import run_monte_carlo
+
+    project, basin = _find_basin(basin_id)
+    if runoff is None:
+        runoff = "racional" if basin.c else "scs-cn"
+
+    try:
+        distributions = basin_distributions(basin, dist, runoff.lower(), tr, amc)
+        result = run_monte_carlo(
+            area_ha=basin.area_ha,
+            slope_pct=basin.slope_pct,
+            distributions=distributions,
+            length_m=basin.length_m,
+            tc_method=tc_method.lower(),
+            storm_code=storm.lower(),
+            tr=tr,
+            dt_min=dt,
+            runoff=runoff.lower(),
+            lambda_coef=lambda_coef,
+            n_samples=samples,
+            seed=seed,
+            workers=workers,
+        )
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    print_uncertainty(basin, result)
+
+
+def basin_sensitivity(
+    basin_id: Annotated[str, typer.Argument(help="ID de la cuenca")],
+    method: Annotated[str, typer.Option("--method", "-m", help="Método: sobol, morris, tornado")] = "sobol",
+    factors: Annotated[Optional[str], typer.Option("--factors", "-f", help="Factores separados por coma: area, slope, c, cn, lambda, amc, tc, dt, x, storm")] = None,
+    ranges: Annotated[Optional[list[str]], typer.Option("--range", "-r", help="Rango factor=mín,máx o niveles factor=a,b,... (ej: area=70,90; storm=gz,blocks)")] = None,
+    samples: Annotated[Optional[int], typer.Option("--samples", "-n", help="Muestras base (sobol, def. 1024) o trayectorias (morris, def. 20)")] = None,
+    target: Annotated[str, typer.Option("--target", "-t", help="Salida: qp, volume, tp")] = "qp",
+    tc_method: Annotated[str, typer.Option("--tc", help="Método de Tc base")] = "kirpich",
+    storm: Annotated[str, typer.Option("--storm", "-s", help="Tormenta base")] = "gz",
+    tr: Annotated[int, typer.Option("--tr", help="Período de retorno (años)")] = 10,
+    dt: Annotated[float, typer.Option("--dt", help="Paso de tiempo base (min)")] = 5.0,
+    x: Annotated[float, typer.Option("--x", help="Factor X base")] = 1.0,
+    runoff: Annotated[Optional[str], typer.Option("--runoff", help="racional o scs-cn (por defecto según los datos de la cuenca)")] = None,
+    amc: Annotated[str, typer.Option("--amc", help="AMC base: I, II, III")] = "II",
+    lambda_coef: Annotated[float, typer.Option("--lambda", help="Coeficiente lambda base")] = 0.2,
+    seed: Annotated[Optional[int], typer.Option("--seed", help="Semilla (resultados reproducibles)")] = None,
+    workers: Annotated[int, typer.Option("--workers", "-w", help="Procesos de cálculo")] = 1,
+) -> None:
+    """
+    Ordena qué entradas dominan el caudal pico de la cuenca.
+
+    Sobol: índices de primer orden (S1) y totales (ST). Morris: efectos
+    elementales (mu*, sigma). Tornado: un factor por vez desde el valor
+    base. Sin --factors se analizan todos los aplicables con rangos por
+    defecto (±20% para área, pendiente y C; ±10 para CN).
+    """
+    from hidropluvial.cli.basin.sensitivity import build_factors, model_for_basin, print_sensitivity
+    from hidropluvial.cli.theme import print_error
+    from hidropluvial.core.sensitivity import run_sensitivity
+
+    targets = {"qp": "peak_flow_m3s", "volume": "volume_m3", "tp": "time_to_peak_hr"}
+    if target.lower() not in targets:
+        print_error(f"Salida '{target}' no soportada (usar {', '.join(targets)})")
+        raise typer.Exit(1)
+
+    project, basin = _find_basin(basin_id)
+    if runoff is None:
+        runoff = "racional" if basin.c else "scs-cn"
+    method = method.lower()
+    if samples is None:
+        samples = 20 if method == "morris" else 1024
+
+    try:
+        model = model_for_basin(
+            basin,
+            runoff.lower(),
+            lambda_coef=lambda_coef,
+            amc=amc.upper(),
+            tc_method=tc_method.lower(),
+            dt_min=dt,
+            x_factor=x,
+            storm_code=storm.lower(),
+            tr=tr,
+            output=targets[target.lower()],
+            workers=workers,
+        )
+        result = run_sensitivity(
+            model, build_factors(model, factors, ranges), method, samples, seed
+        )
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    print_sensitivity(basin, result)
+
+
+def basin_screen(
+    basin_id: Annotated[str, typer.Argument(help="ID de la cuenca")],
+    tc_methods: Annotated[Optional[str], typer.Option("--tc", help="Métodos de Tc separados por coma (por defecto los de la cuenca)")] = None,
+    storms: Annotated[str, typer.Option("--storm", "-s", help="Tormentas: gz, blocks, blocks24, scs_ii")] = "gz",
+    tr: Annotated[str, typer.Option("--tr", help="Períodos de retorno (lista o rango)")] = "2,10,25",
+    dt: Annotated[str, typer.Option("--dt", help="Pasos de tiempo en min (lista o rango)")] = "5",
+    x: Annotated[str, typer.Option("--x", help="Factores X para GZ (lista o rango)")] = "1.0,1.25,1.67,2.25",
+    runoff: Annotated[Optional[str], typer.Option("--runoff", help="racional, scs-cn o ambos separados por coma (por defecto según la cuenca)")] = None,
+    amc: Annotated[str, typer.Option("--amc", help="AMC: I, II, III")] = "II",
+    lambda_coef: Annotated[float, typer.Option("--lambda", help="Coeficiente lambda para Ia (SCS-CN)")] = 0.2,
+    rank_by: Annotated[str, typer.Option("--rank", help="Ordenar por: qp, volume, tp")] = "qp",
+    top: Annotated[int, typer.Option("--top", "-k", help="Escenarios críticos a mostrar y materializar")] = 10,
+    output: Annotated[Optional[str], typer.Option("--output", "-o", help="CSV con Qp, Tp y volumen de todos los escenarios")] = None,
+    hydrographs: Annotated[Optional[str], typer.Option("--hydrographs", help="CSV con los hidrogramas de los escenarios críticos")] = None,
+    workers: Annotated[int, typer.Option("--workers", "-w", help="Procesos de cálculo")] = 1,
+) -> None:
+    """
+    Cribado rápido de escenarios: solo picos, sin guardar análisis.
+
+    Evalúa todas las combinaciones de método de Tc, tormenta, Tr, dt, X y
+    escorrentía con el pipeline vectorizado y construye el hidrograma
+    completo solo de los --top escenarios más desfavorables.
+
+    Ejemplo:
+        hp basin screen abc123 --storm gz,blocks --tr 2,10,25 --dt 1:10:1
+    """
+    from hidropluvial.cli.basin.screening import (
+        basin_scenarios,
+        print_screening,
+        write_hydrographs,
+        write_screening,
+    )
+    from hidropluvial.cli.hydrograph import parse_values
+    from hidropluvial.cli.theme import print_error, print_success
+    from hidropluvial.core.screening import screen_scenarios
+
+    targets = {"qp": "peak_flow_m3s", "volume": "volume_m3", "tp": "time_to_peak_hr"}
+    if rank_by.lower() not in targets:
+        print_error(f"Orden '{rank_by}' no soportado (usar {', '.join(targets)})")
+        raise typer.Exit(1)
+
+    project, basin = _find_basin(basin_id)
+    if tc_methods:
+        methods = [m.strip().lower() for m in tc_methods.split(",") if m.strip()]
+    else:
+        methods = [tc.method for tc in basin.tc_results] or ["kirpich"]
+    if runoff:
+        runoffs = [r.strip().lower() for r in runoff.split(",") if r.strip()]
+    else:
+        runoffs = ["racional"] if basin.c else ["scs-cn"]
+
+    try:
+        scenarios = basin_scenarios(
+            basin,
+            tc_methods=methods,
+            storms=[s.strip().lower() for s in storms.split(",") if s.strip()],
+            return_periods=parse_values(tr, int),
+            dts=parse_values(dt),
+            x_factors=parse_values(x),
+            runoff_methods=runoffs,
+            amc=amc.upper(),
+        )
+        result = screen_scenarios(
+            scenarios,
+            basin.area_ha,
+            basin.p3_10,
+            lambda_coef=lambda_coef,
+            top_k=top,
+            rank_by=targets[rank_by.lower()],
+            workers=workers,
+        )
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    print_screening(basin, result, top)
+
+    if output:
+        write_screening(output, result)
+        print_success(f"Escenarios exportados a: {output}")
+    if hydrographs:
+        write_hydrographs(hydrographs, result)
+        print_success(f"Hidrogramas críticos exportados a: {hydrographs}")
+
+
 def analysis_list(
     basin_id: Annotated[str, typer.Argument(help="ID de la cuenca")],
 ) -> None:
@@ -1,69 +1,184 @@
 """
 Exportación de cuencas a diferentes formatos.
+
+Las exportaciones a Excel usan el modo write-only de openpyxl: cada hoja se
+escribe fila a fila desde generadores sobre los análisis, sin construir
+DataFrames intermedios ni mantener el libro completo en memoria.
+
+La exportación Parquet (extra opcional 'parquet', requiere pyarrow) escribe
+una tabla de análisis y una tabla larga de series en grupos comprimidos.
 """
 
+from itertools import zip_longest
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
+import numpy as np
 import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+from hidropluvial.models import AnalysisRun, Basin, StormResult
+from hidropluvial.precision import pack_series, storage_dtype, widen_series
+
 
-from hidropluvial.models import Basin
+# Límite de filas de una hoja Excel (incluye el encabezado)
+EXCEL_MAX_ROWS = 1_048_576
+
+# Columnas del resumen de análisis: fijas y opcionales (en orden de aparición)
+SUMMARY_COLUMNS = [
+    "ID", "Método Tc", "Tc (min)", "tp (min)", "tb (min)", "Método Pe",
+    "Tormenta", "Tr (años)", "Duración (hr)", "P total (mm)", "i pico (mm/hr)",
+    "Pe (mm)", "Qp (m³/s)", "Tp (min)", "Vol (hm³)",
+]
+SUMMARY_OPTIONAL_COLUMNS = ["C", "t0 (min)", "CN ajustado", "AMC", "λ", "Factor X", "Nota"]
 
 
 def export_to_excel(basin: Basin, output_path: Path, include_timeseries: bool = True) -> None:
     """
     Exporta cuenca a Excel con múltiples hojas.
 
+    Las hojas se escriben en streaming (openpyxl write-only), una a una,
+    con el mismo contenido y disposición de columnas que las tablas
+    generadas por los helpers `_get_*_dataframe`.
+
     Args:
         basin: Cuenca a exportar
         output_path: Ruta del archivo Excel
         include_timeseries: Si True, incluye hojas con series temporales (hietogramas e hidrogramas)
     """
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        # Hoja 1: Datos de la cuenca
-        cuenca_data = _get_basin_dataframe(basin)
-        cuenca_data.to_excel(writer, sheet_name="Cuenca", index=False)
-
-        # Hoja 2: Resultados de Tc (valores base)
-        if basin.tc_results:
-            tc_data = _get_tc_dataframe(basin)
-            tc_data.to_excel(writer, sheet_name="Tiempo Concentracion", index=False)
-
-        # Hoja 2b: Tc por Tr (para Desbordes donde C varía con Tr)
-        tc_by_tr_data = _get_tc_by_tr_dataframe(basin)
-        if tc_by_tr_data is not None:
-            tc_by_tr_data.to_excel(writer, sheet_name="Tc Desbordes por Tr", index=False)
-
-        # Hoja 3: Resumen de análisis
-        if basin.analyses:
-            summary_data = _get_summary_dataframe(basin)
-            summary_data.to_excel(writer, sheet_name="Resumen Analisis", index=False)
-
-            # Hoja 4: Detalle por período de retorno
-            pivot_data = _get_pivot_dataframe(basin)
-            if pivot_data is not None:
-                pivot_data.to_excel(writer, sheet_name="Por Periodo Retorno", index=True)
-
-            # Hoja 5: Datos de tormentas (hietogramas)
-            storm_data = _get_storms_dataframe(basin)
-            if storm_data is not None:
-                storm_data.to_excel(writer, sheet_name="Tormentas", index=False)
-
-            # Hoja 6: Series temporales de tormentas (opcional)
-            if include_timeseries:
-                hyetograph_data = _get_hyetographs_dataframe(basin)
-                if hyetograph_data is not None:
-                    hyetograph_data.to_excel(writer, sheet_name="Hietogramas", index=False)
-
-                # Hoja 7: Series temporales de hidrogramas
-                hydrograph_data = _get_hydrographs_dataframe(basin)
-                if hydrograph_data is not None:
-                    hydrograph_data.to_excel(writer, sheet_name="Hidrogramas", index=False)
-
-        # Hoja 8: Notas (si hay)
-        notes_data = _get_notes_dataframe(basin)
-        if notes_data is not None:
-            notes_data.to_excel(writer, sheet_name="Notas", index=False)
+    wb = Workbook(write_only=True)
+
+    # Hoja 1: Datos de la cuenca
+    _write_sheet(wb, "Cuenca", ["Parámetro", "Valor"], _iter_basin_rows(basin))
+
+    # Hoja 2: Resultados de Tc (valores base)
+    if basin.tc_results:
+        rows = [_tc_row(tc) for tc in basin.tc_results]
+        columns = _ordered_keys(rows)
+        _write_sheet(wb, "Tiempo Concentracion", columns, _dict_rows(rows, columns))
+
+    # Hoja 2b: Tc por Tr (para Desbordes donde C varía con Tr)
+    tc_by_tr_rows = _tc_by_tr_rows(basin)
+    if tc_by_tr_rows:
+        columns = _ordered_keys(tc_by_tr_rows)
+        _write_sheet(wb, "Tc Desbordes por Tr", columns, _dict_rows(tc_by_tr_rows, columns))
+
+    # Hoja 3: Resumen de análisis
+    if basin.analyses:
+        columns = _summary_columns(basin.analyses)
+        rows = (_summary_row(a) for a in basin.analyses)
+        _write_sheet(wb, "Resumen Analisis", columns, _dict_rows(rows, columns))
+
+        # Hoja 4: Detalle por período de retorno
+        pivot = _pivot_table(basin.analyses)
+        if pivot is not None:
+            _write_sheet(wb, "Por Periodo Retorno", *pivot)
+
+        # Hoja 5: Datos de tormentas (hietogramas)
+        storms = _unique_storms(basin.analyses)
+        if storms:
+            rows = [_storm_row(s) for s in storms]
+            columns = _ordered_keys(rows)
+            _write_sheet(wb, "Tormentas", columns, _dict_rows(rows, columns))
+
+        # Hoja 6: Series temporales de tormentas (opcional)
+        if include_timeseries:
+            hyetographs = _hyetograph_columns(basin.analyses)
+            if hyetographs:
+                _write_sheet(wb, "Hietogramas", *_wide_sheet(hyetographs))
+
+            # Hoja 7: Series temporales de hidrogramas
+            hydrographs = _hydrograph_columns(basin.analyses)
+            if hydrographs:
+                _write_sheet(wb, "Hidrogramas", *_wide_sheet(hydrographs))
+
+    # Hoja 8: Notas (si hay)
+    notes_rows = _notes_rows(basin)
+    if notes_rows:
+        columns = ["Tipo", "ID", "Descripción", "Nota"]
+        _write_sheet(wb, "Notas", columns, _dict_rows(notes_rows, columns))
+
+    wb.save(output_path)
+
+
+def export_project_to_excel(
+    basins: Iterable[Basin],
+    output_path: Path,
+    include_timeseries: bool = True,
+) -> int:
+    """
+    Exporta todas las cuencas de un proyecto a un único Excel.
+
+    Las cuencas se consumen de a una desde el iterable (ver
+    `ProjectManager.iter_basins`), y sus filas se agregan a cada hoja a
+    medida que se recorren. Las series temporales se escriben en formato
+    largo (una fila por instante), de modo que ninguna hoja requiere
+    conocer todas las cuencas de antemano. Si una hoja supera el límite de
+    filas de Excel, continúa en una hoja nueva ("Hidrogramas (2)", ...).
+
+    Args:
+        basins: Iterable de cuencas (puede ser un generador)
+        output_path: Ruta del archivo Excel
+        include_timeseries: Si True, incluye hojas de hietogramas e hidrogramas
+
+    Returns:
+        Número de cuencas exportadas
+    """
+    wb = Workbook(write_only=True)
+
+    basins_sheet = _SheetStream(wb, "Cuencas", [
+        "ID", "Nombre", "Área (ha)", "Pendiente (%)", "P3,10 (mm)",
+        "Coeficiente C", "Curve Number CN", "Longitud cauce (m)", "N análisis",
+    ])
+    summary_columns = SUMMARY_COLUMNS + SUMMARY_OPTIONAL_COLUMNS
+    summary_sheet = _SheetStream(wb, "Resumen Analisis", ["Cuenca ID", "Cuenca"] + summary_columns)
+    hyetograph_sheet = None
+    hydrograph_sheet = None
+    if include_timeseries:
+        hyetograph_sheet = _SheetStream(wb, "Hietogramas", [
+            "Cuenca ID", "Análisis ID", "t (min)", "P (mm)", "i (mm/hr)", "Pacum (mm)",
+        ])
+        hydrograph_sheet = _SheetStream(wb, "Hidrogramas", [
+            "Cuenca ID", "Análisis ID", "t (min)", "Q (m3/s)",
+        ])
+
+    n_basins = 0
+    for basin in basins:
+        n_basins += 1
+        basins_sheet.append([
+            basin.id,
+            basin.name,
+            basin.area_ha,
+            basin.slope_pct,
+            basin.p3_10,
+            basin.c,
+            basin.cn,
+            basin.length_m,
+            len(basin.analyses),
+        ])
+
+        for a in basin.analyses:
+            row = _summary_row(a)
+            summary_sheet.append([basin.id, basin.name] + [row.get(c) for c in summary_columns])
+
+            if hyetograph_sheet is not None:
+                series = _hyetograph_series(a.storm)
+                if series is not None:
+                    prefix = [basin.id, a.id]
+                    for values in zip(*series):
+                        hyetograph_sheet.append(prefix + list(values))
+
+            if hydrograph_sheet is not None and a.hydrograph.time_hr and a.hydrograph.flow_m3s:
+                prefix = [basin.id, a.id]
+                time_min = np.round(np.asarray(a.hydrograph.time_hr) * 60, 1).tolist()
+                flow = np.round(np.asarray(a.hydrograph.flow_m3s), 4).tolist()
+                for t, q in zip(time_min, flow):
+                    hydrograph_sheet.append(prefix + [t, q])
+
+    wb.save(output_path)
+    return n_basins
 
 
 def export_to_csv(basin: Basin, output_path: Path) -> None:
@@ -141,83 +256,419 @@ def export_to_csv_complete(basin: Basin, output_dir: Path) -> dict[str, Path]:
     return created_files
 
 
-def _get_basin_dataframe(basin: Basin) -> pd.DataFrame:
-    """Genera DataFrame con datos de la cuenca."""
-    data = {
-        "Parámetro": [
-            "Nombre cuenca",
-            "ID",
-            "Área (ha)",
-            "Área (km²)",
-            "Pendiente (%)",
-            "P3,10 (mm)",
-            "Coeficiente C",
-            "Curve Number CN",
-            "Longitud cauce (m)",
-        ],
-        "Valor": [
-            basin.name,
-            basin.id,
-            basin.area_ha,
-            basin.area_ha / 100,
-            basin.slope_pct,
-            basin.p3_10,
-            basin.c if basin.c else "-",
-            basin.cn if basin.cn else "-",
-            basin.length_m if basin.length_m else "-",
-        ],
+# ============================================================================
+# Exportación columnar (Parquet)
+# ============================================================================
+
+# Filas acumuladas antes de escribir un grupo de filas (row group)
+PARQUET_CHUNK_ROWS = 250_000
+
+PARQUET_ANALYSES_FILE = "analisis.parquet"
+PARQUET_SERIES_FILE = "series.parquet"
+
+
+def _import_pyarrow():
+    """Importa pyarrow (dependencia opcional, extra 'parquet')."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "La exportación Parquet requiere pyarrow. "
+            "Instalar con: pip install 'hidropluvial[parquet]'"
+        ) from e
+    return pa, pq
+
+
+def _parquet_schemas(pa) -> tuple:
+    """Esquemas de las tablas de análisis y de series (formato largo)."""
+    # Series con la precisión de almacenamiento (float32 por defecto)
+    value = pa.from_numpy_dtype(storage_dtype())
+    label = pa.dictionary(pa.int32(), pa.string())
+    analyses = pa.schema([
+        ("basin_id", pa.string()),
+        ("basin_name", pa.string()),
+        ("analysis_id", pa.string()),
+        ("timestamp", pa.string()),
+        ("tc_method", pa.string()),
+        ("tc_min", pa.float64()),
+        ("runoff_method", pa.string()),
+        ("c", pa.float64()),
+        ("cn_adjusted", pa.float64()),
+        ("amc", pa.string()),
+        ("lambda", pa.float64()),
+        ("t0_min", pa.float64()),
+        ("storm_type", pa.string()),
+        ("return_period", pa.int32()),
+        ("duration_hr", pa.float64()),
+        ("total_depth_mm", pa.float64()),
+        ("peak_intensity_mmhr", pa.float64()),
+        ("n_intervals", pa.int32()),
+        ("x_factor", pa.float64()),
+        ("peak_flow_m3s", pa.float64()),
+        ("time_to_peak_min", pa.float64()),
+        ("tp_unit_min", pa.float64()),
+        ("tb_min", pa.float64()),
+        ("volume_m3", pa.float64()),
+        ("runoff_mm", pa.float64()),
+        ("note", pa.string()),
+    ])
+    series = pa.schema([
+        ("basin_id", label),
+        ("analysis_id", label),
+        ("variable", label),
+        ("step", pa.int32()),
+        ("time_min", value),
+        ("value", value),
+    ])
+    return analyses, series
+
+
+def _analysis_record(basin: Basin, a: AnalysisRun) -> dict:
+    """Fila de la tabla de análisis (nombres de campo como en la base de datos)."""
+    params = a.tc.parameters or {}
+    rm = params.get("runoff_method")
+    if rm is None:
+        rm = {"Racional": "racional", "SCS-CN": "scs-cn"}.get(_runoff_method_label(a))
+
+    amc = params.get("amc")
+    return {
+        "basin_id": basin.id,
+        "basin_name": basin.name,
+        "analysis_id": a.id,
+        "timestamp": a.timestamp,
+        "tc_method": a.tc.method,
+        "tc_min": a.tc.tc_min,
+        "runoff_method": rm,
+        "c": params.get("c"),
+        "cn_adjusted": params.get("cn_adjusted"),
+        "amc": str(amc) if amc is not None else None,
+        "lambda": params.get("lambda"),
+        "t0_min": params.get("t0_min"),
+        "storm_type": a.storm.type,
+        "return_period": a.storm.return_period,
+        "duration_hr": a.storm.duration_hr,
+        "total_depth_mm": a.storm.total_depth_mm,
+        "peak_intensity_mmhr": a.storm.peak_intensity_mmhr,
+        "n_intervals": a.storm.n_intervals,
+        "x_factor": a.hydrograph.x_factor,
+        "peak_flow_m3s": a.hydrograph.peak_flow_m3s,
+        "time_to_peak_min": a.hydrograph.time_to_peak_min,
+        "tp_unit_min": a.hydrograph.tp_unit_min,
+        "tb_min": a.hydrograph.tb_min,
+        "volume_m3": a.hydrograph.volume_m3,
+        "runoff_mm": a.hydrograph.runoff_mm,
+        "note": a.note,
     }
 
+
+class _SeriesChunk:
+    """Acumula series de varios análisis y las escribe como un bloque columnar."""
+
+    def __init__(self, pa, schema):
+        self._pa = pa
+        self._schema = schema
+        self._keys: list[tuple[str, str, str]] = []
+        self._times: list[np.ndarray] = []
+        self._values: list[np.ndarray] = []
+        self.n_rows = 0
+
+    def add(
+        self,
+        basin_id: str,
+        analysis_id: str,
+        variable: str,
+        time_min: np.ndarray,
+        values: np.ndarray,
+    ) -> None:
+        self._keys.append((basin_id, analysis_id, variable))
+        self._times.append(time_min)
+        self._values.append(values)
+        self.n_rows += len(values)
+
+    def _label_column(self, labels: tuple[str, ...], owner: np.ndarray):
+        """Columna diccionario: índice por fila hacia las etiquetas únicas del bloque."""
+        uniq, inverse = np.unique(np.asarray(labels, dtype=object), return_inverse=True)
+        return self._pa.DictionaryArray.from_arrays(
+            self._pa.array(inverse.astype(np.int32)[owner]),
+            self._pa.array(uniq.tolist(), type=self._pa.string()),
+        )
+
+    def flush(self, writer) -> None:
+        if not self._keys:
+            return
+
+        pa = self._pa
+        lengths = np.array([len(v) for v in self._values])
+        owner = np.repeat(np.arange(len(lengths)), lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        step = (np.arange(self.n_rows) - starts).astype(np.int32)
+
+        basin_ids, analysis_ids, variables = zip(*self._keys)
+        table = pa.Table.from_arrays(
+            [
+                self._label_column(basin_ids, owner),
+                self._label_column(analysis_ids, owner),
+                self._label_column(variables, owner),
+                pa.array(step),
+                pa.array(pack_series(np.concatenate(self._times))),
+                pa.array(pack_series(np.concatenate(self._values))),
+            ],
+            schema=self._schema,
+        )
+        writer.write_table(table)
+
+        self._keys.clear()
+        self._times.clear()
+        self._values.clear()
+        self.n_rows = 0
+
+
+def export_to_parquet(
+    basins: Iterable[Basin],
+    output_dir: Path,
+    compression: str = "zstd",
+    chunk_rows: int = PARQUET_CHUNK_ROWS,
+) -> dict[str, Path]:
+    """
+    Exporta cuencas a dos archivos Parquet (formato columnar comprimido).
+
+    - analisis.parquet: una fila por análisis (parámetros y resultados).
+    - series.parquet: formato largo, una fila por instante de cada serie,
+      con columnas basin_id, analysis_id, variable ("intensity_mmhr" del
+      hietograma o "flow_m3s" del hidrograma), step, time_min y value.
+      time_min y value usan la precisión de almacenamiento activa (float32
+      por defecto, ver hidropluvial.precision).
+
+    Las cuencas se consumen de a una y las series se escriben en grupos de
+    hasta `chunk_rows` filas, por lo que la memoria no depende del tamaño
+    del proyecto. Leer con `read_parquet_export`.
+
+    Args:
+        basins: Iterable de cuencas (ej: [basin] o `ProjectManager.iter_basins`)
+        output_dir: Directorio donde crear los archivos
+        compression: Códec Parquet ("zstd", "snappy", "gzip", "none")
+        chunk_rows: Filas por grupo de filas
+
+    Returns:
+        Diccionario con nombres de tabla y rutas creadas
+
+    Raises:
+        ImportError: Si pyarrow no está instalado
+    """
+    pa, pq = _import_pyarrow()
+    analyses_schema, series_schema = _parquet_schemas(pa)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    analyses_path = output_dir / PARQUET_ANALYSES_FILE
+    series_path = output_dir / PARQUET_SERIES_FILE
+
+    records: list[dict] = []
+    chunk = _SeriesChunk(pa, series_schema)
+
+    with pq.ParquetWriter(analyses_path, analyses_schema, compression=compression) as analyses_writer, \
+            pq.ParquetWriter(series_path, series_schema, compression=compression) as series_writer:
+        for basin in basins:
+            for a in basin.analyses:
+                records.append(_analysis_record(basin, a))
+
+                s = a.storm
+                if s.time_min and s.intensity_mmhr:
+                    chunk.add(
+                        basin.id, a.id, "intensity_mmhr",
+                        np.asarray(s.time_min, dtype=np.float64),
+                        np.asarray(s.intensity_mmhr, dtype=np.float64),
+                    )
+
+                h = a.hydrograph
+                if h.time_hr and h.flow_m3s:
+                    chunk.add(
+                        basin.id, a.id, "flow_m3s",
+                        np.asarray(h.time_hr, dtype=np.float64) * 60,
+                        np.asarray(h.flow_m3s, dtype=np.float64),
+                    )
+
+                if chunk.n_rows >= chunk_rows:
+                    chunk.flush(series_writer)
+
+            if len(records) >= chunk_rows:
+                analyses_writer.write_table(pa.Table.from_pylist(records, schema=analyses_schema))
+                records.clear()
+
+        chunk.flush(series_writer)
+        if records:
+            analyses_writer.write_table(pa.Table.from_pylist(records, schema=analyses_schema))
+
+    return {"analisis": analyses_path, "series": series_path}
+
+
+def read_parquet_export(
+    output_dir: Path,
+    analysis_ids: Optional[list[str]] = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Lee una exportación generada por `export_to_parquet`.
+
+    Args:
+        output_dir: Directorio con analisis.parquet y series.parquet
+        analysis_ids: Si se indica, lee solo las series de esos análisis
+            (filtro aplicado por pyarrow durante la lectura)
+
+    Returns:
+        Tupla (análisis, series) como DataFrames (time_min y value en
+        float64 aunque se hayan guardado en float32)
+    """
+    _import_pyarrow()
+    output_dir = Path(output_dir)
+
+    analyses = pd.read_parquet(output_dir / PARQUET_ANALYSES_FILE)
+    filters = [("analysis_id", "in", list(analysis_ids))] if analysis_ids else None
+    series = pd.read_parquet(output_dir / PARQUET_SERIES_FILE, filters=filters)
+    for column in ("time_min", "value"):
+        series[column] = widen_series(series[column].to_numpy())
+
+    return analyses, series
+
+
+# ============================================================================
+# Escritura en streaming (openpyxl write-only)
+# ============================================================================
+
+class _SheetStream:
+    """
+    Hoja write-only que continúa en una hoja nueva al llenarse.
+
+    Excel admite como máximo EXCEL_MAX_ROWS filas por hoja; al alcanzarlo
+    se crea "<título> (2)", "<título> (3)", ... repitiendo el encabezado.
+    """
+
+    def __init__(self, wb: Workbook, title: str, header: list[str]):
+        self._wb = wb
+        self._title = title
+        self._header = header
+        self._part = 0
+        self._open_sheet()
+
+    def _open_sheet(self) -> None:
+        self._part += 1
+        title = self._title if self._part == 1 else f"{self._title} ({self._part})"
+        self._ws = self._wb.create_sheet(title)
+        self._ws.append(_header_cells(self._ws, self._header))
+        self._n_rows = 1
+
+    def append(self, row: list[Any]) -> None:
+        if self._n_rows >= EXCEL_MAX_ROWS:
+            self._open_sheet()
+        self._ws.append(row)
+        self._n_rows += 1
+
+
+def _header_cells(ws, header: list[str]) -> list[WriteOnlyCell]:
+    """Crea las celdas de encabezado en negrita (como pandas.to_excel)."""
+    cells = []
+    for name in header:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.font = Font(bold=True)
+        cells.append(cell)
+    return cells
+
+
+def _write_sheet(wb: Workbook, title: str, header: list[str], rows: Iterable[list[Any]]) -> None:
+    """Crea una hoja y escribe encabezado y filas desde un iterable."""
+    sheet = _SheetStream(wb, title, header)
+    for row in rows:
+        sheet.append(row)
+
+
+def _ordered_keys(rows: Iterable[dict]) -> list[str]:
+    """Unión de claves en orden de primera aparición (igual que pd.DataFrame)."""
+    keys: dict[str, None] = {}
+    for row in rows:
+        for key in row:
+            keys.setdefault(key, None)
+    return list(keys)
+
+
+def _dict_rows(rows: Iterable[dict], columns: list[str]) -> Iterator[list[Any]]:
+    """Convierte filas dict a listas según el orden de columnas."""
+    for row in rows:
+        yield [row.get(c) for c in columns]
+
+
+def _wide_sheet(columns: dict[str, list]) -> tuple[list[str], Iterator[tuple]]:
+    """Encabezado y filas de una hoja de columnas pareadas de distinto largo."""
+    return list(columns), zip_longest(*columns.values(), fillvalue=None)
+
+
+def _padded_dataframe(columns: dict[str, list]) -> pd.DataFrame:
+    """DataFrame de columnas de distinto largo, rellenando con None."""
+    max_len = max(len(values) for values in columns.values())
+    return pd.DataFrame({
+        name: values + [None] * (max_len - len(values))
+        for name, values in columns.items()
+    })
+
+
+# ============================================================================
+# Filas por hoja (compartidas por Excel, CSV y DataFrames)
+# ============================================================================
+
+def _iter_basin_rows(basin: Basin) -> Iterator[list[Any]]:
+    """Filas (parámetro, valor) con los datos de la cuenca."""
+    yield ["Nombre cuenca", basin.name]
+    yield ["ID", basin.id]
+    yield ["Área (ha)", basin.area_ha]
+    yield ["Área (km²)", basin.area_ha / 100]
+    yield ["Pendiente (%)", basin.slope_pct]
+    yield ["P3,10 (mm)", basin.p3_10]
+    yield ["Coeficiente C", basin.c if basin.c else "-"]
+    yield ["Curve Number CN", basin.cn if basin.cn else "-"]
+    yield ["Longitud cauce (m)", basin.length_m if basin.length_m else "-"]
+
     if basin.notes:
-        data["Parámetro"].append("Notas")
-        data["Valor"].append(basin.notes)
+        yield ["Notas", basin.notes]
 
-    return pd.DataFrame(data)
+
+def _get_basin_dataframe(basin: Basin) -> pd.DataFrame:
+    """Genera DataFrame con datos de la cuenca."""
+    return pd.DataFrame(list(_iter_basin_rows(basin)), columns=["Parámetro", "Valor"])
+
+
+def _tc_row(tc) -> dict:
+    """Fila con un resultado de Tc."""
+    row = {
+        "Método": tc.method.capitalize(),
+        "Tc (hr)": round(tc.tc_hr, 3),
+        "Tc (min)": round(tc.tc_min, 1),
+    }
+    if tc.parameters:
+        if "c" in tc.parameters:
+            row["C"] = tc.parameters["c"]
+        if "length_m" in tc.parameters:
+            row["Longitud (m)"] = tc.parameters["length_m"]
+        if "cn" in tc.parameters:
+            row["CN"] = tc.parameters["cn"]
+        if "t0_min" in tc.parameters:
+            row["t0 (min)"] = tc.parameters["t0_min"]
+    return row
 
 
 def _get_tc_dataframe(basin: Basin) -> pd.DataFrame:
     """Genera DataFrame con resultados de Tc."""
-    rows = []
-    for tc in basin.tc_results:
-        row = {
-            "Método": tc.method.capitalize(),
-            "Tc (hr)": round(tc.tc_hr, 3),
-            "Tc (min)": round(tc.tc_min, 1),
-        }
-        if tc.parameters:
-            if "c" in tc.parameters:
-                row["C"] = tc.parameters["c"]
-            if "length_m" in tc.parameters:
-                row["Longitud (m)"] = tc.parameters["length_m"]
-            if "cn" in tc.parameters:
-                row["CN"] = tc.parameters["cn"]
-            if "t0_min" in tc.parameters:
-                row["t0 (min)"] = tc.parameters["t0_min"]
-        rows.append(row)
-    return pd.DataFrame(rows)
+    return pd.DataFrame([_tc_row(tc) for tc in basin.tc_results])
 
 
-def _get_tc_by_tr_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
+def _tc_by_tr_rows(basin: Basin) -> list[dict]:
     """
-    Genera DataFrame con Tc por período de retorno para métodos que varían con Tr.
+    Filas de Tc por período de retorno para métodos que varían con Tr.
 
     Útil para Desbordes donde C cambia según Tr, afectando el Tc.
     """
-    if not basin.analyses:
-        return None
-
-    # Buscar análisis con método Desbordes u otros que varíen con Tr
-    desbordes_analyses = [
-        a for a in basin.analyses
-        if a.tc.method.lower() == "desbordes"
-    ]
-
-    if not desbordes_analyses:
-        return None
-
-    # Agrupar por Tr único
+    # Agrupar por Tr único los análisis con método Desbordes
     tr_data = {}
-    for a in desbordes_analyses:
+    for a in basin.analyses:
+        if a.tc.method.lower() != "desbordes":
+            continue
         tr = a.storm.return_period
         if tr not in tr_data:
             c_val = a.tc.parameters.get("c") if a.tc.parameters else None
@@ -228,95 +679,144 @@ def _get_tc_by_tr_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
                 "Tc (hr)": round(a.tc.tc_min / 60, 3),
             }
 
-    if not tr_data:
-        return None
-
     # Ordenar por Tr
-    rows = [tr_data[tr] for tr in sorted(tr_data.keys())]
+    return [tr_data[tr] for tr in sorted(tr_data.keys())]
+
+
+def _get_tc_by_tr_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
+    """
+    Genera DataFrame con Tc por período de retorno para métodos que varían con Tr.
+
+    Útil para Desbordes donde C cambia según Tr, afectando el Tc.
+    """
+    rows = _tc_by_tr_rows(basin)
+    if not rows:
+        return None
     return pd.DataFrame(rows)
 
 
+def _runoff_method_label(a: AnalysisRun) -> str:
+    """Método de escorrentía de un análisis ("Racional", "SCS-CN" o "-")."""
+    if a.tc.parameters and "runoff_method" in a.tc.parameters:
+        rm = a.tc.parameters["runoff_method"]
+        return "Racional" if rm == "racional" else "SCS-CN"
+    if a.tc.parameters:
+        if "cn_adjusted" in a.tc.parameters:
+            return "SCS-CN"
+        if "c" in a.tc.parameters:
+            return "Racional"
+    return "-"
+
+
+def _summary_row(a: AnalysisRun) -> dict:
+    """Fila del resumen de un análisis."""
+    row = {
+        "ID": a.id,
+        "Método Tc": a.tc.method.capitalize(),
+        "Tc (min)": round(a.tc.tc_min, 1),
+        "tp (min)": round(a.hydrograph.tp_unit_min, 1) if a.hydrograph.tp_unit_min else None,
+        "tb (min)": round(a.hydrograph.tb_min, 1) if a.hydrograph.tb_min else None,
+        "Método Pe": _runoff_method_label(a),
+        "Tormenta": a.storm.type.upper(),
+        "Tr (años)": a.storm.return_period,
+        "Duración (hr)": round(a.storm.duration_hr, 2),
+        "P total (mm)": round(a.storm.total_depth_mm, 1),
+        "i pico (mm/hr)": round(a.storm.peak_intensity_mmhr, 1),
+        "Pe (mm)": round(a.hydrograph.runoff_mm, 1),
+        "Qp (m³/s)": round(a.hydrograph.peak_flow_m3s, 2),
+        "Tp (min)": round(a.hydrograph.time_to_peak_min, 1),
+        "Vol (hm³)": round(a.hydrograph.volume_m3 / 1_000_000, 4),
+    }
+
+    if a.tc.parameters and "c" in a.tc.parameters:
+        row["C"] = round(a.tc.parameters["c"], 3)
+    if a.tc.parameters and "t0_min" in a.tc.parameters:
+        row["t0 (min)"] = a.tc.parameters["t0_min"]
+    if a.tc.parameters:
+        if "cn_adjusted" in a.tc.parameters:
+            row["CN ajustado"] = a.tc.parameters["cn_adjusted"]
+        if "amc" in a.tc.parameters:
+            row["AMC"] = a.tc.parameters["amc"]
+        if "lambda" in a.tc.parameters:
+            row["λ"] = a.tc.parameters["lambda"]
+
+    if a.hydrograph.x_factor:
+        row["Factor X"] = a.hydrograph.x_factor
+    if a.note:
+        row["Nota"] = a.note
+
+    return row
+
+
+def _summary_columns(analyses: list[AnalysisRun]) -> list[str]:
+    """Columnas del resumen presentes en los análisis (sin guardar las filas)."""
+    return _ordered_keys(_summary_row(a) for a in analyses)
+
+
 def _get_summary_dataframe(basin: Basin) -> pd.DataFrame:
     """Genera DataFrame con resumen de todos los análisis."""
-    rows = []
-    for a in basin.analyses:
-        runoff_method = "-"
-        if a.tc.parameters and "runoff_method" in a.tc.parameters:
-            rm = a.tc.parameters["runoff_method"]
-            runoff_method = "Racional" if rm == "racional" else "SCS-CN"
-        elif a.tc.parameters:
-            if "cn_adjusted" in a.tc.parameters:
-                runoff_method = "SCS-CN"
-            elif "c" in a.tc.parameters:
-                runoff_method = "Racional"
-
-        row = {
-            "ID": a.id,
-            "Método Tc": a.tc.method.capitalize(),
-            "Tc (min)": round(a.tc.tc_min, 1),
-            "tp (min)": round(a.hydrograph.tp_unit_min, 1) if a.hydrograph.tp_unit_min else None,
-            "tb (min)": round(a.hydrograph.tb_min, 1) if a.hydrograph.tb_min else None,
-            "Método Pe": runoff_method,
-            "Tormenta": a.storm.type.upper(),
-            "Tr (años)": a.storm.return_period,
-            "Duración (hr)": round(a.storm.duration_hr, 2),
-            "P total (mm)": round(a.storm.total_depth_mm, 1),
-            "i pico (mm/hr)": round(a.storm.peak_intensity_mmhr, 1),
-            "Pe (mm)": round(a.hydrograph.runoff_mm, 1),
-            "Qp (m³/s)": round(a.hydrograph.peak_flow_m3s, 2),
-            "Tp (min)": round(a.hydrograph.time_to_peak_min, 1),
-            "Vol (hm³)": round(a.hydrograph.volume_m3 / 1_000_000, 4),
-        }
+    return pd.DataFrame([_summary_row(a) for a in basin.analyses])
 
-        if a.tc.parameters and "c" in a.tc.parameters:
-            row["C"] = round(a.tc.parameters["c"], 3)
-        if a.tc.parameters and "t0_min" in a.tc.parameters:
-            row["t0 (min)"] = a.tc.parameters["t0_min"]
-        if a.tc.parameters:
-            if "cn_adjusted" in a.tc.parameters:
-                row["CN ajustado"] = a.tc.parameters["cn_adjusted"]
-            if "amc" in a.tc.parameters:
-                row["AMC"] = a.tc.parameters["amc"]
-            if "lambda" in a.tc.parameters:
-                row["λ"] = a.tc.parameters["lambda"]
-
-        if a.hydrograph.x_factor:
-            row["Factor X"] = a.hydrograph.x_factor
-        if a.note:
-            row["Nota"] = a.note
 
-        rows.append(row)
+def _pivot_label(a: AnalysisRun) -> str:
+    """Etiqueta método Tc + escorrentía (+ X) usada en la tabla pivote."""
+    method_label = a.tc.method
 
-    return pd.DataFrame(rows)
+    if a.tc.parameters and "runoff_method" in a.tc.parameters:
+        rm = a.tc.parameters["runoff_method"]
+        esc_label = "C" if rm == "racional" else "CN"
+        method_label = f"{method_label}+{esc_label}"
+    elif a.tc.parameters:
+        if "cn_adjusted" in a.tc.parameters:
+            method_label = f"{method_label}+CN"
+        elif "c" in a.tc.parameters:
+            method_label = f"{method_label}+C"
 
+    if a.hydrograph.x_factor:
+        method_label = f"{method_label} X={a.hydrograph.x_factor:.2f}"
 
-def _get_pivot_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
-    """Genera tabla pivote de Q pico por Tr y método."""
-    if not basin.analyses:
+    return method_label
+
+
+def _pivot_table(analyses: list[AnalysisRun]) -> Optional[tuple[list[str], Iterator[list[Any]]]]:
+    """
+    Tabla pivote de Q pico (método × Tr) como encabezado y filas.
+
+    Equivale a `_get_pivot_dataframe` (primer valor por celda, filas y
+    columnas ordenadas) sin pasar por pandas.
+    """
+    table: dict[str, dict[int, float]] = {}
+    trs: set[int] = set()
+    for a in analyses:
+        tr = a.storm.return_period
+        trs.add(tr)
+        table.setdefault(_pivot_label(a), {}).setdefault(tr, round(a.hydrograph.peak_flow_m3s, 3))
+
+    if len(trs) <= 1 and len(table) <= 1:
         return None
 
-    rows = []
-    for a in basin.analyses:
-        method_label = a.tc.method
+    sorted_trs = sorted(trs)
+    header = ["Método"] + [f"Tr={tr}" for tr in sorted_trs]
+    rows = (
+        [method] + [table[method].get(tr) for tr in sorted_trs]
+        for method in sorted(table)
+    )
+    return header, rows
 
-        if a.tc.parameters and "runoff_method" in a.tc.parameters:
-            rm = a.tc.parameters["runoff_method"]
-            esc_label = "C" if rm == "racional" else "CN"
-            method_label = f"{method_label}+{esc_label}"
-        elif a.tc.parameters:
-            if "cn_adjusted" in a.tc.parameters:
-                method_label = f"{method_label}+CN"
-            elif "c" in a.tc.parameters:
-                method_label = f"{method_label}+C"
 
-        if a.hydrograph.x_factor:
-            method_label = f"{method_label} X={a.hydrograph.x_factor:.2f}"
+def _get_pivot_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
+    """Genera tabla pivote de Q pico por Tr y método."""
+    if not basin.analyses:
+        return None
 
-        rows.append({
-            "Método": method_label,
+    rows = [
+        {
+            "Método": _pivot_label(a),
             "Tr": a.storm.return_period,
             "Q pico (m³/s)": round(a.hydrograph.peak_flow_m3s, 3),
-        })
+        }
+        for a in basin.analyses
+    ]
 
     df = pd.DataFrame(rows)
 
@@ -333,8 +833,8 @@ def _get_pivot_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
     return None
 
 
-def _get_notes_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
-    """Genera DataFrame con notas de cuenca y análisis."""
+def _notes_rows(basin: Basin) -> list[dict]:
+    """Filas con notas de cuenca y análisis."""
     rows = []
 
     if basin.notes:
@@ -357,165 +857,171 @@ def _get_notes_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
                 "Nota": a.note,
             })
 
+    return rows
+
+
+def _get_notes_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
+    """Genera DataFrame con notas de cuenca y análisis."""
+    rows = _notes_rows(basin)
     if rows:
         return pd.DataFrame(rows)
     return None
 
 
-def _get_storms_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
-    """Genera DataFrame con resumen de todas las tormentas utilizadas."""
-    if not basin.analyses:
-        return None
-
-    # Identificar tormentas únicas por tipo, Tr y duración
+def _unique_storms(analyses: list[AnalysisRun]) -> list[StormResult]:
+    """Tormentas únicas por tipo, Tr y duración (en orden de aparición)."""
     storm_keys = set()
     storms = []
 
-    for a in basin.analyses:
+    for a in analyses:
         s = a.storm
         key = (s.type, s.return_period, s.duration_hr)
         if key not in storm_keys:
             storm_keys.add(key)
             storms.append(s)
 
-    if not storms:
-        return None
+    return storms
 
-    rows = []
-    for s in storms:
-        # Calcular dt desde time_min si está disponible
-        dt_min = None
-        if s.time_min and len(s.time_min) >= 2:
-            dt_min = s.time_min[1] - s.time_min[0]
-
-        row = {
-            "Tipo": s.type.upper(),
-            "Tr (años)": s.return_period,
-            "Duración (hr)": round(s.duration_hr, 2),
-            "dt (min)": round(dt_min, 1) if dt_min else None,
-            "P total (mm)": round(s.total_depth_mm, 1),
-            "i pico (mm/hr)": round(s.peak_intensity_mmhr, 1),
-            "N intervalos": s.n_intervals,
-        }
 
-        # Calcular posición del pico desde intensidades
-        if s.intensity_mmhr and len(s.intensity_mmhr) > 0:
-            intensities = list(s.intensity_mmhr)
-            peak_idx = intensities.index(max(intensities))
-            n = len(intensities)
-            peak_pos = (peak_idx + 0.5) / n
-            row["Posición pico"] = f"{peak_pos:.0%}"
+def _storm_row(s: StormResult) -> dict:
+    """Fila con el resumen de una tormenta."""
+    # Calcular dt desde time_min si está disponible
+    dt_min = None
+    if s.time_min and len(s.time_min) >= 2:
+        dt_min = s.time_min[1] - s.time_min[0]
 
-        rows.append(row)
+    row = {
+        "Tipo": s.type.upper(),
+        "Tr (años)": s.return_period,
+        "Duración (hr)": round(s.duration_hr, 2),
+        "dt (min)": round(dt_min, 1) if dt_min else None,
+        "P total (mm)": round(s.total_depth_mm, 1),
+        "i pico (mm/hr)": round(s.peak_intensity_mmhr, 1),
+        "N intervalos": s.n_intervals,
+    }
 
-    return pd.DataFrame(rows)
+    # Calcular posición del pico desde intensidades
+    if s.intensity_mmhr and len(s.intensity_mmhr) > 0:
+        peak_idx = int(np.argmax(s.intensity_mmhr))
+        n = len(s.intensity_mmhr)
+        peak_pos = (peak_idx + 0.5) / n
+        row["Posición pico"] = f"{peak_pos:.0%}"
 
+    return row
 
-def _get_hyetographs_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
+
+def _get_storms_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
+    """Genera DataFrame con resumen de todas las tormentas utilizadas."""
+    storms = _unique_storms(basin.analyses)
+    if not storms:
+        return None
+    return pd.DataFrame([_storm_row(s) for s in storms])
+
+
+def _hyetograph_series(s: StormResult) -> Optional[tuple[list, list, list, list]]:
     """
-    Genera DataFrame con series temporales de hietogramas.
+    Series (tiempo, profundidad, intensidad, acumulada) de una tormenta.
 
-    Formato: columnas pareadas de tiempo e intensidad por cada tormenta única.
+    Las profundidades se calculan desde las intensidades (mm = mm/hr × hr);
+    los valores se redondean a 2 decimales.
     """
-    if not basin.analyses:
+    if not s.time_min or not s.intensity_mmhr:
         return None
 
-    # Identificar tormentas únicas con datos de series temporales
-    storm_data = {}
+    dt_min = s.time_min[1] - s.time_min[0] if len(s.time_min) >= 2 else 5.0
+    intensity = np.asarray(s.intensity_mmhr, dtype=float)
+    depths = intensity * dt_min / 60.0
+    cumulative = np.cumsum(depths)
 
-    for a in basin.analyses:
-        s = a.storm
-        key = f"{s.type.upper()}_Tr{s.return_period}"
-        if key not in storm_data and s.time_min and s.intensity_mmhr:
-            # Calcular profundidades desde intensidades si no están disponibles
-            dt_min = s.time_min[1] - s.time_min[0] if len(s.time_min) >= 2 else 5.0
-            depths = [i * dt_min / 60.0 for i in s.intensity_mmhr]  # mm = mm/hr * hr
-            cumulative = []
-            cumsum = 0
-            for d in depths:
-                cumsum += d
-                cumulative.append(cumsum)
-
-            storm_data[key] = {
-                "time": list(s.time_min),
-                "depth": depths,
-                "intensity": list(s.intensity_mmhr),
-                "cumulative": cumulative,
-            }
+    return (
+        list(s.time_min),
+        np.round(depths, 2).tolist(),
+        np.round(intensity, 2).tolist(),
+        np.round(cumulative, 2).tolist(),
+    )
 
-    if not storm_data:
-        return None
 
-    # Construir DataFrame con columnas pareadas (cada tormenta tiene su propio tiempo)
-    # Encontrar la longitud máxima para padding
-    max_len = max(len(data["time"]) for data in storm_data.values())
+def _hyetograph_columns(analyses: list[AnalysisRun]) -> dict[str, list]:
+    """
+    Columnas pareadas (tiempo, P, i, Pacum) por cada tormenta única.
 
-    result = {}
-    for key, data in storm_data.items():
-        n = len(data["time"])
-        padding = [None] * (max_len - n)
+    Cada columna conserva su propio largo; el relleno lo hace quien escribe.
+    """
+    columns: dict[str, list] = {}
+    seen = set()
 
-        result[f"t_{key} (min)"] = data["time"] + padding
-        result[f"P_{key} (mm)"] = [round(d, 2) for d in data["depth"]] + padding
-        result[f"i_{key} (mm/hr)"] = [round(i, 2) for i in data["intensity"]] + padding
-        result[f"Pacum_{key} (mm)"] = [round(c, 2) for c in data["cumulative"]] + padding
+    for a in analyses:
+        s = a.storm
+        key = f"{s.type.upper()}_Tr{s.return_period}"
+        if key in seen:
+            continue
+        series = _hyetograph_series(s)
+        if series is None:
+            continue
+        seen.add(key)
 
-    return pd.DataFrame(result)
+        time, depth, intensity, cumulative = series
+        columns[f"t_{key} (min)"] = time
+        columns[f"P_{key} (mm)"] = depth
+        columns[f"i_{key} (mm/hr)"] = intensity
+        columns[f"Pacum_{key} (mm)"] = cumulative
 
+    return columns
 
-def _get_hydrographs_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
+
+def _get_hyetographs_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
     """
-    Genera DataFrame con series temporales de hidrogramas.
+    Genera DataFrame con series temporales de hietogramas.
 
-    Formato: columnas pareadas de tiempo y caudal por cada análisis.
+    Formato: columnas pareadas de tiempo e intensidad por cada tormenta única.
     """
-    if not basin.analyses:
+    columns = _hyetograph_columns(basin.analyses)
+    if not columns:
         return None
+    return _padded_dataframe(columns)
 
-    # Filtrar análisis con datos de hidrograma
-    valid_analyses = [
-        a for a in basin.analyses
-        if a.hydrograph.time_hr and a.hydrograph.flow_m3s
-    ]
 
-    if not valid_analyses:
-        return None
+def _hydrograph_label(a: AnalysisRun) -> str:
+    """Etiqueta de un hidrograma: método + Tr + X (si aplica) + _CN."""
+    label = f"{a.tc.method}_Tr{a.storm.return_period}"
+    if a.hydrograph.x_factor:
+        label += f"_X{a.hydrograph.x_factor:.2f}"
 
-    # Usar la serie de tiempo más larga como referencia para padding
-    max_len = max(len(a.hydrograph.time_hr) for a in valid_analyses)
+    # Agregar método de escorrentía si es diferente
+    if a.tc.parameters and "runoff_method" in a.tc.parameters:
+        rm = a.tc.parameters["runoff_method"]
+        if rm == "scs-cn":
+            label += "_CN"
 
-    result = {}
+    return label
 
-    # Construir etiquetas únicas para cada análisis
-    for a in valid_analyses:
-        h = a.hydrograph
-        s = a.storm
 
-        # Etiqueta: método + Tr + X (si aplica)
-        label = f"{a.tc.method}_Tr{s.return_period}"
-        if h.x_factor:
-            label += f"_X{h.x_factor:.2f}"
+def _hydrograph_columns(analyses: list[AnalysisRun]) -> dict[str, list]:
+    """Columnas pareadas (tiempo en min, caudal) por cada análisis con hidrograma."""
+    columns: dict[str, list] = {}
 
-        # Agregar método de escorrentía si es diferente
-        if a.tc.parameters and "runoff_method" in a.tc.parameters:
-            rm = a.tc.parameters["runoff_method"]
-            if rm == "scs-cn":
-                label += "_CN"
+    for a in analyses:
+        h = a.hydrograph
+        if not h.time_hr or not h.flow_m3s:
+            continue
 
-        # Convertir tiempo a minutos
-        time_min = [t * 60 for t in h.time_hr]
+        label = _hydrograph_label(a)
+        columns[f"t_{label} (min)"] = np.round(np.asarray(h.time_hr) * 60, 1).tolist()
+        columns[f"Q_{label} (m3/s)"] = np.round(np.asarray(h.flow_m3s), 4).tolist()
 
-        # Padding para igualar longitudes
-        n = len(time_min)
-        padding = [None] * (max_len - n)
+    return columns
 
-        time_col = f"t_{label} (min)"
-        q_col = f"Q_{label} (m3/s)"
 
-        result[time_col] = [round(t, 1) for t in time_min] + padding
-        result[q_col] = [round(q, 4) for q in h.flow_m3s] + padding
+def _get_hydrographs_dataframe(basin: Basin) -> Optional[pd.DataFrame]:
+    """
+    Genera DataFrame con series temporales de hidrogramas.
 
-    return pd.DataFrame(result)
+    Formato: columnas pareadas de tiempo y caudal por cada análisis.
+    """
+    columns = _hydrograph_columns(basin.analyses)
+    if not columns:
+        return None
+    return _padded_dataframe(columns)
 
 
 def compare_basins(
@@ -46,6 +46,8 @@ def generate_basin_report(
     Returns:
         Path del directorio de salida
     """
+    import numpy as np
+
     from hidropluvial.reports.charts import (
         HydrographSeries,
         generate_hydrograph_tikz,
@@ -84,13 +86,13 @@ def generate_basin_report(
         # Hidrograma
         if hydro.time_hr and hydro.flow_m3s:
             series = HydrographSeries(
-                time_hr=hydro.time_hr,
+                time_min=np.asarray(hydro.time_hr) * 60,
                 flow_m3s=hydro.flow_m3s,
                 label=f"{hydro.tc_method} Tr{storm.return_period}",
             )
             tikz_hydro = generate_hydrograph_tikz(
                 series=[series],
-                title=f"Hidrograma - {base_name}",
+                caption=f"Hidrograma - {base_name}",
                 width=fig_width,
                 height=fig_height,
             )
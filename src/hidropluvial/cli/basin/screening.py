@@ -0,0 +1,177 @@
+"""
+Cribado de escenarios de una cuenca (solo picos).
+
+Arma la grilla de escenarios (método de Tc × tormenta × Tr × dt × X ×
+escorrentía) con las reglas de los análisis guardados, la evalúa con
+core/screening.py y muestra los escenarios críticos.
+"""
+
+import csv
+from typing import Optional
+
+import numpy as np
+
+from hidropluvial.config import AntecedentMoistureCondition
+from hidropluvial.core.ensemble import storm_window
+from hidropluvial.core.montecarlo import MC_TC_METHODS, tc_samples
+from hidropluvial.core.runoff import adjust_cn_for_amc
+from hidropluvial.core.screening import ScreeningResult, concat_scenarios, scenario_grid
+from hidropluvial.models import Basin
+
+
+# Columnas mostradas: (clave, encabezado, formato)
+_COLUMNS = (
+    ("tc_method", "Tc", "{}"),
+    ("storm", "Tormenta", "{}"),
+    ("tr", "Tr", "{}"),
+    ("dt_min", "dt", "{:g}"),
+    ("x", "X", "{:.2f}"),
+    ("runoff", "Esc.", "{}"),
+    ("peak_flow_m3s", "Qp", "{:.3f}"),
+    ("time_to_peak_hr", "Tp", "{:.2f}"),
+    ("volume_m3", "Vol", "{:,.0f}"),
+)
+
+# Columnas de resultados (numéricas)
+_OUTPUT_KEYS = ("peak_flow_m3s", "time_to_peak_hr", "volume_m3")
+
+# Etiqueta corta del método de escorrentía
+_RUNOFF_LABELS = {"racional": "C", "scs-cn": "CN"}
+
+
+def basin_tc_hr(basin: Basin, method: str, c: Optional[float], t0_min: float) -> float:
+    """Tc de un método: calculado (kirpich, temez, desbordes) o guardado en la cuenca."""
+    if method in MC_TC_METHODS and (method != "desbordes" or c):
+        return float(tc_samples(method, basin.area_ha, basin.slope_pct, basin.length_m, c, 1, t0_min)[0])
+    stored = basin.get_tc(method)
+    if stored is None:
+        raise ValueError(f"La cuenca no tiene Tc por el método '{method}'")
+    return stored.tc_hr
+
+
+def basin_scenarios(
+    basin: Basin,
+    tc_methods: list[str],
+    storms: list[str],
+    return_periods: list[int],
+    dts: list[float],
+    x_factors: list[float],
+    runoff_methods: list[str],
+    amc: str = "II",
+    t0_min: float = 5.0,
+) -> dict[str, np.ndarray]:
+    """
+    Escenarios de la cuenca con las reglas de los análisis guardados.
+
+    C se ajusta por Tr (y Desbordes se recalcula con ese C); CN se ajusta
+    por AMC. Solo la tormenta GZ usa varios factores X (el resto, X = 1) y
+    las tormentas de 24 h usan dt >= 10 min, así que los pasos menores se
+    unifican. El hidrograma unitario de cada escenario se elige como en el
+    runner: triangular SCS para SCS-CN con tormentas distintas de GZ.
+
+    Args:
+        basin: Cuenca
+        tc_methods: Métodos de Tc
+        storms: Códigos de tormenta
+        return_periods: Períodos de retorno
+        dts: Pasos de tiempo (min)
+        x_factors: Factores X (tormenta GZ)
+        runoff_methods: 'racional' y/o 'scs-cn'
+        amc: Condición de humedad antecedente (I, II, III)
+        t0_min: Tiempo de entrada para Desbordes (min)
+
+    Returns:
+        Columnas de escenarios, con el método de Tc como etiqueta
+    """
+    from hidropluvial.cli.wizard.runner import _get_c_for_tr_from_basin
+
+    parts = []
+    for runoff in runoff_methods:
+        if runoff == "racional" and not basin.c:
+            raise ValueError("La cuenca no tiene coeficiente C")
+        if runoff == "scs-cn" and not basin.cn:
+            raise ValueError("La cuenca no tiene CN")
+
+        for tr in return_periods:
+            if runoff == "racional":
+                coef = _get_c_for_tr_from_basin(basin, basin.c, tr)
+            else:
+                coef = adjust_cn_for_amc(basin.cn, AntecedentMoistureCondition(amc))
+
+            for method in tc_methods:
+                tc_hr = basin_tc_hr(basin, method, coef if runoff == "racional" else basin.c, t0_min)
+                for storm in storms:
+                    parts.append(scenario_grid(
+                        tc_method=method,
+                        storm=storm,
+                        tr=tr,
+                        dt_min=sorted({storm_window(storm, tc_hr, dt)[1] for dt in dts}),
+                        tc_hr=tc_hr,
+                        x=list(x_factors) if storm == "gz" else 1.0,
+                        runoff=runoff,
+                        coef=coef,
+                    ))
+    return concat_scenarios(parts)
+
+
+def print_screening(basin: Basin, result: ScreeningResult, rows: int) -> None:
+    """
+    Muestra los escenarios ordenados de mayor a menor.
+
+    Args:
+        basin: Cuenca analizada
+        result: Resultado del cribado
+        rows: Cantidad de escenarios a mostrar
+    """
+    from rich import box
+    from rich.table import Table
+
+    from hidropluvial.cli.theme import get_console, get_palette
+
+    console = get_console()
+    p = get_palette()
+
+    table = Table(
+        title=f"{basin.name} - Escenarios críticos ({result.n_scenarios:,} evaluados)",
+        title_style=f"bold {p.primary}",
+        border_style=p.border,
+        header_style=f"bold {p.secondary}",
+        box=box.SIMPLE,
+    )
+    table.add_column("#", justify="right", style="dim")
+    for key, header, _ in _COLUMNS:
+        if key in _OUTPUT_KEYS:
+            table.add_column(header, justify="right", style=p.number)
+        else:
+            table.add_column(header, justify="left", no_wrap=True)
+
+    for rank, i in enumerate(result.ranking()[:rows], start=1):
+        record = result.row(int(i))
+        record["runoff"] = _RUNOFF_LABELS.get(record["runoff"], record["runoff"])
+        table.add_row(str(rank), *(template.format(record[key]) for key, _, template in _COLUMNS))
+
+    console.print(table)
+    console.print("  [dim]dt en min, Qp en m³/s, Tp en h, volumen en m³[/dim]")
+
+
+def write_screening(path: str, result: ScreeningResult) -> None:
+    """Exporta todos los escenarios con Qp, Tp y volumen, ordenados."""
+    keys = [key for key, _, _ in _COLUMNS] + ["tc_hr", "coef"]
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(keys)
+        for i in result.ranking():
+            record = result.row(int(i))
+            writer.writerow([record[key] for key in keys])
+
+
+def write_hydrographs(path: str, result: ScreeningResult) -> None:
+    """Exporta los hidrogramas de los escenarios críticos (formato largo)."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["rank", "tc_method", "storm", "tr", "dt_min", "x", "runoff", "time_hr", "flow_m3s"])
+        for rank, i in enumerate(result.top, start=1):
+            record = result.row(i)
+            label = [record[key] for key in ("tc_method", "storm", "tr", "dt_min", "x", "runoff")]
+            for t, q in zip(*result.hydrographs[i]):
+                writer.writerow([rank, *label, f"{t:.4f}", f"{q:.4f}"])
@@ -0,0 +1,154 @@
+"""
+Análisis de sensibilidad de una cuenca (Sobol, Morris, tornado).
+
+Arma el modelo con los datos de la cuenca, los factores con sus rangos
+(por defecto o indicados con --range) y muestra los índices ordenados
+con barras tipo tornado.
+"""
+
+from typing import Optional
+
+from hidropluvial.core.sensitivity import (
+    Factor,
+    SensitivityModel,
+    SensitivityResult,
+    default_factors,
+    parse_factor,
+)
+from hidropluvial.models import Basin
+
+
+# Nombres y unidades de las salidas
+_OUTPUT_LABELS = {
+    "peak_flow_m3s": ("Qp", "m³/s"),
+    "volume_m3": ("Volumen", "m³"),
+    "time_to_peak_hr": ("Tp", "h"),
+}
+
+# Columnas por método: (índice, encabezado, formato)
+_COLUMNS = {
+    "sobol": [("S1", "S1", "{:.3f}"), ("S1_conf", "±", "{:.3f}"),
+              ("ST", "ST", "{:.3f}"), ("ST_conf", "±", "{:.3f}")],
+    "morris": [("mu_star", "mu*", "{:.4g}"), ("mu", "mu", "{:.4g}"), ("sigma", "sigma", "{:.4g}")],
+    "tornado": [("low", "Mín", "{:.4g}"), ("high", "Máx", "{:.4g}"), ("swing", "Δ", "{:.4g}")],
+}
+
+_BAR_WIDTH = 16
+
+
+def build_factors(
+    model: SensitivityModel,
+    names: Optional[str],
+    ranges: Optional[list[str]],
+) -> list[Factor]:
+    """
+    Factores del análisis: por defecto o los indicados, con rangos propios.
+
+    Args:
+        model: Modelo de la cuenca
+        names: Factores separados por coma (None: todos los aplicables)
+        ranges: Lista "factor=mín,máx" o "factor=n1,n2,..." (discretos)
+
+    Returns:
+        Lista de Factor
+    """
+    overrides: dict[str, Factor] = {}
+    for spec in ranges or []:
+        name, sep, value = spec.partition("=")
+        if not sep:
+            raise ValueError(f"Formato inválido '{spec}' (usar factor=mín,máx)")
+        name = name.strip().lower()
+        overrides[name] = parse_factor(name, value)
+
+    selected = [n.strip().lower() for n in names.split(",") if n.strip()] if names else None
+    if selected is not None:
+        # Los factores con rango propio no necesitan rango por defecto
+        defaults = default_factors(model, [n for n in selected if n not in overrides])
+        by_name = {f.name: f for f in defaults}
+        by_name.update(overrides)
+        return [by_name[n] for n in selected]
+
+    factors = default_factors(model)
+    names_in = {f.name for f in factors}
+    factors = [overrides.get(f.name, f) for f in factors]
+    factors += [f for name, f in overrides.items() if name not in names_in]
+    return factors
+
+
+def model_for_basin(basin: Basin, runoff: str, tr: int = 10, **kwargs) -> SensitivityModel:
+    """
+    Crea el modelo de sensibilidad con los datos de la cuenca.
+
+    Con el método racional el C base se ajusta por Tr, como en los
+    análisis guardados. El CN se pasa en AMC II: el modelo lo ajusta por
+    el AMC de cada evaluación (factor amc).
+    """
+    from hidropluvial.cli.wizard.runner import _get_c_for_tr_from_basin
+
+    c = basin.c
+    if runoff == "racional" and c:
+        c = _get_c_for_tr_from_basin(basin, c, tr)
+    return SensitivityModel(
+        area_ha=basin.area_ha,
+        slope_pct=basin.slope_pct,
+        p3_10=basin.p3_10,
+        length_m=basin.length_m,
+        c=c,
+        cn=basin.cn,
+        runoff=runoff,
+        tr=tr,
+        **kwargs,
+    )
+
+
+def print_sensitivity(basin: Basin, result: SensitivityResult) -> None:
+    """
+    Muestra los índices ordenados por influencia con barras.
+
+    Args:
+        basin: Cuenca analizada
+        result: Resultado del análisis
+    """
+    from rich import box
+    from rich.table import Table
+
+    from hidropluvial.cli.theme import get_console, get_palette
+
+    console = get_console()
+    p = get_palette()
+    label, unit = _OUTPUT_LABELS[result.output]
+
+    table = Table(
+        title=(
+            f"{basin.name} - Sensibilidad de {label} ({result.method}, "
+            f"{result.n_evaluations:,} evaluaciones)"
+        ),
+        title_style=f"bold {p.primary}",
+        border_style=p.border,
+        header_style=f"bold {p.secondary}",
+        box=box.SIMPLE,
+    )
+    table.add_column("Factor", justify="left")
+    table.add_column("Rango", justify="left", style="dim")
+    for _, header, _ in _COLUMNS[result.method]:
+        table.add_column(header, justify="right", style=p.number)
+    if result.method == "tornado":
+        table.add_column("Extremos", justify="left", style="dim")
+    table.add_column("", justify="left", no_wrap=True, min_width=_BAR_WIDTH)
+
+    ranked = result.ranking()
+    main = result.indices[result.rank_by]
+    scale = max(float(abs(main[ranked[0]])), 1e-12)
+
+    for i in ranked:
+        factor = result.factors[i]
+        cells = [factor.name, factor.describe()]
+        cells += [template.format(result.indices[key][i]) for key, _, template in _COLUMNS[result.method]]
+        if result.method == "tornado":
+            cells.append(f"{result.labels['low'][i]} → {result.labels['high'][i]}")
+        bar_len = int(round(_BAR_WIDTH * max(float(main[i]), 0.0) / scale))
+        cells.append(f"[{p.accent}]{'█' * bar_len}[/{p.accent}]")
+        table.add_row(*cells)
+
+    console.print(table)
+    console.print(f"  [dim]{label} base: {result.base_value:.4g} {unit}[/dim]")
@@ -0,0 +1,118 @@
+"""
+Análisis de incertidumbre (Monte Carlo) de una cuenca.
+
+Arma las distribuciones a partir de los datos de la cuenca y de las
+opciones --dist, ejecuta core/montecarlo.py y muestra los cuantiles.
+"""
+
+from typing import Optional
+
+from hidropluvial.config import AntecedentMoistureCondition
+from hidropluvial.core.montecarlo import (
+    DEFAULT_QUANTILES,
+    Distribution,
+    MonteCarloResult,
+    parse_distribution,
+)
+from hidropluvial.core.runoff import adjust_cn_for_amc
+from hidropluvial.models import Basin
+
+
+# Salidas mostradas: (clave, encabezado, formato)
+_OUTPUTS = (
+    ("peak_flow_m3s", "Qp (m³/s)", "{:.3f}"),
+    ("time_to_peak_hr", "Tp (h)", "{:.2f}"),
+    ("volume_m3", "Vol (m³)", "{:,.0f}"),
+)
+
+
+def basin_distributions(
+    basin: Basin,
+    specs: Optional[list[str]],
+    runoff: str,
+    tr: int,
+    amc: str = "II",
+) -> dict[str, Distribution]:
+    """
+    Distribuciones de entrada: las indicadas o constantes con el dato de la cuenca.
+
+    Los valores constantes siguen las reglas de los análisis guardados: C
+    se ajusta por Tr y CN por AMC. Las distribuciones de --dist se usan
+    tal cual.
+
+    Args:
+        basin: Cuenca
+        specs: Lista "variable=distribución" (ej: "p3_10=normal:83,8")
+        runoff: Método de escorrentía (define si hace falta C o CN)
+        tr: Período de retorno (ajuste de C)
+        amc: Condición de humedad antecedente (I, II, III)
+
+    Returns:
+        Diccionario variable -> Distribution
+    """
+    from hidropluvial.cli.wizard.runner import _get_c_for_tr_from_basin
+
+    distributions: dict[str, Distribution] = {}
+    if basin.p3_10:
+        distributions["p3_10"] = Distribution("const", (basin.p3_10,))
+    if basin.c:
+        distributions["c"] = Distribution("const", (_get_c_for_tr_from_basin(basin, basin.c, tr),))
+    if basin.cn and runoff == "scs-cn":
+        cn = adjust_cn_for_amc(basin.cn, AntecedentMoistureCondition(amc.upper()))
+        distributions["cn"] = Distribution("const", (float(cn),))
+
+    for spec in specs or []:
+        name, sep, value = spec.partition("=")
+        if not sep:
+            raise ValueError(f"Formato inválido '{spec}' (usar variable=tipo:parámetros)")
+        distributions[name.strip().lower()] = parse_distribution(value)
+
+    return distributions
+
+
+def print_uncertainty(
+    basin: Basin,
+    mc: MonteCarloResult,
+    quantiles: tuple[float, ...] = DEFAULT_QUANTILES,
+) -> None:
+    """
+    Muestra tabla de cuantiles de Qp, Tp y volumen.
+
+    Args:
+        basin: Cuenca analizada
+        mc: Resultado de Monte Carlo
+        quantiles: Probabilidades a mostrar
+    """
+    from rich import box
+    from rich.table import Table
+
+    from hidropluvial.cli.theme import get_console, get_palette
+
+    console = get_console()
+    p = get_palette()
+    settings = mc.settings
+
+    table = Table(
+        title=(
+            f"{basin.name} - {settings['storm'].upper()} Tr{settings['tr']}, "
+            f"Tc {settings['tc_method']}, {settings['runoff']} ({mc.n_samples:,} muestras)"
+        ),
+        title_style=f"bold {p.primary}",
+        border_style=p.border,
+        header_style=f"bold {p.secondary}",
+        box=box.SIMPLE,
+    )
+    table.add_column("Salida", justify="left")
+    for q in quantiles:
+        table.add_column(f"P{q * 100:g}", justify="right", style=p.number)
+    table.add_column("Media", justify="right", style=p.number)
+
+    values = mc.quantiles(quantiles)
+    means = mc.mean()
+    for key, header, template in _OUTPUTS:
+        cells = [template.format(v) for v in values[key]]
+        table.add_row(header, *cells, template.format(means[key]))
+
+    console.print(table)
+    for name, dist in settings["distributions"].items():
+        console.print(f"  [dim]{name}: {dist}[/dim]")
@@ -0,0 +1,447 @@
+"""
+Comandos CLI para ejecución batch de estudios (sin interacción).
+
+Un estudio se define en un archivo YAML o JSON con una o más cuencas y
+la matriz de análisis (métodos Tc x tormenta x Tr x X). Las cuencas se
+distribuyen entre procesos de trabajo y los resultados se guardan en un
+proyecto con una sola escritura.
+
+Formato (varias cuencas):
+
+    project: "Estudio Arroyo XYZ"      # o project_id: "abc12345"
+    defaults:                          # valores comunes a todas las cuencas
+      p3_10: 83
+      dt_min: 5
+    tc_methods: [kirpich, desbordes]
+    analyses:
+      - storm: gz
+        tr: [2, 10, 25]
+        x: [1.0, 1.25]
+      - storm: blocks
+        tr: [10, 25]
+    basins:
+      - nombre: "Subcuenca 1"
+        area_ha: 62
+        slope_pct: 3.41
+        c: 0.62
+        cn: 81
+        length_m: 800
+      - nombre: "Subcuenca 2"
+        ...
+        analyses: [...]               # opcional: reemplaza la matriz global
+
+También se acepta el formato de una cuenca de examples/cuenca_ejemplo.yaml
+(clave `session` con `cuenca`).
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Annotated, Any, Callable, Optional
+
+import typer
+
+from hidropluvial.models import Basin, Project
+from hidropluvial.project import ProjectManager
+
+# Crear sub-aplicación
+batch_app = typer.Typer(help="Ejecución batch de estudios")
+
+
+# Claves de cuenca aceptadas -> campo de WizardConfig
+_BASIN_FIELDS = {
+    "nombre": "nombre",
+    "name": "nombre",
+    "area_ha": "area_ha",
+    "slope_pct": "slope_pct",
+    "p3_10": "p3_10",
+    "c": "c",
+    "cn": "cn",
+    "length_m": "length_m",
+    "amc": "amc",
+    "lambda": "lambda_coef",
+    "lambda_coef": "lambda_coef",
+    "t0_min": "t0_min",
+    "dt_min": "dt_min",
+    "bimodal_duration_hr": "bimodal_duration_hr",
+    "bimodal_peak1": "bimodal_peak1",
+    "bimodal_peak2": "bimodal_peak2",
+    "bimodal_vol_split": "bimodal_vol_split",
+    "bimodal_peak_width": "bimodal_peak_width",
+    "custom_depth_mm": "custom_depth_mm",
+    "custom_duration_hr": "custom_duration_hr",
+    "custom_distribution": "custom_distribution",
+}
+
+_REQUIRED_FIELDS = ("nombre", "area_ha", "slope_pct", "p3_10")
+
+
+# ============================================================================
+# Definición del estudio
+# ============================================================================
+
+@dataclass
+class AnalysisSpec:
+    """Fila de la matriz de análisis: una tormenta con sus Tr y factores X."""
+    storm: str
+    return_periods: list[int]
+    x_factors: list[float] = field(default_factory=lambda: [1.0])
+
+    def as_tuple(self) -> tuple[str, list[int], list[float]]:
+        return self.storm, self.return_periods, self.x_factors
+
+
+@dataclass
+class StudyBasin:
+    """Cuenca del estudio: parámetros, métodos Tc y matriz de análisis."""
+    params: dict[str, Any]
+    tc_methods: list[str]
+    analyses: list[AnalysisSpec]
+
+    @property
+    def name(self) -> str:
+        return self.params["nombre"]
+
+    def n_combinations(self) -> int:
+        """Cantidad de combinaciones de la matriz (sin contar métodos de escorrentía)."""
+        per_tc = sum(
+            len(a.return_periods) * (len(a.x_factors) if a.storm == "gz" else 1)
+            for a in self.analyses
+        )
+        return per_tc * len(self.tc_methods)
+
+
+@dataclass
+class Study:
+    """Estudio batch: proyecto destino y lista de cuencas."""
+    name: str
+    basins: list[StudyBasin]
+    project_id: Optional[str] = None
+    description: str = ""
+
+
+def _as_list(value: Any) -> list:
+    if value is None:
+        return []
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def _parse_analyses(raw: Any, where: str) -> list[AnalysisSpec]:
+    """Convierte la lista de análisis del archivo en AnalysisSpec."""
+    specs = []
+    for i, entry in enumerate(_as_list(raw), 1):
+        if not isinstance(entry, dict) or "storm" not in entry:
+            raise ValueError(f"{where}: el análisis {i} debe indicar 'storm'")
+
+        trs = [int(t) for t in _as_list(entry.get("tr", entry.get("return_periods")))]
+        if not trs:
+            raise ValueError(f"{where}: el análisis {i} ({entry['storm']}) no indica 'tr'")
+
+        xs = [float(x) for x in _as_list(entry.get("x", entry.get("x_factors")))] or [1.0]
+        specs.append(AnalysisSpec(storm=str(entry["storm"]), return_periods=trs, x_factors=xs))
+    return specs
+
+
+def _parse_basin(raw: dict, defaults: dict, tc_methods: list, analyses: list, where: str) -> StudyBasin:
+    """Combina valores por defecto y datos de una cuenca."""
+    merged = {**defaults, **raw}
+
+    params: dict[str, Any] = {}
+    for key, value in merged.items():
+        if key in _BASIN_FIELDS:
+            params[_BASIN_FIELDS[key]] = value
+
+    missing = [f for f in _REQUIRED_FIELDS if params.get(f) in (None, "")]
+    if missing:
+        raise ValueError(f"{where}: faltan campos {', '.join(missing)}")
+
+    basin_tc = [str(m) for m in _as_list(merged.get("tc_methods", tc_methods))]
+    if not basin_tc:
+        raise ValueError(f"{where}: no se indicaron métodos de Tc ('tc_methods')")
+
+    basin_analyses = _parse_analyses(raw["analyses"], where) if "analyses" in raw else analyses
+    if not basin_analyses:
+        raise ValueError(f"{where}: no se indicaron análisis ('analyses')")
+
+    return StudyBasin(params=params, tc_methods=basin_tc, analyses=basin_analyses)
+
+
+def parse_study(data: dict) -> Study:
+    """
+    Valida y convierte la definición de un estudio (ya leída del archivo).
+
+    Raises:
+        ValueError: Si falta información o el formato es inválido
+    """
+    if not isinstance(data, dict):
+        raise ValueError("El estudio debe ser un diccionario (YAML/JSON)")
+
+    tc_methods = _as_list(data.get("tc_methods"))
+    analyses = _parse_analyses(data.get("analyses"), "estudio")
+    defaults = data.get("defaults") or {}
+
+    # Formato de una cuenca (examples/cuenca_ejemplo.yaml)
+    if "session" in data:
+        session = data["session"] or {}
+        cuenca = session.get("cuenca")
+        if not isinstance(cuenca, dict):
+            raise ValueError("session: falta la sección 'cuenca'")
+        name = session.get("name") or cuenca.get("nombre", "Estudio batch")
+        basin = _parse_basin(cuenca, defaults, tc_methods, analyses, "session.cuenca")
+        return Study(name=name, basins=[basin], project_id=session.get("project_id"))
+
+    raw_basins = data.get("basins")
+    if not raw_basins:
+        raise ValueError("El estudio no define cuencas ('basins')")
+
+    basins = [
+        _parse_basin(raw, defaults, tc_methods, analyses, f"basins[{i}]")
+        for i, raw in enumerate(raw_basins)
+    ]
+    return Study(
+        name=data.get("project") or "Estudio batch",
+        basins=basins,
+        project_id=data.get("project_id"),
+        description=data.get("description", ""),
+    )
+
+
+def load_study(path: Path) -> Study:
+    """Lee un estudio desde un archivo YAML (.yaml/.yml) o JSON."""
+    path = Path(path)
+    text = path.read_text(encoding="utf-8")
+
+    if path.suffix.lower() == ".json":
+        data = json.loads(text)
+    else:
+        import yaml
+        data = yaml.safe_load(text)
+
+    return parse_study(data)
+
+
+# ============================================================================
+# Ejecución
+# ============================================================================
+
+@dataclass
+class BatchResult:
+    """Resultado de la ejecución de un estudio."""
+    project: Project
+    basins: list[Basin]
+    errors: dict[str, str]
+    elapsed_s: float
+
+    @property
+    def n_analyses(self) -> int:
+        return sum(len(b.analyses) for b in self.basins)
+
+
+def _run_basin_job(study_basin: StudyBasin) -> Basin:
+    """Calcula una cuenca del estudio (se ejecuta en un proceso de trabajo)."""
+    from hidropluvial.cli.wizard.config import WizardConfig
+    from hidropluvial.cli.wizard.runner import run_basin_analyses
+
+    config = WizardConfig(**study_basin.params, tc_methods=list(study_basin.tc_methods))
+    return run_basin_analyses(config, [a.as_tuple() for a in study_basin.analyses])
+
+
+def _resolve_project(manager: ProjectManager, study: Study) -> Project:
+    """Obtiene el proyecto destino: por ID, por nombre o creando uno nuevo."""
+    if study.project_id:
+        project = manager.get_project(study.project_id)
+        if project is None:
+            raise ValueError(f"Proyecto '{study.project_id}' no encontrado")
+        return project
+
+    for info in manager.list_projects():
+        if info["name"] == study.name:
+            return manager.load_project(info["id"])
+
+    return manager.create_project(name=study.name, description=study.description)
+
+
+def _store_basin(project: Project, basin: Basin) -> None:
+    """Agrega la cuenca o reemplaza la existente con el mismo nombre (conserva su ID)."""
+    for i, existing in enumerate(project.basins):
+        if existing.name == basin.name:
+            basin.id = existing.id
+            basin.created_at = existing.created_at
+            basin.notes = existing.notes
+            project.basins[i] = basin
+            project.touch()
+            return
+    project.add_basin(basin)
+
+
+def run_study(
+    study: Study,
+    manager: ProjectManager,
+    workers: Optional[int] = None,
+    on_basin_done: Optional[Callable[[StudyBasin, Optional[Basin], Optional[str]], None]] = None,
+) -> BatchResult:
+    """
+    Ejecuta un estudio distribuyendo las cuencas entre procesos.
+
+    Las cuencas ya existentes en el proyecto (mismo nombre) se reemplazan
+    conservando su ID, de modo que re-ejecutar un estudio actualiza los
+    resultados en lugar de duplicarlos. El proyecto se guarda una sola vez
+    al final.
+
+    Args:
+        study: Estudio a ejecutar
+        manager: Gestor de proyectos donde guardar los resultados
+        workers: Procesos de trabajo (None: CPUs disponibles; 1: sin pool)
+        on_basin_done: Callback (cuenca del estudio, resultado, error) al
+            terminar cada cuenca
+
+    Returns:
+        BatchResult con el proyecto, las cuencas calculadas y los errores
+    """
+    project = _resolve_project(manager, study)
+    start = time.perf_counter()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(study.basins)))
+
+    results: list[Optional[Basin]] = [None] * len(study.basins)
+    errors: dict[str, str] = {}
+
+    def _done(i: int, basin: Optional[Basin], error: Optional[str]) -> None:
+        results[i] = basin
+        if error is not None:
+            errors[study.basins[i].name] = error
+        if on_basin_done:
+            on_basin_done(study.basins[i], basin, error)
+
+    if workers == 1:
+        for i, sb in enumerate(study.basins):
+            try:
+                _done(i, _run_basin_job(sb), None)
+            except Exception as e:
+                _done(i, None, str(e))
+    else:
+        # spawn: la barra de progreso de rich corre en un hilo y fork() no es seguro
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {executor.submit(_run_basin_job, sb): i for i, sb in enumerate(study.basins)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    _done(i, future.result(), None)
+                except Exception as e:
+                    _done(i, None, str(e))
+
+    # Guardar en el orden del estudio, con una sola escritura
+    basins = [b for b in results if b is not None]
+    for basin in basins:
+        _store_basin(project, basin)
+    if basins:
+        manager.save_project(project)
+
+    return BatchResult(
+        project=project,
+        basins=basins,
+        errors=errors,
+        elapsed_s=time.perf_counter() - start,
+    )
+
+
+# ============================================================================
+# Comandos
+# ============================================================================
+
+@batch_app.command("run")
+def batch_run(
+    study_file: Annotated[Path, typer.Argument(help="Archivo del estudio (YAML o JSON)")],
+    workers: Annotated[Optional[int], typer.Option("--workers", "-w", help="Procesos de trabajo (default: CPUs)")] = None,
+    project_id: Annotated[Optional[str], typer.Option("--project", "-p", help="ID de proyecto destino (reemplaza al del archivo)")] = None,
+    parquet: Annotated[Optional[Path], typer.Option("--parquet", help="Exportar también a Parquet en este directorio")] = None,
+) -> None:
+    """
+    Ejecuta un estudio definido en un archivo, sin interacción.
+
+    Calcula Tc y todos los análisis de cada cuenca en paralelo y guarda
+    los resultados en el proyecto. Re-ejecutar el mismo estudio actualiza
+    las cuencas existentes (por nombre).
+
+    Ejemplo:
+        hp batch run estudio.yaml --workers 8
+        hp batch run examples/cuenca_ejemplo.yaml --project abc12345
+    """
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+
+    from hidropluvial.cli.theme import get_console, print_error, print_info, print_success, print_warning
+    from hidropluvial.project import get_project_manager
+
+    try:
+        study = load_study(study_file)
+    except FileNotFoundError:
+        print_error(f"Archivo no encontrado: {study_file}")
+        raise typer.Exit(1)
+    except ValueError as e:
+        print_error(f"Estudio inválido: {e}")
+        raise typer.Exit(1)
+
+    if project_id:
+        study.project_id = project_id
+
+    n_basins = len(study.basins)
+    n_combinations = sum(b.n_combinations() for b in study.basins)
+    print_info(f"Estudio '{study.name}': {n_basins} cuencas, {n_combinations} combinaciones Tc x tormenta x Tr x X")
+
+    console = get_console()
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    )
+
+    with progress:
+        task = progress.add_task("Cuencas", total=n_basins)
+
+        def on_basin_done(sb: StudyBasin, basin: Optional[Basin], error: Optional[str]) -> None:
+            if error is None:
+                q_max = max((a.hydrograph.peak_flow_m3s for a in basin.analyses), default=0.0)
+                progress.console.print(
+                    f"  {sb.name}: {len(basin.analyses)} análisis, Qmax {q_max:.3f} m3/s"
+                )
+            else:
+                progress.console.print(f"  [red]{sb.name}: error - {error}[/red]")
+            progress.advance(task)
+
+        try:
+            result = run_study(
+                study, get_project_manager(), workers=workers, on_basin_done=on_basin_done,
+            )
+        except ValueError as e:
+            print_error(str(e))
+            raise typer.Exit(1)
+
+    elapsed = max(result.elapsed_s, 1e-9)
+    print_success(
+        f"{len(result.basins)}/{n_basins} cuencas, {result.n_analyses} análisis "
+        f"en {result.elapsed_s:.1f} s "
+        f"({len(result.basins) / elapsed:.1f} cuencas/s, {result.n_analyses / elapsed:.0f} análisis/s)"
+    )
+    print_info(f"Proyecto: {result.project.name} [{result.project.id}]")
+
+    if parquet and result.basins:
+        from hidropluvial.cli.basin.export import export_to_parquet
+        try:
+            files = export_to_parquet(result.basins, parquet)
+        except ImportError as e:
+            print_error(str(e))
+            raise typer.Exit(1)
+        print_success(f"Parquet: {files['analisis']}, {files['series']}")
+
+    if result.errors:
+        print_warning(f"{len(result.errors)} cuencas con errores")
+        raise typer.Exit(1)
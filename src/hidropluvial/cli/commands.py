@@ -28,6 +28,7 @@ PROYECTOS
   project list                Listar proyectos disponibles
   project show <id>           Ver detalles del proyecto
   project edit <id>           Editar metadatos
+  project export <id>         Exportar proyecto a Excel/Parquet
   project delete <id>         Eliminar proyecto
   project basin-add <id>      Agregar cuenca al proyecto
   project basin-list <id>     Listar cuencas del proyecto
@@ -37,11 +38,15 @@ CUENCAS
 --------------------------------------------------------------
   basin list [project_id]     Listar cuencas (todas o de proyecto)
   basin show <id>             Ver detalles de cuenca
-  basin export <id>           Exportar a Excel/CSV
+  basin export <id>           Exportar a Excel/CSV/Parquet
   basin report <id>           Generar reporte LaTeX
   basin preview <id>          Ver hidrogramas en terminal
   basin compare <id1> <id2>   Comparar cuencas
 
+BATCH (SIN INTERACCION)
+--------------------------------------------------------------
+  batch run <estudio.yaml>    Ejecutar estudio (varias cuencas en paralelo)
+
 CURVAS IDF
 --------------------------------------------------------------
   idf departamentos           Ver P3,10 por departamento
@@ -15,24 +15,34 @@ from hidropluvial.reports.generator import hyetograph_to_csv, idf_to_csv
 export_app = typer.Typer(help="Exportación de datos")
 
 
+def _csv_output_path(output: str, compress: bool) -> str:
+    """Agrega la extensión .gz al archivo de salida si se pide compresión."""
+    if compress and not output.endswith(".gz"):
+        return output + ".gz"
+    return output
+
+
 @export_app.command("idf-csv")
 def export_idf_csv(
     p3_10: Annotated[float, typer.Argument(help="P3,10 base en mm")],
     output: Annotated[str, typer.Option("--output", "-o", help="Archivo de salida")] = "idf_table.csv",
     area: Annotated[Optional[float], typer.Option("--area", "-a", help="Área cuenca km²")] = None,
+    compress: Annotated[bool, typer.Option("--gzip", "-z", help="Comprimir con gzip (.csv.gz)")] = False,
 ):
     """
     Exporta tabla IDF a CSV.
 
     Ejemplo:
         hidropluvial export idf-csv 78 -o montevideo_idf.csv
+        hidropluvial export idf-csv 78 -o montevideo_idf.csv --gzip
     """
     result = generate_dinagua_idf_table(p3_10, area_km2=area)
+    output = _csv_output_path(output, compress)
 
     idf_to_csv(
-        durations_hr=result["durations_hr"].tolist(),
+        durations_hr=result["durations_hr"],
         return_periods_yr=result["return_periods_yr"].tolist(),
-        intensities_mmhr=result["intensities_mmhr"].tolist(),
+        intensities_mmhr=result["intensities_mmhr"],
         filepath=output,
     )
 
@@ -47,6 +57,7 @@ def export_storm_csv(
     return_period: Annotated[int, typer.Option("--tr", "-t", help="Período de retorno")] = 10,
     dt: Annotated[float, typer.Option("--dt", help="Intervalo en minutos")] = 5.0,
     area: Annotated[Optional[float], typer.Option("--area", "-a", help="Área cuenca km²")] = None,
+    compress: Annotated[bool, typer.Option("--gzip", "-z", help="Comprimir con gzip (.csv.gz)")] = False,
 ):
     """
     Exporta hietograma a CSV.
@@ -55,6 +66,7 @@ def export_storm_csv(
         hidropluvial export storm-csv 78 3 --tr 25 -o storm.csv
     """
     result = alternating_blocks_dinagua(p3_10, return_period, duration, dt, area)
+    output = _csv_output_path(output, compress)
 
     hyetograph_to_csv(
         time_min=result.time_min,
@@ -1,8 +1,24 @@
 """
-Comandos CLI para generación de hidrogramas.
+Comandos CLI para generación y calibración de hidrogramas.
+
+Los comandos aceptan valores únicos (resultado detallado) o entradas
+vectorizadas: listas ("1,2,5"), rangos ("1:10:0.5", extremo incluido) o un
+CSV de cuencas (--csv). Todas las combinaciones se calculan en un solo
+proceso, reutilizando hietogramas e hidrogramas unitarios repetidos, y se
+emiten como tabla compacta o JSON lines.
+
+El comando calibrate ajusta CN, λ y los parámetros del hidrograma
+unitario a eventos observados (core/calibration.py); continuous simula
+registros largos de lluvia por bloques (core/continuous.py).
 """
 
-from typing import Annotated, Optional
+import csv
+import itertools
+import json
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Annotated, Any, Callable, Optional
 
 import numpy as np
 import typer
@@ -20,166 +36,691 @@ from hidropluvial.core import (
 )
 from hidropluvial.cli.theme import (
     print_header, print_section, print_separator, print_field,
-    print_success, print_error, get_console, get_palette,
+    print_success, print_error, print_warning, get_console, get_palette,
 )
 from hidropluvial.cli.validators import (
     validate_area, validate_length, validate_slope, validate_p310,
     validate_cn, validate_c_coefficient, validate_x_factor, validate_tc_method,
+    validate_tc,
 )
 
 # Crear sub-aplicación
 hydrograph_app = typer.Typer(help="Generación de hidrogramas")
 
+# Tamaño de los cachés de hietogramas e hidrogramas unitarios
+PIPELINE_CACHE_SIZE = 4096
 
-@hydrograph_app.command("scs")
-def hydrograph_scs(
-    area: Annotated[float, typer.Option("--area", "-a", help="Área de la cuenca en km2")],
-    length: Annotated[float, typer.Option("--length", "-l", help="Longitud del cauce en metros")],
-    slope: Annotated[float, typer.Option("--slope", "-s", help="Pendiente media (m/m o decimal)")],
-    p3_10: Annotated[float, typer.Option("--p3_10", "-p", help="P3,10 en mm")],
-    cn: Annotated[int, typer.Option("--cn", help="Número de curva (30-100)")],
-    return_period: Annotated[int, typer.Option("--tr", "-t", help="Período de retorno en años")] = 25,
-    dt: Annotated[float, typer.Option("--dt", help="Intervalo en minutos")] = 5.0,
-    method: Annotated[str, typer.Option("--method", "-m", help="Método UH: triangular, curvilinear")] = "triangular",
-    tc_method: Annotated[str, typer.Option("--tc-method", help="Método Tc: kirpich, temez, desbordes")] = "kirpich",
-    c_escorrentia: Annotated[Optional[float], typer.Option("--c", help="Coef. escorrentía para desbordes (0-1)")] = None,
-    lambda_coef: Annotated[float, typer.Option("--lambda", help="Coeficiente lambda para Ia")] = 0.2,
-    output: Annotated[Optional[str], typer.Option("--output", "-o", help="Archivo CSV de salida")] = None,
-):
+# Formatos de salida para varias filas
+OUTPUT_FORMATS = ("table", "jsonl")
+
+
+# ============================================================================
+# Entradas vectorizadas
+# ============================================================================
+
+def _cast_value(value: Any, cast: Callable, token: str) -> Any:
     """
-    Genera hidrograma completo usando método SCS.
+    Convierte un valor al tipo pedido; los enteros no admiten decimales.
 
-    Integra: Tc -> IDF -> Hietograma -> Escorrentía -> Hidrograma
+    Raises:
+        typer.BadParameter: Si se pide un entero y el valor no lo es
+    """
+    if cast is not int:
+        return cast(value)
+    number = float(value)
+    if not number.is_integer():
+        raise typer.BadParameter(f"'{token}': se esperaba un valor entero")
+    return int(number)
 
-    Ejemplo:
-        hp hydrograph scs -a 1 -l 1000 -s 0.02 -p 83 --cn 81 --tr 25
-        hp hydrograph scs -a 2 -l 2000 -s 0.015 -p 78 --cn 75 --tc-method temez
+
+def parse_values(value: Any, cast: Callable = float) -> list:
     """
-    # Validar entradas
-    validate_area(area)
-    validate_length(length)
-    validate_slope(slope)
-    validate_p310(p3_10)
-    validate_cn(cn)
-    validate_tc_method(tc_method)
-    if c_escorrentia is not None:
-        validate_c_coefficient(c_escorrentia)
+    Convierte una entrada de la CLI en lista de valores.
 
-    # Convertir pendiente si viene en porcentaje
-    if slope > 1:
-        slope = slope / 100
+    Acepta un número, una lista separada por comas ("1,2,5") o un rango
+    inicio:fin:paso con el extremo incluido ("1:10:0.5"). Se pueden
+    combinar: "1,5:8:1".
 
-    # PASO 1: Tiempo de concentración
+    Args:
+        value: Número o texto a interpretar (None devuelve lista vacía)
+        cast: Tipo de cada valor (float o int)
+
+    Returns:
+        Lista de valores
+
+    Raises:
+        ValueError: Si el texto no es válido
+        typer.BadParameter: Si se piden enteros y un valor no lo es
+    """
+    if value is None:
+        return []
+    if not isinstance(value, str):
+        return [_cast_value(value, cast, str(value))]
+
+    values = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if ":" in part:
+            pieces = part.split(":")
+            if len(pieces) not in (2, 3):
+                raise ValueError(f"Rango inválido: '{part}' (usar inicio:fin:paso)")
+            start, stop = float(pieces[0]), float(pieces[1])
+            step = float(pieces[2]) if len(pieces) == 3 else 1.0
+            if step <= 0 or stop < start:
+                raise ValueError(f"Rango inválido: '{part}'")
+            n = int(np.floor((stop - start) / step + 1e-9)) + 1
+            values.extend(_cast_value(round(start + i * step, 10), cast, part) for i in range(n))
+        else:
+            values.append(_cast_value(part, cast, part))
+    if not values:
+        raise ValueError(f"Sin valores en '{value}'")
+    return values
+
+
+def read_basins_csv(path: Path) -> list[dict[str, str]]:
+    """
+    Lee un CSV de cuencas (una fila por cuenca, encabezados = opciones).
+
+    Los encabezados usan los nombres de las opciones sin guiones
+    (area, length, slope, p3_10, cn, tr, c, x, ...). Una columna
+    'name' o 'nombre' identifica la cuenca en la salida.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        rows = []
+        for row in reader:
+            rows.append({
+                k.strip().lower(): v.strip()
+                for k, v in row.items()
+                if k and v is not None and v.strip() != ""
+            })
+    return rows
+
+
+def expand_rows(
+    sweeps: dict[str, list],
+    base_rows: Optional[list[dict[str, Any]]] = None,
+) -> list[dict[str, Any]]:
+    """
+    Combina filas base (CSV) con los barridos de la línea de comandos.
+
+    Cada fila base se cruza con el producto cartesiano de los barridos cuyas
+    claves no trae la fila (los valores del CSV tienen prioridad).
+
+    Args:
+        sweeps: Parámetro -> lista de valores de la CLI
+        base_rows: Filas del CSV (None: una fila vacía)
+
+    Returns:
+        Lista de filas (dict parámetro -> valor)
+    """
+    rows = []
+    for base in base_rows or [{}]:
+        keys = [k for k, values in sweeps.items() if k not in base and values]
+        for combo in itertools.product(*(sweeps[k] for k in keys)):
+            rows.append({**base, **dict(zip(keys, combo))})
+    return rows
+
+
+def _collect_rows(
+    csv_path: Optional[Path],
+    options: dict[str, tuple[Any, Callable]],
+    required: dict[str, str],
+    replaced_by: Optional[dict[str, str]] = None,
+) -> list[dict[str, Any]]:
+    """
+    Arma las filas a calcular desde CSV y opciones; termina si hay errores.
+
+    Los valores enteros con decimales (CLI o CSV) se rechazan con
+    typer.BadParameter indicando el valor.
+
+    Args:
+        csv_path: CSV de cuencas (opcional)
+        options: Parámetro -> (valor de la CLI, tipo)
+        required: Parámetro obligatorio -> opción de la CLI (para el mensaje)
+        replaced_by: Parámetro obligatorio -> parámetro que lo hace
+            innecesario en la fila (ej: length -> tc, Tc indicado)
+    """
+    replaced_by = replaced_by or {}
+    try:
+        base_rows = None
+        if csv_path is not None:
+            base_rows = read_basins_csv(csv_path)
+            if not base_rows:
+                raise ValueError(f"El archivo {csv_path} no tiene filas")
+
+        sweeps = {name: parse_values(value, cast) for name, (value, cast) in options.items()}
+        rows = expand_rows(sweeps, base_rows)
+
+        for i, row in enumerate(rows, 1):
+            for name, (_, cast) in options.items():
+                if name in row and isinstance(row[name], str):
+                    try:
+                        row[name] = _cast_value(row[name], cast, row[name])
+                    except typer.BadParameter as e:
+                        where = f"fila {i}, " if len(rows) > 1 else ""
+                        raise typer.BadParameter(f"{where}columna '{name}': {e.message}")
+            missing = [
+                name for name in required
+                if row.get(name) is None and row.get(replaced_by.get(name)) is None
+            ]
+            if missing:
+                where = f"fila {i}: " if len(rows) > 1 else ""
+                flags = ", ".join(f"{required[m]} (columna '{m}')" for m in missing)
+                raise ValueError(f"{where}falta {flags}")
+    except FileNotFoundError:
+        print_error(f"Archivo no encontrado: {csv_path}")
+        raise typer.Exit(1)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    return rows
+
+
+# ============================================================================
+# Pipeline con caché
+# ============================================================================
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    """Marca un array cacheado como solo lectura."""
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=PIPELINE_CACHE_SIZE)
+def _design_storm(
+    p3_10: float, tr: int, duration_hr: float, dt: float,
+    area_km2: Optional[float], peak_position: float = 0.5,
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """Hietograma de bloques alternantes DINAGUA: (profundidades, acumulada, total)."""
+    hyetograph = alternating_blocks_dinagua(p3_10, tr, duration_hr, dt, area_km2, peak_position)
+    return (
+        _frozen(np.asarray(hyetograph.depth_mm, dtype=float)),
+        _frozen(np.asarray(hyetograph.cumulative_mm, dtype=float)),
+        hyetograph.total_depth_mm,
+    )
+
+
+@lru_cache(maxsize=PIPELINE_CACHE_SIZE)
+def _unit_hydrograph(kind: str, area: float, tc_hr: float, dt_hr: float, x: float = 1.0) -> np.ndarray:
+    """Ordenadas del hidrograma unitario (triangular, curvilinear o gz)."""
+    if kind == "triangular":
+        _, flow = scs_triangular_uh(area, tc_hr, dt_hr)
+    elif kind == "curvilinear":
+        _, flow = scs_curvilinear_uh(area, tc_hr, dt_hr)
+    else:
+        from hidropluvial.core import triangular_uh_x
+        _, flow = triangular_uh_x(area, tc_hr, dt_hr, x)
+    return _frozen(np.asarray(flow, dtype=float))
+
+
+def clear_pipeline_cache() -> None:
+    """Vacía los cachés de hietogramas e hidrogramas unitarios."""
+    _design_storm.cache_clear()
+    _unit_hydrograph.cache_clear()
+
+
+@dataclass
+class HydrographRow:
+    """Resultado del pipeline para una cuenca y combinación de parámetros."""
+    tc_hr: float
+    duration_hr: float
+    precip_mm: float
+    runoff_mm: float
+    peak_flow_m3s: float
+    time_to_peak_hr: float
+    volume_m3: float
+    extra: dict[str, float] = field(default_factory=dict)
+    time_hr: Optional[np.ndarray] = field(default=None, repr=False)
+    flow_m3s: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def summary(self) -> dict[str, float]:
+        """Resultados escalares (sin series)."""
+        data = asdict(self)
+        data.pop("time_hr")
+        data.pop("flow_m3s")
+        data.update(data.pop("extra"))
+        return data
+
+
+def _route(excess_mm: np.ndarray, uh_flow: np.ndarray, dt_hr: float):
+    """Convolución y resultados del hidrograma."""
+    flow = convolve_uh(excess_mm, uh_flow)
+    time = np.arange(len(flow)) * dt_hr
+    peak_idx = np.argmax(flow)
+    volume_m3 = float(np.trapezoid(flow, time * 3600))
+    return time, flow, float(flow[peak_idx]), float(time[peak_idx]), volume_m3
+
+
+def _scs_tc_hr(
+    area: float, length: float, slope: float, cn: int, tc_method: str, c: Optional[float],
+) -> float:
+    """Tc (h) del pipeline SCS según el método (pendiente en m/m)."""
     if tc_method == "kirpich":
-        tc_hr = kirpich(length, slope)
-    elif tc_method == "temez":
-        tc_hr = temez(length / 1000, slope)  # Temez usa km
-    elif tc_method == "desbordes":
+        return kirpich(length, slope)
+    if tc_method == "temez":
+        return temez(length / 1000, slope)  # Temez usa km
+    if tc_method == "desbordes":
         from hidropluvial.core import desbordes
         area_ha = area * 100  # km2 a ha
         slope_pct = slope * 100  # m/m a %
         # Si no se proporciona C, estimar desde CN
-        if c_escorrentia is None:
+        if c is None:
             # Estimación aproximada: C ≈ 1 - (S/(S+25.4)) donde S = 25400/CN - 254
             s_mm = 25400 / cn - 254
-            c_escorrentia = 1 - (s_mm / (s_mm + 25.4))
-        tc_hr = desbordes(area_ha, slope_pct, c_escorrentia)
-    else:
-        print_error(f"Método Tc desconocido: {tc_method}")
-        raise typer.Exit(1)
+            c = 1 - (s_mm / (s_mm + 25.4))
+        return desbordes(area_ha, slope_pct, c)
+    raise ValueError(f"Método Tc desconocido: {tc_method}")
+
+
+def compute_scs(
+    area: float,
+    length: Optional[float],
+    slope: Optional[float],
+    p3_10: float,
+    cn: int,
+    tr: int = 25,
+    dt: float = 5.0,
+    method: str = "triangular",
+    tc_method: str = "kirpich",
+    c: Optional[float] = None,
+    lambda_coef: float = 0.2,
+    tc_hr: Optional[float] = None,
+) -> HydrographRow:
+    """
+    Pipeline SCS: Tc -> IDF -> hietograma -> escorrentía CN -> hidrograma.
+
+    Args:
+        area: Área de la cuenca (km²)
+        length: Longitud del cauce (m; no se usa si se indica tc_hr)
+        slope: Pendiente (m/m; valores > 1 se interpretan en %)
+        p3_10: P3,10 (mm)
+        cn: Número de curva
+        tr: Período de retorno (años)
+        dt: Intervalo (min)
+        method: Hidrograma unitario: triangular o curvilinear
+        tc_method: kirpich, temez o desbordes
+        c: Coeficiente C para Desbordes (si falta se estima desde CN)
+        lambda_coef: Coeficiente lambda para Ia
+        tc_hr: Tiempo de concentración (h); si se indica no se calcula
+
+    Returns:
+        HydrographRow con resultados y series
+
+    Raises:
+        ValueError: Si el método de Tc o de hidrograma unitario es desconocido
+    """
+    # Convertir pendiente si viene en porcentaje
+    if slope is not None and slope > 1:
+        slope = slope / 100
+
+    # PASO 1: Tiempo de concentración
+    if tc_hr is None:
+        tc_hr = _scs_tc_hr(area, length, slope, cn, tc_method, c)
 
-    tc_min = tc_hr * 60
+    if method not in ("triangular", "curvilinear"):
+        raise ValueError(f"Método UH desconocido: {method}")
 
     # PASO 2: IDF - Precipitación de diseño
     # Duración = Tc (redondeado a múltiplo de dt)
     duration_hr = max(tc_hr, dt / 60)  # Mínimo un intervalo
+    area_idf = area if area > 1 else None
 
-    idf_result = dinagua_intensity(p3_10, return_period, duration_hr, area if area > 1 else None)
+    idf_result = dinagua_intensity(p3_10, tr, duration_hr, area_idf)
     precip_mm = idf_result.depth_mm
-    intensity_mmhr = idf_result.intensity_mmhr
 
     # PASO 3: Hietograma
     dt_hr = dt / 60
-    hyetograph = alternating_blocks_dinagua(
-        p3_10, return_period, duration_hr, dt, area if area > 1 else None
-    )
+    _, cumulative_rain, _ = _design_storm(p3_10, tr, duration_hr, dt, area_idf)
 
     # PASO 4: Escorrentía SCS-CN
     runoff_result = calculate_scs_runoff(precip_mm, cn, lambda_coef)
-    runoff_mm = runoff_result.runoff_mm
-
-    # Calcular exceso de lluvia por intervalo
-    cumulative_rain = np.array(hyetograph.cumulative_mm)
     excess_mm = rainfall_excess_series(cumulative_rain, cn, lambda_coef)
 
-    # PASO 5: Hidrograma unitario
-    if method == "triangular":
-        uh_time, uh_flow = scs_triangular_uh(area, tc_hr, dt_hr)
-    elif method == "curvilinear":
-        uh_time, uh_flow = scs_curvilinear_uh(area, tc_hr, dt_hr)
+    # PASO 5 y 6: Hidrograma unitario y convolución
+    uh_flow = _unit_hydrograph(method, area, tc_hr, dt_hr)
+    time, flow, peak_flow, time_to_peak, volume_m3 = _route(excess_mm, uh_flow, dt_hr)
+
+    return HydrographRow(
+        tc_hr=tc_hr,
+        duration_hr=duration_hr,
+        precip_mm=precip_mm,
+        runoff_mm=runoff_result.runoff_mm,
+        peak_flow_m3s=peak_flow,
+        time_to_peak_hr=time_to_peak,
+        volume_m3=volume_m3,
+        extra={
+            "intensity_mmhr": idf_result.intensity_mmhr,
+            "retention_mm": runoff_result.retention_mm,
+            "initial_abstraction_mm": runoff_result.initial_abstraction_mm,
+        },
+        time_hr=time,
+        flow_m3s=flow,
+    )
+
+
+def compute_gz(
+    area_ha: float,
+    slope_pct: Optional[float],
+    c: float,
+    p3_10: float,
+    tr: int = 2,
+    x: float = 1.0,
+    dt: float = 5.0,
+    t0: float = 5.0,
+    tc_hr: Optional[float] = None,
+) -> HydrographRow:
+    """
+    Pipeline GZ: Desbordes -> tormenta 6 h DINAGUA -> C·P -> triangular con X.
+
+    Args:
+        area_ha: Área de la cuenca (ha)
+        slope_pct: Pendiente media (%; no se usa si se indica tc_hr)
+        c: Coeficiente de escorrentía
+        p3_10: P3,10 (mm)
+        tr: Período de retorno (años)
+        x: Factor X morfológico
+        dt: Intervalo (min)
+        t0: Tiempo de entrada para Desbordes (min)
+        tc_hr: Tiempo de concentración (h); si se indica no se calcula
+
+    Returns:
+        HydrographRow con resultados y series
+    """
+    from hidropluvial.core import desbordes
+
+    # PASO 1: Tiempo de concentración (Método Desbordes)
+    if tc_hr is None:
+        tc_hr = desbordes(area_ha, slope_pct, c, t0)
+
+    # PASO 2: Hietograma de 6 horas con pico en la primera hora
+    duration_hr = 6.0
+    depths, _, precip_mm = _design_storm(p3_10, tr, duration_hr, dt, None, 1.0 / 6.0)
+
+    # PASO 3: Escorrentía con coeficiente C: Pe = C × P (para cada intervalo)
+    excess_mm = c * depths
+
+    # PASO 4 y 5: Hidrograma unitario triangular con factor X y convolución
+    dt_hr = dt / 60
+    uh_flow = _unit_hydrograph("gz", area_ha, tc_hr, dt_hr, x)
+    time, flow, peak_flow, time_to_peak, volume_m3 = _route(excess_mm, uh_flow, dt_hr)
+
+    # Tp y Tb teóricos
+    tp_teorico = 0.5 * dt_hr + 0.6 * tc_hr
+
+    return HydrographRow(
+        tc_hr=tc_hr,
+        duration_hr=duration_hr,
+        precip_mm=precip_mm,
+        runoff_mm=float(np.sum(excess_mm)),
+        peak_flow_m3s=peak_flow,
+        time_to_peak_hr=time_to_peak,
+        volume_m3=volume_m3,
+        extra={"tp_hr": tp_teorico, "tb_hr": (1 + x) * tp_teorico},
+        time_hr=time,
+        flow_m3s=flow,
+    )
+
+
+# ============================================================================
+# Salida de varias filas
+# ============================================================================
+
+# Columnas de la tabla compacta: (clave, encabezado, formato)
+_SCS_COLUMNS = [
+    ("area", "Área km²", "{:.2f}"),
+    ("tc_min", "Tc min", "{:.1f}"),
+    ("tr", "Tr", "{}"),
+    ("cn", "CN", "{}"),
+    ("precip_mm", "P mm", "{:.1f}"),
+    ("runoff_mm", "Q mm", "{:.1f}"),
+    ("peak_flow_m3s", "Qp m³/s", "{:.3f}"),
+    ("time_to_peak_min", "Tp min", "{:.0f}"),
+    ("volume_m3", "Vol m³", "{:.0f}"),
+]
+
+_GZ_COLUMNS = [
+    ("area_ha", "Área ha", "{:.2f}"),
+    ("tc_min", "Tc min", "{:.1f}"),
+    ("tr", "Tr", "{}"),
+    ("c", "C", "{:.2f}"),
+    ("x", "X", "{:.2f}"),
+    ("precip_mm", "P mm", "{:.1f}"),
+    ("runoff_mm", "Pe mm", "{:.1f}"),
+    ("peak_flow_m3s", "Qp m³/s", "{:.3f}"),
+    ("time_to_peak_min", "Tp min", "{:.0f}"),
+    ("volume_m3", "Vol m³", "{:.0f}"),
+]
+
+
+def _record(row: dict[str, Any], result: HydrographRow) -> dict[str, Any]:
+    """Entradas y resultados escalares de una fila."""
+    record = {**row, **result.summary()}
+    record["tc_min"] = result.tc_hr * 60
+    record["time_to_peak_min"] = result.time_to_peak_hr * 60
+    return record
+
+
+def _emit_rows(
+    records: list[dict[str, Any]],
+    columns: list[tuple[str, str, str]],
+    title: str,
+    fmt: str,
+    output: Optional[str],
+) -> None:
+    """Muestra las filas como tabla o JSON lines y opcionalmente las guarda en CSV."""
+    if fmt == "jsonl":
+        for record in records:
+            typer.echo(json.dumps(record, ensure_ascii=False))
     else:
-        print_error(f"Método UH desconocido: {method}")
+        from rich import box
+        from rich.table import Table
+
+        console = get_console()
+        p = get_palette()
+        has_name = any("name" in r for r in records)
+
+        table = Table(
+            title=f"{title} ({len(records)} filas)",
+            title_style=f"bold {p.primary}",
+            border_style=p.border,
+            header_style=f"bold {p.secondary}",
+            box=box.SIMPLE,
+        )
+        if has_name:
+            table.add_column("Cuenca", justify="left")
+        for _, header, _ in columns:
+            table.add_column(header, justify="right", style=p.number)
+
+        for record in records:
+            cells = [str(record.get("name", ""))] if has_name else []
+            cells += [template.format(record[key]) for key, _, template in columns]
+            table.add_row(*cells)
+        console.print(table)
+
+    if output:
+        keys = list(dict.fromkeys(k for r in records for k in r))
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=keys)
+            writer.writeheader()
+            writer.writerows(records)
+        if fmt != "jsonl":
+            print_success(f"Resultados exportados a: {output}")
+
+
+def _check_format(fmt: Optional[str]) -> None:
+    if fmt is not None and fmt not in OUTPUT_FORMATS:
+        print_error(f"Formato desconocido: {fmt} (usar {', '.join(OUTPUT_FORMATS)})")
         raise typer.Exit(1)
 
-    # PASO 6: Convolución
-    hydrograph_flow = convolve_uh(excess_mm, uh_flow)
-    n_total = len(hydrograph_flow)
-    hydrograph_time = np.arange(n_total) * dt_hr
 
-    # Calcular resultados
-    peak_idx = np.argmax(hydrograph_flow)
-    peak_flow = float(hydrograph_flow[peak_idx])
-    time_to_peak = float(hydrograph_time[peak_idx])
-    volume_m3 = float(np.trapezoid(hydrograph_flow, hydrograph_time * 3600))
+def _validate_rows(rows: list[dict[str, Any]], checks: dict[str, Callable]) -> None:
+    """Valida todas las filas antes de calcular; termina en la primera inválida."""
+    for i, row in enumerate(rows, 1):
+        for name, check in checks.items():
+            value = row.get(name)
+            if value is not None and not check(value, exit_on_error=False):
+                if len(rows) > 1:
+                    print_error(f"Fila {i} inválida: {row}")
+                raise typer.Exit(1)
+
+
+def _name_option(row: dict[str, Any]) -> dict[str, Any]:
+    """Normaliza la columna de nombre del CSV ('nombre' -> 'name')."""
+    if "nombre" in row:
+        row["name"] = row.pop("nombre")
+    return row
+
+
+def _write_series(output: str, result: HydrographRow) -> None:
+    with open(output, 'w') as f:
+        f.write("Tiempo_hr,Caudal_m3s\n")
+        for t, q in zip(result.time_hr, result.flow_m3s):
+            f.write(f"{t:.4f},{q:.4f}\n")
+    print_success(f"Hidrograma exportado a: {output}")
+
+
+# ============================================================================
+# Comandos
+# ============================================================================
+
+@hydrograph_app.command("scs")
+def hydrograph_scs(
+    area: Annotated[Optional[str], typer.Option("--area", "-a", help="Área de la cuenca en km2 (valor, lista o rango)")] = None,
+    length: Annotated[Optional[str], typer.Option("--length", "-l", help="Longitud del cauce en metros")] = None,
+    slope: Annotated[Optional[str], typer.Option("--slope", "-s", help="Pendiente media (m/m o decimal)")] = None,
+    p3_10: Annotated[Optional[str], typer.Option("--p3_10", "-p", help="P3,10 en mm")] = None,
+    cn: Annotated[Optional[str], typer.Option("--cn", help="Número de curva (30-100)")] = None,
+    return_period: Annotated[str, typer.Option("--tr", "-t", help="Período de retorno en años")] = "25",
+    dt: Annotated[float, typer.Option("--dt", help="Intervalo en minutos")] = 5.0,
+    method: Annotated[str, typer.Option("--method", "-m", help="Método UH: triangular, curvilinear")] = "triangular",
+    tc_method: Annotated[str, typer.Option("--tc-method", help="Método Tc: kirpich, temez, desbordes")] = "kirpich",
+    tc: Annotated[Optional[str], typer.Option("--tc", help="Tc en horas (valor, lista o rango); reemplaza el cálculo con --tc-method")] = None,
+    c_escorrentia: Annotated[Optional[str], typer.Option("--c", help="Coef. escorrentía para desbordes (0-1)")] = None,
+    lambda_coef: Annotated[float, typer.Option("--lambda", help="Coeficiente lambda para Ia")] = 0.2,
+    output: Annotated[Optional[str], typer.Option("--output", "-o", help="Archivo CSV de salida")] = None,
+    csv_path: Annotated[Optional[Path], typer.Option("--csv", help="CSV de cuencas (columnas: area, length, slope, p3_10, cn, ...)")] = None,
+    fmt: Annotated[Optional[str], typer.Option("--format", "-f", help="Salida para varias filas: table, jsonl")] = None,
+):
+    """
+    Genera hidrograma completo usando método SCS.
+
+    Integra: Tc -> IDF -> Hietograma -> Escorrentía -> Hidrograma
+
+    Con listas, rangos o --csv calcula todas las combinaciones en un solo
+    proceso y muestra una tabla (o JSON lines con --format jsonl). Con
+    --output guarda la tabla en CSV. Con --tc (o columna 'tc') se usa ese
+    Tc y no hacen falta longitud ni pendiente.
+
+    Ejemplo:
+        hp hydrograph scs -a 1 -l 1000 -s 0.02 -p 83 --cn 81 --tr 25
+        hp hydrograph scs -a 2 -l 2000 -s 0.015 -p 78 --cn 75 --tc-method temez
+        hp hydrograph scs -a 0.5:5:0.5 -l 1000 -s 0.02 -p 83 --cn 70,80,90 --tr 2,10,25
+        hp hydrograph scs -a 2 -p 83 --cn 80 --tc 0.5:2:0.25
+        hp hydrograph scs --csv cuencas.csv -p 83 --tr 10 --format jsonl
+    """
+    _check_format(fmt)
+    validate_tc_method(tc_method)
+
+    rows = _collect_rows(
+        csv_path,
+        {
+            "area": (area, float),
+            "length": (length, float),
+            "slope": (slope, float),
+            "p3_10": (p3_10, float),
+            "cn": (cn, int),
+            "tr": (return_period, int),
+            "c": (c_escorrentia, float),
+            "tc": (tc, float),
+        },
+        required={"area": "--area", "length": "--length", "slope": "--slope", "p3_10": "--p3_10", "cn": "--cn"},
+        replaced_by={"length": "tc", "slope": "tc"},
+    )
+    _validate_rows(rows, {
+        "area": validate_area,
+        "length": validate_length,
+        "slope": validate_slope,
+        "p3_10": validate_p310,
+        "cn": validate_cn,
+        "c": validate_c_coefficient,
+        "tc": validate_tc,
+    })
+
+    results = []
+    for row in rows:
+        try:
+            results.append(compute_scs(
+                row["area"], row.get("length"), row.get("slope"), row["p3_10"], row["cn"],
+                tr=row["tr"], dt=dt, method=method, tc_method=tc_method,
+                c=row.get("c"), lambda_coef=lambda_coef, tc_hr=row.get("tc"),
+            ))
+        except ValueError as e:
+            print_error(str(e))
+            raise typer.Exit(1)
+
+    if len(rows) > 1 or csv_path is not None or fmt is not None:
+        records = [_record(_name_option(row), result) for row, result in zip(rows, results)]
+        _emit_rows(records, _SCS_COLUMNS, "HIDROGRAMA SCS", fmt or "table", output)
+        return
+
+    row, result = rows[0], results[0]
+    precip_mm = result.precip_mm
+    runoff_mm = result.runoff_mm
 
     # Mostrar resultados
     print_header("HIDROGRAMA SCS - ANÁLISIS COMPLETO")
 
     print_section("Datos de Entrada")
-    print_field("Área de cuenca", f"{area:.2f}", "km²")
-    print_field("Longitud cauce", f"{length:.0f}", "m")
-    print_field("Pendiente", f"{slope*100:.2f}", "%")
-    print_field("P3,10", f"{p3_10:.1f}", "mm")
-    print_field("Período retorno", str(return_period), "años")
-    print_field("CN", str(cn))
-    print_field("Método Tc", tc_method)
+    print_field("Área de cuenca", f"{row['area']:.2f}", "km²")
+    if row.get("length") is not None:
+        print_field("Longitud cauce", f"{row['length']:.0f}", "m")
+    if row.get("slope") is not None:
+        slope = row["slope"] / 100 if row["slope"] > 1 else row["slope"]
+        print_field("Pendiente", f"{slope*100:.2f}", "%")
+    print_field("P3,10", f"{row['p3_10']:.1f}", "mm")
+    print_field("Período retorno", str(row["tr"]), "años")
+    print_field("CN", str(row["cn"]))
+    print_field("Método Tc", "indicado (--tc)" if row.get("tc") is not None else tc_method)
     print_field("Método UH", method)
 
     print_section("Resultados Intermedios")
-    print_field("Tc", f"{tc_hr:.2f} hr ({tc_min:.1f} min)")
-    print_field("Duración tormenta", f"{duration_hr:.2f}", "hr")
-    print_field("Intensidad", f"{intensity_mmhr:.2f}", "mm/hr")
+    print_field("Tc", f"{result.tc_hr:.2f} hr ({result.tc_hr * 60:.1f} min)")
+    print_field("Duración tormenta", f"{result.duration_hr:.2f}", "hr")
+    print_field("Intensidad", f"{result.extra['intensity_mmhr']:.2f}", "mm/hr")
     print_field("Precipitación total", f"{precip_mm:.2f}", "mm")
-    print_field("Retención S", f"{runoff_result.retention_mm:.2f}", "mm")
-    print_field("Abstracción Ia", f"{runoff_result.initial_abstraction_mm:.2f}", "mm")
+    print_field("Retención S", f"{result.extra['retention_mm']:.2f}", "mm")
+    print_field("Abstracción Ia", f"{result.extra['initial_abstraction_mm']:.2f}", "mm")
     print_field("Escorrentía Q", f"{runoff_mm:.2f}", "mm")
     print_field("Coef. escorrentía", f"{runoff_mm/precip_mm*100:.1f}", "%")
 
     print_section("Resultados Finales")
-    print_field("CAUDAL PICO", f"{peak_flow:.3f}", "m³/s")
-    print_field("TIEMPO AL PICO", f"{time_to_peak:.2f} hr ({time_to_peak*60:.1f} min)")
-    print_field("VOLUMEN", f"{volume_m3:.0f}", "m³")
+    print_field("CAUDAL PICO", f"{result.peak_flow_m3s:.3f}", "m³/s")
+    print_field("TIEMPO AL PICO", f"{result.time_to_peak_hr:.2f} hr ({result.time_to_peak_hr*60:.1f} min)")
+    print_field("VOLUMEN", f"{result.volume_m3:.0f}", "m³")
 
     # Exportar si se solicita
     if output:
-        with open(output, 'w') as f:
-            f.write("Tiempo_hr,Caudal_m3s\n")
-            for t, q in zip(hydrograph_time, hydrograph_flow):
-                f.write(f"{t:.4f},{q:.4f}\n")
-        print_success(f"Hidrograma exportado a: {output}")
+        _write_series(output, result)
 
 
 @hydrograph_app.command("gz")
 def hydrograph_gz(
-    area_ha: Annotated[float, typer.Option("--area", "-a", help="Área de la cuenca en hectáreas")],
-    slope_pct: Annotated[float, typer.Option("--slope", "-s", help="Pendiente media en porcentaje (%)")],
-    c: Annotated[float, typer.Option("--c", help="Coeficiente de escorrentía (0-1)")],
-    p3_10: Annotated[float, typer.Option("--p3_10", "-p", help="P3,10 en mm")],
-    return_period: Annotated[int, typer.Option("--tr", "-t", help="Período de retorno en años")] = 2,
-    x_factor: Annotated[float, typer.Option("--x", help="Factor X morfológico (1.0-5.5)")] = 1.0,
+    area_ha: Annotated[Optional[str], typer.Option("--area", "-a", help="Área de la cuenca en hectáreas (valor, lista o rango)")] = None,
+    slope_pct: Annotated[Optional[str], typer.Option("--slope", "-s", help="Pendiente media en porcentaje (%)")] = None,
+    c: Annotated[Optional[str], typer.Option("--c", help="Coeficiente de escorrentía (0-1)")] = None,
+    p3_10: Annotated[Optional[str], typer.Option("--p3_10", "-p", help="P3,10 en mm")] = None,
+    return_period: Annotated[str, typer.Option("--tr", "-t", help="Período de retorno en años")] = "2",
+    x_factor: Annotated[str, typer.Option("--x", help="Factor X morfológico (1.0-5.5)")] = "1.0",
     dt: Annotated[float, typer.Option("--dt", help="Intervalo en minutos")] = 5.0,
     t0: Annotated[float, typer.Option("--t0", help="Tiempo entrada Tc en minutos")] = 5.0,
+    tc: Annotated[Optional[str], typer.Option("--tc", help="Tc en horas (valor, lista o rango); reemplaza Desbordes")] = None,
     output: Annotated[Optional[str], typer.Option("--output", "-o", help="Archivo CSV de salida")] = None,
+    csv_path: Annotated[Optional[Path], typer.Option("--csv", help="CSV de cuencas (columnas: area_ha, slope_pct, c, ...)")] = None,
+    fmt: Annotated[Optional[str], typer.Option("--format", "-f", help="Salida para varias filas: table, jsonl")] = None,
 ):
     """
     Genera hidrograma completo usando método GZ.
@@ -197,88 +738,333 @@ def hydrograph_gz(
         1.67 - Método NRCS/SCS estándar
         2.25 - Uso mixto rural/urbano
 
+    Con listas, rangos o --csv calcula todas las combinaciones en un solo
+    proceso (la tormenta de 6 h se genera una vez por P3,10 y Tr). Con
+    --tc (o columna 'tc') se usa ese Tc y no hace falta la pendiente.
+
     Ejemplo:
         hp hydrograph gz -a 100 -s 2.23 --c 0.62 -p 83 --tr 2 --x 1.0
         hp hydrograph gz -a 50 -s 1.5 --c 0.5 -p 78 --tr 10 --x 1.67
+        hp hydrograph gz -a 10:200:10 -s 2 --c 0.4,0.6 -p 83 --tr 2,10 --x 1,1.25
+        hp hydrograph gz -a 100 --c 0.6 -p 83 --tc 0.25:1:0.25
+        hp hydrograph gz --csv cuencas.csv -p 83 --format jsonl
     """
-    # Validar entradas
-    validate_area(area_ha)
-    if slope_pct <= 0:
-        print_error(f"La pendiente debe ser positiva (recibido: {slope_pct})")
-        raise typer.Exit(1)
-    validate_c_coefficient(c)
-    validate_p310(p3_10)
-    validate_x_factor(x_factor)
-
-    from hidropluvial.core import desbordes, triangular_uh_x
+    _check_format(fmt)
 
-    # PASO 1: Tiempo de concentración (Método Desbordes)
-    tc_hr = desbordes(area_ha, slope_pct, c, t0)
-    tc_min = tc_hr * 60
-
-    # PASO 2: Hietograma de 6 horas con pico adelantado
-    duration_hr = 6.0
-    peak_position = 1.0 / 6.0  # Pico en la primera hora
-
-    hyetograph = alternating_blocks_dinagua(
-        p3_10, return_period, duration_hr, dt, None, peak_position
+    rows = _collect_rows(
+        csv_path,
+        {
+            "area_ha": (area_ha, float),
+            "slope_pct": (slope_pct, float),
+            "c": (c, float),
+            "p3_10": (p3_10, float),
+            "tr": (return_period, int),
+            "x": (x_factor, float),
+            "tc": (tc, float),
+        },
+        required={"area_ha": "--area", "slope_pct": "--slope", "c": "--c", "p3_10": "--p3_10"},
+        replaced_by={"slope_pct": "tc"},
     )
 
-    precip_mm = hyetograph.total_depth_mm
+    for i, row in enumerate(rows, 1):
+        if row.get("slope_pct") is not None and row["slope_pct"] <= 0:
+            where = f"Fila {i}: " if len(rows) > 1 else ""
+            print_error(f"{where}La pendiente debe ser positiva (recibido: {row['slope_pct']})")
+            raise typer.Exit(1)
+    _validate_rows(rows, {
+        "area_ha": validate_area,
+        "c": validate_c_coefficient,
+        "p3_10": validate_p310,
+        "x": validate_x_factor,
+        "tc": validate_tc,
+    })
 
-    # PASO 3: Escorrentía con coeficiente C
-    # Pe = C × P (para cada intervalo)
-    depths = np.array(hyetograph.depth_mm)
-    excess_mm = c * depths
-    total_runoff_mm = float(np.sum(excess_mm))
-
-    # PASO 4: Hidrograma unitario triangular con factor X
-    dt_hr = dt / 60
-    uh_time, uh_flow = triangular_uh_x(area_ha, tc_hr, dt_hr, x_factor)
+    results = [
+        compute_gz(
+            row["area_ha"], row.get("slope_pct"), row["c"], row["p3_10"],
+            tr=row["tr"], x=row["x"], dt=dt, t0=t0, tc_hr=row.get("tc"),
+        )
+        for row in rows
+    ]
 
-    # PASO 5: Convolución
-    hydrograph_flow = convolve_uh(excess_mm, uh_flow)
-    n_total = len(hydrograph_flow)
-    hydrograph_time = np.arange(n_total) * dt_hr
+    if len(rows) > 1 or csv_path is not None or fmt is not None:
+        records = [_record(_name_option(row), result) for row, result in zip(rows, results)]
+        _emit_rows(records, _GZ_COLUMNS, "HIDROGRAMA GZ", fmt or "table", output)
+        return
 
-    # Calcular resultados
-    peak_idx = np.argmax(hydrograph_flow)
-    peak_flow = float(hydrograph_flow[peak_idx])
-    time_to_peak = float(hydrograph_time[peak_idx])
-    volume_m3 = float(np.trapezoid(hydrograph_flow, hydrograph_time * 3600))
-
-    # Calcular Tp y Tb teóricos
-    tp_teorico = 0.5 * dt_hr + 0.6 * tc_hr
-    tb_teorico = (1 + x_factor) * tp_teorico
+    row, result = rows[0], results[0]
+    tc_hr = result.tc_hr
+    tp_teorico = result.extra["tp_hr"]
+    tb_teorico = result.extra["tb_hr"]
 
     # Mostrar resultados
     print_header("HIDROGRAMA GZ - ANÁLISIS COMPLETO")
 
     print_section("Datos de Entrada")
-    print_field("Área de cuenca", f"{area_ha:.2f}", "ha")
-    print_field("Pendiente", f"{slope_pct:.2f}", "%")
-    print_field("Coef. escorrentía C", f"{c:.2f}")
-    print_field("P3,10", f"{p3_10:.1f}", "mm")
-    print_field("Período retorno", str(return_period), "años")
-    print_field("Factor X", f"{x_factor:.2f}")
+    print_field("Área de cuenca", f"{row['area_ha']:.2f}", "ha")
+    if row.get("slope_pct") is not None:
+        print_field("Pendiente", f"{row['slope_pct']:.2f}", "%")
+    print_field("Coef. escorrentía C", f"{row['c']:.2f}")
+    print_field("P3,10", f"{row['p3_10']:.1f}", "mm")
+    print_field("Período retorno", str(row["tr"]), "años")
+    print_field("Factor X", f"{row['x']:.2f}")
 
     print_section("Resultados Intermedios")
-    print_field("Tc (Desbordes)", f"{tc_hr:.2f} hr ({tc_min:.1f} min)")
+    tc_label = "Tc (indicado)" if row.get("tc") is not None else "Tc (Desbordes)"
+    print_field(tc_label, f"{tc_hr:.2f} hr ({tc_hr * 60:.1f} min)")
     print_field("Tp teórico", f"{tp_teorico:.2f} hr ({tp_teorico*60:.1f} min)")
     print_field("Tb teórico", f"{tb_teorico:.2f} hr ({tb_teorico*60:.1f} min)")
-    print_field("Duración tormenta", f"{duration_hr:.1f}", "hr")
-    print_field("Precipitación total", f"{precip_mm:.2f}", "mm")
-    print_field("Escorrentía (C*P)", f"{total_runoff_mm:.2f}", "mm")
+    print_field("Duración tormenta", f"{result.duration_hr:.1f}", "hr")
+    print_field("Precipitación total", f"{result.precip_mm:.2f}", "mm")
+    print_field("Escorrentía (C*P)", f"{result.runoff_mm:.2f}", "mm")
 
     print_section("Resultados Finales")
-    print_field("CAUDAL PICO", f"{peak_flow:.3f}", "m³/s")
-    print_field("TIEMPO AL PICO", f"{time_to_peak:.2f} hr ({time_to_peak*60:.1f} min)")
-    print_field("VOLUMEN", f"{volume_m3:.0f}", "m³")
+    print_field("CAUDAL PICO", f"{result.peak_flow_m3s:.3f}", "m³/s")
+    print_field("TIEMPO AL PICO", f"{result.time_to_peak_hr:.2f} hr ({result.time_to_peak_hr*60:.1f} min)")
+    print_field("VOLUMEN", f"{result.volume_m3:.0f}", "m³")
 
     # Exportar si se solicita
     if output:
-        with open(output, 'w') as f:
-            f.write("Tiempo_hr,Caudal_m3s\n")
-            for t, q in zip(hydrograph_time, hydrograph_flow):
-                f.write(f"{t:.4f},{q:.4f}\n")
-        print_success(f"Hidrograma exportado a: {output}")
+        _write_series(output, result)
+
+
+def _parse_assignments(specs: Optional[list[str]], what: str) -> dict[str, list[float]]:
+    """Interpreta opciones repetibles 'nombre=v1[,v2]'."""
+    parsed = {}
+    for spec in specs or []:
+        name, sep, value = spec.partition("=")
+        try:
+            if not sep:
+                raise ValueError
+            parsed[name.strip().lower()] = [float(v) for v in value.split(",")]
+        except ValueError:
+            print_error(f"{what} inválido: '{spec}' (usar nombre=valor)")
+            raise typer.Exit(1)
+    return parsed
+
+
+def _event_names(paths: list[Path]) -> list[str]:
+    """Nombres de evento: el del archivo, con su carpeta si se repite."""
+    stems = [path.stem for path in paths]
+    return [
+        f"{path.parent.name}/{path.stem}" if stems.count(path.stem) > 1 else path.stem
+        for path in paths
+    ]
+
+
+@hydrograph_app.command("calibrate")
+def hydrograph_calibrate(
+    events: Annotated[list[Path], typer.Argument(help="CSV de eventos observados (columnas: time_min, rain_mm, flow_m3s)")],
+    area_ha: Annotated[float, typer.Option("--area", "-a", help="Área de la cuenca en hectáreas")],
+    model: Annotated[str, typer.Option("--model", "-m", help="Modelo: triangular (CN, λ, Tc, X), clark (CN, λ, Tc, R), snyder (CN, λ, Ct, Cp)")] = "triangular",
+    params: Annotated[Optional[str], typer.Option("--params", help="Parámetros a calibrar separados por coma (por defecto todos los no fijados)")] = None,
+    fix: Annotated[Optional[list[str]], typer.Option("--fix", help="Parámetro fijo nombre=valor (ej: lambda=0.2)")] = None,
+    bound: Annotated[Optional[list[str]], typer.Option("--bound", help="Rango de búsqueda nombre=mín,máx (ej: tc=0.2,3)")] = None,
+    objective: Annotated[str, typer.Option("--objective", help="Objetivo: nse, kge")] = "nse",
+    length_km: Annotated[Optional[float], typer.Option("--length", help="Longitud del cauce en km (Snyder)")] = None,
+    lc_km: Annotated[Optional[float], typer.Option("--lc", help="Distancia al centroide en km (Snyder)")] = None,
+    maxiter: Annotated[int, typer.Option("--maxiter", help="Generaciones máximas de la búsqueda global")] = 200,
+    seed: Annotated[Optional[int], typer.Option("--seed", help="Semilla (resultados reproducibles)")] = None,
+    output: Annotated[Optional[str], typer.Option("--output", "-o", help="CSV con caudal observado y simulado por evento")] = None,
+):
+    """
+    Calibra pérdidas SCS-CN e hidrograma unitario contra eventos observados.
+
+    Con varios eventos la calibración es conjunta (promedio del objetivo).
+    El caudal observado debe ser escorrentía directa (sin caudal base).
+
+    Ejemplo:
+        hp hydrograph calibrate ev1.csv ev2.csv -a 250 --model clark
+        hp hydrograph calibrate ev1.csv -a 250 --params cn,tc --fix x=1.67 --bound tc=0.3,3
+    """
+    from rich import box
+    from rich.table import Table
+
+    from hidropluvial.core.calibration import calibrate, load_event_csv
+
+    fixed = {name: values[0] for name, values in _parse_assignments(fix, "Valor fijo").items()}
+    bounds = {}
+    for name, values in _parse_assignments(bound, "Rango").items():
+        if len(values) != 2:
+            print_error(f"Rango inválido para '{name}' (usar nombre=mín,máx)")
+            raise typer.Exit(1)
+        bounds[name] = (values[0], values[1])
+
+    try:
+        observed = [load_event_csv(path, name) for path, name in zip(events, _event_names(events))]
+        result = calibrate(
+            observed,
+            area_ha,
+            model=model.lower(),
+            params=[p.strip().lower() for p in params.split(",")] if params else None,
+            fixed=fixed,
+            bounds=bounds,
+            objective=objective.lower(),
+            length_km=length_km,
+            lc_km=lc_km,
+            maxiter=maxiter,
+            seed=seed,
+        )
+    except (OSError, ValueError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    console = get_console()
+    p = get_palette()
+
+    print_header(f"CALIBRACIÓN - {result.model.upper()}")
+    print_section("Parámetros")
+    for name, value in result.params.items():
+        mark = "" if name in result.calibrated else " (fijo)"
+        print_field(name, f"{value:.4g}{mark}")
+    print_field(f"{result.objective.upper()} conjunto", f"{result.score:.4f}")
+    print_field("Evaluaciones", f"{result.n_evaluations:,}")
+
+    table = Table(
+        title=f"Ajuste por evento ({len(observed)})",
+        title_style=f"bold {p.primary}",
+        border_style=p.border,
+        header_style=f"bold {p.secondary}",
+        box=box.SIMPLE,
+    )
+    table.add_column("Evento", justify="left")
+    for header in ("NSE", "KGE", "Error pico", "Error Tp (min)", "Error vol."):
+        table.add_column(header, justify="right", style=p.number)
+    for name, m in result.metrics.items():
+        table.add_row(
+            name,
+            f"{m['nse']:.3f}",
+            f"{m['kge']:.3f}",
+            f"{m['peak_error']:+.1%}",
+            f"{m['peak_time_error_hr'] * 60:+.0f}",
+            f"{m['volume_error']:+.1%}",
+        )
+    console.print(table)
+
+    if not result.success:
+        print_warning("La búsqueda global no reportó convergencia; considere aumentar --maxiter")
+
+    if output:
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["event", "time_hr", "observed_m3s", "simulated_m3s"])
+            for event in observed:
+                for t, q_obs, q_sim in zip(event.time_hr, event.flow_m3s, result.simulated[event.name]):
+                    writer.writerow([event.name, f"{t:.4f}", f"{q_obs:.4f}", f"{q_sim:.4f}"])
+        print_success(f"Hidrogramas exportados a: {output}")
+
+
+@hydrograph_app.command("continuous")
+def hydrograph_continuous(
+    rainfall: Annotated[Path, typer.Argument(help="CSV de lluvia continua (columnas: fecha/hora, rain_mm)")],
+    area_ha: Annotated[float, typer.Option("--area", "-a", help="Área de la cuenca en hectáreas")],
+    cn: Annotated[float, typer.Option("--cn", help="Número de curva (AMC II)")],
+    tc_hr: Annotated[float, typer.Option("--tc", help="Tiempo de concentración en horas")],
+    x_factor: Annotated[float, typer.Option("--x", "-x", help="Factor X del hidrograma triangular")] = 1.67,
+    lambda_coef: Annotated[float, typer.Option("--lambda", help="Coeficiente λ para Ia")] = 0.2,
+    gap_hr: Annotated[float, typer.Option("--gap", help="Horas secas que separan eventos")] = 6.0,
+    amc: Annotated[bool, typer.Option("--amc/--no-amc", help="Ajustar CN por lluvia antecedente de 5 días")] = True,
+    chunk_rows: Annotated[int, typer.Option("--chunk", help="Registros por bloque")] = 65_536,
+    output: Annotated[Optional[str], typer.Option("--output", "-o", help="CSV con los máximos anuales")] = None,
+    series: Annotated[Optional[str], typer.Option("--series", help="CSV con la serie completa de caudales")] = None,
+):
+    """
+    Simulación continua de un registro largo de lluvia.
+
+    El registro se procesa por bloques (memoria constante): exceso SCS-CN
+    por evento, hidrograma triangular y convolución overlap-add. Muestra
+    los caudales máximos anuales y su ajuste Gumbel.
+
+    Ejemplo:
+        hp hydrograph continuous lluvia_5min.csv -a 250 --cn 80 --tc 1.2
+        hp hydrograph continuous lluvia_5min.csv -a 250 --cn 80 --tc 1.2 --no-amc -o maximos.csv
+    """
+    from rich import box
+    from rich.table import Table
+
+    from hidropluvial.core.continuous import (
+        AMC_THRESHOLDS_MM,
+        read_rainfall_csv,
+        simulate_continuous,
+    )
+
+    validate_area(area_ha)
+    validate_cn(cn)
+    validate_x_factor(x_factor)
+
+    series_file = open(series, "w", newline="", encoding="utf-8") if series else None
+    on_chunk = None
+    if series_file is not None:
+        writer = csv.writer(series_file)
+        writer.writerow(["time", "flow_m3s"])
+
+        def on_chunk(times, flow):
+            writer.writerows(zip(times.astype(str), np.round(flow, 4)))
+
+    try:
+        result = simulate_continuous(
+            read_rainfall_csv(rainfall, chunk_rows=chunk_rows),
+            area_ha,
+            cn,
+            tc_hr,
+            x_factor=x_factor,
+            lambda_coef=lambda_coef,
+            inter_event_hr=gap_hr,
+            amc_thresholds_mm=AMC_THRESHOLDS_MM if amc else None,
+            on_chunk=on_chunk,
+        )
+    except (OSError, ValueError) as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+    finally:
+        if series_file is not None:
+            series_file.close()
+
+    console = get_console()
+    p = get_palette()
+
+    print_header("SIMULACIÓN CONTINUA")
+    print_field("Registros", f"{result.n_steps:,} (dt = {result.dt_min:g} min)")
+    print_field("Eventos", f"{result.n_events:,}")
+    print_field("Lluvia total", f"{result.total_rain_mm:,.1f}", "mm")
+    print_field("Escorrentía total", f"{result.total_runoff_mm:,.1f}", "mm")
+
+    table = Table(
+        title=f"Máximos anuales ({len(result.annual_maxima)})",
+        title_style=f"bold {p.primary}",
+        border_style=p.border,
+        header_style=f"bold {p.secondary}",
+        box=box.SIMPLE,
+    )
+    table.add_column("Año", justify="left")
+    for header in ("Qp (m³/s)", "Fecha", "Lluvia (mm)", "Escorrentía (mm)"):
+        table.add_column(header, justify="right", style=p.number)
+    for m in result.annual_maxima:
+        table.add_row(
+            str(m.year),
+            f"{m.peak_flow_m3s:.3f}",
+            str(m.time.astype("datetime64[m]")).replace("T", " "),
+            f"{m.rain_mm:.1f}",
+            f"{m.runoff_mm:.1f}",
+        )
+    console.print(table)
+
+    if len(result.annual_maxima) >= 2:
+        print_section("Ajuste Gumbel")
+        for tr, q in result.frequency().items():
+            print_field(f"Tr {tr} años", f"{q:.3f}", "m³/s")
+    else:
+        print_warning("Se necesitan al menos 2 años para el ajuste de frecuencia")
+
+    if output:
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer_max = csv.writer(f)
+            writer_max.writerow(["year", "peak_flow_m3s", "time", "rain_mm", "runoff_mm"])
+            for m in result.annual_maxima:
+                writer_max.writerow([
+                    m.year, f"{m.peak_flow_m3s:.4f}", str(m.time),
+                    f"{m.rain_mm:.2f}", f"{m.runoff_mm:.2f}",
+                ])
+        print_success(f"Máximos anuales exportados a: {output}")
+    if series:
+        print_success(f"Serie de caudales exportada a: {series}")
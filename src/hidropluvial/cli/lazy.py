@@ -0,0 +1,87 @@
+"""
+Carga diferida de sub-aplicaciones del CLI.
+
+Cada sub-aplicación (idf, storm, project, ...) se registra con su nombre,
+módulo y texto de ayuda. El módulo se importa recién cuando se invoca el
+subcomando, de modo que `hp --help` o `hp idf uruguay` no pagan la
+importación de numpy, pandas, rich, questionary o plotext de los demás.
+"""
+
+import importlib
+from difflib import get_close_matches
+from typing import NamedTuple
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazySubcommand(NamedTuple):
+    """Sub-aplicación registrada para carga diferida."""
+    module: str
+    attr: str
+    help: str
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Grupo Typer que importa las sub-aplicaciones al invocarlas.
+
+    Las subclases definen `lazy_subcommands` (ver `lazy_group`). Al listar
+    la ayuda se usan comandos vacíos con el texto registrado, sin importar
+    ningún módulo.
+    """
+
+    lazy_subcommands: dict[str, LazySubcommand] = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listing_help = False
+
+    def list_commands(self, ctx) -> list[str]:
+        # Sub-aplicaciones diferidas primero, en el orden de registro
+        eager = [n for n in super().list_commands(ctx) if n not in self.lazy_subcommands]
+        return list(self.lazy_subcommands) + eager
+
+    def get_command(self, ctx, cmd_name: str):
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is not None or cmd_name not in self.lazy_subcommands:
+            return cmd
+
+        spec = self.lazy_subcommands[cmd_name]
+        if self._listing_help:
+            return TyperGroup(name=cmd_name, help=spec.help)
+
+        return self.load_command(cmd_name)
+
+    def load_command(self, cmd_name: str):
+        """Importa la sub-aplicación y la registra como comando del grupo."""
+        spec = self.lazy_subcommands[cmd_name]
+        sub_app = getattr(importlib.import_module(spec.module), spec.attr)
+        cmd = typer.main.get_group(sub_app)
+        cmd.name = cmd_name
+        self.add_command(cmd, cmd_name)
+        return cmd
+
+    def format_help(self, ctx, formatter) -> None:
+        self._listing_help = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing_help = False
+
+    def resolve_command(self, ctx, args: list[str]):
+        # Las sugerencias de Typer solo miran comandos ya cargados
+        name = args[0] if args else None
+        if name and not ctx.resilient_parsing and not name.startswith("-"):
+            names = self.list_commands(ctx)
+            if name not in names:
+                matches = get_close_matches(name, names)
+                if matches:
+                    suggestions = ", ".join(f"{m!r}" for m in matches)
+                    ctx.fail(f"No such command {name!r}. Did you mean {suggestions}?")
+        return super().resolve_command(ctx, args)
+
+
+def lazy_group(subcommands: dict[str, LazySubcommand]) -> type[LazyTyperGroup]:
+    """Crea una clase de grupo con las sub-aplicaciones indicadas."""
+    return type("LazyTyperGroup", (LazyTyperGroup,), {"lazy_subcommands": dict(subcommands)})
@@ -4,15 +4,28 @@ Visualizacion rapida de hidrogramas e hietogramas en terminal.
 Incluye:
 - Sparklines para vistas compactas en tablas
 - Graficos ASCII detallados con plotext
+
+Todas las vistas pasan por el mismo pipeline: la serie se reduce con NumPy
+al ancho en caracteres del destino (conservando el pico) antes de dibujar.
+Los resultados por análisis se guardan en un caché LRU por (id, ancho).
 """
 
-from typing import Sequence
+from collections import OrderedDict
+from typing import Callable, Sequence
 
+import numpy as np
 import plotext as plt
 
 from hidropluvial.cli.formatters import format_flow
 
 
+# Puntos horizontales por carácter con marcador braille
+BRAILLE_POINTS_PER_CHAR = 2
+
+# Entradas del caché de series reducidas por análisis
+PREVIEW_CACHE_SIZE = 1024
+
+
 # Caracteres para sparklines (8 niveles)
 # Unicode block elements: ▁▂▃▄▅▆▇█
 _SPARK_UNICODE = " \u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
@@ -35,6 +48,181 @@ def _detect_unicode_support() -> bool:
 SPARK_CHARS = _SPARK_UNICODE if _detect_unicode_support() else _SPARK_ASCII
 
 
+# ============================================================================
+# Reducción de series
+# ============================================================================
+
+def bin_peak(values: Sequence[float], n_bins: int) -> np.ndarray:
+    """
+    Agrupa una serie en n_bins tramos consecutivos tomando el máximo de cada uno.
+
+    A diferencia de muestrear un punto por tramo, el pico de la serie
+    siempre queda representado.
+
+    Args:
+        values: Serie de valores
+        n_bins: Cantidad de tramos
+
+    Returns:
+        Array con a lo sumo n_bins valores (la serie original si ya es corta)
+    """
+    arr = np.asarray(values, dtype=float)
+    if len(arr) <= n_bins or n_bins < 1:
+        return arr
+    starts = (np.arange(n_bins) * len(arr)) // n_bins
+    return np.maximum.reduceat(arr, starts)
+
+
+def downsample_series(x, y, max_points: int) -> tuple[list[float], list[float]]:
+    """
+    Reduce una serie a lo sumo max_points puntos conservando la forma.
+
+    Divide la serie en tramos y toma el mínimo y el máximo de cada uno
+    (decimación min-max), de modo que el pico y los valles se mantienen.
+
+    Args:
+        x: Abscisas
+        y: Ordenadas
+        max_points: Cantidad máxima de puntos a devolver
+
+    Returns:
+        Tupla (x, y) como listas
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_points or max_points < 4:
+        return x.tolist(), y.tolist()
+
+    n_buckets = max_points // 2
+    starts = (np.arange(n_buckets) * n) // n_buckets
+    lengths = np.diff(np.append(starts, n))
+
+    # Posición del mínimo y del máximo de cada tramo, sin bucles de Python:
+    # se rellena cada tramo hasta el largo máximo y se reduce por filas
+    width = lengths.max()
+    idx = starts[:, None] + np.arange(width)[None, :]
+    valid = idx < (starts + lengths)[:, None]
+    idx = np.where(valid, idx, starts[:, None])
+    blocks = y[idx]
+    idx_min = idx[np.arange(n_buckets), np.argmin(np.where(valid, blocks, np.inf), axis=1)]
+    idx_max = idx[np.arange(n_buckets), np.argmax(np.where(valid, blocks, -np.inf), axis=1)]
+
+    keep = np.unique(np.concatenate(([0, n - 1], idx_min, idx_max)))
+    return x[keep].tolist(), y[keep].tolist()
+
+
+def downsample_bars(x, y, max_bars: int) -> tuple[list[float], list[float]]:
+    """
+    Reduce un hietograma a lo sumo max_bars barras.
+
+    Cada barra agrupa intervalos consecutivos y toma la intensidad máxima
+    del grupo, para que la intensidad pico siga visible.
+
+    Args:
+        x: Posición de las barras
+        y: Altura de las barras
+        max_bars: Cantidad máxima de barras
+
+    Returns:
+        Tupla (x, y) como listas
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= max_bars or max_bars < 1:
+        return x.tolist(), y.tolist()
+
+    group = -(-n // max_bars)
+    starts = np.arange(0, n, group)
+    counts = np.diff(np.append(starts, n))
+    bar_y = np.maximum.reduceat(y, starts)
+    bar_x = np.add.reduceat(x, starts) / counts
+    return bar_x.tolist(), bar_y.tolist()
+
+
+# ============================================================================
+# Caché por análisis
+# ============================================================================
+
+_preview_cache: "OrderedDict[tuple, object]" = OrderedDict()
+
+
+def _cached(key: tuple, build: Callable[[], object]):
+    """Devuelve el valor en caché para key, construyéndolo si falta (LRU)."""
+    try:
+        _preview_cache.move_to_end(key)
+        return _preview_cache[key]
+    except KeyError:
+        value = build()
+        _preview_cache[key] = value
+        if len(_preview_cache) > PREVIEW_CACHE_SIZE:
+            _preview_cache.popitem(last=False)
+        return value
+
+
+def clear_preview_cache() -> None:
+    """Vacía el caché de series reducidas."""
+    _preview_cache.clear()
+
+
+def analysis_sparkline(analysis, width: int = 20) -> str:
+    """
+    Sparkline del hidrograma de un análisis, en caché por análisis y ancho.
+
+    Args:
+        analysis: AnalysisRun
+        width: Ancho en caracteres
+
+    Returns:
+        Sparkline, o "-" si el análisis no tiene hidrograma
+    """
+    flow = analysis.hydrograph.flow_m3s
+    if not flow:
+        return "-"
+    key = ("sparkline", analysis.id, len(flow), width)
+    return _cached(key, lambda: sparkline(flow, width))
+
+
+def analysis_hydrograph_points(analysis, width: int) -> tuple[list[float], list[float]]:
+    """
+    Hidrograma de un análisis reducido a un gráfico braille de `width` columnas.
+
+    Args:
+        analysis: AnalysisRun
+        width: Ancho del gráfico en caracteres
+
+    Returns:
+        Tupla (time_hr, flow_m3s) como listas
+    """
+    hydro = analysis.hydrograph
+    key = ("hydrograph", analysis.id, len(hydro.flow_m3s), width)
+    return _cached(
+        key,
+        lambda: downsample_series(hydro.time_hr, hydro.flow_m3s, width * BRAILLE_POINTS_PER_CHAR),
+    )
+
+
+def analysis_hyetograph_bars(analysis, width: int) -> tuple[list[float], list[float]]:
+    """
+    Hietograma de un análisis reducido a lo sumo a `width` barras.
+
+    Args:
+        analysis: AnalysisRun
+        width: Ancho del gráfico en caracteres
+
+    Returns:
+        Tupla (time_min, intensity_mmhr) como listas
+    """
+    storm = analysis.storm
+    key = ("hyetograph", analysis.id, len(storm.intensity_mmhr), width)
+    return _cached(key, lambda: downsample_bars(storm.time_min, storm.intensity_mmhr, width))
+
+
+# ============================================================================
+# Sparklines y gráficos
+# ============================================================================
+
 def sparkline(values: Sequence[float], width: int = 20) -> str:
     """
     Genera un sparkline compacto para una serie de valores.
@@ -50,34 +238,23 @@ def sparkline(values: Sequence[float], width: int = 20) -> str:
         >>> sparkline([0, 1, 4, 9, 4, 1, 0])
         '▁▂▄█▄▂▁'
     """
-    if not values or len(values) == 0:
+    if values is None or len(values) == 0:
         return ""
 
-    # Resamplear si es necesario
-    if len(values) > width:
-        step = len(values) / width
-        resampled = []
-        for i in range(width):
-            idx = int(i * step)
-            resampled.append(values[idx])
-        values = resampled
+    # Reducir al ancho conservando el pico de cada tramo
+    arr = bin_peak(values, width)
 
     # Normalizar valores
-    min_val = min(values)
-    max_val = max(values)
+    min_val = arr.min()
+    max_val = arr.max()
 
     if max_val == min_val:
         # Todos los valores iguales
-        return SPARK_CHARS[4] * len(values)
+        return SPARK_CHARS[4] * len(arr)
 
     # Mapear a caracteres
-    result = []
-    for v in values:
-        normalized = (v - min_val) / (max_val - min_val)
-        idx = int(normalized * (len(SPARK_CHARS) - 1))
-        result.append(SPARK_CHARS[idx])
-
-    return "".join(result)
+    levels = ((arr - min_val) / (max_val - min_val) * (len(SPARK_CHARS) - 1)).astype(int)
+    return "".join([SPARK_CHARS[i] for i in levels.tolist()])
 
 
 def sparkline_with_peak(
@@ -121,14 +298,15 @@ def plot_hydrograph_terminal(
     plt.clear_figure()
     plt.plot_size(width, height)
 
-    plt.plot(list(time_hr), list(flow_m3s), marker="braille")
+    plot_t, plot_q = downsample_series(time_hr, flow_m3s, width * BRAILLE_POINTS_PER_CHAR)
+    plt.plot(plot_t, plot_q, marker="braille")
 
     plt.title(title)
     plt.xlabel("Tiempo (h)")
     plt.ylabel("Q (m3/s)")
 
     # Marcar pico
-    peak_idx = flow_m3s.index(max(flow_m3s)) if isinstance(flow_m3s, list) else list(flow_m3s).index(max(flow_m3s))
+    peak_idx = int(np.argmax(flow_m3s))
     peak_q = flow_m3s[peak_idx]
     peak_t = time_hr[peak_idx]
 
@@ -158,8 +336,9 @@ def plot_hyetograph_terminal(
     plt.clear_figure()
     plt.plot_size(width, height)
 
-    # Usar barras para hietograma
-    plt.bar(list(time_min), list(intensity_mmhr))
+    # Usar barras para hietograma (a lo sumo una por columna)
+    bar_x, bar_y = downsample_bars(time_min, intensity_mmhr, width)
+    plt.bar(bar_x, bar_y)
 
     plt.title(title)
     plt.xlabel("Tiempo (min)")
@@ -197,8 +376,9 @@ def plot_hydrograph_comparison_terminal(
     for i, analysis in enumerate(analyses):
         color = colors[i % len(colors)]
 
-        time_list = list(analysis["time_hr"])
-        flow_list = list(analysis["flow_m3s"])
+        time_list, flow_list = downsample_series(
+            analysis["time_hr"], analysis["flow_m3s"], width * BRAILLE_POINTS_PER_CHAR
+        )
 
         max_time = max(max_time, max(time_list) if time_list else 0)
         max_flow = max(max_flow, max(flow_list) if flow_list else 0)
@@ -13,6 +13,7 @@ from hidropluvial.cli.project.base import (
     project_show,
     project_delete,
     project_edit,
+    project_export,
 )
 from hidropluvial.cli.project.basin import (
     basin_add,
@@ -23,6 +24,14 @@ from hidropluvial.cli.project.basin import (
 from hidropluvial.cli.project.report import (
     project_report,
 )
+from hidropluvial.cli.project.critical import (
+    project_critical,
+)
+from hidropluvial.cli.project.network import (
+    project_link,
+    project_unlink,
+    project_network,
+)
 
 # Crear sub-aplicación
 project_app = typer.Typer(help="Gestión de proyectos hidrológicos")
@@ -33,6 +42,7 @@ project_app.command("list")(project_list)
 project_app.command("show")(project_show)
 project_app.command("delete")(project_delete)
 project_app.command("edit")(project_edit)
+project_app.command("export")(project_export)
 
 # Comandos de cuencas (basin)
 project_app.command("basin-add")(basin_add)
@@ -43,4 +53,12 @@ project_app.command("basin-delete")(basin_delete)
 # Comandos de reporte
 project_app.command("report")(project_report)
 
+# Comandos de análisis
+project_app.command("critical")(project_critical)
+
+# Comandos de red de drenaje
+project_app.command("link")(project_link)
+project_app.command("unlink")(project_unlink)
+project_app.command("network")(project_network)
+
 __all__ = ["project_app", "get_project_manager"]
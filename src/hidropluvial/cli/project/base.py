@@ -2,6 +2,7 @@
 Comandos base para gestión de proyectos.
 """
 
+from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
@@ -201,3 +202,58 @@ def project_edit(
     for change in changes:
         typer.echo(f"    - {change}")
     typer.echo("")
+
+
+def project_export(
+    project_id: Annotated[str, typer.Argument(help="ID del proyecto")],
+    output: Annotated[Optional[str], typer.Option("--output", "-o", help="Archivo (xlsx) o directorio (parquet) de salida")] = None,
+    format: Annotated[str, typer.Option("--format", "-f", help="Formato: xlsx, parquet")] = "xlsx",
+    timeseries: Annotated[bool, typer.Option("--timeseries/--no-timeseries", help="Incluir hietogramas e hidrogramas (xlsx)")] = True,
+) -> None:
+    """
+    Exporta todas las cuencas de un proyecto a Excel o Parquet.
+
+    Las cuencas se leen y escriben de a una (modo streaming), por lo que
+    la memoria no crece con el tamaño del proyecto.
+
+    Ejemplo:
+        hp project export abc123 -o estudio.xlsx
+        hp project export abc123 --format parquet -o estudio_parquet
+    """
+    from hidropluvial.cli.basin.export import export_project_to_excel, export_to_parquet
+
+    manager = get_project_manager()
+    full_id = manager.find_project_id(project_id)
+
+    if full_id is None:
+        print_error(f"Proyecto '{project_id}' no encontrado.")
+        raise typer.Exit(1)
+
+    if output is None:
+        output = f"proyecto_{full_id}"
+
+    if format == "parquet":
+        try:
+            files = export_to_parquet(manager.iter_basins(full_id), Path(output))
+        except ImportError as e:
+            print_error(str(e))
+            raise typer.Exit(1)
+        for path in files.values():
+            print_success(f"Exportado: {path.absolute()}")
+        return
+
+    if format != "xlsx":
+        print_error(f"Formato '{format}' no soportado. Use 'xlsx' o 'parquet'.")
+        raise typer.Exit(1)
+
+    if not output.endswith(".xlsx"):
+        output = f"{output}.xlsx"
+
+    output_path = Path(output)
+    n_basins = export_project_to_excel(
+        manager.iter_basins(full_id),
+        output_path,
+        include_timeseries=timeseries,
+    )
+
+    print_success(f"Exportadas {n_basins} cuencas: {output_path.absolute()}")
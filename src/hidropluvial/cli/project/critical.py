@@ -0,0 +1,142 @@
+"""
+Comando CLI para la duración crítica de tormenta de las cuencas de un proyecto.
+"""
+
+import csv
+from typing import Annotated, Optional
+
+import typer
+
+from hidropluvial.cli.project.base import get_project_manager
+from hidropluvial.cli.theme import print_error, print_success, get_console, get_palette
+
+
+def project_critical(
+    project_id: Annotated[str, typer.Argument(help="ID del proyecto")],
+    family: Annotated[str, typer.Option("--family", "-f", help="Familias separadas por coma: blocks, gz, chicago, huff_q1..huff_q4, scs_ii")] = "blocks",
+    tr: Annotated[str, typer.Option("--tr", help="Períodos de retorno (lista o rango)")] = "2,10,25",
+    dt: Annotated[str, typer.Option("--dt", help="Pasos de tiempo en min (lista o rango)")] = "5",
+    durations: Annotated[Optional[str], typer.Option("--durations", "-d", help="Duraciones del barrido en h (lista o rango; por defecto 0.5 a 24 h)")] = None,
+    tc_method: Annotated[str, typer.Option("--tc", help="Método de Tc")] = "kirpich",
+    runoff: Annotated[Optional[str], typer.Option("--runoff", help="racional o scs-cn (por defecto según cada cuenca)")] = None,
+    amc: Annotated[str, typer.Option("--amc", help="AMC: I, II, III")] = "II",
+    lambda_coef: Annotated[float, typer.Option("--lambda", help="Coeficiente lambda para Ia (SCS-CN)")] = 0.2,
+    basin_filter: Annotated[Optional[list[str]], typer.Option("--basin", "-b", help="Cuencas a incluir (nombre o ID, repetible)")] = None,
+    output: Annotated[Optional[str], typer.Option("--output", "-o", help="CSV con las duraciones críticas")] = None,
+    hydrographs: Annotated[Optional[str], typer.Option("--hydrographs", help="CSV con los hidrogramas críticos")] = None,
+    workers: Annotated[int, typer.Option("--workers", "-w", help="Procesos de cálculo")] = 1,
+) -> None:
+    """
+    Busca la duración de tormenta que maximiza Qp en cada cuenca y Tr.
+
+    Barre duraciones × dt por familia en una evaluación vectorizada y
+    refina alrededor del máximo (todas las duraciones múltiplo de dt entre
+    los vecinos del mejor punto).
+
+    Ejemplo:
+        hp project critical abc123 --family blocks,huff_q2 --tr 2,10,25 --dt 5,10
+    """
+    from rich import box
+    from rich.table import Table
+
+    from hidropluvial.cli.basin.screening import basin_tc_hr
+    from hidropluvial.cli.hydrograph import parse_values
+    from hidropluvial.cli.wizard.runner import _get_c_for_tr_from_basin
+    from hidropluvial.config import AntecedentMoistureCondition
+    from hidropluvial.core.critical import StormBasin, critical_durations
+    from hidropluvial.core.runoff import adjust_cn_for_amc
+
+    project = get_project_manager().get_project(project_id)
+    if project is None:
+        print_error(f"Proyecto '{project_id}' no encontrado.")
+        raise typer.Exit(1)
+
+    basins = project.basins
+    if basin_filter:
+        wanted = {b.lower() for b in basin_filter}
+        basins = [b for b in basins if b.name.lower() in wanted or b.id in wanted]
+    if not basins:
+        print_error("El proyecto no tiene cuencas para analizar")
+        raise typer.Exit(1)
+
+    try:
+        return_periods = parse_values(tr, int)
+        cases = []
+        for basin in basins:
+            method = (runoff or ("racional" if basin.c else "scs-cn")).lower()
+            for t in return_periods:
+                if method == "racional":
+                    if not basin.c:
+                        raise ValueError(f"La cuenca '{basin.name}' no tiene coeficiente C")
+                    c = _get_c_for_tr_from_basin(basin, basin.c, t)
+                    params = {"c": c}
+                elif method == "scs-cn":
+                    if not basin.cn:
+                        raise ValueError(f"La cuenca '{basin.name}' no tiene CN")
+                    c = basin.c
+                    params = {"cn": adjust_cn_for_amc(basin.cn, AntecedentMoistureCondition(amc.upper()))}
+                else:
+                    raise ValueError(f"Escorrentía '{runoff}' no soportada (usar racional o scs-cn)")
+                cases.append((StormBasin(
+                    area_ha=basin.area_ha,
+                    tc_hr=basin_tc_hr(basin, tc_method.lower(), c, 5.0),
+                    p3_10=basin.p3_10,
+                    lambda_coef=lambda_coef,
+                    name=basin.name,
+                    **params,
+                ), t))
+
+        results = critical_durations(
+            cases,
+            families=[f.strip().lower() for f in family.split(",") if f.strip()],
+            durations_hr=parse_values(durations) if durations else None,
+            dts_min=parse_values(dt),
+            workers=workers,
+        )
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    console = get_console()
+    p = get_palette()
+    table = Table(
+        title=f"{project.name} - Duración crítica de tormenta",
+        title_style=f"bold {p.primary}",
+        border_style=p.border,
+        header_style=f"bold {p.secondary}",
+        box=box.SIMPLE,
+    )
+    table.add_column("Cuenca", justify="left")
+    table.add_column("Familia", justify="left", no_wrap=True)
+    table.add_column("Tr", justify="right")
+    for header in ("Duración (h)", "dt (min)", "Qp (m³/s)", "Tp (h)"):
+        table.add_column(header, justify="right", style=p.number)
+
+    for r in results:
+        table.add_row(
+            r.basin, r.family, str(r.tr), f"{r.duration_hr:.2f}", f"{r.dt_min:g}",
+            f"{r.peak_flow_m3s:.3f}", f"{r.time_to_peak_hr:.2f}",
+        )
+    console.print(table)
+
+    if output:
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["basin", "family", "tr", "duration_hr", "dt_min",
+                             "peak_flow_m3s", "time_to_peak_hr", "volume_m3", "evaluations"])
+            for r in results:
+                writer.writerow([
+                    r.basin, r.family, r.tr, f"{r.duration_hr:.4f}", f"{r.dt_min:g}",
+                    f"{r.peak_flow_m3s:.4f}", f"{r.time_to_peak_hr:.4f}", f"{r.volume_m3:.1f}",
+                    r.n_evaluations,
+                ])
+        print_success(f"Duraciones críticas exportadas a: {output}")
+
+    if hydrographs:
+        with open(hydrographs, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["basin", "family", "tr", "time_hr", "flow_m3s"])
+            for r in results:
+                for t, q in zip(r.time_hr, r.flow_m3s):
+                    writer.writerow([r.basin, r.family, r.tr, f"{t:.4f}", f"{q:.4f}"])
+        print_success(f"Hidrogramas críticos exportados a: {hydrographs}")
@@ -0,0 +1,267 @@
+"""
+Comandos CLI para la red de drenaje de un proyecto.
+"""
+
+import csv
+from typing import Annotated, Optional
+
+import typer
+
+from hidropluvial.cli.project.base import get_project_manager
+from hidropluvial.cli.theme import print_error, print_info, print_success, get_console, get_palette
+
+
+def _find_basin(project, basin_ref: str):
+    """Cuenca del proyecto por nombre o ID (parcial)."""
+    for basin in project.basins:
+        if basin.name.lower() == basin_ref.lower():
+            return basin
+    return project.get_basin(basin_ref)
+
+
+def _project_downstream(project) -> dict:
+    """Destino de cada cuenca del proyecto por ID (None: salida)."""
+    downstream = {basin.id: None for basin in project.basins}
+    for reach in project.reaches:
+        if reach.basin_id in downstream:
+            downstream[reach.basin_id] = reach.downstream_id
+    return downstream
+
+
+def project_link(
+    project_id: Annotated[str, typer.Argument(help="ID del proyecto")],
+    basin_ref: Annotated[str, typer.Argument(help="Cuenca aguas arriba (nombre o ID)")],
+    to: Annotated[Optional[str], typer.Option("--to", "-t", help="Cuenca donde descarga (nombre o ID); omitir para una salida")] = None,
+    method: Annotated[str, typer.Option("--method", "-m", help="Tránsito: lag o muskingum")] = "lag",
+    lag: Annotated[float, typer.Option("--lag", help="Retardo del tramo (min), método lag")] = 0.0,
+    k_hr: Annotated[float, typer.Option("--k", help="K de Muskingum (h)")] = 0.0,
+    x: Annotated[float, typer.Option("--x", help="X de Muskingum (0 a 0.5)")] = 0.2,
+) -> None:
+    """
+    Conecta una cuenca con la cuenca donde descarga (red de drenaje).
+
+    Ejemplo:
+        hp project link abc123 "Subcuenca A" --to "Subcuenca C" --lag 12
+        hp project link abc123 "Subcuenca C" --to Salida -m muskingum --k 0.4 --x 0.2
+    """
+    from hidropluvial.core.network import NetworkReach, topological_order
+    from hidropluvial.models import Reach
+
+    manager = get_project_manager()
+    project = manager.get_project(project_id)
+    if project is None:
+        print_error(f"Proyecto '{project_id}' no encontrado.")
+        raise typer.Exit(1)
+
+    basin = _find_basin(project, basin_ref)
+    if basin is None:
+        print_error(f"Cuenca '{basin_ref}' no encontrada en el proyecto.")
+        raise typer.Exit(1)
+    downstream = None
+    if to is not None:
+        downstream = _find_basin(project, to)
+        if downstream is None:
+            print_error(f"Cuenca '{to}' no encontrada en el proyecto.")
+            raise typer.Exit(1)
+        if downstream.id == basin.id:
+            print_error("Una cuenca no puede descargar en sí misma.")
+            raise typer.Exit(1)
+
+    try:
+        reach = NetworkReach(method=method, lag_min=lag, k_hr=k_hr, x=x)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    previous = project.get_reach(basin.id)
+    project.set_reach(Reach(
+        basin_id=basin.id,
+        downstream_id=downstream.id if downstream else None,
+        method=reach.method,
+        lag_min=reach.lag_min,
+        k_hr=reach.k_hr,
+        x=reach.x,
+    ))
+    try:
+        topological_order(_project_downstream(project))
+    except ValueError as e:
+        print_error(f"{e}. El tramo no se guardó.")
+        raise typer.Exit(1)
+
+    manager.save_project(project)
+    target = downstream.name if downstream else "salida de la red"
+    print_success(f"{'Tramo actualizado' if previous else 'Tramo agregado'}: {basin.name} -> {target}")
+
+
+def project_unlink(
+    project_id: Annotated[str, typer.Argument(help="ID del proyecto")],
+    basin_ref: Annotated[str, typer.Argument(help="Cuenca (nombre o ID)")],
+) -> None:
+    """
+    Elimina el tramo aguas abajo de una cuenca (pasa a ser salida).
+    """
+    manager = get_project_manager()
+    project = manager.get_project(project_id)
+    if project is None:
+        print_error(f"Proyecto '{project_id}' no encontrado.")
+        raise typer.Exit(1)
+
+    basin = _find_basin(project, basin_ref)
+    if basin is None or not project.remove_reach(basin.id):
+        print_error(f"La cuenca '{basin_ref}' no tiene tramo en la red.")
+        raise typer.Exit(1)
+
+    manager.save_project(project)
+    print_success(f"Tramo eliminado: {basin.name} es ahora una salida de la red")
+
+
+def _network_nodes(
+    project,
+    return_periods: list[int],
+    tc_method: str,
+    runoff: Optional[str],
+    amc: str,
+    lambda_coef: float,
+) -> list:
+    """
+    Subcuencas de la red del proyecto (nodos identificados por ID de cuenca).
+
+    C se ajusta por Tr como en los análisis guardados; CN se ajusta por AMC.
+    El HU de cada subcuenca es el del runner: triangular SCS para SCS-CN.
+
+    Raises:
+        ValueError: Si falta un dato de cuenca
+    """
+    from hidropluvial.cli.basin.screening import basin_tc_hr
+    from hidropluvial.cli.wizard.runner import _get_c_for_tr_from_basin
+    from hidropluvial.config import AntecedentMoistureCondition
+    from hidropluvial.core.critical import StormBasin
+    from hidropluvial.core.network import NetworkNode, NetworkReach
+    from hidropluvial.core.runoff import adjust_cn_for_amc
+
+    nodes = []
+    for basin in project.basins:
+        method = (runoff or ("racional" if basin.c else "scs-cn")).lower()
+        c_by_tr = {}
+        if method == "racional":
+            if not basin.c:
+                raise ValueError(f"La cuenca '{basin.name}' no tiene coeficiente C")
+            c_by_tr = {t: _get_c_for_tr_from_basin(basin, basin.c, t) for t in return_periods}
+            params = {"c": basin.c}
+        elif method == "scs-cn":
+            if not basin.cn:
+                raise ValueError(f"La cuenca '{basin.name}' no tiene CN")
+            params = {"cn": adjust_cn_for_amc(basin.cn, AntecedentMoistureCondition(amc.upper()))}
+        else:
+            raise ValueError(f"Escorrentía '{runoff}' no soportada (usar racional o scs-cn)")
+
+        reach = project.get_reach(basin.id)
+        nodes.append(NetworkNode(
+            basin=StormBasin(
+                area_ha=basin.area_ha,
+                tc_hr=basin_tc_hr(basin, tc_method.lower(), basin.c, 5.0),
+                p3_10=basin.p3_10,
+                lambda_coef=lambda_coef,
+                name=basin.id,
+                **params,
+            ),
+            downstream=reach.downstream_id if reach else None,
+            reach=NetworkReach(reach.method, reach.lag_min, reach.k_hr, reach.x) if reach else NetworkReach(),
+            c_by_tr=c_by_tr,
+        ))
+    return nodes
+
+
+def project_network(
+    project_id: Annotated[str, typer.Argument(help="ID del proyecto")],
+    family: Annotated[str, typer.Option("--family", "-f", help="Tormenta: blocks, gz, chicago, huff_q1..huff_q4, scs_ii")] = "blocks",
+    tr: Annotated[str, typer.Option("--tr", help="Períodos de retorno (lista o rango)")] = "2,10,25",
+    dt: Annotated[float, typer.Option("--dt", help="Paso de tiempo (min)")] = 5.0,
+    duration: Annotated[Optional[float], typer.Option("--duration", "-d", help="Duración de la tormenta en h (por defecto, el mayor tiempo de llegada a una salida)")] = None,
+    tc_method: Annotated[str, typer.Option("--tc", help="Método de Tc")] = "kirpich",
+    runoff: Annotated[Optional[str], typer.Option("--runoff", help="racional o scs-cn (por defecto según cada cuenca)")] = None,
+    amc: Annotated[str, typer.Option("--amc", help="AMC: I, II, III")] = "II",
+    lambda_coef: Annotated[float, typer.Option("--lambda", help="Coeficiente lambda para Ia (SCS-CN)")] = 0.2,
+    show_all: Annotated[bool, typer.Option("--all", "-a", help="Mostrar y exportar todas las cuencas, no solo las salidas")] = False,
+    output: Annotated[Optional[str], typer.Option("--output", "-o", help="CSV con los hidrogramas combinados")] = None,
+    workers: Annotated[int, typer.Option("--workers", "-w", help="Procesos para los hidrogramas de las subcuencas")] = 1,
+) -> None:
+    """
+    Calcula los hidrogramas combinados de la red de drenaje del proyecto.
+
+    Los hidrogramas de cada cuenca se suman con los transitados desde las
+    cuencas que descargan en ella (tramos definidos con 'hp project link'),
+    en orden aguas abajo, para todos los Tr en una sola pasada.
+
+    Ejemplo:
+        hp project network abc123 --tr 2,10,25,100 --dt 5 -o salida.csv
+    """
+    from rich import box
+    from rich.table import Table
+
+    from hidropluvial.cli.hydrograph import parse_values
+    from hidropluvial.core.network import compute_network
+
+    project = get_project_manager().get_project(project_id)
+    if project is None:
+        print_error(f"Proyecto '{project_id}' no encontrado.")
+        raise typer.Exit(1)
+    if not project.basins:
+        print_error("El proyecto no tiene cuencas para analizar")
+        raise typer.Exit(1)
+
+    try:
+        return_periods = parse_values(tr, int)
+        nodes = _network_nodes(project, return_periods, tc_method, runoff, amc, lambda_coef)
+        result = compute_network(
+            nodes, return_periods, family=family.strip().lower(),
+            duration_hr=duration, dt_min=dt, workers=workers,
+        )
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    names = {basin.id: basin.name for basin in project.basins}
+    areas = {node.name: node.basin.area_ha for node in nodes}
+    for basin_id in result.order:
+        target = result.downstream[basin_id]
+        if target is not None:
+            areas[target] += areas[basin_id]
+    shown = result.order if show_all else result.outlets
+
+    console = get_console()
+    p = get_palette()
+    table = Table(
+        title=f"{project.name} - Red de drenaje ({result.family}, {result.duration_hr:.2f} h, dt {result.dt_min:g} min)",
+        title_style=f"bold {p.primary}",
+        border_style=p.border,
+        header_style=f"bold {p.secondary}",
+        box=box.SIMPLE,
+    )
+    table.add_column("Cuenca", justify="left")
+    table.add_column("Descarga en", justify="left")
+    table.add_column("Área acum. (ha)", justify="right", style=p.number)
+    for t in result.return_periods:
+        table.add_column(f"Qp Tr{t} (m³/s)", justify="right", style=p.number)
+
+    for basin_id in shown:
+        target = result.downstream[basin_id]
+        table.add_row(
+            names[basin_id],
+            names[target] if target else "salida",
+            f"{areas[basin_id]:.1f}",
+            *(f"{q:.3f}" for q in result.peak_flows(basin_id)),
+        )
+    console.print(table)
+    print_info(f"{len(nodes)} cuencas, {len(result.outlets)} salida(s)")
+
+    if output:
+        with open(output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["basin", "basin_id", "tr", "time_hr", "flow_m3s"])
+            for basin_id in shown:
+                time_hr = result.time_hr(basin_id)
+                for i, t in enumerate(result.return_periods):
+                    for time, q in zip(time_hr, result.outflow[basin_id][i]):
+                        writer.writerow([names[basin_id], basin_id, t, f"{time:.4f}", f"{q:.4f}"])
+        print_success(f"Hidrogramas combinados exportados a: {output}")
@@ -321,6 +321,8 @@ def project_report(
 
 def _generate_basin_tikz(basin, basin_dir, hidrogramas_dir, hietogramas_dir) -> dict:
     """Genera gráficos TikZ para una cuenca."""
+    import numpy as np
+
     from hidropluvial.reports.charts import (
         HydrographSeries,
         generate_hydrograph_tikz,
@@ -360,7 +362,7 @@ def _generate_basin_tikz(basin, basin_dir, hidrogramas_dir, hietogramas_dir) ->
             hydro_filename = f"hidrograma_{file_id}.tex"
             hydro_path = hidrogramas_dir / hydro_filename
 
-            time_min_hydro = [t * 60 for t in analysis.hydrograph.time_hr]
+            time_min_hydro = np.asarray(analysis.hydrograph.time_hr) * 60
             x_label = f" X={analysis.hydrograph.x_factor:.2f}" if analysis.hydrograph.x_factor else ""
 
             series = [
@@ -544,84 +546,33 @@ Método Tc & Tormenta & Tr & P (mm) & Qp (m³/s) & Tp (min) & Vol (hm³) \\
 
 def _generate_sec_fichas(basin, generated_files, path_prefix) -> str:
     """Genera sección con fichas individuales de cada análisis."""
-    content = r"""% Sección: Fichas Individuales de Análisis
-% Generado automáticamente por HidroPluvial
+    from hidropluvial.reports.generator import render_template
 
-\subsection{Análisis Individuales}
-
-"""
+    hyetographs = set(generated_files.get("hyetographs", []))
+    hydrographs = set(generated_files.get("hydrographs", []))
 
-    for i, analysis in enumerate(basin.analyses, 1):
+    fichas = []
+    for analysis in basin.analyses:
         hydro = analysis.hydrograph
         storm = analysis.storm
-        tc = analysis.tc
 
-        # Identificador del análisis
+        # Identificador del análisis (mismo que los archivos TikZ)
         x_str = f"_X{hydro.x_factor:.2f}".replace(".", "") if hydro.x_factor else ""
-        file_id = f"{tc.method}_{storm.type}_Tr{storm.return_period}{x_str}"
-
-        # Título de la ficha
-        x_label = f" (X={hydro.x_factor:.2f})" if hydro.x_factor else ""
-        content += f"\\subsubsection{{Análisis {i}: {tc.method.capitalize()} + {storm.type.upper()} Tr={storm.return_period}{x_label}}}\n\n"
-
-        # Tabla de parámetros del análisis
-        content += r"""\begin{table}[H]
-\centering
-\small
-\begin{tabular}{lr}
-\toprule
-Parámetro & Valor \\
-\midrule
-"""
-
-        content += f"Método Tc & {tc.method.capitalize()} \\\\\n"
-        content += f"Tc (min) & {tc.tc_min:.1f} \\\\\n"
-        content += f"Tc (hr) & {tc.tc_hr:.3f} \\\\\n"
-        content += "\\midrule\n"
-        content += f"Tipo tormenta & {storm.type.upper()} \\\\\n"
-        content += f"Período de retorno & {storm.return_period} años \\\\\n"
-        content += f"Precipitación total & {storm.total_depth_mm:.1f} mm \\\\\n"
-        content += f"Duración & {storm.duration_hr * 60:.0f} min \\\\\n"
-        content += "\\midrule\n"
-        content += f"Caudal pico & {hydro.peak_flow_m3s:.3f} m³/s \\\\\n"
-        content += f"Tiempo al pico & {hydro.time_to_peak_min:.1f} min \\\\\n"
-        content += f"Volumen total & {hydro.volume_m3 / 1_000_000:.4f} hm³ \\\\\n"
-
-        if hydro.x_factor:
-            content += f"Factor X & {hydro.x_factor:.2f} \\\\\n"
-
-        content += r"""\bottomrule
-\end{tabular}
-\caption{Parámetros del análisis}
-\end{table}
-
-"""
-
-        # Gráficos (hietograma e hidrograma)
-        hyeto_filename = f"hietograma_{file_id}.tex"
-        hydro_filename = f"hidrograma_{file_id}.tex"
-
-        if hyeto_filename in generated_files.get("hyetographs", []):
-            content += r"""\begin{figure}[H]
-\centering
-"""
-            content += f"\\input{{{path_prefix}hietogramas/{hyeto_filename}}}\n"
-            content += r"""\end{figure}
-
-"""
-
-        if hydro_filename in generated_files.get("hydrographs", []):
-            content += r"""\begin{figure}[H]
-\centering
-"""
-            content += f"\\input{{{path_prefix}hidrogramas/{hydro_filename}}}\n"
-            content += r"""\end{figure}
-
-"""
-
-        content += "\\clearpage\n\n"
+        file_id = f"{analysis.tc.method}_{storm.type}_Tr{storm.return_period}{x_str}"
+
+        figures = []
+        if f"hietograma_{file_id}.tex" in hyetographs:
+            figures.append(f"{path_prefix}hietogramas/hietograma_{file_id}.tex")
+        if f"hidrograma_{file_id}.tex" in hydrographs:
+            figures.append(f"{path_prefix}hidrogramas/hidrograma_{file_id}.tex")
+
+        fichas.append({
+            "analysis": analysis,
+            "x_label": f" (X={hydro.x_factor:.2f})" if hydro.x_factor else "",
+            "figures": figures,
+        })
 
-    return content
+    return render_template("sec_fichas.tex", fichas=fichas)
 
 
 def _generate_project_section(project, basins: list, n_basins: int, n_analyses: int) -> str:
@@ -43,6 +43,7 @@ def report_idf(
     )
 
     # Crear contenido del reporte
+    area_row = f"Área de cuenca & {area} km² \\\\" if area else ""
     content = f"""
 \\section{{Datos de Entrada}}
 
@@ -54,7 +55,7 @@ Parámetro & Valor \\\\
 \\midrule
 Método & DINAGUA Uruguay \\\\
 $P_{{3,10}}$ base & {p3_10} mm \\\\
-{"Área de cuenca & " + str(area) + " km² \\\\" if area else ""}
+{area_row}
 \\bottomrule
 \\end{{tabular}}
 \\caption{{Parámetros de entrada}}
@@ -144,6 +145,7 @@ def report_storm(
     )
 
     # Contenido
+    area_row = f"Área de cuenca & {area} km² \\\\" if area else ""
     content = f"""
 \\section{{Datos de Entrada}}
 
@@ -158,7 +160,7 @@ $P_{{3,10}}$ base & {p3_10} mm \\\\
 Período de retorno & {return_period} años \\\\
 Duración de tormenta & {duration} horas \\\\
 Intervalo $\\Delta t$ & {dt} minutos \\\\
-{"Área de cuenca & " + str(area) + " km² \\\\" if area else ""}
+{area_row}
 \\bottomrule
 \\end{{tabular}}
 \\caption{{Parámetros de entrada}}
@@ -258,7 +258,7 @@ def print_analyses_summary_table(
         show_sparkline: Si mostrar sparklines
         sparkline_width: Ancho del sparkline
     """
-    from hidropluvial.cli.preview import sparkline
+    from hidropluvial.cli.preview import analysis_sparkline
     from hidropluvial.cli.formatters import format_flow
 
     console = get_console()
@@ -359,7 +359,7 @@ def print_analyses_summary_table(
 
         if show_sparkline:
             if hydro.flow_m3s:
-                spark = sparkline(hydro.flow_m3s, width=sparkline_width)
+                spark = analysis_sparkline(analysis, sparkline_width)
                 row.append(Text(spark, style=p.info))
             else:
                 row.append("-")
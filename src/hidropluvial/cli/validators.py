@@ -112,6 +112,25 @@ def validate_length(value: float, exit_on_error: bool = True) -> bool:
     return True
 
 
+def validate_tc(value: float, exit_on_error: bool = True) -> bool:
+    """
+    Valida que el tiempo de concentración sea positivo.
+
+    Args:
+        value: Tc en horas
+        exit_on_error: Si True, termina el programa con error
+
+    Returns:
+        True si es válido, False si no
+    """
+    if value <= 0:
+        print_error(f"Tc debe ser positivo (recibido: {value})")
+        if exit_on_error:
+            raise typer.Exit(1)
+        return False
+    return True
+
+
 def validate_p310(value: float, exit_on_error: bool = True) -> bool:
     """
     Valida que P3,10 esté en rango realista para Uruguay (30-150 mm).
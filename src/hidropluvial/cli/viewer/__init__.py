@@ -6,6 +6,7 @@ Submodulos:
 - components: Componentes de UI (tablas, paneles)
 - filters: Lógica de filtrado de análisis
 - plots: Gráficos con plotext
+- frames: Caché de fichas pre-renderizadas
 """
 
 from hidropluvial.cli.viewer.main import interactive_hydrograph_viewer
@@ -1,11 +1,17 @@
 """
 Lógica de filtrado para el visor interactivo.
 
-Funciones para filtrar análisis por múltiples criterios.
+Funciones para filtrar análisis por múltiples criterios. Los filtros se
+resuelven con un índice de facetas (FacetIndex) que se construye una vez
+por conjunto de análisis: para cada campo guarda valor -> máscara de
+posiciones, de modo que filtrar es intersecar máscaras y los conteos por
+valor salen del índice sin volver a recorrer la lista.
 """
 
-from typing import Optional
+from collections.abc import Sequence
+from typing import Any, Callable, Optional
 
+import numpy as np
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -16,53 +22,152 @@ from hidropluvial.cli.theme import get_palette
 from hidropluvial.cli.viewer.terminal import clear_screen
 
 
+# Campos filtrables y cómo se obtiene su valor de un AnalysisRun
+FACET_FIELDS: dict[str, Callable[[Any], Any]] = {
+    "tc_method": lambda a: a.tc.method,
+    "storm_type": lambda a: a.storm.type,
+    "return_period": lambda a: a.storm.return_period,
+    "x_factor": lambda a: a.hydrograph.x_factor,
+}
+
+
+class AnalysisView(Sequence):
+    """
+    Vista de solo lectura de un subconjunto de análisis.
+
+    Guarda solo las posiciones seleccionadas; no copia los objetos.
+    """
+
+    def __init__(self, analyses: list, positions: np.ndarray):
+        self._analyses = analyses
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return AnalysisView(self._analyses, self._positions[i])
+        return self._analyses[self._positions[i]]
+
+    def __iter__(self):
+        analyses = self._analyses
+        for pos in self._positions.tolist():
+            yield analyses[pos]
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Posiciones de los análisis en la lista original."""
+        return self._positions
+
+
+class FacetIndex:
+    """
+    Índice de facetas sobre una lista de análisis.
+
+    Se construye en una sola pasada. Para cada campo de FACET_FIELDS guarda
+    valor -> máscara booleana de las posiciones que lo tienen.
+
+    Args:
+        analyses: Lista de AnalysisRun
+        fields: Campos a indexar (por defecto todos los de FACET_FIELDS)
+    """
+
+    def __init__(self, analyses: list, fields: Optional[tuple[str, ...]] = None):
+        self.analyses = analyses
+        self.fields = tuple(fields or FACET_FIELDS)
+        n = len(analyses)
+
+        self._masks: dict[str, dict[Any, np.ndarray]] = {}
+        for field in self.fields:
+            getter = FACET_FIELDS[field]
+            positions: dict[Any, list[int]] = {}
+            for i, a in enumerate(analyses):
+                positions.setdefault(getter(a), []).append(i)
+
+            masks = {}
+            for value, idx in positions.items():
+                mask = np.zeros(n, dtype=bool)
+                mask[idx] = True
+                masks[value] = mask
+            self._masks[field] = masks
+
+    def __len__(self) -> int:
+        return len(self.analyses)
+
+    def values(self, field: str) -> list:
+        """
+        Valores distintos de un campo, ordenados como texto.
+
+        El factor X omite los análisis sin factor (None o 0).
+        """
+        values = self._masks[field].keys()
+        if field == "x_factor":
+            values = [v for v in values if v]
+        return sorted(values, key=lambda x: str(x))
+
+    def counts(self, field: str) -> dict:
+        """Cantidad de análisis por valor de un campo."""
+        return {v: int(m.sum()) for v, m in self._masks[field].items()}
+
+    def mask(self, filters: dict) -> np.ndarray:
+        """
+        Máscara de los análisis que cumplen los filtros.
+
+        OR entre los valores de un mismo campo, AND entre campos. Los
+        campos sin valores no filtran.
+        """
+        result = np.ones(len(self.analyses), dtype=bool)
+        for field, values in filters.items():
+            if not values:
+                continue
+            masks = self._masks.get(field, {})
+            selected = np.zeros(len(self.analyses), dtype=bool)
+            for value in values:
+                if value in masks:
+                    selected |= masks[value]
+            result &= selected
+        return result
+
+    def select(self, filters: dict) -> AnalysisView:
+        """Vista con los análisis que cumplen los filtros."""
+        return AnalysisView(self.analyses, np.flatnonzero(self.mask(filters)))
+
+
 def get_unique_values(analyses: list, field: str) -> list:
     """Obtiene valores unicos de un campo en los analisis."""
-    values = set()
-    for a in analyses:
-        if field == "tc_method":
-            values.add(a.tc.method)
-        elif field == "storm_type":
-            values.add(a.storm.type)
-        elif field == "return_period":
-            values.add(a.storm.return_period)
-        elif field == "x_factor":
-            if a.hydrograph.x_factor:
-                values.add(a.hydrograph.x_factor)
-    return sorted(values, key=lambda x: str(x))
-
-
-def filter_analyses(analyses: list, filters: dict) -> list:
-    """Filtra analisis con selección múltiple (OR dentro de cada campo, AND entre campos)."""
-    result = analyses
-
-    for field, values in filters.items():
-        if not values:
-            continue
+    return FacetIndex(analyses, fields=(field,)).values(field)
 
-        if field == "tc_method":
-            result = [a for a in result if a.tc.method in values]
-        elif field == "storm_type":
-            result = [a for a in result if a.storm.type in values]
-        elif field == "return_period":
-            result = [a for a in result if a.storm.return_period in values]
-        elif field == "x_factor":
-            result = [a for a in result if a.hydrograph.x_factor in values]
 
-    return result
+def filter_analyses(analyses: list, filters: dict) -> Sequence:
+    """Filtra analisis con selección múltiple (OR dentro de cada campo, AND entre campos)."""
+    if not any(filters.values()):
+        return analyses
+    return FacetIndex(analyses, fields=tuple(f for f, v in filters.items() if v)).select(filters)
 
 
-def build_filter_summary_table(all_analyses: list, current_filters: dict) -> Table:
+def build_filter_summary_table(
+    all_analyses: list,
+    current_filters: dict,
+    index: Optional[FacetIndex] = None,
+) -> Table:
     """
     Construye tabla normalizada de variables disponibles para filtrar.
-    Variables como columnas, valores como filas.
+    Variables como columnas, valores como filas, con la cantidad de
+    análisis de cada valor.
     """
     p = get_palette()
+    index = index or FacetIndex(all_analyses)
 
-    tc_methods = get_unique_values(all_analyses, "tc_method")
-    storm_types = get_unique_values(all_analyses, "storm_type")
-    return_periods = get_unique_values(all_analyses, "return_period")
-    x_factors = get_unique_values(all_analyses, "x_factor")
+    tc_methods = index.values("tc_method")
+    storm_types = index.values("storm_type")
+    return_periods = index.values("return_period")
+    x_factors = index.values("x_factor")
+
+    tc_counts = index.counts("tc_method")
+    storm_counts = index.counts("storm_type")
+    tr_counts = index.counts("return_period")
+    x_counts = index.counts("x_factor")
 
     # Filtros activos (para marcar)
     active_tc = set(current_filters.get("tc_method", []))
@@ -77,10 +182,10 @@ def build_filter_summary_table(all_analyses: list, current_filters: dict) -> Tab
         padding=(0, 1),
         expand=False,
     )
-    table.add_column("Método Tc", width=12)
-    table.add_column("Tormenta", width=10)
-    table.add_column("TR", width=6, justify="right")
-    table.add_column("Factor X", width=10, justify="right")
+    table.add_column("Método Tc", width=16)
+    table.add_column("Tormenta", width=14)
+    table.add_column("TR", width=10, justify="right")
+    table.add_column("Factor X", width=12, justify="right")
 
     # Determinar número máximo de filas
     max_rows = max(len(tc_methods), len(storm_types), len(return_periods), len(x_factors) or 1)
@@ -90,7 +195,7 @@ def build_filter_summary_table(all_analyses: list, current_filters: dict) -> Tab
         if i < len(tc_methods):
             tc_val = tc_methods[i]
             tc_style = f"bold {p.accent}" if tc_val in active_tc else ""
-            tc_text = Text(tc_val.title(), style=tc_style)
+            tc_text = Text(f"{tc_val.title()} ({tc_counts[tc_val]})", style=tc_style)
         else:
             tc_text = Text("")
 
@@ -98,7 +203,7 @@ def build_filter_summary_table(all_analyses: list, current_filters: dict) -> Tab
         if i < len(storm_types):
             storm_val = storm_types[i]
             storm_style = f"bold {p.accent}" if storm_val in active_storm else ""
-            storm_text = Text(storm_val.upper(), style=storm_style)
+            storm_text = Text(f"{storm_val.upper()} ({storm_counts[storm_val]})", style=storm_style)
         else:
             storm_text = Text("")
 
@@ -106,7 +211,7 @@ def build_filter_summary_table(all_analyses: list, current_filters: dict) -> Tab
         if i < len(return_periods):
             tr_val = return_periods[i]
             tr_style = f"bold {p.accent}" if tr_val in active_tr else ""
-            tr_text = Text(str(tr_val), style=tr_style)
+            tr_text = Text(f"{tr_val} ({tr_counts[tr_val]})", style=tr_style)
         else:
             tr_text = Text("")
 
@@ -114,7 +219,7 @@ def build_filter_summary_table(all_analyses: list, current_filters: dict) -> Tab
         if x_factors and i < len(x_factors):
             x_val = x_factors[i]
             x_style = f"bold {p.accent}" if x_val in active_x else ""
-            x_text = Text(f"{x_val:.2f}", style=x_style)
+            x_text = Text(f"{x_val:.2f} ({x_counts[x_val]})", style=x_style)
         else:
             x_text = Text("-" if i == 0 and not x_factors else "")
 
@@ -123,22 +228,34 @@ def build_filter_summary_table(all_analyses: list, current_filters: dict) -> Tab
     return table
 
 
-def show_filter_menu(console: Console, all_analyses: list, current_filters: dict) -> tuple:
+def show_filter_menu(
+    console: Console,
+    all_analyses: list,
+    current_filters: dict,
+    index: Optional[FacetIndex] = None,
+) -> tuple:
     """
     Muestra menu de filtros con selección múltiple.
-    Retorna los nuevos filtros y lista filtrada.
+    Retorna los nuevos filtros y la vista filtrada.
+
+    Args:
+        console: Consola Rich
+        all_analyses: Lista completa de análisis
+        current_filters: Filtros activos
+        index: Índice de facetas de all_analyses (se construye si falta)
     """
     import questionary
     from questionary import Choice
     from hidropluvial.cli.wizard.styles import get_wizard_style
 
     p = get_palette()
+    index = index or FacetIndex(all_analyses)
 
     # Obtener valores unicos
-    tc_methods = get_unique_values(all_analyses, "tc_method")
-    storm_types = get_unique_values(all_analyses, "storm_type")
-    return_periods = get_unique_values(all_analyses, "return_period")
-    x_factors = get_unique_values(all_analyses, "x_factor")
+    tc_methods = index.values("tc_method")
+    storm_types = index.values("storm_type")
+    return_periods = index.values("return_period")
+    x_factors = index.values("x_factor")
 
     new_filters = {}
 
@@ -146,7 +263,7 @@ def show_filter_menu(console: Console, all_analyses: list, current_filters: dict
     console.print()
 
     # Mostrar tabla resumen
-    summary_table = build_filter_summary_table(all_analyses, current_filters)
+    summary_table = build_filter_summary_table(all_analyses, current_filters, index)
     console.print(Panel(
         summary_table,
         title=Text(" Filtrar Análisis ", style=f"bold {p.primary}"),
@@ -167,7 +284,7 @@ def show_filter_menu(console: Console, all_analyses: list, current_filters: dict
         if action == "Limpiar todos los filtros":
             return {}, all_analyses
         elif action == "Cancelar":
-            return current_filters, filter_analyses(all_analyses, current_filters)
+            return current_filters, index.select(current_filters)
 
     console.print(f"  [dim]Usa ESPACIO para seleccionar, ENTER para confirmar[/dim]")
     console.print()
@@ -177,6 +294,7 @@ def show_filter_menu(console: Console, all_analyses: list, current_filters: dict
         choices = [
             Choice(
                 m.title(),
+                value=m,
                 checked=m in current_filters.get("tc_method", [])
             )
             for m in tc_methods
@@ -187,13 +305,14 @@ def show_filter_menu(console: Console, all_analyses: list, current_filters: dict
             style=get_wizard_style(),
         ).ask()
         if result:
-            new_filters["tc_method"] = [r.lower() for r in result]
+            new_filters["tc_method"] = result
 
     # Filtro por tipo de tormenta
     if len(storm_types) > 1:
         choices = [
             Choice(
                 s.upper(),
+                value=s,
                 checked=s in current_filters.get("storm_type", [])
             )
             for s in storm_types
@@ -204,13 +323,14 @@ def show_filter_menu(console: Console, all_analyses: list, current_filters: dict
             style=get_wizard_style(),
         ).ask()
         if result:
-            new_filters["storm_type"] = [r.lower() for r in result]
+            new_filters["storm_type"] = result
 
     # Filtro por periodo de retorno
     if len(return_periods) > 1:
         choices = [
             Choice(
                 f"TR {tr}",
+                value=tr,
                 checked=tr in current_filters.get("return_period", [])
             )
             for tr in return_periods
@@ -221,13 +341,14 @@ def show_filter_menu(console: Console, all_analyses: list, current_filters: dict
             style=get_wizard_style(),
         ).ask()
         if result:
-            new_filters["return_period"] = [int(r.replace("TR ", "")) for r in result]
+            new_filters["return_period"] = result
 
     # Filtro por factor X
     if len(x_factors) > 1:
         choices = [
             Choice(
                 f"X={x:.2f}",
+                value=x,
                 checked=x in current_filters.get("x_factor", [])
             )
             for x in x_factors
@@ -238,12 +359,10 @@ def show_filter_menu(console: Console, all_analyses: list, current_filters: dict
             style=get_wizard_style(),
         ).ask()
         if result:
-            new_filters["x_factor"] = [float(r.replace("X=", "")) for r in result]
+            new_filters["x_factor"] = result
 
     # Aplicar filtros
-    filtered = filter_analyses(all_analyses, new_filters)
-
-    return new_filters, filtered
+    return new_filters, index.select(new_filters)
 
 
 def format_active_filters(active_filters: dict) -> str:
@@ -0,0 +1,127 @@
+"""
+Caché de fichas pre-renderizadas para el visor interactivo.
+
+Renderizar los gráficos con plotext es lo más costoso de cada ficha. Los
+cuadros se guardan en un caché LRU por análisis y los vecinos del análisis
+actual se generan en segundo plano, de modo que navegar con las flechas
+solo tiene que mostrar un cuadro ya listo.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+from rich.text import Text
+
+
+# Tamaño por defecto del caché (fichas)
+FRAME_CACHE_SIZE = 64
+
+# Vecinos a cada lado del análisis actual que se pre-renderizan
+PREFETCH_RADIUS = 2
+
+
+class FrameCache:
+    """
+    Caché LRU de gráficos renderizados, con pre-renderizado en segundo plano.
+
+    plotext mantiene una figura global, por lo que todos los renderizados
+    (del hilo principal y del hilo de fondo) se serializan con un lock.
+
+    Args:
+        render: Función analysis -> str (texto con códigos ANSI)
+        maxsize: Cantidad máxima de cuadros en memoria
+    """
+
+    def __init__(self, render: Callable[[object], str], maxsize: int = FRAME_CACHE_SIZE):
+        self._render = render
+        self.maxsize = maxsize
+        self._frames: OrderedDict[str, Text] = OrderedDict()
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, analysis_id: str) -> bool:
+        return analysis_id in self._frames
+
+    def get(self, analysis) -> Text:
+        """
+        Obtiene el cuadro del análisis, renderizándolo si hace falta.
+
+        Si el cuadro se está generando en segundo plano, espera ese
+        resultado en lugar de renderizar de nuevo; si ese renderizado
+        falló o se canceló, lo intenta otra vez en este hilo.
+        """
+        with self._lock:
+            frame = self._frames.get(analysis.id)
+            if frame is not None:
+                self._frames.move_to_end(analysis.id)
+                return frame
+            pending = self._pending.get(analysis.id)
+
+        if pending is not None:
+            try:
+                return pending.result()
+            except Exception:
+                pass
+        return self._build(analysis)
+
+    def prefetch(self, analyses: list, current_idx: int, radius: int = PREFETCH_RADIUS) -> None:
+        """
+        Encola en segundo plano los vecinos de current_idx.
+
+        La navegación es circular, así que los vecinos también lo son. Se
+        encolan primero los más cercanos.
+        """
+        n = len(analyses)
+        if n <= 1:
+            return
+
+        offsets = [o for d in range(1, radius + 1) for o in (d, -d)]
+        for offset in offsets:
+            analysis = analyses[(current_idx + offset) % n]
+            with self._lock:
+                if analysis.id in self._frames or analysis.id in self._pending:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="hp-viewer"
+                    )
+                self._pending[analysis.id] = self._executor.submit(self._build, analysis)
+
+    def invalidate(self, analysis_id: str) -> None:
+        """Descarta el cuadro de un análisis (p.ej. tras eliminarlo)."""
+        with self._lock:
+            self._frames.pop(analysis_id, None)
+
+    def close(self) -> None:
+        """Cancela el pre-renderizado pendiente y libera el hilo de fondo."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _build(self, analysis) -> Text:
+        frame = None
+        try:
+            with self._render_lock:
+                frame = Text.from_ansi(self._render(analysis))
+        finally:
+            # También si el renderizado falla: un futuro fallido no debe
+            # quedar en _pending (get() lo re-lanzaría en cada llamada)
+            with self._lock:
+                self._pending.pop(analysis.id, None)
+                if frame is not None:
+                    self._frames[analysis.id] = frame
+                    self._frames.move_to_end(analysis.id)
+                    while len(self._frames) > self.maxsize:
+                        self._frames.popitem(last=False)
+        return frame
@@ -8,22 +8,56 @@ Permite navegar entre análisis usando:
 - e: editar nota del análisis actual
 - d: eliminar análisis actual
 - q/ESC: salir
+
+La pantalla se dibuja con rich.Live sobre la pantalla alternativa: cada
+tecla reemplaza el cuadro en el lugar, sin limpiar la terminal. Los
+gráficos salen de un caché de fichas pre-renderizadas (ver frames.py).
 """
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
 
 from hidropluvial.cli.theme import get_palette
-from hidropluvial.cli.viewer.terminal import clear_screen, get_key
+from hidropluvial.cli.viewer.terminal import get_key, suspend_live
 from hidropluvial.cli.viewer.components import build_analysis_list, build_info_panel
 from hidropluvial.cli.viewer.filters import (
-    filter_analyses,
+    FacetIndex,
     show_filter_menu,
     format_active_filters,
 )
-from hidropluvial.cli.viewer.plots import plot_combined
+from hidropluvial.cli.viewer.frames import FrameCache
+from hidropluvial.cli.viewer.plots import render_combined
+
+
+def _build_nav_text(active_filters: dict, on_edit_note, on_delete) -> Text:
+    """Construye la línea de instrucciones de navegación."""
+    p = get_palette()
+
+    nav_text = Text()
+    nav_text.append("  [", style=p.muted)
+    nav_text.append("←→", style=f"bold {p.primary}")
+    nav_text.append("] Navegar  [", style=p.muted)
+    nav_text.append("f", style=f"bold {p.primary}")
+    nav_text.append("] Filtrar  ", style=p.muted)
+    if active_filters:
+        nav_text.append("[", style=p.muted)
+        nav_text.append("c", style=f"bold {p.primary}")
+        nav_text.append("] Limpiar  ", style=p.muted)
+    if on_edit_note:
+        nav_text.append("[", style=p.muted)
+        nav_text.append("e", style=f"bold {p.primary}")
+        nav_text.append("] Nota  ", style=p.muted)
+    if on_delete:
+        nav_text.append("[", style=p.muted)
+        nav_text.append("d", style=f"bold {p.primary}")
+        nav_text.append("] Eliminar  ", style=p.muted)
+    nav_text.append("[", style=p.muted)
+    nav_text.append("q", style=f"bold {p.primary}")
+    nav_text.append("] Salir", style=p.muted)
+    return nav_text
 
 
 def interactive_hydrograph_viewer(
@@ -66,140 +100,137 @@ def interactive_hydrograph_viewer(
     console = Console()
     p = get_palette()
 
+    # Los gráficos no pueden ser más anchos que la terminal
+    plot_width = max(20, min(width, console.width - 2))
+    frames = FrameCache(
+        lambda a: render_combined(a, width=plot_width, height_hyeto=8, height_hydro=12)
+    )
+
     # Estado del visor
     all_analyses = analyses
     filtered_analyses = analyses
     current_idx = 0
     active_filters = {}
+    facets = FacetIndex(all_analyses)
+
+    live = Live(console=console, screen=True, auto_refresh=False, transient=True)
+    live.start()
+    try:
+        while True:
+            n_analyses = len(filtered_analyses)
+
+            # Manejo de filtros vacíos
+            if n_analyses == 0:
+                live.update(Group(
+                    Text.from_markup("\n  [yellow]No hay análisis que coincidan con los filtros.[/yellow]"),
+                    Text.from_markup("  Presiona [bold]f[/bold] para cambiar filtros o [bold]q[/bold] para salir.\n"),
+                ), refresh=True)
+                key = get_key()
+                if key == 'q' or key == 'esc':
+                    break
+                elif key == 'f':
+                    with suspend_live(live):
+                        active_filters, filtered_analyses = show_filter_menu(
+                            console, all_analyses, active_filters, facets
+                        )
+                    current_idx = 0
+                elif key == 'c' and active_filters:
+                    active_filters = {}
+                    filtered_analyses = all_analyses
+                    current_idx = 0
+                continue
+
+            # Ajustar índice si está fuera de rango
+            if current_idx >= n_analyses:
+                current_idx = n_analyses - 1
+
+            analysis = filtered_analyses[current_idx]
+            parts = []
 
-    while True:
-        clear_screen()
+            # PRIMERO: Lista de análisis (compacta, arriba)
+            if len(all_analyses) > 1:
+                filter_info = format_active_filters(active_filters)
 
-        n_analyses = len(filtered_analyses)
+                title_text = Text()
+                title_text.append(f" {session_name} ", style=f"bold {p.secondary}")
+                title_text.append(f"({n_analyses}/{len(all_analyses)} análisis)", style=p.muted)
+                if filter_info:
+                    title_text.append(filter_info, style=f"italic {p.accent}")
 
-        # Manejo de filtros vacíos
-        if n_analyses == 0:
-            console.print("\n  [yellow]No hay análisis que coincidan con los filtros.[/yellow]")
-            console.print("  Presiona [bold]f[/bold] para cambiar filtros o [bold]q[/bold] para salir.\n")
+                list_table = build_analysis_list(filtered_analyses, current_idx)
+                parts.append(Panel(
+                    list_table,
+                    title=title_text,
+                    title_align="left",
+                    border_style=p.border,
+                    box=box.ROUNDED,
+                    padding=(0, 0),
+                ))
+
+            # SEGUNDO: Panel de información compacto
+            parts.append(build_info_panel(analysis, session_name, current_idx, n_analyses))
+
+            # TERCERO: Gráficos (pre-renderizados en caché)
+            parts.append(frames.get(analysis))
+
+            # Instrucciones de navegación
+            parts.append(_build_nav_text(active_filters, on_edit_note, on_delete))
+
+            live.update(Group(*parts), refresh=True)
+
+            # Preparar los vecinos mientras se espera la tecla
+            frames.prefetch(filtered_analyses, current_idx)
+
+            # Esperar input
             key = get_key()
+
             if key == 'q' or key == 'esc':
                 break
+            elif key == 'left':
+                current_idx = (current_idx - 1) % n_analyses
+            elif key == 'right':
+                current_idx = (current_idx + 1) % n_analyses
             elif key == 'f':
-                active_filters, filtered_analyses = show_filter_menu(
-                    console, all_analyses, active_filters
-                )
+                with suspend_live(live):
+                    active_filters, filtered_analyses = show_filter_menu(
+                        console, all_analyses, active_filters, facets
+                    )
                 current_idx = 0
             elif key == 'c' and active_filters:
+                # Limpiar filtros
                 active_filters = {}
                 filtered_analyses = all_analyses
                 current_idx = 0
-            continue
-
-        # Ajustar índice si está fuera de rango
-        if current_idx >= n_analyses:
-            current_idx = n_analyses - 1
-
-        analysis = filtered_analyses[current_idx]
-
-        # PRIMERO: Lista de análisis (compacta, arriba)
-        if len(all_analyses) > 1:
-            filter_info = format_active_filters(active_filters)
-
-            title_text = Text()
-            title_text.append(f" {session_name} ", style=f"bold {p.secondary}")
-            title_text.append(f"({n_analyses}/{len(all_analyses)} análisis)", style=p.muted)
-            if filter_info:
-                title_text.append(filter_info, style=f"italic {p.accent}")
-
-            list_table = build_analysis_list(filtered_analyses, current_idx)
-            list_panel = Panel(
-                list_table,
-                title=title_text,
-                title_align="left",
-                border_style=p.border,
-                box=box.ROUNDED,
-                padding=(0, 0),
-            )
-            console.print(list_panel)
-
-        # SEGUNDO: Panel de información compacto
-        info_panel = build_info_panel(analysis, session_name, current_idx, n_analyses)
-        console.print(info_panel)
-
-        # TERCERO: Gráficos (reducidos para que quepa todo)
-        plot_combined(
-            analysis,
-            width=width,
-            height_hyeto=8,
-            height_hydro=12,
-        )
-
-        # Instrucciones de navegación
-        nav_text = Text()
-        nav_text.append("  [", style=p.muted)
-        nav_text.append("←→", style=f"bold {p.primary}")
-        nav_text.append("] Navegar  [", style=p.muted)
-        nav_text.append("f", style=f"bold {p.primary}")
-        nav_text.append("] Filtrar  ", style=p.muted)
-        if active_filters:
-            nav_text.append("[", style=p.muted)
-            nav_text.append("c", style=f"bold {p.primary}")
-            nav_text.append("] Limpiar  ", style=p.muted)
-        if on_edit_note:
-            nav_text.append("[", style=p.muted)
-            nav_text.append("e", style=f"bold {p.primary}")
-            nav_text.append("] Nota  ", style=p.muted)
-        if on_delete:
-            nav_text.append("[", style=p.muted)
-            nav_text.append("d", style=f"bold {p.primary}")
-            nav_text.append("] Eliminar  ", style=p.muted)
-        nav_text.append("[", style=p.muted)
-        nav_text.append("q", style=f"bold {p.primary}")
-        nav_text.append("] Salir", style=p.muted)
-        console.print(nav_text)
-
-        # Esperar input
-        key = get_key()
-
-        if key == 'q' or key == 'esc':
-            clear_screen()
-            console.print(f"\n  Visor cerrado. Cuenca: {session_name}\n")
-            break
-        elif key == 'left':
-            current_idx = (current_idx - 1) % n_analyses
-        elif key == 'right':
-            current_idx = (current_idx + 1) % n_analyses
-        elif key == 'f':
-            active_filters, filtered_analyses = show_filter_menu(
-                console, all_analyses, active_filters
-            )
-            current_idx = 0
-        elif key == 'c' and active_filters:
-            # Limpiar filtros
-            active_filters = {}
-            filtered_analyses = all_analyses
-            current_idx = 0
-        elif key == 'e' and on_edit_note:
-            # Editar nota del análisis actual
-            analysis = filtered_analyses[current_idx]
-            current_note = getattr(analysis, 'note', None) or ""
-            new_note = on_edit_note(analysis.id, current_note)
-            if new_note is not None:
-                analysis.note = new_note if new_note else None
-        elif key == 'd' and on_delete:
-            # Eliminar análisis actual
-            analysis = filtered_analyses[current_idx]
-            if on_delete(analysis.id):
-                # Eliminar de ambas listas
-                all_analyses = [a for a in all_analyses if a.id != analysis.id]
-                filtered_analyses = [a for a in filtered_analyses if a.id != analysis.id]
-                # Ajustar índice
-                if current_idx >= len(filtered_analyses):
-                    current_idx = max(0, len(filtered_analyses) - 1)
-                # Si no quedan análisis, salir
-                if not all_analyses:
-                    clear_screen()
-                    console.print("\n  Todos los análisis han sido eliminados.\n")
-                    return all_analyses
+            elif key == 'e' and on_edit_note:
+                # Editar nota del análisis actual
+                current_note = getattr(analysis, 'note', None) or ""
+                with suspend_live(live):
+                    new_note = on_edit_note(analysis.id, current_note)
+                if new_note is not None:
+                    analysis.note = new_note if new_note else None
+            elif key == 'd' and on_delete:
+                # Eliminar análisis actual
+                with suspend_live(live):
+                    deleted = on_delete(analysis.id)
+                if deleted:
+                    frames.invalidate(analysis.id)
+                    # Eliminar y reconstruir el índice de facetas
+                    all_analyses = [a for a in all_analyses if a.id != analysis.id]
+                    facets = FacetIndex(all_analyses)
+                    filtered_analyses = facets.select(active_filters)
+                    # Ajustar índice
+                    if current_idx >= len(filtered_analyses):
+                        current_idx = max(0, len(filtered_analyses) - 1)
+                    # Si no quedan análisis, salir
+                    if not all_analyses:
+                        break
+    finally:
+        live.stop()
+        frames.close()
+
+    if not all_analyses:
+        console.print("\n  Todos los análisis han sido eliminados.\n")
+    else:
+        console.print(f"\n  Visor cerrado. Cuenca: {session_name}\n")
 
     return all_analyses
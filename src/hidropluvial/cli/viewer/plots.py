@@ -1,11 +1,17 @@
 """
 Funciones de gráficos para el visor interactivo.
 
-Usa plotext para gráficos en terminal.
+Usa plotext para gráficos en terminal. Las series se reducen al ancho
+del gráfico antes de plotear con el pipeline de cli/preview.py: la
+terminal no puede mostrar más puntos que columnas (x2 con braille) y
+plotext escala con el largo de la serie.
 """
 
+import numpy as np
 import plotext as plt
 
+from hidropluvial.cli.preview import analysis_hydrograph_points, analysis_hyetograph_bars
+
 
 def plot_combined(
     analysis,
@@ -22,6 +28,27 @@ def plot_combined(
         height_hyeto: Alto del hietograma
         height_hydro: Alto del hidrograma
     """
+    print(render_combined(analysis, width, height_hyeto, height_hydro))
+
+
+def render_combined(
+    analysis,
+    width: int = 70,
+    height_hyeto: int = 8,
+    height_hydro: int = 12,
+) -> str:
+    """
+    Genera hietograma e hidrograma combinados como texto (con códigos ANSI).
+
+    Args:
+        analysis: AnalysisRun con datos de tormenta e hidrograma
+        width: Ancho total del grafico
+        height_hyeto: Alto del hietograma
+        height_hydro: Alto del hidrograma
+
+    Returns:
+        Gráfico renderizado, listo para imprimir
+    """
     hydro = analysis.hydrograph
     storm = analysis.storm
 
@@ -59,8 +86,11 @@ def plot_combined(
             max_time = max(time_values) + dt_min / 60 if time_values else 6
             x_ticks = list(range(0, int(max_time) + 2))
 
-        # Barras con valores numericos
-        plt.bar(time_values, storm.intensity_mmhr, color="cyan")
+        # Barras con valores numericos (a lo sumo una por columna)
+        bar_x, bar_y = analysis_hyetograph_bars(analysis, width)
+        if not use_minutes:
+            bar_x = [t / 60 for t in bar_x]
+        plt.bar(bar_x, bar_y, color="cyan")
 
         plt.xticks(x_ticks, [str(t) for t in x_ticks])
         plt.title(f"Hietograma - P={storm.total_depth_mm:.1f}mm  imax={storm.peak_intensity_mmhr:.1f}mm/h")
@@ -76,10 +106,11 @@ def plot_combined(
     plt.plot_size(width, height_hydro)
 
     if hydro.time_hr and hydro.flow_m3s:
-        plt.plot(list(hydro.time_hr), list(hydro.flow_m3s), marker="braille", color="blue")
+        plot_t, plot_q = analysis_hydrograph_points(analysis, width)
+        plt.plot(plot_t, plot_q, marker="braille", color="blue")
 
         # Marcar pico
-        peak_idx = list(hydro.flow_m3s).index(max(hydro.flow_m3s))
+        peak_idx = int(np.argmax(hydro.flow_m3s))
         peak_q = hydro.flow_m3s[peak_idx]
         peak_t = hydro.time_hr[peak_idx]
         plt.scatter([peak_t], [peak_q], marker="x", color="red")
@@ -97,7 +128,7 @@ def plot_combined(
         plt.title("Hidrograma - Sin datos")
 
     plt.theme("clear")
-    plt.show()
+    return plt.build()
 
 
 def plot_hydrograph(
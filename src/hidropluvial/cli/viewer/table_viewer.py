@@ -3,22 +3,135 @@ Visor interactivo de tabla resumen de análisis.
 
 Permite navegar entre análisis usando:
 - Flechas arriba/abajo: cambiar análisis seleccionado
+- RePág/AvPág, Inicio/Fin: saltar por páginas
+- s: cambiar el orden de la tabla
 - e: editar nota del análisis actual
 - d: eliminar análisis actual
 - Enter: ver ficha detallada del análisis
 - q/ESC: salir
+
+La tabla es virtual: solo se construyen las filas de la ventana visible.
+Las estadísticas de columna y los órdenes se guardan en TableModel hasta
+que cambian los datos; los sparklines salen del caché de cli/preview.py.
 """
 
 from typing import Callable, Optional
 
-from rich.console import Console
+import numpy as np
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.text import Text
 from rich import box
 
 from hidropluvial.cli.theme import get_palette
-from hidropluvial.cli.viewer.terminal import clear_screen, get_key
-from hidropluvial.cli.preview import sparkline
+from hidropluvial.cli.viewer.filters import AnalysisView
+from hidropluvial.cli.viewer.terminal import get_key, suspend_live
+from hidropluvial.cli.preview import analysis_sparkline
+
+
+# Líneas de pantalla ocupadas por encabezado, bordes de tabla e instrucciones
+TABLE_CHROME_LINES = 12
+
+# Órdenes disponibles: nombre -> (etiqueta, clave, descendente)
+SORT_ORDERS: dict[str, tuple[str, Optional[Callable], bool]] = {
+    "original": ("original", None, False),
+    "qp": ("Qp desc.", lambda a: a.hydrograph.peak_flow_m3s, True),
+    "tr": ("Tr", lambda a: a.storm.return_period, False),
+    "tc": ("Método Tc", lambda a: a.tc.method, False),
+}
+
+
+class TableModel:
+    """
+    Datos de la tabla resumen con estadísticas y órdenes en caché.
+
+    Los cachés se invalidan al modificar la lista (ver remove).
+
+    Args:
+        analyses: Lista de AnalysisRun
+    """
+
+    def __init__(self, analyses: list):
+        self.analyses = list(analyses)
+        self._stats: Optional[dict[str, tuple[float, float]]] = None
+        self._orders: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.analyses)
+
+    def column_stats(self) -> dict[str, tuple[float, float]]:
+        """Mínimo y máximo por columna numérica (para destacar valores)."""
+        if self._stats is None:
+            stats = {}
+            if self.analyses:
+                qp = np.fromiter(
+                    (a.hydrograph.peak_flow_m3s for a in self.analyses),
+                    dtype=float, count=len(self.analyses),
+                )
+                stats["qp"] = (float(qp.min()), float(qp.max()))
+            self._stats = stats
+        return self._stats
+
+    @property
+    def max_qp(self) -> float:
+        """Caudal pico máximo de la tabla."""
+        return self.column_stats().get("qp", (0, 0))[1]
+
+    def order(self, sort: str = "original") -> np.ndarray:
+        """Posiciones de los análisis en el orden indicado."""
+        if sort not in self._orders:
+            _, key, descending = SORT_ORDERS[sort]
+            if key is None:
+                positions = list(range(len(self.analyses)))
+            else:
+                # sorted es estable (también con reverse): los empates
+                # mantienen el orden original
+                positions = sorted(
+                    range(len(self.analyses)),
+                    key=lambda i: key(self.analyses[i]),
+                    reverse=descending,
+                )
+            self._orders[sort] = np.asarray(positions, dtype=np.intp)
+        return self._orders[sort]
+
+    def rows(self, sort: str = "original") -> AnalysisView:
+        """Vista de los análisis en el orden indicado (sin copiar objetos)."""
+        return AnalysisView(self.analyses, self.order(sort))
+
+    def sparkline(self, analysis, width: int) -> str:
+        """Sparkline del hidrograma de un análisis (caché compartido de preview)."""
+        return analysis_sparkline(analysis, width)
+
+    def remove(self, analysis_id: str) -> None:
+        """Elimina un análisis e invalida estadísticas y órdenes."""
+        self.analyses = [a for a in self.analyses if a.id != analysis_id]
+        self._stats = None
+        self._orders.clear()
+
+
+def visible_window(n_rows: int, selected: int, page_size: int, start: int = 0) -> tuple[int, int]:
+    """
+    Calcula la ventana de filas visibles que contiene a la seleccionada.
+
+    La ventana solo se desplaza cuando la selección sale de ella.
+
+    Args:
+        n_rows: Total de filas
+        selected: Fila seleccionada
+        page_size: Filas visibles
+        start: Inicio de la ventana anterior
+
+    Returns:
+        Tupla (inicio, fin) con fin exclusivo
+    """
+    page_size = max(1, page_size)
+    if selected < start:
+        start = selected
+    elif selected >= start + page_size:
+        start = selected - page_size + 1
+    start = max(0, min(start, n_rows - page_size))
+    return start, min(n_rows, start + page_size)
 
 
 def build_interactive_table(
@@ -26,15 +139,22 @@ def build_interactive_table(
     selected_idx: int,
     title: str = "RESUMEN DE ANÁLISIS",
     sparkline_width: int = 12,
+    window: Optional[tuple[int, int]] = None,
+    model: Optional[TableModel] = None,
+    labels: Optional[list[int]] = None,
 ) -> Table:
     """
     Construye tabla resumen con fila seleccionada destacada.
 
     Args:
-        analyses: Lista de AnalysisRun
+        analyses: Secuencia de AnalysisRun (en el orden a mostrar)
         selected_idx: Índice de fila seleccionada
         title: Título de la tabla
         sparkline_width: Ancho del sparkline
+        window: Filas (inicio, fin) a construir; por defecto todas
+        model: TableModel con estadísticas y sparklines en caché
+        labels: Número a mostrar en la columna # de cada fila (por defecto
+            su posición)
 
     Returns:
         Rich Table
@@ -42,6 +162,8 @@ def build_interactive_table(
     from hidropluvial.cli.formatters import format_flow
 
     p = get_palette()
+    model = model or TableModel(analyses)
+    start, end = window or (0, len(analyses))
 
     table = Table(
         title=title,
@@ -66,10 +188,12 @@ def build_interactive_table(
     table.add_column("Qp", justify="right")
     table.add_column("Hidrograma", justify="left")
 
-    # Encontrar Qp máximo
-    max_qp = max(a.hydrograph.peak_flow_m3s for a in analyses) if analyses else 0
+    # Qp máximo (para destacar), calculado una vez por modelo
+    max_qp = model.max_qp
 
-    for idx, analysis in enumerate(analyses):
+    for idx in range(start, end):
+        analysis = analyses[idx]
+        label = labels[idx] if labels is not None else idx
         hydro = analysis.hydrograph
         storm = analysis.storm
         tc = analysis.tc
@@ -100,7 +224,7 @@ def build_interactive_table(
         qp_str = format_flow(qp_val)
 
         # Sparkline
-        spark = sparkline(hydro.flow_m3s, width=sparkline_width) if hydro.flow_m3s else "-"
+        spark = model.sparkline(analysis, sparkline_width)
 
         # Determinar estilo de la fila
         is_selected = idx == selected_idx
@@ -109,7 +233,7 @@ def build_interactive_table(
         if is_selected:
             # Fila seleccionada: fondo destacado
             row_style = f"bold reverse {p.primary}"
-            idx_text = Text(f">{idx}", style=row_style)
+            idx_text = Text(f">{label}", style=row_style)
             tc_method_text = Text(tc.method[:12], style=row_style)
             tc_text = Text(tc_min, style=row_style)
             x_text = Text(x_str, style=row_style)
@@ -122,7 +246,7 @@ def build_interactive_table(
             spark_text = Text(spark, style=row_style)
         else:
             # Fila normal
-            idx_text = Text(str(idx), style=p.muted)
+            idx_text = Text(str(label), style=p.muted)
             tc_method_text = Text(tc.method[:12])
             tc_text = Text(tc_min, style=p.number)
             x_text = Text(x_str, style=p.number)
@@ -163,6 +287,8 @@ def interactive_table_viewer(
 
     Navegación:
     - Flechas arriba/abajo: cambiar análisis seleccionado
+    - RePág/AvPág, Inicio/Fin: saltar por páginas
+    - s: cambiar el orden (original, Qp, Tr, método Tc)
     - e: editar nota del análisis actual
     - d: eliminar análisis actual
     - Enter: ver ficha detallada
@@ -173,7 +299,8 @@ def interactive_table_viewer(
         session_name: Nombre de la cuenca/sesión
         on_edit_note: Callback(analysis_id, current_note) -> new_note
         on_delete: Callback(analysis_id) -> bool
-        on_view_detail: Callback(index) para ver detalle
+        on_view_detail: Callback(index) para ver detalle (índice en la
+            lista original)
 
     Returns:
         Lista actualizada de análisis
@@ -185,99 +312,136 @@ def interactive_table_viewer(
     console = Console()
     p = get_palette()
 
-    all_analyses = list(analyses)
+    model = TableModel(analyses)
+    sort_names = list(SORT_ORDERS)
+    sort = "original"
     current_idx = 0
+    window_start = 0
+
+    live = Live(console=console, screen=True, auto_refresh=False, transient=True)
+    live.start()
+    try:
+        while True:
+            n_analyses = len(model)
+
+            if n_analyses == 0:
+                live.update(Group(
+                    Text.from_markup("\n  [yellow]No quedan análisis.[/yellow]"),
+                    Text.from_markup("  Presiona [bold]q[/bold] para salir.\n"),
+                ), refresh=True)
+                key = get_key()
+                if key == 'q' or key == 'esc':
+                    break
+                continue
+
+            # Ajustar índice si está fuera de rango
+            if current_idx >= n_analyses:
+                current_idx = n_analyses - 1
+
+            rows = model.rows(sort)
+            positions = model.order(sort)
+            page_size = max(3, console.height - TABLE_CHROME_LINES)
+            window_start, window_end = visible_window(
+                n_analyses, current_idx, page_size, window_start
+            )
+
+            # Encabezado
+            header_text = Text()
+            header_text.append(f"\n  {session_name} ", style=f"bold {p.secondary}")
+            header_text.append(f"({n_analyses} análisis)", style=p.muted)
+            header_text.append(
+                f"  filas {window_start + 1}-{window_end}  orden: {SORT_ORDERS[sort][0]}\n",
+                style=p.muted,
+            )
+
+            # Tabla con fila seleccionada (solo la ventana visible)
+            table = build_interactive_table(
+                rows,
+                current_idx,
+                title=f"Tabla Resumen - {session_name}",
+                window=(window_start, window_end),
+                model=model,
+                labels=positions,
+            )
+
+            # Información del análisis seleccionado
+            analysis = rows[current_idx]
+            info_text = Text()
+            info_text.append("\n  Seleccionado: ", style=p.muted)
+            info_text.append(f"[{positions[current_idx]}] ", style=f"bold {p.primary}")
+            info_text.append(f"{analysis.hydrograph.tc_method} ", style="bold")
+            info_text.append(f"{analysis.storm.type} Tr{analysis.storm.return_period}")
+            if analysis.note:
+                info_text.append(f" - Nota: {analysis.note[:40]}...", style=f"italic {p.muted}")
+
+            # Instrucciones de navegación
+            nav_text = Text()
+            nav_text.append("\n  [", style=p.muted)
+            nav_text.append("↑↓", style=f"bold {p.primary}")
+            nav_text.append("] Navegar  ", style=p.muted)
+            nav_text.append("[", style=p.muted)
+            nav_text.append("RePág/AvPág", style=f"bold {p.primary}")
+            nav_text.append("] Página  ", style=p.muted)
+            nav_text.append("[", style=p.muted)
+            nav_text.append("s", style=f"bold {p.primary}")
+            nav_text.append("] Ordenar  ", style=p.muted)
+            nav_text.append("[", style=p.muted)
+            nav_text.append("Enter", style=f"bold {p.primary}")
+            nav_text.append("] Ver ficha  ", style=p.muted)
+            if on_edit_note:
+                nav_text.append("[", style=p.muted)
+                nav_text.append("e", style=f"bold {p.primary}")
+                nav_text.append("] Nota  ", style=p.muted)
+            if on_delete:
+                nav_text.append("[", style=p.muted)
+                nav_text.append("d", style=f"bold {p.primary}")
+                nav_text.append("] Eliminar  ", style=p.muted)
+            nav_text.append("[", style=p.muted)
+            nav_text.append("q", style=f"bold {p.primary}")
+            nav_text.append("] Salir", style=p.muted)
 
-    while True:
-        clear_screen()
-
-        n_analyses = len(all_analyses)
+            live.update(Group(header_text, table, info_text, nav_text), refresh=True)
 
-        if n_analyses == 0:
-            console.print("\n  [yellow]No quedan análisis.[/yellow]")
-            console.print("  Presiona [bold]q[/bold] para salir.\n")
+            # Esperar input
             key = get_key()
+
             if key == 'q' or key == 'esc':
                 break
-            continue
-
-        # Ajustar índice si está fuera de rango
-        if current_idx >= n_analyses:
-            current_idx = n_analyses - 1
-
-        # Encabezado
-        console.print()
-        header_text = Text()
-        header_text.append(f"  {session_name} ", style=f"bold {p.secondary}")
-        header_text.append(f"({n_analyses} análisis)", style=p.muted)
-        console.print(header_text)
-        console.print()
-
-        # Tabla con fila seleccionada
-        table = build_interactive_table(
-            all_analyses,
-            current_idx,
-            title=f"Tabla Resumen - {session_name}",
-        )
-        console.print(table)
-
-        # Información del análisis seleccionado
-        analysis = all_analyses[current_idx]
-        console.print()
-        info_text = Text()
-        info_text.append("  Seleccionado: ", style=p.muted)
-        info_text.append(f"[{current_idx}] ", style=f"bold {p.primary}")
-        info_text.append(f"{analysis.hydrograph.tc_method} ", style="bold")
-        info_text.append(f"{analysis.storm.type} Tr{analysis.storm.return_period}")
-        if analysis.note:
-            info_text.append(f" - Nota: {analysis.note[:40]}...", style=f"italic {p.muted}")
-        console.print(info_text)
-
-        # Instrucciones de navegación
-        nav_text = Text()
-        nav_text.append("\n  [", style=p.muted)
-        nav_text.append("↑↓", style=f"bold {p.primary}")
-        nav_text.append("] Navegar  ", style=p.muted)
-        nav_text.append("[", style=p.muted)
-        nav_text.append("Enter", style=f"bold {p.primary}")
-        nav_text.append("] Ver ficha  ", style=p.muted)
-        if on_edit_note:
-            nav_text.append("[", style=p.muted)
-            nav_text.append("e", style=f"bold {p.primary}")
-            nav_text.append("] Nota  ", style=p.muted)
-        if on_delete:
-            nav_text.append("[", style=p.muted)
-            nav_text.append("d", style=f"bold {p.primary}")
-            nav_text.append("] Eliminar  ", style=p.muted)
-        nav_text.append("[", style=p.muted)
-        nav_text.append("q", style=f"bold {p.primary}")
-        nav_text.append("] Salir", style=p.muted)
-        console.print(nav_text)
-
-        # Esperar input
-        key = get_key()
-
-        if key == 'q' or key == 'esc':
-            clear_screen()
-            console.print(f"\n  Tabla cerrada. Cuenca: {session_name}\n")
-            break
-        elif key == 'up':
-            current_idx = (current_idx - 1) % n_analyses
-        elif key == 'down':
-            current_idx = (current_idx + 1) % n_analyses
-        elif key == 'enter' and on_view_detail:
-            on_view_detail(current_idx)
-        elif key == 'e' and on_edit_note:
-            analysis = all_analyses[current_idx]
-            current_note = getattr(analysis, 'note', None) or ""
-            new_note = on_edit_note(analysis.id, current_note)
-            if new_note is not None:
-                analysis.note = new_note if new_note else None
-        elif key == 'd' and on_delete:
-            analysis = all_analyses[current_idx]
-            if on_delete(analysis.id):
-                all_analyses = [a for a in all_analyses if a.id != analysis.id]
-                if current_idx >= len(all_analyses):
-                    current_idx = max(0, len(all_analyses) - 1)
-
-    return all_analyses
+            elif key == 'up':
+                current_idx = (current_idx - 1) % n_analyses
+            elif key == 'down':
+                current_idx = (current_idx + 1) % n_analyses
+            elif key == 'pgup':
+                current_idx = max(0, current_idx - page_size)
+            elif key == 'pgdn':
+                current_idx = min(n_analyses - 1, current_idx + page_size)
+            elif key == 'home':
+                current_idx = 0
+            elif key == 'end':
+                current_idx = n_analyses - 1
+            elif key == 's':
+                # Mantener seleccionado el mismo análisis en el nuevo orden
+                position = positions[current_idx]
+                sort = sort_names[(sort_names.index(sort) + 1) % len(sort_names)]
+                current_idx = int(np.flatnonzero(model.order(sort) == position)[0])
+            elif key == 'enter' and on_view_detail:
+                with suspend_live(live):
+                    on_view_detail(int(positions[current_idx]))
+            elif key == 'e' and on_edit_note:
+                current_note = getattr(analysis, 'note', None) or ""
+                with suspend_live(live):
+                    new_note = on_edit_note(analysis.id, current_note)
+                if new_note is not None:
+                    analysis.note = new_note if new_note else None
+            elif key == 'd' and on_delete:
+                with suspend_live(live):
+                    deleted = on_delete(analysis.id)
+                if deleted:
+                    model.remove(analysis.id)
+                    if current_idx >= len(model):
+                        current_idx = max(0, len(model) - 1)
+    finally:
+        live.stop()
+
+    console.print(f"\n  Tabla cerrada. Cuenca: {session_name}\n")
+    return model.analyses
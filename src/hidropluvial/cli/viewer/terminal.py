@@ -6,6 +6,7 @@ Funciones para limpiar pantalla y capturar teclas.
 
 import os
 import sys
+from contextlib import contextmanager
 
 
 def clear_screen() -> None:
@@ -23,6 +24,8 @@ def get_key() -> str:
         - 'right': flecha derecha
         - 'up': flecha arriba
         - 'down': flecha abajo
+        - 'pgup' / 'pgdn': re pág / av pág
+        - 'home' / 'end': inicio / fin
         - 'q': tecla q
         - 'esc': tecla escape
         - 'enter': tecla enter
@@ -43,6 +46,14 @@ def get_key() -> str:
                 return 'up'
             elif key2 == b'P':
                 return 'down'
+            elif key2 == b'I':
+                return 'pgup'
+            elif key2 == b'Q':
+                return 'pgdn'
+            elif key2 == b'G':
+                return 'home'
+            elif key2 == b'O':
+                return 'end'
         elif key == b'\x1b':  # ESC
             return 'esc'
         elif key == b'q' or key == b'Q':
@@ -82,6 +93,14 @@ def get_key() -> str:
                         return 'up'
                     elif key3 == 'B':
                         return 'down'
+                    elif key3 == 'H':
+                        return 'home'
+                    elif key3 == 'F':
+                        return 'end'
+                    elif key3 and key3 in '1456':
+                        # Secuencias ESC [ n ~
+                        if sys.stdin.read(1) == '~':
+                            return {'1': 'home', '4': 'end', '5': 'pgup', '6': 'pgdn'}[key3]
                 return 'esc'
             elif key == 'q' or key == 'Q':
                 return 'q'
@@ -99,3 +118,18 @@ def get_key() -> str:
             return key
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+@contextmanager
+def suspend_live(live):
+    """
+    Detiene un rich.Live mientras se muestran menús o prompts externos.
+
+    Args:
+        live: Instancia de rich.live.Live en curso
+    """
+    live.stop()
+    try:
+        yield
+    finally:
+        live.start(refresh=True)
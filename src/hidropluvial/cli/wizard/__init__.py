@@ -4,6 +4,8 @@ Wizard - Asistente interactivo para analisis hidrologicos.
 Estructura:
 - config.py: Clase WizardConfig para recolectar datos
 - runner.py: Clase AnalysisRunner para ejecutar analisis
+- progress.py: Progreso, cancelacion y reanudacion de ejecuciones
+- speculative.py: Calculo anticipado mientras se completa el wizard
 - menus.py: Menus interactivos post-ejecucion
 - main.py: Punto de entrada principal
 """
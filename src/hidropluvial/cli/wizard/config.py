@@ -3,7 +3,7 @@ WizardConfig - Recolecta datos de cuenca y parametros de analisis.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 import questionary
@@ -20,6 +20,9 @@ from hidropluvial.cli.theme import (
     print_error,
 )
 
+if TYPE_CHECKING:
+    from hidropluvial.cli.wizard.speculative import SpeculativeRun
+
 
 @dataclass
 class WizardConfig:
@@ -67,18 +70,29 @@ class WizardConfig:
     output_name: Optional[str] = None
 
     @classmethod
-    def from_wizard(cls) -> Optional["WizardConfig"]:
-        """Recolecta datos interactivamente con navegación."""
+    def from_wizard(cls, speculative: Optional["SpeculativeRun"] = None) -> Optional["WizardConfig"]:
+        """
+        Recolecta datos interactivamente con navegación.
+
+        Args:
+            speculative: Si se indica, se le notifica el estado tras cada
+                paso para que empiece a calcular en segundo plano
+        """
         from hidropluvial.cli.wizard.steps import WizardNavigator
 
-        navigator = WizardNavigator()
+        on_step_done = speculative.update if speculative else None
+        navigator = WizardNavigator(on_step_done=on_step_done)
         state = navigator.run()
 
         if state is None:
             return None
 
-        # Convertir WizardState a WizardConfig
-        config = cls(
+        return cls.from_state(state)
+
+    @classmethod
+    def from_state(cls, state) -> "WizardConfig":
+        """Convierte un WizardState a WizardConfig."""
+        return cls(
             nombre=state.nombre,
             area_ha=state.area_ha,
             slope_pct=state.slope_pct,
@@ -108,8 +122,6 @@ class WizardConfig:
             output_name=state.output_name,
         )
 
-        return config
-
     @classmethod
     def from_wizard_legacy(cls) -> Optional["WizardConfig"]:
         """Recolecta datos interactivamente (versión sin navegación)."""
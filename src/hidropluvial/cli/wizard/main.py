@@ -10,11 +10,13 @@ import questionary
 from hidropluvial.cli.wizard.styles import WIZARD_STYLE, print_banner, get_console
 from hidropluvial.cli.wizard.config import WizardConfig
 from hidropluvial.cli.wizard.runner import AnalysisRunner
+from hidropluvial.cli.wizard.speculative import SpeculativeRun
 from hidropluvial.cli.wizard.menus import (
     PostExecutionMenu,
     continue_project_menu,
     manage_projects_menu,
 )
+from hidropluvial.models import Basin
 from hidropluvial.project import Project, get_project_manager
 from hidropluvial.cli.theme import (
     print_header, print_section, print_success, print_warning,
@@ -75,35 +77,67 @@ def _new_basin() -> None:
 
     print_success(f"Proyecto seleccionado: {project.name} [{project.id}]")
 
-    # Recolectar configuracion de la cuenca
-    config = WizardConfig.from_wizard()
-    if config is None:
-        raise typer.Exit()
+    # Recolectar configuracion de la cuenca; los analisis se calculan en
+    # segundo plano mientras se completan las ultimas preguntas
+    speculative = SpeculativeRun()
+    try:
+        config = WizardConfig.from_wizard(speculative)
+        if config is None:
+            raise typer.Exit()
 
-    # Mostrar resumen y confirmar
-    config.print_summary()
+        # Mostrar resumen y confirmar
+        config.print_summary()
 
-    confirmar = questionary.confirm(
-        "\nEjecutar analisis?",
-        default=True,
-        style=WIZARD_STYLE,
-    ).ask()
+        confirmar = questionary.confirm(
+            "\nEjecutar analisis?",
+            default=True,
+            style=WIZARD_STYLE,
+        ).ask()
 
-    if not confirmar:
-        print_warning("Operacion cancelada")
-        raise typer.Exit()
+        if not confirmar:
+            print_warning("Operacion cancelada")
+            raise typer.Exit()
 
-    # Ejecutar con el proyecto seleccionado
-    print_header("EJECUTANDO ANALISIS")
+        # Ejecutar con el proyecto seleccionado
+        print_header("EJECUTANDO ANALISIS")
 
-    runner = AnalysisRunner(config, project_id=project.id)
-    project, basin = runner.run()
+        project, basin = _run_analyses(config, project, speculative)
+    finally:
+        speculative.close()
 
     # Menu post-ejecucion
     menu = PostExecutionMenu(project, basin, config.c, config.cn, config.length_m)
     menu.show()
 
 
+def _run_analyses(
+    config: WizardConfig, project: Project, speculative: SpeculativeRun
+) -> tuple[Project, Basin]:
+    """
+    Ejecuta los análisis de la cuenca con barra de progreso.
+
+    Si el usuario cancela (Ctrl+C), los análisis terminados quedan
+    guardados y se ofrece reanudar los pendientes.
+    """
+    runner = AnalysisRunner(config, project_id=project.id, speculative=speculative)
+    project, basin = runner.run()
+
+    while runner.cancelled:
+        reanudar = questionary.confirm(
+            "Reanudar los analisis pendientes?",
+            default=True,
+            style=WIZARD_STYLE,
+        ).ask()
+        if not reanudar:
+            print_info(f"Cuenca guardada con {len(basin.analyses)} analisis")
+            break
+
+        runner = AnalysisRunner(config, project_id=project.id, resume_basin_id=basin.id)
+        project, basin = runner.run()
+
+    return project, basin
+
+
 def _select_or_create_project_for_basin() -> Optional[Project]:
     """Permite seleccionar un proyecto existente o crear uno nuevo para la cuenca."""
     project_manager = get_project_manager()
@@ -275,29 +309,32 @@ def _add_basin_to_project(project: Project) -> None:
     """Agrega una nueva cuenca al proyecto usando el wizard."""
     print_info(f"Agregando cuenca al proyecto: {project.name}")
 
-    # Recolectar configuracion
-    config = WizardConfig.from_wizard()
-    if config is None:
-        return
+    # Recolectar configuracion (con calculo anticipado en segundo plano)
+    speculative = SpeculativeRun()
+    try:
+        config = WizardConfig.from_wizard(speculative)
+        if config is None:
+            return
 
-    # Mostrar resumen y confirmar
-    config.print_summary()
+        # Mostrar resumen y confirmar
+        config.print_summary()
 
-    confirmar = questionary.confirm(
-        "\nEjecutar analisis?",
-        default=True,
-        style=WIZARD_STYLE,
-    ).ask()
+        confirmar = questionary.confirm(
+            "\nEjecutar analisis?",
+            default=True,
+            style=WIZARD_STYLE,
+        ).ask()
 
-    if not confirmar:
-        print_warning("Operacion cancelada")
-        return
+        if not confirmar:
+            print_warning("Operacion cancelada")
+            return
 
-    # Ejecutar con el proyecto existente
-    print_header("EJECUTANDO ANALISIS")
+        # Ejecutar con el proyecto existente
+        print_header("EJECUTANDO ANALISIS")
 
-    runner = AnalysisRunner(config, project_id=project.id)
-    updated_project, basin = runner.run()
+        updated_project, basin = _run_analyses(config, project, speculative)
+    finally:
+        speculative.close()
 
     print_success(f"Cuenca '{basin.name}' agregada al proyecto '{project.name}'")
 
@@ -0,0 +1,202 @@
+"""
+Progreso y cancelación de ejecuciones largas de análisis.
+
+Los runners emiten ProgressEvent a un callback (por defecto, una barra de
+progreso de rich) y consultan un CancelToken entre análisis. Cancelar (o
+Ctrl+C) detiene la ejecución al terminar el análisis en curso y conserva
+los resultados ya calculados.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional
+
+
+# ============================================================================
+# Eventos y cancelación
+# ============================================================================
+
+@dataclass
+class ProgressEvent:
+    """
+    Estado de una ejecución en curso.
+
+    Attributes:
+        stage: Etapa actual ("tc", "analisis", "guardado", ...)
+        done: Análisis terminados (incluye los reanudados)
+        total: Análisis totales de la ejecución
+        elapsed_s: Segundos desde el inicio
+        eta_s: Segundos restantes estimados (None sin datos suficientes)
+        stage_times: Segundos acumulados por etapa
+        label: Descripción del último análisis terminado
+    """
+    stage: str
+    done: int
+    total: int
+    elapsed_s: float
+    eta_s: Optional[float] = None
+    stage_times: dict[str, float] = field(default_factory=dict)
+    label: str = ""
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class CancelToken:
+    """Señal de cancelación cooperativa (se puede activar desde otro hilo)."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class ProgressTracker:
+    """
+    Cuenta análisis terminados, mide tiempos por etapa y estima el ETA.
+
+    El ETA se calcula con el ritmo de los análisis ejecutados en esta
+    corrida; los reanudados (ya guardados) cuentan como hechos pero no
+    entran en el ritmo.
+
+    Args:
+        total: Análisis totales
+        on_progress: Callback que recibe cada ProgressEvent
+        cancel: Token de cancelación
+        done: Análisis ya completados antes de empezar (reanudación)
+    """
+
+    def __init__(
+        self,
+        total: int,
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancelToken] = None,
+        done: int = 0,
+    ):
+        self.total = total
+        self.done = done
+        self.on_progress = on_progress
+        self.cancel_token = cancel
+        self.stage_times: dict[str, float] = {}
+        self.interrupted = False
+        self._resumed = done
+        self._stage = ""
+        self._start = time.perf_counter()
+        self._run_time = 0.0
+
+    @property
+    def elapsed_s(self) -> float:
+        return time.perf_counter() - self._start
+
+    @property
+    def cancelled(self) -> bool:
+        """True si se pidió cancelar (token o Ctrl+C)."""
+        return self.interrupted or bool(self.cancel_token and self.cancel_token.cancelled)
+
+    def set_total(self, total: int, done: int = 0) -> None:
+        """Fija el total (una vez planificada la ejecución) y los ya completados."""
+        self.total = total
+        self.done = done
+        self._resumed = done
+
+    def eta_s(self) -> Optional[float]:
+        """Segundos restantes estimados según el ritmo actual."""
+        ran = self.done - self._resumed
+        if ran <= 0 or self._run_time <= 0:
+            return None
+        return (self._run_time / ran) * (self.total - self.done)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Acumula el tiempo de una etapa y la informa al empezar."""
+        previous, self._stage = self._stage, name
+        start = time.perf_counter()
+        self.emit()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stage_times[name] = self.stage_times.get(name, 0.0) + elapsed
+            self._stage = previous
+
+    @contextmanager
+    def step(self, label: str = "") -> Iterator[None]:
+        """Mide un análisis; al terminar avanza el contador y emite un evento."""
+        start = time.perf_counter()
+        yield
+        self._run_time += time.perf_counter() - start
+        self.done += 1
+        self.emit(label)
+
+    def emit(self, label: str = "") -> None:
+        if self.on_progress is None:
+            return
+        self.on_progress(ProgressEvent(
+            stage=self._stage,
+            done=self.done,
+            total=self.total,
+            elapsed_s=self.elapsed_s,
+            eta_s=self.eta_s(),
+            stage_times=dict(self.stage_times),
+            label=label,
+        ))
+
+
+# ============================================================================
+# Barra de progreso
+# ============================================================================
+
+def _format_eta(eta_s: Optional[float]) -> str:
+    if eta_s is None:
+        return "--:--"
+    minutes, seconds = divmod(int(round(eta_s)), 60)
+    return f"{minutes:d}:{seconds:02d}"
+
+
+@contextmanager
+def progress_bar(description: str = "Analisis") -> Iterator[ProgressCallback]:
+    """
+    Barra de progreso de rich que consume ProgressEvent.
+
+    Uso:
+        with progress_bar() as on_progress:
+            runner.run(on_progress=on_progress)
+    """
+    from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn
+
+    from hidropluvial.cli.theme import get_console
+
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        TextColumn("ETA {task.fields[eta]}"),
+        TextColumn("{task.fields[label]}", style="dim"),
+        console=get_console(),
+        transient=True,
+    )
+    task = progress.add_task(description, total=None, eta=_format_eta(None), label="")
+
+    def on_progress(event: ProgressEvent) -> None:
+        progress.update(
+            task,
+            total=event.total,
+            completed=event.done,
+            eta=_format_eta(event.eta_s),
+            label=event.label,
+        )
+
+    with progress:
+        yield on_progress
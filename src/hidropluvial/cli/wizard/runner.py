@@ -2,17 +2,27 @@
 AnalysisRunner - Ejecuta analisis hidrologicos.
 """
 
-from typing import Optional, Tuple
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import numpy as np
 import typer
 
+from hidropluvial.cache import ResultCache, get_result_cache
 from hidropluvial.cli.wizard.config import WizardConfig
+from hidropluvial.cli.wizard.progress import (
+    CancelToken,
+    ProgressCallback,
+    ProgressTracker,
+    progress_bar,
+)
 from hidropluvial.cli.theme import (
     get_console,
     get_palette,
     print_success,
     print_info,
+    print_warning,
     print_section,
     print_completion_banner,
     print_result_row,
@@ -52,8 +62,41 @@ from hidropluvial.models import (
     HydrographResult,
     AnalysisRun,
 )
+from hidropluvial.precision import store_series
 from hidropluvial.project import Project, get_project_manager
 
+if TYPE_CHECKING:
+    from hidropluvial.cli.wizard.speculative import SpeculativeRun
+
+
+# Intervalo mínimo entre guardados parciales del proyecto (segundos)
+CHECKPOINT_INTERVAL_S = 10.0
+
+
+def analysis_key(
+    tc_method: str, storm_code: str, tr: int, x: Optional[float], runoff_method: str
+) -> tuple:
+    """
+    Identifica una combinación de análisis (para reanudar sin repetir).
+
+    El factor X solo distingue análisis de la tormenta GZ.
+    """
+    return (tc_method, storm_code, tr, x if storm_code == "gz" else None, runoff_method)
+
+
+def _existing_keys(basin: Basin) -> set[tuple]:
+    """Combinaciones ya calculadas en una cuenca."""
+    return {
+        analysis_key(
+            a.tc.method,
+            a.storm.type,
+            a.storm.return_period,
+            a.hydrograph.x_factor,
+            a.tc.parameters.get("runoff_method", "racional"),
+        )
+        for a in basin.analyses
+    }
+
 
 def _get_amc_enum(amc_str: str) -> AntecedentMoistureCondition:
     """Convierte string AMC a enum."""
@@ -115,10 +158,240 @@ def _get_c_for_tr_from_basin(basin: Basin, c_base: float, tr: int) -> float:
     return adjust_c_for_tr(c_base, tr, base_tr=2)
 
 
+def _storm_params(storm_code: str, source) -> dict:
+    """
+    Parámetros propios de la tormenta que afectan el hietograma.
+
+    Args:
+        storm_code: Código de tormenta
+        source: Objeto con los atributos bimodal_* y custom_* (WizardConfig
+            o AdditionalAnalysisRunner)
+    """
+    if storm_code == "bimodal":
+        names = ("bimodal_peak1", "bimodal_peak2", "bimodal_vol_split", "bimodal_peak_width")
+    elif storm_code == "custom":
+        names = ("custom_depth_mm", "custom_distribution", "custom_hyetograph_time", "custom_hyetograph_depth")
+    else:
+        return {}
+    return {name: getattr(source, name) for name in names}
+
+
+def _analysis_inputs(
+    area: float,
+    tc_hr: float,
+    p3_10: float,
+    storm_code: str,
+    storm_params: dict,
+    tr: int,
+    duration_hr: float,
+    dt: float,
+    x: float,
+    runoff_method: str,
+    coef: float,
+    lambda_coef: float,
+) -> dict:
+    """
+    Entradas que determinan el resultado de un análisis (clave de caché).
+
+    El factor X solo cuenta en la tormenta GZ y lambda solo en SCS-CN, así
+    que cambiarlos en otros análisis no invalida la caché.
+    """
+    return {
+        "area_ha": area,
+        "tc_hr": tc_hr,
+        "p3_10": p3_10,
+        "storm": storm_code,
+        "storm_params": storm_params,
+        "tr": tr,
+        "duration_hr": duration_hr,
+        "dt_min": dt,
+        "x": x if storm_code == "gz" else 1.0,
+        "runoff": runoff_method,
+        "coef": coef,
+        "lambda": lambda_coef if runoff_method == "scs-cn" else None,
+    }
+
+
+def _simulate(
+    hyetograph,
+    area: float,
+    tc_hr: float,
+    dt: float,
+    storm_code: str,
+    x: float,
+    runoff_method: str,
+    coef: float,
+    lambda_coef: float,
+) -> dict:
+    """
+    Escorrentía, hidrograma unitario y convolución de un análisis.
+
+    Args:
+        hyetograph: Hietograma de diseño
+        area: Área (ha)
+        tc_hr: Tiempo de concentración (h)
+        dt: Paso de tiempo (min)
+        storm_code: Código de tormenta
+        x: Factor X morfológico (solo tormenta GZ)
+        runoff_method: 'racional' o 'scs-cn'
+        coef: C ajustado (racional) o CN ajustado (SCS-CN)
+        lambda_coef: Coeficiente lambda para Ia (SCS-CN)
+
+    Returns:
+        Escalares y series (hietograma y caudal) del análisis
+    """
+    depths = np.array(hyetograph.depth_mm)
+    if runoff_method == "racional":
+        # Método Racional: Q = C × P
+        excess_mm = coef * depths
+    else:
+        cumulative = np.array(hyetograph.cumulative_mm)
+        excess_mm = rainfall_excess_series(cumulative, coef, lambda_coef)
+
+    dt_hr = dt / 60
+    if runoff_method == "racional" or storm_code == "gz":
+        # Hidrograma triangular con factor X para método racional o tormenta GZ
+        _, uh_flow = triangular_uh_x(area, tc_hr, dt_hr, x if storm_code == "gz" else 1.0)
+    else:
+        # Hidrograma SCS para método CN
+        _, uh_flow = scs_triangular_uh(area / 100, tc_hr, dt_hr)
+
+    flow = convolve_uh(excess_mm, uh_flow)
+    time_hr = np.arange(len(flow)) * dt_hr
+    peak_idx = np.argmax(flow)
+
+    return {
+        "total_depth_mm": hyetograph.total_depth_mm,
+        "peak_intensity_mmhr": hyetograph.peak_intensity_mmhr,
+        "runoff_mm": float(np.sum(excess_mm)),
+        "peak_flow_m3s": float(flow[peak_idx]),
+        "time_to_peak_hr": float(time_hr[peak_idx]),
+        "volume_m3": float(np.trapezoid(flow, time_hr * 3600)),
+        "storm_time_min": np.asarray(hyetograph.time_min, dtype=float),
+        "storm_intensity_mmhr": np.asarray(hyetograph.intensity_mmhr, dtype=float),
+        "flow_m3s": flow,
+    }
+
+
+def _build_analysis(
+    tc_result,
+    tc_hr: float,
+    tc_params: dict,
+    storm_code: str,
+    tr: int,
+    x: float,
+    duration_hr: float,
+    dt: float,
+    sim: dict,
+) -> AnalysisRun:
+    """
+    Arma el AnalysisRun a partir del resultado de _simulate (o de la caché).
+
+    Args:
+        tc_result: Resultado de Tc de la cuenca
+        tc_hr: Tc usado (recalculado en Desbordes)
+        tc_params: Parámetros a guardar con el Tc
+        storm_code: Código de tormenta
+        tr: Período de retorno
+        x: Factor X
+        duration_hr: Duración de la tormenta (h)
+        dt: Paso de tiempo (min)
+        sim: Escalares y series del análisis
+    """
+    from hidropluvial.core import scs_time_to_peak
+
+    dt_hr = dt / 60
+    # Calcular tp del hidrograma unitario SCS: Tp = ΔD/2 + 0.6×Tc
+    tp_unit_hr = scs_time_to_peak(tc_hr, dt_hr)
+    flow = sim["flow_m3s"]
+    time_to_peak = sim["time_to_peak_hr"]
+
+    # Series guardadas con la precisión de almacenamiento (escalares en float64)
+    storm_time_min = store_series(sim["storm_time_min"])
+    storm_result = StormResult(
+        type=storm_code,
+        return_period=tr,
+        duration_hr=duration_hr,
+        total_depth_mm=sim["total_depth_mm"],
+        peak_intensity_mmhr=sim["peak_intensity_mmhr"],
+        n_intervals=len(storm_time_min),
+        time_min=storm_time_min,
+        intensity_mmhr=store_series(sim["storm_intensity_mmhr"]),
+    )
+
+    hydrograph_result = HydrographResult(
+        tc_method=tc_result.method,
+        tc_min=tc_hr * 60,
+        storm_type=storm_code,
+        return_period=tr,
+        x_factor=x if storm_code == "gz" else None,
+        peak_flow_m3s=sim["peak_flow_m3s"],
+        time_to_peak_hr=time_to_peak,
+        time_to_peak_min=time_to_peak * 60,
+        tp_unit_hr=tp_unit_hr,
+        tp_unit_min=tp_unit_hr * 60 if tp_unit_hr else None,
+        volume_m3=sim["volume_m3"],
+        total_depth_mm=sim["total_depth_mm"],
+        runoff_mm=sim["runoff_mm"],
+        time_hr=store_series(np.arange(len(flow)) * dt_hr),
+        flow_m3s=store_series(flow),
+    )
+
+    return AnalysisRun(
+        tc=TcResult(method=tc_result.method, tc_hr=tc_hr, tc_min=tc_hr * 60, parameters=tc_params),
+        storm=storm_result,
+        hydrograph=hydrograph_result,
+    )
+
+
+def _tc_parameters(
+    tc_result,
+    area: float,
+    runoff_method: str,
+    c_adjusted: Optional[float],
+    cn_adjusted: Optional[float],
+    t0_min: float,
+    amc: str,
+    lambda_coef: float,
+) -> dict:
+    """Parámetros de Tc a guardar con el análisis (incluye la escorrentía usada)."""
+    tc_params = {}
+    if tc_result.method == "desbordes" and c_adjusted:
+        tc_params = {
+            "c": c_adjusted,
+            "area_ha": area,
+            "t0_min": t0_min,
+        }
+    elif tc_result.parameters:
+        tc_params = dict(tc_result.parameters)
+
+    # Agregar método de escorrentía usado
+    tc_params["runoff_method"] = runoff_method
+
+    # Agregar parámetros según el método de escorrentía
+    if runoff_method == "racional" and c_adjusted:
+        tc_params["c"] = round(c_adjusted, 3)
+    elif runoff_method == "scs-cn" and cn_adjusted is not None:
+        tc_params["cn_adjusted"] = round(cn_adjusted, 1)
+        tc_params["amc"] = amc
+        tc_params["lambda"] = lambda_coef
+    return tc_params
+
+
 class AnalysisRunner:
     """Ejecuta analisis hidrologicos basados en WizardConfig."""
 
-    def __init__(self, config: WizardConfig, project_id: Optional[str] = None):
+    def __init__(
+        self,
+        config: WizardConfig,
+        project_id: Optional[str] = None,
+        quiet: bool = False,
+        speculative: Optional["SpeculativeRun"] = None,
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancelToken] = None,
+        resume_basin_id: Optional[str] = None,
+        use_cache: bool = True,
+    ):
         """
         Inicializa el runner.
 
@@ -126,24 +399,62 @@ class AnalysisRunner:
             config: Configuración del wizard
             project_id: ID del proyecto existente (opcional).
                        Si no se especifica, se crea un proyecto por defecto.
+            quiet: No imprimir resultados intermedios (ejecución batch)
+            speculative: Cálculo anticipado lanzado durante el wizard; si
+                coincide con la configuración final se reutilizan sus resultados
+            on_progress: Callback de progreso (por defecto, barra de rich
+                salvo en modo quiet)
+            cancel: Token para cancelar la ejecución; también se cancela con
+                Ctrl+C. Los análisis terminados se conservan y se guardan.
+            resume_basin_id: Cuenca del proyecto a completar: se omiten las
+                combinaciones que ya tiene guardadas
+            use_cache: Reutilizar resultados de la caché en disco (y guardar
+                los nuevos)
         """
         self.config = config
         self.project_manager = get_project_manager()
         self.project: Optional[Project] = None
         self.basin: Optional[Basin] = None
         self.project_id = project_id
+        self.quiet = quiet
+        self.speculative = speculative
+        self.on_progress = on_progress
+        self.cancel = cancel
+        self.resume_basin_id = resume_basin_id
+        self.tracker: Optional[ProgressTracker] = None
+        # True si la ejecución se canceló antes de completar todos los análisis
+        self.cancelled = False
+        # Hietogramas ya generados: (tormenta, Tr, duración, dt) -> HyetographResult
+        self._hyetographs: dict[tuple, object] = {}
+        self._last_checkpoint = 0.0
+        self.cache: Optional[ResultCache] = get_result_cache() if use_cache else None
 
     def run(self) -> Tuple[Project, Basin]:
         """
         Ejecuta el analisis completo y retorna (project, basin).
 
         Crea o usa un proyecto y guarda la cuenca con todos sus análisis.
+        Si se cancela, guarda los análisis terminados; la ejecución se puede
+        completar luego con resume_basin_id.
         """
         self._create_project_and_basin()
-        self._calculate_tc()
-        self._run_analyses()
 
-        if self.config.output_name:
+        precomputed = self.speculative.take(self.config) if self.speculative else None
+        if precomputed is not None:
+            self._use_precomputed(precomputed)
+        else:
+            with self._progress_callback() as on_progress:
+                self.tracker = ProgressTracker(0, on_progress, self.cancel)
+                # Al reanudar, Tc ya está calculado en la cuenca
+                if not self.basin.tc_results:
+                    with self.tracker.stage("tc"):
+                        self._calculate_tc()
+                self._run_analyses()
+
+        if self.cancelled:
+            n_done, n_total = self.tracker.done, self.tracker.total
+            print_warning(f"Ejecucion cancelada: {n_done} de {n_total} analisis guardados")
+        elif self.config.output_name:
             self._generate_report()
 
         self._print_summary()
@@ -153,12 +464,26 @@ class AnalysisRunner:
 
         return self.project, self.basin
 
+    def _progress_callback(self):
+        """Contexto que entrega el callback de progreso a usar."""
+        if self.on_progress is not None or self.quiet:
+            return nullcontext(self.on_progress)
+        return progress_bar()
+
     def _create_project_and_basin(self) -> None:
-        """Crea o obtiene el proyecto y crea la cuenca."""
+        """Crea o obtiene el proyecto y crea la cuenca (o retoma una existente)."""
         # Si hay project_id, usar ese proyecto
         if self.project_id:
             self.project = self.project_manager.get_project(self.project_id)
 
+        if self.resume_basin_id:
+            basin = self.project.get_basin(self.resume_basin_id) if self.project else None
+            if basin is None:
+                raise ValueError(f"Cuenca '{self.resume_basin_id}' no encontrada")
+            self.basin = basin
+            print_info(f"Reanudando cuenca {basin.id} ({len(basin.analyses)} analisis guardados)")
+            return
+
         # Si no hay proyecto o no se encontró, crear uno por defecto
         if not self.project:
             self.project = self.project_manager.create_project(
@@ -167,8 +492,13 @@ class AnalysisRunner:
             )
             print_success(f"Proyecto creado: {self.project.id}")
 
-        # Crear cuenca con datos del wizard
-        self.basin = Basin(
+        self.basin = self._build_basin()
+        self.project.add_basin(self.basin)
+        print_success(f"Cuenca creada: {self.basin.id}")
+
+    def _build_basin(self) -> Basin:
+        """Crea la cuenca (sin análisis) con los datos de la configuración."""
+        basin = Basin(
             name=self.config.nombre,
             area_ha=self.config.area_ha,
             slope_pct=self.config.slope_pct,
@@ -190,7 +520,7 @@ class AnalysisRunner:
                 )
                 for d in self.config.c_weighted_data["items"]
             ]
-            self.basin.c_weighted = WeightedCoefficient(
+            basin.c_weighted = WeightedCoefficient(
                 type="c",
                 table_used=self.config.c_weighted_data["table_key"],
                 weighted_value=self.config.c,
@@ -198,9 +528,19 @@ class AnalysisRunner:
                 base_tr=self.config.c_weighted_data["base_tr"],
             )
 
-        self.project.add_basin(self.basin)
-        print_success(f"Cuenca creada: {self.basin.id}")
+        return basin
+
+    def _use_precomputed(self, precomputed: Basin) -> None:
+        """Copia Tc y análisis calculados de antemano a la cuenca del proyecto."""
+        for tc_result in precomputed.tc_results:
+            self.basin.add_tc_result(tc_result)
+            if not self.quiet:
+                print_result_row(f"Tc ({tc_result.method})", f"{tc_result.tc_min:.1f}", "min")
 
+        for analysis in precomputed.analyses:
+            self.basin.add_analysis(analysis)
+
+        print_success(f"{len(precomputed.analyses)} analisis completados")
 
     def _calculate_tc(self) -> None:
         """Calcula tiempo de concentracion con los metodos seleccionados."""
@@ -238,60 +578,100 @@ class AnalysisRunner:
                     parameters=tc_params,
                 )
                 self.basin.add_tc_result(result)
-                print_result_row(f"Tc ({method})", f"{tc_min:.1f}", "min")
+                if not self.quiet:
+                    print_result_row(f"Tc ({method})", f"{tc_min:.1f}", "min")
 
-    def _run_analyses(self) -> None:
-        """Ejecuta todos los analisis."""
-        n_analyses = 0
-
-        # Determinar métodos de escorrentía disponibles
+    def _runoff_methods(self) -> list[str]:
+        """Métodos de escorrentía disponibles según los coeficientes."""
         runoff_methods = []
         if self.config.c:
             runoff_methods.append("racional")
         if self.config.cn:
             runoff_methods.append("scs-cn")
+        return runoff_methods
+
+    def _run_analyses(self) -> None:
+        """Ejecuta todos los analisis."""
+        matrix = [
+            (storm_code, self.config.return_periods, self.config.x_factors)
+            for storm_code in self.config.storm_codes
+        ]
+        n_analyses = self._execute(self._plan(matrix, self._runoff_methods()))
+
+        if not self.cancelled:
+            print_success(f"{n_analyses} analisis completados")
 
+    def _plan(
+        self,
+        matrix: list[tuple[str, list[int], list[float]]],
+        runoff_methods: list[str],
+    ) -> list[tuple]:
+        """
+        Lista ordenada de análisis a ejecutar: (tc_result, Tr, X, tormenta, método).
+
+        Solo la tormenta GZ usa varios factores X; las demás usan X=1.0.
+        """
+        jobs = []
         for tc_result in self.basin.tc_results:
-            for storm_code in self.config.storm_codes:
-                for tr in self.config.return_periods:
+            for storm_code, return_periods, x_factors in matrix:
+                for tr in return_periods:
                     for runoff_method in runoff_methods:
-                        if storm_code == "gz":
-                            # Multiples valores de X para GZ
-                            for x in self.config.x_factors:
-                                self._run_single_analysis(tc_result, tr, x, storm_code, runoff_method)
-                                n_analyses += 1
-                        else:
-                            # Solo X=1.0 para tormentas no-GZ
-                            self._run_single_analysis(tc_result, tr, 1.0, storm_code, runoff_method)
-                            n_analyses += 1
-
-        print_success(f"{n_analyses} analisis completados")
+                        xs = x_factors if storm_code == "gz" else [1.0]
+                        for x in xs:
+                            jobs.append((tc_result, tr, x, storm_code, runoff_method))
+        return jobs
 
-    def _run_single_analysis(self, tc_result, tr: int, x: float, storm_code: str, runoff_method: str = "racional") -> None:
-        """Ejecuta un analisis individual.
+    def _execute(self, jobs: list[tuple]) -> int:
+        """
+        Ejecuta los análisis planificados que aún no estén en la cuenca.
 
-        Args:
-            tc_result: Resultado de tiempo de concentración
-            tr: Período de retorno (años)
-            x: Factor X morfológico
-            storm_code: Código de tormenta (gz, blocks, blocks24)
-            runoff_method: Método de escorrentía ('racional' o 'scs-cn')
+        Emite progreso tras cada análisis, guarda el proyecto cada
+        CHECKPOINT_INTERVAL_S segundos y se detiene si se cancela (token o
+        Ctrl+C), conservando lo ya calculado.
+
+        Returns:
+            Cantidad de análisis ejecutados en esta corrida
         """
-        p3_10 = self.config.p3_10
-        area = self.config.area_ha
+        if self.tracker is None:
+            self.tracker = ProgressTracker(0, self.on_progress, self.cancel)
 
-        # Obtener C ajustado para el Tr del análisis (si aplica y usa método racional)
-        c_adjusted = None
-        if runoff_method == "racional" and self.config.c:
-            c_adjusted = _get_c_for_tr(self.config, tr)
+        completed = _existing_keys(self.basin) if self.basin.analyses else set()
+        pending = [
+            job for job in jobs
+            if analysis_key(job[0].method, job[3], job[1], job[2], job[4]) not in completed
+        ]
+        self.tracker.set_total(len(jobs), done=len(jobs) - len(pending))
+        self._last_checkpoint = time.perf_counter()
 
-        # Recalcular Tc si es método Desbordes (depende de C y t0)
-        if tc_result.method == "desbordes" and c_adjusted:
-            tc_hr = desbordes(area, self.config.slope_pct, c_adjusted, self.config.t0_min)
-        else:
-            tc_hr = tc_result.tc_hr
+        n_analyses = 0
+        with self.tracker.stage("analisis"):
+            try:
+                for tc_result, tr, x, storm_code, runoff_method in pending:
+                    if self.tracker.cancelled:
+                        break
+                    label = f"{tc_result.method} {storm_code} Tr{tr}"
+                    with self.tracker.step(label):
+                        self._run_single_analysis(tc_result, tr, x, storm_code, runoff_method)
+                    n_analyses += 1
+                    self._checkpoint()
+            except KeyboardInterrupt:
+                self.tracker.interrupted = True
+
+        self.cancelled = n_analyses < len(pending)
+        return n_analyses
 
-        # Determinar duracion y dt
+    def _checkpoint(self) -> None:
+        """Guarda el proyecto si pasó el intervalo desde el último guardado."""
+        if self.project is None:
+            return
+        now = time.perf_counter()
+        if now - self._last_checkpoint >= CHECKPOINT_INTERVAL_S:
+            with self.tracker.stage("guardado"):
+                self.project_manager.save_project(self.project)
+            self._last_checkpoint = time.perf_counter()
+
+    def _storm_window(self, storm_code: str, tc_hr: float) -> tuple[float, float]:
+        """Duración (h) y paso de tiempo (min) de la tormenta."""
         # Usar dt configurado por el usuario (default 5 min)
         dt = self.config.dt_min
         if storm_code == "gz":
@@ -312,7 +692,24 @@ class AnalysisRunner:
         else:
             duration_hr = max(tc_hr, 1.0)
 
-        # Generar tormenta
+        return duration_hr, dt
+
+    def _hyetograph(self, storm_code: str, tr: int, duration_hr: float, dt: float):
+        """
+        Genera el hietograma de diseño (memorizado).
+
+        El mismo hietograma se repite para cada método de Tc, factor X y
+        método de escorrentía; se genera una sola vez por combinación.
+        """
+        key = (storm_code, tr, duration_hr, dt)
+        if key not in self._hyetographs:
+            self._hyetographs[key] = self._generate_hyetograph(storm_code, tr, duration_hr, dt)
+        return self._hyetographs[key]
+
+    def _generate_hyetograph(self, storm_code: str, tr: int, duration_hr: float, dt: float):
+        """Genera el hietograma de diseño para una tormenta y Tr."""
+        p3_10 = self.config.p3_10
+
         if storm_code == "gz":
             peak_position = 1.0 / 6.0
             hyetograph = alternating_blocks_dinagua(
@@ -365,120 +762,66 @@ class AnalysisRunner:
                 p3_10, tr, duration_hr, dt, None
             )
 
-        depths = np.array(hyetograph.depth_mm)
+        return hyetograph
+
+    def _run_single_analysis(self, tc_result, tr: int, x: float, storm_code: str, runoff_method: str = "racional") -> None:
+        """Ejecuta un analisis individual.
+
+        El hidrograma se toma de la caché de resultados si ya se calculó
+        con las mismas entradas (en esta u otra sesión).
+
+        Args:
+            tc_result: Resultado de tiempo de concentración
+            tr: Período de retorno (años)
+            x: Factor X morfológico
+            storm_code: Código de tormenta (gz, blocks, blocks24)
+            runoff_method: Método de escorrentía ('racional' o 'scs-cn')
+        """
+        area = self.config.area_ha
+
+        # Obtener C ajustado para el Tr del análisis (si aplica y usa método racional)
+        c_adjusted = None
+        if runoff_method == "racional" and self.config.c:
+            c_adjusted = _get_c_for_tr(self.config, tr)
+
+        # Recalcular Tc si es método Desbordes (depende de C y t0)
+        if tc_result.method == "desbordes" and c_adjusted:
+            tc_hr = desbordes(area, self.config.slope_pct, c_adjusted, self.config.t0_min)
+        else:
+            tc_hr = tc_result.tc_hr
 
-        # Escorrentía según método seleccionado
+        duration_hr, dt = self._storm_window(storm_code, tc_hr)
+
+        # Coeficiente según método de escorrentía seleccionado
         cn_adjusted = None
         if runoff_method == "racional" and c_adjusted:
-            # Método Racional: Q = C × P
-            excess_mm = c_adjusted * depths
-            runoff_mm = float(np.sum(excess_mm))
+            coef = c_adjusted
         elif runoff_method == "scs-cn" and self.config.cn:
-            # Método SCS-CN
-            amc_enum = _get_amc_enum(self.config.amc)
-            cn_adjusted = adjust_cn_for_amc(self.config.cn, amc_enum)
-
-            cumulative = np.array(hyetograph.cumulative_mm)
-            excess_mm = rainfall_excess_series(
-                cumulative, cn_adjusted, self.config.lambda_coef
-            )
-            runoff_mm = float(np.sum(excess_mm))
+            cn_adjusted = adjust_cn_for_amc(self.config.cn, _get_amc_enum(self.config.amc))
+            coef = cn_adjusted
         else:
             # No hay coeficiente para el método solicitado
             return
 
-        # Hidrograma unitario
-        dt_hr = dt / 60
-        x_val = x if storm_code == "gz" else 1.0
-
-        # Calcular tp del hidrograma unitario SCS: Tp = ΔD/2 + 0.6×Tc
-        from hidropluvial.core import scs_time_to_peak
-        tp_unit_hr = scs_time_to_peak(tc_hr, dt_hr)
-
-        if runoff_method == "racional" or storm_code == "gz":
-            # Hidrograma triangular con factor X para método racional o tormenta GZ
-            uh_time, uh_flow = triangular_uh_x(area, tc_hr, dt_hr, x_val)
-        else:
-            # Hidrograma SCS para método CN
-            uh_time, uh_flow = scs_triangular_uh(area / 100, tc_hr, dt_hr)
-            x_val = 1.67
-
-        # Convolucion
-        hydrograph_flow = convolve_uh(excess_mm, uh_flow)
-        n_total = len(hydrograph_flow)
-        hydrograph_time = np.arange(n_total) * dt_hr
-
-        peak_idx = np.argmax(hydrograph_flow)
-        peak_flow = float(hydrograph_flow[peak_idx])
-        time_to_peak = float(hydrograph_time[peak_idx])
-        volume_m3 = float(np.trapezoid(hydrograph_flow, hydrograph_time * 3600))
-
-        # Preparar parametros de Tc para guardar
-        tc_params = {}
-        if tc_result.method == "desbordes" and c_adjusted:
-            tc_params = {
-                "c": c_adjusted,
-                "area_ha": area,
-                "t0_min": self.config.t0_min,
-            }
-        elif tc_result.parameters:
-            tc_params = dict(tc_result.parameters)
-
-        # Agregar método de escorrentía usado
-        tc_params["runoff_method"] = runoff_method
-
-        # Agregar parámetros según el método de escorrentía
-        if runoff_method == "racional" and c_adjusted:
-            tc_params["c"] = round(c_adjusted, 3)
-        elif runoff_method == "scs-cn" and cn_adjusted is not None:
-            tc_params["cn_adjusted"] = round(cn_adjusted, 1)
-            tc_params["amc"] = self.config.amc
-            tc_params["lambda"] = self.config.lambda_coef
-
-        # Crear objetos de resultado
-        tc_result_obj = TcResult(
-            method=tc_result.method,
-            tc_hr=tc_hr,
-            tc_min=tc_hr * 60,
-            parameters=tc_params,
+        lambda_coef = self.config.lambda_coef
+        inputs = _analysis_inputs(
+            area, tc_hr, self.config.p3_10, storm_code, _storm_params(storm_code, self.config),
+            tr, duration_hr, dt, x, runoff_method, coef, lambda_coef,
         )
 
-        storm_result = StormResult(
-            type=storm_code,
-            return_period=tr,
-            duration_hr=duration_hr,
-            total_depth_mm=hyetograph.total_depth_mm,
-            peak_intensity_mmhr=hyetograph.peak_intensity_mmhr,
-            n_intervals=len(hyetograph.time_min),
-            time_min=list(hyetograph.time_min),
-            intensity_mmhr=list(hyetograph.intensity_mmhr),
-        )
+        def compute() -> dict:
+            hyetograph = self._hyetograph(storm_code, tr, duration_hr, dt)
+            return _simulate(hyetograph, area, tc_hr, dt, storm_code, x, runoff_method, coef, lambda_coef)
 
-        hydrograph_result = HydrographResult(
-            tc_method=tc_result.method,
-            tc_min=tc_hr * 60,
-            storm_type=storm_code,
-            return_period=tr,
-            x_factor=x if storm_code == "gz" else None,
-            peak_flow_m3s=peak_flow,
-            time_to_peak_hr=time_to_peak,
-            time_to_peak_min=time_to_peak * 60,
-            tp_unit_hr=tp_unit_hr,
-            tp_unit_min=tp_unit_hr * 60 if tp_unit_hr else None,
-            volume_m3=volume_m3,
-            total_depth_mm=hyetograph.total_depth_mm,
-            runoff_mm=runoff_mm,
-            time_hr=[float(t) for t in hydrograph_time],
-            flow_m3s=[float(q) for q in hydrograph_flow],
-        )
+        sim = self.cache.get_or_compute("analysis", inputs, compute) if self.cache is not None else compute()
 
-        analysis = AnalysisRun(
-            tc=tc_result_obj,
-            storm=storm_result,
-            hydrograph=hydrograph_result,
+        tc_params = _tc_parameters(
+            tc_result, area, runoff_method, c_adjusted, cn_adjusted,
+            self.config.t0_min, self.config.amc, lambda_coef,
+        )
+        self.basin.add_analysis(
+            _build_analysis(tc_result, tc_hr, tc_params, storm_code, tr, x, duration_hr, dt, sim)
         )
-
-        self.basin.add_analysis(analysis)
 
     def _generate_report(self) -> None:
         """Genera reporte LaTeX."""
@@ -525,6 +868,31 @@ class AnalysisRunner:
             console.print()
 
 
+def run_basin_analyses(
+    config: WizardConfig,
+    matrix: list[tuple[str, list[int], list[float]]],
+) -> Basin:
+    """
+    Calcula Tc y una matriz de análisis para una cuenca, sin proyecto ni consola.
+
+    Usado por la ejecución batch (`hp batch run`) en procesos de trabajo:
+    la cuenca resultante se guarda luego en el proceso principal.
+
+    Args:
+        config: Datos de la cuenca y parámetros (métodos Tc, dt, AMC, ...)
+        matrix: Lista de (código de tormenta, períodos de retorno, factores X)
+
+    Returns:
+        Cuenca con resultados de Tc y análisis
+    """
+    runner = AnalysisRunner(config, quiet=True)
+    runner.basin = runner._build_basin()
+    runner._calculate_tc()
+    runner._execute(runner._plan(matrix, runner._runoff_methods()))
+
+    return runner.basin
+
+
 class AdditionalAnalysisRunner:
     """Ejecuta analisis adicionales sobre una cuenca existente."""
 
@@ -547,6 +915,7 @@ class AdditionalAnalysisRunner:
         custom_distribution: str = "alternating_blocks",
         custom_hyetograph_time: list = None,
         custom_hyetograph_depth: list = None,
+        use_cache: bool = True,
     ):
         self.basin = basin
         self.c = c
@@ -565,6 +934,7 @@ class AdditionalAnalysisRunner:
         self.custom_distribution = custom_distribution
         self.custom_hyetograph_time = custom_hyetograph_time
         self.custom_hyetograph_depth = custom_hyetograph_depth
+        self.cache: Optional[ResultCache] = get_result_cache() if use_cache else None
 
     def run(
         self,
@@ -573,20 +943,26 @@ class AdditionalAnalysisRunner:
         return_periods: list[int],
         x_factors: list[float],
         runoff_method: str = None,
+        on_progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancelToken] = None,
+        skip_existing: bool = False,
     ) -> int:
         """Ejecuta analisis adicionales. Retorna cantidad de analisis agregados.
 
+        Si se cancela (token o Ctrl+C) se detiene tras el análisis en curso y
+        los análisis ya agregados quedan en la cuenca.
+
         Args:
             tc_methods: Lista de métodos de Tc a usar
             storm_code: Código de tormenta
             return_periods: Lista de períodos de retorno
             x_factors: Lista de factores X
             runoff_method: Método de escorrentía ('racional', 'scs-cn' o None para ambos)
+            on_progress: Callback de progreso (por defecto, barra de rich)
+            cancel: Token de cancelación
+            skip_existing: Omitir combinaciones que la cuenca ya tiene
+                (reanudar una ejecución cancelada)
         """
-        p3_10 = self.basin.p3_10
-        area = self.basin.area_ha
-        n_analyses = 0
-
         # Determinar métodos de escorrentía a usar
         if runoff_method:
             runoff_methods = [runoff_method]
@@ -597,208 +973,169 @@ class AdditionalAnalysisRunner:
             if self.cn:
                 runoff_methods.append("scs-cn")
 
-        for tc_result in self.basin.tc_results:
-            if tc_result.method not in tc_methods:
-                continue
-
-            for tr in return_periods:
-                for x in x_factors:
-                    for r_method in runoff_methods:
-                        # Obtener C ajustado para el Tr del análisis (si usa método racional)
-                        c_adjusted = None
-                        if r_method == "racional" and self.c:
-                            c_adjusted = _get_c_for_tr_from_basin(self.basin, self.c, tr)
-
-                        # Recalcular Tc si es método Desbordes (depende de C y t0)
-                        if tc_result.method == "desbordes" and c_adjusted:
-                            tc_hr = desbordes(area, self.basin.slope_pct, c_adjusted, self.t0_min)
-                        else:
-                            tc_hr = tc_result.tc_hr
-
-                        # Determinar duracion y dt
-                        dt = self.dt_min
-                        if storm_code == "gz":
-                            duration_hr = 6.0
-                        elif storm_code == "bimodal":
-                            duration_hr = self.bimodal_duration_hr
-                        elif storm_code == "custom":
-                            duration_hr = self.custom_duration_hr
-                        elif storm_code == "blocks24" or storm_code == "scs_ii":
-                            duration_hr = 24.0
-                            # Para tormentas de 24h, dt mínimo de 10 min
-                            if dt < 10.0:
-                                dt = 10.0
-                        elif storm_code.startswith("huff"):
-                            duration_hr = max(tc_hr * 2, 2.0)
-                        else:
-                            duration_hr = max(tc_hr, 1.0)
-
-                        # Generar tormenta
-                        if storm_code == "gz":
-                            peak_position = 1.0 / 6.0
-                            hyetograph = alternating_blocks_dinagua(
-                                p3_10, tr, duration_hr, dt, None, peak_position
-                            )
-                        elif storm_code == "bimodal":
-                            hyetograph = bimodal_dinagua(
-                                p3_10, tr, duration_hr, dt,
-                                peak1_position=self.bimodal_peak1,
-                                peak2_position=self.bimodal_peak2,
-                                volume_split=self.bimodal_vol_split,
-                                peak_width_fraction=self.bimodal_peak_width,
-                            )
-                        elif storm_code == "custom":
-                            # Tormenta personalizada
-                            if self.custom_hyetograph_time and self.custom_hyetograph_depth:
-                                hyetograph = custom_hyetograph(
-                                    self.custom_hyetograph_time,
-                                    self.custom_hyetograph_depth,
-                                )
-                            elif self.custom_depth_mm:
-                                distribution = self.custom_distribution
-                                peak_pos = 1.0 / 6.0 if distribution == "alternating_blocks_gz" else 0.5
-                                if distribution == "alternating_blocks_gz":
-                                    distribution = "alternating_blocks"
-                                hyetograph = custom_depth_storm(
-                                    self.custom_depth_mm,
-                                    duration_hr,
-                                    dt,
-                                    distribution=distribution,
-                                    peak_position=peak_pos,
-                                )
-                            else:
-                                hyetograph = alternating_blocks_dinagua(
-                                    p3_10, tr, duration_hr, dt, None
-                                )
-                        elif storm_code.startswith("huff"):
-                            quartile = int(storm_code.split("_q")[1]) if "_q" in storm_code else 2
-                            total_depth = dinagua_depth(p3_10, tr, duration_hr, None)
-                            hyetograph = huff_distribution(total_depth, duration_hr, dt, quartile=quartile)
-                        elif storm_code == "scs_ii":
-                            total_depth = dinagua_depth(p3_10, tr, duration_hr, None)
-                            hyetograph = scs_distribution(total_depth, duration_hr, dt, StormMethod.SCS_TYPE_II)
-                        else:
-                            hyetograph = alternating_blocks_dinagua(
-                                p3_10, tr, duration_hr, dt, None
-                            )
-
-                        depths = np.array(hyetograph.depth_mm)
-
-                        # Escorrentía según método seleccionado
-                        cn_adjusted = None
-                        if r_method == "racional" and c_adjusted:
-                            excess_mm = c_adjusted * depths
-                            runoff_mm = float(np.sum(excess_mm))
-                        elif r_method == "scs-cn" and self.cn:
-                            amc_enum = _get_amc_enum(self.amc)
-                            cn_adjusted = adjust_cn_for_amc(self.cn, amc_enum)
-
-                            cumulative = np.array(hyetograph.cumulative_mm)
-                            excess_mm = rainfall_excess_series(
-                                cumulative, cn_adjusted, self.lambda_coef
-                            )
-                            runoff_mm = float(np.sum(excess_mm))
-                        else:
-                            continue
-
-                        # Hidrograma unitario
-                        dt_hr = dt / 60
-                        x_val = x if storm_code == "gz" else 1.0
-
-                        # Calcular tp del hidrograma unitario SCS: Tp = ΔD/2 + 0.6×Tc
-                        from hidropluvial.core import scs_time_to_peak
-                        tp_unit_hr = scs_time_to_peak(tc_hr, dt_hr)
-
-                        if r_method == "racional" or storm_code == "gz":
-                            uh_time, uh_flow = triangular_uh_x(area, tc_hr, dt_hr, x_val)
-                        else:
-                            uh_time, uh_flow = scs_triangular_uh(area / 100, tc_hr, dt_hr)
-                            x_val = 1.67
-
-                        # Convolucion
-                        hydrograph_flow = convolve_uh(excess_mm, uh_flow)
-                        n_total = len(hydrograph_flow)
-                        hydrograph_time = np.arange(n_total) * dt_hr
-
-                        peak_idx = np.argmax(hydrograph_flow)
-                        peak_flow = float(hydrograph_flow[peak_idx])
-                        time_to_peak = float(hydrograph_time[peak_idx])
-                        volume_m3 = float(np.trapezoid(hydrograph_flow, hydrograph_time * 3600))
-
-                        # Preparar parametros de Tc para guardar
-                        tc_params = {}
-                        if tc_result.method == "desbordes" and c_adjusted:
-                            tc_params = {
-                                "c": c_adjusted,
-                                "area_ha": area,
-                                "t0_min": self.t0_min,
-                            }
-                        elif tc_result.parameters:
-                            tc_params = dict(tc_result.parameters)
-
-                        # Agregar método de escorrentía usado
-                        tc_params["runoff_method"] = r_method
-
-                        # Agregar parámetros según el método
-                        if r_method == "racional" and c_adjusted:
-                            tc_params["c"] = round(c_adjusted, 3)
-                        elif r_method == "scs-cn" and cn_adjusted is not None:
-                            tc_params["cn_adjusted"] = round(cn_adjusted, 1)
-                            tc_params["amc"] = self.amc
-                            tc_params["lambda"] = self.lambda_coef
-
-                        # Crear objetos de resultado
-                        tc_result_obj = TcResult(
-                            method=tc_result.method,
-                            tc_hr=tc_hr,
-                            tc_min=tc_hr * 60,
-                            parameters=tc_params,
-                        )
-
-                        storm_result = StormResult(
-                            type=storm_code,
-                            return_period=tr,
-                            duration_hr=duration_hr,
-                            total_depth_mm=hyetograph.total_depth_mm,
-                            peak_intensity_mmhr=hyetograph.peak_intensity_mmhr,
-                            n_intervals=len(hyetograph.time_min),
-                            time_min=list(hyetograph.time_min),
-                            intensity_mmhr=list(hyetograph.intensity_mmhr),
-                        )
-
-                        hydrograph_result = HydrographResult(
-                            tc_method=tc_result.method,
-                            tc_min=tc_hr * 60,
-                            storm_type=storm_code,
-                            return_period=tr,
-                            x_factor=x if storm_code == "gz" else None,
-                            peak_flow_m3s=peak_flow,
-                            time_to_peak_hr=time_to_peak,
-                            time_to_peak_min=time_to_peak * 60,
-                            tp_unit_hr=tp_unit_hr,
-                            tp_unit_min=tp_unit_hr * 60 if tp_unit_hr else None,
-                            volume_m3=volume_m3,
-                            total_depth_mm=hyetograph.total_depth_mm,
-                            runoff_mm=runoff_mm,
-                            time_hr=[float(t) for t in hydrograph_time],
-                            flow_m3s=[float(q) for q in hydrograph_flow],
-                        )
-
-                        analysis = AnalysisRun(
-                            tc=tc_result_obj,
-                            storm=storm_result,
-                            hydrograph=hydrograph_result,
-                        )
-
-                        self.basin.add_analysis(analysis)
-
-                        n_analyses += 1
-
-                    # Solo un X para tormentas no-GZ
-                    if storm_code != "gz":
-                        break
+        jobs = [
+            (tc_result, tr, x, r_method)
+            for tc_result in self.basin.tc_results
+            if tc_result.method in tc_methods
+            for tr in return_periods
+            for x in x_factors
+            for r_method in runoff_methods
+        ]
 
+        completed = _existing_keys(self.basin) if skip_existing else set()
+        pending = [
+            job for job in jobs
+            if analysis_key(job[0].method, storm_code, job[1], job[2], job[3]) not in completed
+        ]
+
+        n_analyses = 0
+        context = nullcontext(on_progress) if on_progress is not None else progress_bar()
+        with context as callback:
+            self.tracker = ProgressTracker(len(jobs), callback, cancel, done=len(jobs) - len(pending))
+            with self.tracker.stage("analisis"):
+                try:
+                    for tc_result, tr, x, r_method in pending:
+                        if self.tracker.cancelled:
+                            break
+                        with self.tracker.step(f"{tc_result.method} {storm_code} Tr{tr}"):
+                            added = self._run_single(tc_result, storm_code, tr, x, r_method)
+                        n_analyses += int(added)
+                except KeyboardInterrupt:
+                    self.tracker.interrupted = True
+
+        if self.tracker.cancelled:
+            print_warning(
+                f"Ejecucion cancelada: {self.tracker.done} de {self.tracker.total} "
+                "combinaciones procesadas"
+            )
         print_success(f"{n_analyses} analisis agregados")
         print_info(f"Total en cuenca: {len(self.basin.analyses)} analisis")
 
         return n_analyses
+
+    def _storm_window(self, storm_code: str, tc_hr: float) -> tuple[float, float]:
+        """Duración (h) y paso de tiempo (min) de la tormenta."""
+        dt = self.dt_min
+        if storm_code == "gz":
+            duration_hr = 6.0
+        elif storm_code == "bimodal":
+            duration_hr = self.bimodal_duration_hr
+        elif storm_code == "custom":
+            duration_hr = self.custom_duration_hr
+        elif storm_code == "blocks24" or storm_code == "scs_ii":
+            duration_hr = 24.0
+            # Para tormentas de 24h, dt mínimo de 10 min
+            if dt < 10.0:
+                dt = 10.0
+        elif storm_code.startswith("huff"):
+            duration_hr = max(tc_hr * 2, 2.0)
+        else:
+            duration_hr = max(tc_hr, 1.0)
+
+        return duration_hr, dt
+
+    def _hyetograph(self, storm_code: str, tr: int, duration_hr: float, dt: float):
+        """Genera el hietograma de diseño para una tormenta y Tr."""
+        p3_10 = self.basin.p3_10
+
+        if storm_code == "gz":
+            peak_position = 1.0 / 6.0
+            hyetograph = alternating_blocks_dinagua(
+                p3_10, tr, duration_hr, dt, None, peak_position
+            )
+        elif storm_code == "bimodal":
+            hyetograph = bimodal_dinagua(
+                p3_10, tr, duration_hr, dt,
+                peak1_position=self.bimodal_peak1,
+                peak2_position=self.bimodal_peak2,
+                volume_split=self.bimodal_vol_split,
+                peak_width_fraction=self.bimodal_peak_width,
+            )
+        elif storm_code == "custom":
+            # Tormenta personalizada
+            if self.custom_hyetograph_time and self.custom_hyetograph_depth:
+                hyetograph = custom_hyetograph(
+                    self.custom_hyetograph_time,
+                    self.custom_hyetograph_depth,
+                )
+            elif self.custom_depth_mm:
+                distribution = self.custom_distribution
+                peak_pos = 1.0 / 6.0 if distribution == "alternating_blocks_gz" else 0.5
+                if distribution == "alternating_blocks_gz":
+                    distribution = "alternating_blocks"
+                hyetograph = custom_depth_storm(
+                    self.custom_depth_mm,
+                    duration_hr,
+                    dt,
+                    distribution=distribution,
+                    peak_position=peak_pos,
+                )
+            else:
+                hyetograph = alternating_blocks_dinagua(
+                    p3_10, tr, duration_hr, dt, None
+                )
+        elif storm_code.startswith("huff"):
+            quartile = int(storm_code.split("_q")[1]) if "_q" in storm_code else 2
+            total_depth = dinagua_depth(p3_10, tr, duration_hr, None)
+            hyetograph = huff_distribution(total_depth, duration_hr, dt, quartile=quartile)
+        elif storm_code == "scs_ii":
+            total_depth = dinagua_depth(p3_10, tr, duration_hr, None)
+            hyetograph = scs_distribution(total_depth, duration_hr, dt, StormMethod.SCS_TYPE_II)
+        else:
+            hyetograph = alternating_blocks_dinagua(
+                p3_10, tr, duration_hr, dt, None
+            )
+
+        return hyetograph
+
+    def _run_single(self, tc_result, storm_code: str, tr: int, x: float, r_method: str) -> bool:
+        """Ejecuta un análisis y lo agrega a la cuenca. False si no aplica.
+
+        El hidrograma se toma de la caché de resultados si ya se calculó
+        con las mismas entradas.
+        """
+        area = self.basin.area_ha
+
+        # Obtener C ajustado para el Tr del análisis (si usa método racional)
+        c_adjusted = None
+        if r_method == "racional" and self.c:
+            c_adjusted = _get_c_for_tr_from_basin(self.basin, self.c, tr)
+
+        # Recalcular Tc si es método Desbordes (depende de C y t0)
+        if tc_result.method == "desbordes" and c_adjusted:
+            tc_hr = desbordes(area, self.basin.slope_pct, c_adjusted, self.t0_min)
+        else:
+            tc_hr = tc_result.tc_hr
+
+        duration_hr, dt = self._storm_window(storm_code, tc_hr)
+
+        # Coeficiente según método de escorrentía seleccionado
+        cn_adjusted = None
+        if r_method == "racional" and c_adjusted:
+            coef = c_adjusted
+        elif r_method == "scs-cn" and self.cn:
+            cn_adjusted = adjust_cn_for_amc(self.cn, _get_amc_enum(self.amc))
+            coef = cn_adjusted
+        else:
+            return False
+
+        inputs = _analysis_inputs(
+            area, tc_hr, self.basin.p3_10, storm_code, _storm_params(storm_code, self),
+            tr, duration_hr, dt, x, r_method, coef, self.lambda_coef,
+        )
+
+        def compute() -> dict:
+            hyetograph = self._hyetograph(storm_code, tr, duration_hr, dt)
+            return _simulate(hyetograph, area, tc_hr, dt, storm_code, x, r_method, coef, self.lambda_coef)
+
+        sim = self.cache.get_or_compute("analysis", inputs, compute) if self.cache is not None else compute()
+
+        tc_params = _tc_parameters(
+            tc_result, area, r_method, c_adjusted, cn_adjusted,
+            self.t0_min, self.amc, self.lambda_coef,
+        )
+        self.basin.add_analysis(
+            _build_analysis(tc_result, tc_hr, tc_params, storm_code, tr, x, duration_hr, dt, sim)
+        )
+
+        return True
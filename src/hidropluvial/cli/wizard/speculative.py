@@ -0,0 +1,127 @@
+"""
+Cálculo anticipado de análisis mientras el wizard sigue preguntando.
+
+En cuanto el estado del wizard tiene datos de cuenca, métodos de Tc,
+tormentas y períodos de retorno, se lanza en un hilo de fondo el cálculo
+completo (Tc, hietogramas e hidrogramas). Si el usuario vuelve atrás y
+cambia algo que afecta el cálculo, el resultado anterior se descarta y se
+lanza uno nuevo. Al ejecutar, AnalysisRunner reutiliza el resultado si la
+configuración final coincide, de modo que la espera tras la última
+pregunta es mínima.
+"""
+
+import copy
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Optional
+
+from hidropluvial.cli.wizard.config import WizardConfig
+from hidropluvial.models import Basin
+
+
+# Campos de WizardConfig que no afectan el cálculo
+_NON_COMPUTE_FIELDS = ("nombre", "output_name")
+
+
+def config_fingerprint(config: WizardConfig) -> str:
+    """
+    Huella de los campos de la configuración que afectan el cálculo.
+
+    Args:
+        config: Configuración del wizard
+
+    Returns:
+        String que cambia si y solo si cambia algún dato de cálculo
+    """
+    data = asdict(config)
+    for name in _NON_COMPUTE_FIELDS:
+        data.pop(name, None)
+    return json.dumps(data, sort_keys=True, default=str)
+
+
+def is_ready(config: WizardConfig) -> bool:
+    """Indica si la configuración tiene todo lo necesario para calcular."""
+    return bool(
+        config.area_ha > 0
+        and config.p3_10 > 0
+        and (config.c or config.cn)
+        and config.tc_methods
+        and config.storm_codes
+        and config.return_periods
+    )
+
+
+def _compute(config: WizardConfig) -> Basin:
+    """Calcula Tc y todos los análisis de la configuración."""
+    from hidropluvial.cli.wizard.runner import run_basin_analyses
+
+    matrix = [(code, config.return_periods, config.x_factors) for code in config.storm_codes]
+    return run_basin_analyses(config, matrix)
+
+
+class SpeculativeRun:
+    """
+    Cálculo de análisis en segundo plano a partir del estado del wizard.
+
+    Se usa como callback de WizardNavigator (update) y luego se pasa a
+    AnalysisRunner, que consulta take() con la configuración final.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._fingerprint: Optional[str] = None
+        self._future: Optional[Future] = None
+
+    def update(self, state) -> None:
+        """
+        Lanza el cálculo si el estado está completo y cambió desde el último.
+
+        Args:
+            state: WizardState (o WizardConfig) actual
+        """
+        config = state if isinstance(state, WizardConfig) else WizardConfig.from_state(state)
+        if not is_ready(config):
+            return
+
+        fingerprint = config_fingerprint(config)
+        if fingerprint == self._fingerprint:
+            return
+
+        if self._future is not None:
+            # Si ya empezó, termina en segundo plano y se ignora su resultado
+            self._future.cancel()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hp-speculative")
+
+        # Copia: los pasos del wizard pueden seguir modificando las listas del estado
+        self._fingerprint = fingerprint
+        self._future = self._executor.submit(_compute, copy.deepcopy(config))
+
+    def take(self, config: WizardConfig) -> Optional[Basin]:
+        """
+        Devuelve la cuenca calculada si corresponde a la configuración dada.
+
+        Espera a que termine el cálculo si todavía está en curso. Devuelve
+        None si no hay cálculo para esta configuración o si falló (en ese
+        caso el runner calcula normalmente).
+        """
+        if self._future is None or config_fingerprint(config) != self._fingerprint:
+            return None
+
+        future, self._future, self._fingerprint = self._future, None, None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def close(self) -> None:
+        """Descarta cálculos pendientes y libera el hilo de fondo."""
+        if self._future is not None:
+            self._future.cancel()
+        self._future = None
+        self._fingerprint = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
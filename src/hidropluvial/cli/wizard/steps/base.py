@@ -5,7 +5,7 @@ Clases base y utilidades para los pasos del wizard.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import typer
 import questionary
@@ -179,10 +179,17 @@ class WizardStep(ABC):
 class WizardNavigator:
     """Controlador de navegación del wizard."""
 
-    def __init__(self, steps: list[WizardStep] = None, state: WizardState = None):
+    def __init__(
+        self,
+        steps: list[WizardStep] = None,
+        state: WizardState = None,
+        on_step_done: Optional[Callable[[WizardState], None]] = None,
+    ):
         self.state = state or WizardState()
         self.steps: list[WizardStep] = steps if steps is not None else self._default_steps()
         self.current_step = 0
+        # Se llama con el estado tras completar cada paso (cálculo anticipado)
+        self.on_step_done = on_step_done
 
     def _default_steps(self) -> list[WizardStep]:
         """Crea los pasos por defecto del wizard."""
@@ -222,6 +229,8 @@ class WizardNavigator:
 
             if result == StepResult.NEXT:
                 self.current_step += 1
+                if self.on_step_done:
+                    self.on_step_done(self.state)
             elif result == StepResult.BACK:
                 if self.current_step > 0:
                     self.current_step -= 1
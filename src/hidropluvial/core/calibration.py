@@ -0,0 +1,492 @@
+"""
+Calibración de parámetros contra hidrogramas observados.
+
+Ajusta pérdidas SCS-CN (CN, λ) y el hidrograma unitario (Tc y X del
+triangular, Tc y R de Clark, o Ct y Cp de Snyder) a uno o varios eventos
+observados (lluvia real + caudal de escorrentía directa).
+
+La búsqueda global usa scipy.optimize.differential_evolution en modo
+vectorizado: cada generación evalúa toda la población en lote (exceso,
+hidrogramas unitarios y convolución como matrices). Luego se refina el
+mejor punto con Nelder-Mead. En calibración conjunta el objetivo es el
+promedio ponderado sobre los eventos.
+
+Métricas: NSE, KGE, error de pico, error de tiempo al pico y de volumen.
+El caudal observado debe ser escorrentía directa (sin caudal base).
+"""
+
+import csv
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hidropluvial.config import HyetographResult
+from hidropluvial.core import kernels
+from hidropluvial.core.ensemble import convolve_batch, excess_scs, triangular_uh_batch
+from hidropluvial.core.hydrograph import clark_time_area, snyder_uh
+from hidropluvial.core.temporal import custom_hyetograph
+
+
+# Parámetros de cada modelo (pérdidas + hidrograma unitario)
+CALIBRATION_MODELS = {
+    "triangular": ("cn", "lambda", "tc", "x"),
+    "clark": ("cn", "lambda", "tc", "r"),
+    "snyder": ("cn", "lambda", "ct", "cp"),
+}
+
+# Rangos de búsqueda por defecto
+DEFAULT_BOUNDS = {
+    "cn": (40.0, 98.0),
+    "lambda": (0.01, 0.30),
+    "tc": (0.05, 12.0),
+    "x": (1.0, 5.5),
+    "r": (0.05, 24.0),
+    "ct": (0.3, 8.0),
+    "cp": (0.3, 0.95),
+}
+
+# Valores para parámetros no calibrados ni fijados
+DEFAULT_VALUES = {"lambda": 0.2, "x": 1.0, "ct": 2.0, "cp": 0.6}
+
+CALIBRATION_OBJECTIVES = ("nse", "kge")
+
+
+# ============================================================================
+# Eventos observados
+# ============================================================================
+
+@dataclass
+class ObservedEvent:
+    """
+    Evento de lluvia con su hidrograma observado.
+
+    Attributes:
+        name: Nombre del evento
+        hyetograph: Hietograma del evento (custom_hyetograph)
+        time_hr: Tiempos de las observaciones de caudal (h desde el
+            inicio de la lluvia)
+        flow_m3s: Caudal observado de escorrentía directa (m³/s)
+        weight: Peso en la calibración conjunta
+    """
+    name: str
+    hyetograph: HyetographResult
+    time_hr: NDArray[np.floating]
+    flow_m3s: NDArray[np.floating]
+    weight: float = 1.0
+
+    def __post_init__(self):
+        self.time_hr = np.asarray(self.time_hr, dtype=float)
+        self.flow_m3s = np.asarray(self.flow_m3s, dtype=float)
+        if len(self.time_hr) != len(self.flow_m3s):
+            raise ValueError(f"Evento '{self.name}': tiempos y caudales de distinta longitud")
+        if len(self.flow_m3s) < 3:
+            raise ValueError(f"Evento '{self.name}': se necesitan al menos 3 caudales observados")
+        if np.ptp(self.flow_m3s) == 0:
+            raise ValueError(f"Evento '{self.name}': el caudal observado es constante")
+
+    @property
+    def dt_hr(self) -> float:
+        return (self.hyetograph.time_min[1] - self.hyetograph.time_min[0]) / 60
+
+    @property
+    def depth_mm(self) -> NDArray[np.floating]:
+        return np.asarray(self.hyetograph.depth_mm, dtype=float)
+
+
+def load_event_csv(path: str | Path, name: Optional[str] = None, weight: float = 1.0) -> ObservedEvent:
+    """
+    Lee un evento observado desde CSV.
+
+    Columnas: time_min, rain_mm, flow_m3s. Las filas con rain_mm definen
+    el hietograma (intervalos regulares, tiempo central como en
+    custom_hyetograph); las filas con flow_m3s, el hidrograma observado.
+    Cualquiera de las dos columnas puede quedar vacía en una fila.
+
+    Args:
+        path: Ruta al CSV
+        name: Nombre del evento (por defecto, el nombre del archivo)
+        weight: Peso en la calibración conjunta
+
+    Returns:
+        ObservedEvent
+    """
+    path = Path(path)
+    rain_t, rain, flow_t, flow = [], [], [], []
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = {"time_min", "rain_mm", "flow_m3s"} - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"{path.name}: faltan columnas {', '.join(sorted(missing))}")
+        for row in reader:
+            t = float(row["time_min"])
+            if (row.get("rain_mm") or "").strip():
+                rain_t.append(t)
+                rain.append(float(row["rain_mm"]))
+            if (row.get("flow_m3s") or "").strip():
+                flow_t.append(t / 60)
+                flow.append(float(row["flow_m3s"]))
+
+    return ObservedEvent(
+        name=name or path.stem,
+        hyetograph=custom_hyetograph(rain_t, rain),
+        time_hr=np.array(flow_t),
+        flow_m3s=np.array(flow),
+        weight=weight,
+    )
+
+
+# ============================================================================
+# Métricas
+# ============================================================================
+
+def nse(sim: NDArray[np.floating], obs: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Nash-Sutcliffe por fila (sim: ... x T)."""
+    obs = np.asarray(obs, dtype=float)
+    return 1 - np.sum((sim - obs) ** 2, axis=-1) / np.sum((obs - obs.mean()) ** 2)
+
+
+def kge(sim: NDArray[np.floating], obs: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Kling-Gupta (2009) por fila (sim: ... x T)."""
+    obs = np.asarray(obs, dtype=float)
+    sim_mean = sim.mean(axis=-1)
+    sim_std = sim.std(axis=-1)
+    cov = np.mean((sim - sim_mean[..., None]) * (obs - obs.mean()), axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.where(sim_std > 0, cov / (sim_std * obs.std()), 0.0)
+    alpha = sim_std / obs.std()
+    beta = sim_mean / obs.mean()
+    return 1 - np.sqrt((r - 1) ** 2 + (alpha - 1) ** 2 + (beta - 1) ** 2)
+
+
+def event_metrics(
+    sim: NDArray[np.floating],
+    obs: NDArray[np.floating],
+    time_hr: NDArray[np.floating],
+) -> dict[str, float]:
+    """
+    Métricas de ajuste de un hidrograma simulado.
+
+    Returns:
+        Diccionario con nse, kge, peak_error (relativo), peak_time_error_hr
+        y volume_error (relativo)
+    """
+    sim = np.asarray(sim, dtype=float)
+    obs = np.asarray(obs, dtype=float)
+    obs_volume = np.trapezoid(obs, time_hr)
+    return {
+        "nse": float(nse(sim, obs)),
+        "kge": float(kge(sim, obs)),
+        "peak_error": float((sim.max() - obs.max()) / obs.max()),
+        "peak_time_error_hr": float(time_hr[np.argmax(sim)] - time_hr[np.argmax(obs)]),
+        "volume_error": float((np.trapezoid(sim, time_hr) - obs_volume) / obs_volume),
+    }
+
+
+# ============================================================================
+# Simulación en lote
+# ============================================================================
+
+def clark_uh_batch(
+    area_km2: float,
+    tc_hr: NDArray[np.floating],
+    r_hr: NDArray[np.floating],
+    dt_hr: float,
+) -> NDArray[np.floating]:
+    """
+    Hidrogramas unitarios de Clark (N x M), muestra a muestra como clark_uh.
+
+    El tránsito por el reservorio lineal usa core/kernels.py (vectorizado
+    sobre las muestras, o compilado con Numba si está disponible).
+    """
+    tc_hr = np.asarray(tc_hr, dtype=float)
+    r_hr = np.asarray(r_hr, dtype=float)
+
+    c1 = dt_hr / (2 * r_hr + dt_hr)
+    c0 = (2 * r_hr - dt_hr) / (2 * r_hr + dt_hr)
+
+    tb = tc_hr + 5 * r_hr
+    n_points = np.ceil(tb / dt_hr).astype(int) + 1
+    j = np.arange(n_points.max())[None, :]
+    t = j * (tb / (n_points - 1))[:, None]
+
+    area_cum = clark_time_area(np.minimum(t / tc_hr[:, None], 1.0))
+    area_incr = np.empty_like(area_cum)
+    area_incr[:, 0] = area_cum[:, 0]
+    area_incr[:, 1:] = np.diff(area_cum, axis=1)
+    inflow = area_incr * area_km2 * 1000 / (dt_hr * 3600)
+
+    outflow = kernels.linear_reservoir_batch(inflow, c0, c1)
+    outflow[j >= n_points[:, None]] = 0.0
+    return outflow
+
+
+def _snyder_uh_batch(
+    area_km2: float,
+    length_km: float,
+    lc_km: float,
+    dt_hr: float,
+    ct: NDArray[np.floating],
+    cp: NDArray[np.floating],
+) -> NDArray[np.floating]:
+    """Hidrogramas unitarios de Snyder por mm de escorrentía (N x M)."""
+    # snyder_uh está definido para 25.4 mm (1 pulgada) de escorrentía
+    rows = [snyder_uh(area_km2, length_km, lc_km, dt_hr, a, b)[1] / 25.4 for a, b in zip(ct, cp)]
+    uh = np.zeros((len(rows), max(len(r) for r in rows)))
+    for i, row in enumerate(rows):
+        uh[i, :len(row)] = row
+    return uh
+
+
+def _resample(flow: NDArray[np.floating], dt_hr: float, time_hr: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Interpola filas de caudal (paso dt) en los tiempos observados."""
+    pos = np.asarray(time_hr) / dt_hr
+    i0 = np.floor(pos).astype(int)
+    frac = pos - i0
+    needed = i0.max() + 2
+    if flow.shape[1] < needed:
+        flow = np.pad(flow, ((0, 0), (0, needed - flow.shape[1])))
+    return flow[:, i0] * (1 - frac) + flow[:, i0 + 1] * frac
+
+
+def unit_hydrographs_batch(
+    model: str,
+    area_ha: float,
+    params: dict[str, NDArray[np.floating]],
+    dt_hr: float,
+    length_km: Optional[float] = None,
+    lc_km: Optional[float] = None,
+) -> NDArray[np.floating]:
+    """
+    Hidrogramas unitarios (por mm) de N juegos de parámetros.
+
+    Returns:
+        Matriz N x M de ordenadas (m³/s por mm)
+    """
+    n = len(params["cn"])
+    if model == "triangular":
+        return triangular_uh_batch(np.full(n, area_ha), params["tc"], dt_hr, params["x"])
+    if model == "clark":
+        return clark_uh_batch(area_ha / 100, params["tc"], params["r"], dt_hr)
+    if model == "snyder":
+        if not length_km or not lc_km:
+            raise ValueError("Snyder requiere longitud del cauce y distancia al centroide")
+        return _snyder_uh_batch(area_ha / 100, length_km, lc_km, dt_hr, params["ct"], params["cp"])
+    raise ValueError(f"Modelo '{model}' no soportado (usar {', '.join(CALIBRATION_MODELS)})")
+
+
+def simulate_batch(
+    event: ObservedEvent,
+    area_ha: float,
+    model: str,
+    params: dict[str, NDArray[np.floating]],
+    length_km: Optional[float] = None,
+    lc_km: Optional[float] = None,
+    uh: Optional[NDArray[np.floating]] = None,
+) -> NDArray[np.floating]:
+    """
+    Caudal simulado en los tiempos observados para N juegos de parámetros.
+
+    Args:
+        event: Evento observado
+        area_ha: Área de la cuenca (ha)
+        model: triangular, clark o snyder
+        params: Parámetro -> array de N valores
+        length_km: Longitud del cauce (Snyder)
+        lc_km: Distancia al centroide (Snyder)
+        uh: Hidrogramas unitarios ya calculados para el dt del evento
+            (se comparten entre eventos con el mismo paso)
+
+    Returns:
+        Matriz N x len(event.time_hr) de caudales (m³/s)
+    """
+    n = len(params["cn"])
+    depths = np.broadcast_to(event.depth_mm, (n, len(event.depth_mm)))
+    excess = excess_scs(depths, params["cn"], params["lambda"])
+
+    if uh is None:
+        uh = unit_hydrographs_batch(model, area_ha, params, event.dt_hr, length_km, lc_km)
+
+    return _resample(convolve_batch(excess, uh), event.dt_hr, event.time_hr)
+
+
+# ============================================================================
+# Calibración
+# ============================================================================
+
+@dataclass
+class CalibrationResult:
+    """
+    Resultado de una calibración.
+
+    Attributes:
+        model: Modelo calibrado
+        params: Valores calibrados y fijos de todos los parámetros del modelo
+        calibrated: Nombres de los parámetros ajustados
+        objective: Métrica optimizada (nse, kge)
+        score: Valor ponderado de la métrica en el óptimo
+        metrics: Métricas por evento
+        simulated: Caudal simulado por evento (en los tiempos observados)
+        n_evaluations: Juegos de parámetros evaluados
+        success: Si el optimizador reportó convergencia
+    """
+    model: str
+    params: dict[str, float]
+    calibrated: list[str]
+    objective: str
+    score: float
+    metrics: dict[str, dict[str, float]]
+    simulated: dict[str, NDArray[np.floating]] = field(default_factory=dict)
+    n_evaluations: int = 0
+    success: bool = True
+
+
+def calibrate(
+    events: list[ObservedEvent],
+    area_ha: float,
+    model: str = "triangular",
+    params: Optional[list[str]] = None,
+    fixed: Optional[dict[str, float]] = None,
+    bounds: Optional[dict[str, tuple[float, float]]] = None,
+    objective: str = "nse",
+    length_km: Optional[float] = None,
+    lc_km: Optional[float] = None,
+    popsize: int = 15,
+    maxiter: int = 200,
+    seed: Optional[int] = None,
+    polish: bool = True,
+) -> CalibrationResult:
+    """
+    Calibra los parámetros de un modelo contra uno o varios eventos.
+
+    Args:
+        events: Eventos observados
+        area_ha: Área de la cuenca (ha)
+        model: triangular (CN, λ, Tc, X), clark (CN, λ, Tc, R) o
+            snyder (CN, λ, Ct, Cp)
+        params: Parámetros a calibrar (por defecto todos los del modelo
+            que no estén en `fixed`)
+        fixed: Valores fijos de parámetros no calibrados
+        bounds: Rangos de búsqueda (sobrescriben DEFAULT_BOUNDS)
+        objective: nse o kge (se maximiza el promedio ponderado)
+        length_km: Longitud del cauce (Snyder)
+        lc_km: Distancia al centroide (Snyder)
+        popsize: Tamaño relativo de la población (por parámetro)
+        maxiter: Generaciones máximas de la búsqueda global
+        seed: Semilla
+        polish: Refinar el óptimo con Nelder-Mead
+
+    Returns:
+        CalibrationResult
+    """
+    from scipy.optimize import differential_evolution, minimize
+
+    if model not in CALIBRATION_MODELS:
+        raise ValueError(f"Modelo '{model}' no soportado (usar {', '.join(CALIBRATION_MODELS)})")
+    if objective not in CALIBRATION_OBJECTIVES:
+        raise ValueError(f"Objetivo '{objective}' no soportado (usar {', '.join(CALIBRATION_OBJECTIVES)})")
+    if not events:
+        raise ValueError("Se necesita al menos un evento observado")
+    names = [e.name for e in events]
+    repeated = sorted({name for name in names if names.count(name) > 1})
+    if repeated:
+        raise ValueError(f"Eventos con nombre repetido: {', '.join(repeated)}")
+
+    model_params = CALIBRATION_MODELS[model]
+    fixed = dict(fixed or {})
+    if params is None:
+        params = [p for p in model_params if p not in fixed]
+    unknown = [p for p in list(params) + list(fixed) if p not in model_params]
+    if unknown:
+        raise ValueError(
+            f"Parámetros no válidos para {model}: {', '.join(unknown)} "
+            f"(usar {', '.join(model_params)})"
+        )
+    if not params:
+        raise ValueError("No hay parámetros para calibrar")
+
+    for name in model_params:
+        if name not in params and name not in fixed:
+            if name not in DEFAULT_VALUES:
+                raise ValueError(f"Indicar un valor fijo para '{name}' o calibrarlo")
+            fixed[name] = DEFAULT_VALUES[name]
+
+    search = {**DEFAULT_BOUNDS, **(bounds or {})}
+    box = [search[name] for name in params]
+    for name, (low, high) in zip(params, box):
+        if low >= high:
+            raise ValueError(f"Rango inválido para '{name}': {low} >= {high}")
+
+    metric = nse if objective == "nse" else kge
+    weights = np.array([e.weight for e in events], dtype=float)
+    weights = weights / weights.sum()
+    counter = {"n": 0}
+
+    def param_arrays(x: NDArray[np.floating]) -> dict[str, NDArray[np.floating]]:
+        # x: k x S (formato vectorizado de differential_evolution)
+        s = x.shape[1]
+        values = {name: np.full(s, float(v)) for name, v in fixed.items()}
+        values.update({name: x[i] for i, name in enumerate(params)})
+        return values
+
+    def loss(x: NDArray[np.floating]) -> NDArray[np.floating]:
+        values = param_arrays(x)
+        counter["n"] += x.shape[1]
+        total = np.zeros(x.shape[1])
+        uh_by_dt = {}
+        for w, event in zip(weights, events):
+            if event.dt_hr not in uh_by_dt:
+                uh_by_dt[event.dt_hr] = unit_hydrographs_batch(
+                    model, area_ha, values, event.dt_hr, length_km, lc_km
+                )
+            sim = simulate_batch(
+                event, area_ha, model, values, length_km, lc_km, uh=uh_by_dt[event.dt_hr]
+            )
+            total += w * (1 - np.nan_to_num(metric(sim, event.flow_m3s), nan=-1e6))
+        return total
+
+    result = differential_evolution(
+        loss,
+        box,
+        popsize=popsize,
+        maxiter=maxiter,
+        seed=seed,
+        vectorized=True,
+        updating="deferred",
+        polish=False,
+        tol=1e-6,
+    )
+    best, success = result.x, bool(result.success)
+
+    if polish:
+        local = minimize(
+            lambda v: float(loss(np.asarray(v)[:, None])[0]),
+            best,
+            method="Nelder-Mead",
+            bounds=box,
+            options={"xatol": 1e-4, "fatol": 1e-7, "maxiter": 400 * len(params)},
+        )
+        if local.fun <= result.fun:
+            best = local.x
+
+    values = param_arrays(np.asarray(best)[:, None])
+    final = {name: float(values[name][0]) for name in model_params}
+    metrics, simulated = {}, {}
+    for event in events:
+        sim = simulate_batch(event, area_ha, model, values, length_km, lc_km)[0]
+        simulated[event.name] = sim
+        metrics[event.name] = event_metrics(sim, event.flow_m3s, event.time_hr)
+
+    return CalibrationResult(
+        model=model,
+        params=final,
+        calibrated=list(params),
+        objective=objective,
+        score=float(sum(w * metrics[e.name][objective] for w, e in zip(weights, events))),
+        metrics=metrics,
+        simulated=simulated,
+        n_evaluations=counter["n"],
+        success=success,
+    )
@@ -0,0 +1,429 @@
+"""
+Simulación continua de registros largos de lluvia.
+
+Procesa registros de varios años (por ejemplo, 5 minutos durante 20 años,
+~2 millones de pasos) por bloques, con memoria constante:
+
+    lluvia (CSV por bloques) -> exceso SCS-CN por evento -> HU triangular
+    -> convolución overlap-add -> máximos anuales
+
+Separación de eventos: un evento termina tras `inter_event_hr` horas sin
+lluvia. Al empezar un evento nuevo la lluvia acumulada se reinicia (la
+abstracción inicial Ia se recupera) y, opcionalmente, el CN se ajusta por
+la condición antecedente (AMC) según la lluvia de los 5 días previos.
+
+El resultado es la serie de caudales máximos anuales, lista para un
+análisis de frecuencia (Gumbel).
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hidropluvial.config import AntecedentMoistureCondition
+from hidropluvial.core.hydrograph import triangular_uh_x
+from hidropluvial.core.runoff import adjust_cn_for_amc, scs_runoff
+
+
+# Filas por bloque al leer el registro
+DEFAULT_CHUNK_ROWS = 65_536
+
+# Umbrales de lluvia antecedente de 5 días para AMC (mm, estación de
+# crecimiento, SCS): < 35.6 -> AMC I, > 53.3 -> AMC III
+AMC_THRESHOLDS_MM = (35.6, 53.3)
+
+# Días de lluvia antecedente para AMC
+ANTECEDENT_DAYS = 5
+
+# Períodos de retorno por defecto para el análisis de frecuencia
+DEFAULT_RETURN_PERIODS = (2, 5, 10, 25, 50, 100)
+
+
+# ============================================================================
+# Lectura por bloques
+# ============================================================================
+
+def read_rainfall_csv(
+    path: str | Path,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    time_column: Optional[str] = None,
+    rain_column: str = "rain_mm",
+) -> Iterator[tuple[NDArray[np.datetime64], NDArray[np.floating]]]:
+    """
+    Lee un registro de lluvia por bloques.
+
+    El CSV debe tener una columna de fecha/hora (la primera, o
+    `time_column`) y la lluvia por paso en mm. El paso debe ser regular:
+    los huecos deben completarse con 0 antes de simular.
+
+    Args:
+        path: Ruta al CSV
+        chunk_rows: Filas por bloque
+        time_column: Columna de fecha/hora (por defecto, la primera)
+        rain_column: Columna de lluvia (mm por paso)
+
+    Yields:
+        Tuplas (tiempos datetime64, lluvia mm)
+    """
+    import pandas as pd
+
+    path = Path(path)
+    reader = pd.read_csv(path, chunksize=chunk_rows)
+    for chunk in reader:
+        column = time_column or chunk.columns[0]
+        if rain_column not in chunk.columns:
+            raise ValueError(f"{path.name}: falta la columna '{rain_column}'")
+        times = pd.to_datetime(chunk[column]).to_numpy(dtype="datetime64[s]")
+        rain = pd.to_numeric(chunk[rain_column], errors="coerce").fillna(0.0).to_numpy(dtype=float)
+        yield times, np.maximum(rain, 0.0)
+
+
+# ============================================================================
+# Exceso por eventos
+# ============================================================================
+
+class EventExcess:
+    """
+    Exceso de lluvia SCS-CN con separación de eventos, por bloques.
+
+    Mantiene entre bloques el estado del evento en curso (lluvia y
+    escorrentía acumuladas, CN), los pasos desde la última lluvia y la
+    lluvia de los últimos días para AMC.
+
+    Args:
+        cn: Número de curva (AMC II)
+        dt_min: Paso del registro (min)
+        lambda_coef: Coeficiente lambda para Ia
+        inter_event_hr: Horas secas que separan eventos
+        amc_thresholds_mm: Umbrales (AMC I, AMC III) de lluvia antecedente;
+            None mantiene AMC II en todos los eventos
+    """
+
+    def __init__(
+        self,
+        cn: float,
+        dt_min: float,
+        lambda_coef: float = 0.2,
+        inter_event_hr: float = 6.0,
+        amc_thresholds_mm: Optional[tuple[float, float]] = AMC_THRESHOLDS_MM,
+    ):
+        if not 30 <= cn <= 100:
+            raise ValueError("CN debe estar entre 30 y 100")
+        if inter_event_hr <= 0:
+            raise ValueError("La separación entre eventos debe ser > 0")
+
+        self.cn = float(cn)
+        self.lambda_coef = lambda_coef
+        self.gap_steps = max(int(round(inter_event_hr * 60 / dt_min)), 1)
+        self.amc_thresholds_mm = amc_thresholds_mm
+        self.antecedent_steps = int(round(ANTECEDENT_DAYS * 24 * 60 / dt_min))
+        self._cn_by_amc = {
+            amc: adjust_cn_for_amc(cn, amc) for amc in AntecedentMoistureCondition
+        }
+
+        self.n_events = 0
+        self._event_p = 0.0
+        self._event_q = 0.0
+        self._event_cn = self.cn
+        # Índice de la última lluvia relativo al inicio del próximo bloque
+        self._last_wet = -np.inf
+        self._tail = np.zeros(0)
+
+    def _event_cn_for(self, antecedent_mm: NDArray[np.floating]) -> NDArray[np.floating]:
+        if self.amc_thresholds_mm is None:
+            return np.full(len(antecedent_mm), self.cn)
+        dry, wet = self.amc_thresholds_mm
+        cn = np.full(len(antecedent_mm), self._cn_by_amc[AntecedentMoistureCondition.AVERAGE])
+        cn[antecedent_mm < dry] = self._cn_by_amc[AntecedentMoistureCondition.DRY]
+        cn[antecedent_mm > wet] = self._cn_by_amc[AntecedentMoistureCondition.WET]
+        return cn
+
+    def process(self, rain: NDArray[np.floating]) -> NDArray[np.floating]:
+        """
+        Exceso incremental (mm) de un bloque de lluvia.
+
+        Args:
+            rain: Lluvia por paso (mm)
+
+        Returns:
+            Exceso por paso (mm)
+        """
+        rain = np.asarray(rain, dtype=float)
+        n = len(rain)
+        if n == 0:
+            return np.zeros(0)
+        idx = np.arange(n)
+        wet = rain > 0
+
+        # Última lluvia antes de cada paso y pasos secos intermedios
+        last_wet = np.maximum.accumulate(np.maximum(np.where(wet, idx, -np.inf), self._last_wet))
+        previous_wet = np.concatenate([[self._last_wet], last_wet[:-1]])
+        new_event = wet & (idx - previous_wet - 1 >= self.gap_steps)
+        starts = np.flatnonzero(new_event)
+        segment = np.cumsum(new_event)
+
+        # Lluvia acumulada dentro de cada evento (segmento 0: evento en curso)
+        cum_rain = np.cumsum(rain)
+        offsets = np.concatenate([[-self._event_p], cum_rain[starts] - rain[starts]])
+        event_p = cum_rain - offsets[segment]
+
+        # CN de cada evento según la lluvia antecedente a su inicio
+        extended = np.concatenate([self._tail, rain])
+        cum_ext = np.concatenate([[0.0], np.cumsum(extended)])
+        start_ext = starts + len(self._tail)
+        antecedent = cum_ext[start_ext] - cum_ext[np.maximum(start_ext - self.antecedent_steps, 0)]
+        segment_cn = np.concatenate([[self._event_cn], self._event_cn_for(antecedent)])
+
+        step_cn = segment_cn[segment]
+        event_q = np.empty(n)
+        for cn in np.unique(step_cn):
+            mask = step_cn == cn
+            event_q[mask] = scs_runoff(event_p[mask], cn, self.lambda_coef)
+
+        previous_q = np.concatenate([[self._event_q], event_q[:-1]])
+        previous_q[starts] = 0.0
+        excess = np.maximum(event_q - previous_q, 0.0)
+
+        self.n_events += len(starts)
+        self._event_p = float(event_p[-1])
+        self._event_q = float(event_q[-1])
+        self._event_cn = float(segment_cn[-1])
+        self._last_wet = float(last_wet[-1]) - n
+        self._tail = extended[-self.antecedent_steps:] if self.antecedent_steps else np.zeros(0)
+        return excess
+
+
+# ============================================================================
+# Convolución overlap-add
+# ============================================================================
+
+class OverlapAddRouter:
+    """
+    Convolución por bloques con el hidrograma unitario (overlap-add).
+
+    Cada bloque se convoluciona por FFT y la cola (M - 1 valores) se suma
+    al bloque siguiente, de modo que la memoria no depende del largo del
+    registro.
+
+    Args:
+        unit_hydrograph: Ordenadas del HU (m³/s por mm)
+    """
+
+    def __init__(self, unit_hydrograph: NDArray[np.floating]):
+        self.uh = np.asarray(unit_hydrograph, dtype=float)
+        self._tail = np.zeros(len(self.uh) - 1)
+
+    def process(self, excess: NDArray[np.floating]) -> NDArray[np.floating]:
+        """Caudal (m³/s) de los pasos del bloque."""
+        from scipy.signal import oaconvolve
+
+        n = len(excess)
+        if n == 0:
+            return np.zeros(0)
+        full = oaconvolve(excess, self.uh)
+        full[:len(self._tail)] += self._tail
+        self._tail = full[n:].copy()
+        return np.maximum(full[:n], 0.0)
+
+    def flush(self) -> NDArray[np.floating]:
+        """Caudal pendiente tras el último bloque (recesión final)."""
+        tail, self._tail = self._tail, np.zeros(len(self.uh) - 1)
+        return np.maximum(tail, 0.0)
+
+
+# ============================================================================
+# Simulación
+# ============================================================================
+
+@dataclass
+class AnnualMaximum:
+    """Máximo anual de caudal y totales del año."""
+    year: int
+    peak_flow_m3s: float
+    time: np.datetime64
+    rain_mm: float = 0.0
+    runoff_mm: float = 0.0
+
+
+@dataclass
+class ContinuousResult:
+    """
+    Resultado de una simulación continua.
+
+    Attributes:
+        annual_maxima: Máximos anuales ordenados por año
+        n_steps: Pasos simulados
+        n_events: Eventos de lluvia separados
+        dt_min: Paso del registro (min)
+        total_rain_mm: Lluvia total
+        total_runoff_mm: Escorrentía directa total
+    """
+    annual_maxima: list[AnnualMaximum]
+    n_steps: int
+    n_events: int
+    dt_min: float
+    total_rain_mm: float
+    total_runoff_mm: float
+    settings: dict = field(default_factory=dict)
+
+    @property
+    def peaks(self) -> NDArray[np.floating]:
+        return np.array([m.peak_flow_m3s for m in self.annual_maxima])
+
+    def frequency(
+        self, return_periods: Iterable[float] = DEFAULT_RETURN_PERIODS,
+    ) -> dict[float, float]:
+        """Caudales por período de retorno (Gumbel) de los máximos anuales."""
+        return gumbel_quantiles(self.peaks, return_periods)
+
+
+def gumbel_quantiles(
+    peaks: NDArray[np.floating],
+    return_periods: Iterable[float] = DEFAULT_RETURN_PERIODS,
+) -> dict[float, float]:
+    """
+    Ajuste Gumbel por momentos de una serie de máximos anuales.
+
+    Q(T) = media + K(T) × desvío,  K(T) = -(√6/π) {0.5772 + ln[ln(T/(T-1))]}
+
+    Args:
+        peaks: Máximos anuales
+        return_periods: Períodos de retorno (años, > 1)
+
+    Returns:
+        Diccionario Tr -> caudal
+    """
+    peaks = np.asarray(peaks, dtype=float)
+    if len(peaks) < 2:
+        raise ValueError("Se necesitan al menos 2 máximos anuales")
+    mean, std = peaks.mean(), peaks.std(ddof=1)
+    quantiles = {}
+    for tr in return_periods:
+        if tr <= 1:
+            raise ValueError("Período de retorno debe ser > 1 año")
+        k = -np.sqrt(6) / np.pi * (0.5772156649 + np.log(np.log(tr / (tr - 1))))
+        quantiles[tr] = float(mean + k * std)
+    return quantiles
+
+
+def _years(times: NDArray[np.datetime64]) -> NDArray[np.int_]:
+    return times.astype("datetime64[Y]").astype(int) + 1970
+
+
+def simulate_continuous(
+    records: Iterable[tuple[NDArray[np.datetime64], NDArray[np.floating]]],
+    area_ha: float,
+    cn: float,
+    tc_hr: float,
+    x_factor: float = 1.67,
+    lambda_coef: float = 0.2,
+    inter_event_hr: float = 6.0,
+    amc_thresholds_mm: Optional[tuple[float, float]] = AMC_THRESHOLDS_MM,
+    on_chunk: Optional[Callable[[NDArray[np.datetime64], NDArray[np.floating]], None]] = None,
+) -> ContinuousResult:
+    """
+    Simula un registro continuo de lluvia por bloques.
+
+    Args:
+        records: Bloques (tiempos, lluvia mm), por ejemplo de read_rainfall_csv
+        area_ha: Área de la cuenca (ha)
+        cn: Número de curva (AMC II)
+        tc_hr: Tiempo de concentración (h)
+        x_factor: Factor X del hidrograma triangular
+        lambda_coef: Coeficiente lambda para Ia
+        inter_event_hr: Horas secas que separan eventos
+        amc_thresholds_mm: Umbrales de AMC (None: siempre AMC II)
+        on_chunk: Callback con (tiempos, caudal) de cada bloque simulado
+
+    Returns:
+        ContinuousResult con los máximos anuales
+    """
+    excess_stream: Optional[EventExcess] = None
+    router: Optional[OverlapAddRouter] = None
+    dt: Optional[np.timedelta64] = None
+    last_time: Optional[np.datetime64] = None
+
+    maxima: dict[int, AnnualMaximum] = {}
+    n_steps = 0
+    total_rain = total_runoff = 0.0
+
+    def update_maxima(times, flow, rain=None, excess=None):
+        years = _years(times)
+        for year in np.unique(years):
+            if rain is None and int(year) not in maxima:
+                # La recesión final no abre un año sin registro
+                continue
+            mask = years == year
+            i = int(np.argmax(np.where(mask, flow, -np.inf)))
+            current = maxima.setdefault(int(year), AnnualMaximum(int(year), -np.inf, times[i]))
+            if flow[i] > current.peak_flow_m3s:
+                current.peak_flow_m3s = float(flow[i])
+                current.time = times[i]
+            if rain is not None:
+                current.rain_mm += float(rain[mask].sum())
+                current.runoff_mm += float(excess[mask].sum())
+
+    for times, rain in records:
+        times = np.asarray(times, dtype="datetime64[s]")
+        rain = np.asarray(rain, dtype=float)
+        if len(times) == 0:
+            continue
+
+        if dt is None:
+            if len(times) < 2:
+                raise ValueError("El primer bloque debe tener al menos 2 registros")
+            dt = times[1] - times[0]
+            if dt <= np.timedelta64(0, "s"):
+                raise ValueError("Los tiempos del registro deben ser crecientes")
+            dt_min = dt / np.timedelta64(1, "m")
+            excess_stream = EventExcess(cn, dt_min, lambda_coef, inter_event_hr, amc_thresholds_mm)
+            _, uh = triangular_uh_x(area_ha, tc_hr, dt_min / 60, x_factor)
+            router = OverlapAddRouter(uh)
+        else:
+            expected_first = last_time + dt
+            if times[0] != expected_first:
+                raise ValueError(f"Registro irregular: se esperaba {expected_first}, se leyó {times[0]}")
+
+        steps = np.diff(times)
+        if len(steps) and np.any(steps != dt):
+            bad = int(np.flatnonzero(steps != dt)[0])
+            raise ValueError(f"Registro irregular en {times[bad]} -> {times[bad + 1]}")
+
+        excess = excess_stream.process(rain)
+        flow = router.process(excess)
+        update_maxima(times, flow, rain, excess)
+        if on_chunk is not None:
+            on_chunk(times, flow)
+
+        n_steps += len(rain)
+        total_rain += float(rain.sum())
+        total_runoff += float(excess.sum())
+        last_time = times[-1]
+
+    if router is None:
+        raise ValueError("El registro de lluvia está vacío")
+
+    # Recesión posterior al último registro
+    tail = router.flush()
+    if len(tail):
+        tail_times = last_time + dt * np.arange(1, len(tail) + 1)
+        update_maxima(tail_times, tail)
+        if on_chunk is not None:
+            on_chunk(tail_times, tail)
+
+    return ContinuousResult(
+        annual_maxima=[maxima[year] for year in sorted(maxima)],
+        n_steps=n_steps,
+        n_events=excess_stream.n_events,
+        dt_min=float(dt / np.timedelta64(1, "m")),
+        total_rain_mm=total_rain,
+        total_runoff_mm=total_runoff,
+        settings={
+            "area_ha": area_ha, "cn": cn, "tc_hr": tc_hr, "x": x_factor,
+            "lambda": lambda_coef, "inter_event_hr": inter_event_hr,
+            "amc": amc_thresholds_mm is not None,
+        },
+    )
@@ -0,0 +1,430 @@
+"""
+Búsqueda de la duración crítica de tormenta.
+
+Los análisis usan duraciones fijas por tormenta (GZ 6 h, bloques
+max(Tc, 1 h), 24 h para blocks24 y SCS). Este módulo busca, para una
+familia de tormentas, la duración (y el dt) que maximiza el caudal pico:
+
+    1. Barrido grueso: todas las combinaciones duración × dt en una sola
+       evaluación vectorizada (una matriz de hietogramas por dt).
+    2. Refinamiento: todas las duraciones múltiplo de dt entre los vecinos
+       del mejor punto del barrido.
+
+Las profundidades DINAGUA se memorizan: el hietograma unitario de cada
+(familia, duración, dt) no depende de P3,10 ni de Tr (ambos escalan la
+lámina), así que se calcula una vez y se reutiliza para todas las
+cuencas y períodos de retorno.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hidropluvial.core.ensemble import (
+    convolve_batch,
+    excess_rational,
+    excess_scs,
+    unit_hydrograph_batch,
+)
+from hidropluvial.core.idf import dinagua_ct
+from hidropluvial.core.temporal import (
+    _distribute_alternating_blocks,
+    _load_huff_curves,
+    _load_scs_distributions,
+)
+
+
+# Familias de tormenta soportadas
+CRITICAL_FAMILIES = ("blocks", "gz", "chicago", "huff_q1", "huff_q2", "huff_q3", "huff_q4", "scs_ii")
+
+# Posición del pico de los bloques alternados por familia
+_PEAK_POSITION = {"blocks": 0.5, "gz": 1.0 / 6.0}
+
+# Coeficiente de avance de la tormenta Chicago
+CHICAGO_ADVANCEMENT = 0.375
+
+# Duraciones del barrido grueso por defecto (h)
+DEFAULT_DURATIONS_HR = (0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 6.0, 9.0, 12.0, 18.0, 24.0)
+
+
+# ============================================================================
+# Profundidades memorizadas
+# ============================================================================
+
+def dinagua_cd_array(duration_hr: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Factor Cd de DINAGUA vectorizado (ver idf.dinagua_cd)."""
+    d = np.asarray(duration_hr, dtype=float)
+    short = 0.6208 / (d + 0.0137) ** 0.5639 * d / 3.0
+    long = 1.0287 / (d + 1.0293) ** 0.8083 * d / 3.0
+    return np.where(d < 3.0, short, long)
+
+
+@lru_cache(maxsize=64)
+def _cd_grid(dt_min: float, n_intervals: int) -> NDArray[np.floating]:
+    """Cd acumulado en 0, dt, 2 dt, ..., n dt (solo lectura)."""
+    d = np.arange(n_intervals + 1) * dt_min / 60
+    cd = np.zeros(n_intervals + 1)
+    cd[1:] = dinagua_cd_array(d[1:])
+    cd.setflags(write=False)
+    return cd
+
+
+def cd_grid(dt_min: float, n_intervals: int) -> NDArray[np.floating]:
+    """
+    Cd en los múltiplos de dt hasta n intervalos.
+
+    Se memoriza una grilla por dt que crece al doble cuando hace falta:
+    todas las duraciones del barrido con el mismo dt comparten la misma
+    evaluación de la curva IDF.
+    """
+    size = 64
+    while size < n_intervals:
+        size *= 2
+    return _cd_grid(float(dt_min), size)[:n_intervals + 1]
+
+
+def _chicago_cumulative(duration_hr: float, dt_min: float, n_intervals: int) -> NDArray[np.floating]:
+    """
+    Lámina acumulada Chicago con la curva DINAGUA en los bordes de intervalo.
+
+    En toda ventana de duración τ alrededor del pico cae la lámina IDF de
+    τ: antes del pico r·P(t_b / r) y después (1 - r)·P(t_a / (1 - r)).
+    """
+    r = CHICAGO_ADVANCEMENT
+    t = np.arange(n_intervals + 1) * dt_min / 60
+    t_peak = r * duration_hr
+
+    before = np.maximum(t_peak - t, 0.0) / r
+    after = np.maximum(t - t_peak, 0.0) / (1 - r)
+    cd_before = np.where(before > 0, dinagua_cd_array(np.maximum(before, 1e-12)), 0.0)
+    cd_after = np.where(after > 0, dinagua_cd_array(np.maximum(after, 1e-12)), 0.0)
+
+    total_before = r * dinagua_cd_array(np.array(duration_hr)) if r > 0 else 0.0
+    return total_before - r * cd_before + (1 - r) * cd_after
+
+
+@lru_cache(maxsize=1024)
+def unit_hyetograph(family: str, duration_hr: float, dt_min: float) -> NDArray[np.floating]:
+    """
+    Hietograma de la familia para P3,10 × Ct = 1 mm (solo lectura).
+
+    Args:
+        family: Familia de tormenta (ver CRITICAL_FAMILIES)
+        duration_hr: Duración (h)
+        dt_min: Paso de tiempo (min)
+
+    Returns:
+        Profundidad por intervalo
+    """
+    n_intervals = int(round(duration_hr * 60 / dt_min, 9))
+    if n_intervals < 1:
+        raise ValueError(f"Duración {duration_hr} h menor que dt = {dt_min} min")
+
+    if family in _PEAK_POSITION:
+        increments = np.diff(cd_grid(dt_min, n_intervals))
+        pattern = _distribute_alternating_blocks(
+            np.sort(increments)[::-1], n_intervals, _PEAK_POSITION[family]
+        )
+    elif family == "chicago":
+        pattern = np.diff(_chicago_cumulative(duration_hr, dt_min, n_intervals))
+    elif family.startswith("huff_q"):
+        # Curva Huff de probabilidad 50% (igual que huff_distribution)
+        curve = _load_huff_curves()[family]["probability_50"]
+        fraction = np.interp(np.linspace(0, 100, n_intervals + 1), curve["time_pct"], curve["rain_pct"]) / 100
+        pattern = np.diff(fraction) * cd_grid(dt_min, n_intervals)[-1]
+    elif family == "scs_ii":
+        curve = _load_scs_distributions()["scs_type_ii"]
+        fraction = np.interp(
+            np.linspace(0, 24, n_intervals + 1), curve["time_hr"], curve["ratio"]
+        )
+        pattern = np.diff(fraction) * cd_grid(dt_min, n_intervals)[-1]
+    else:
+        raise ValueError(f"Familia '{family}' no soportada (usar {', '.join(CRITICAL_FAMILIES)})")
+
+    pattern = np.array(pattern, dtype=float)
+    pattern.setflags(write=False)
+    return pattern
+
+
+# ============================================================================
+# Evaluación
+# ============================================================================
+
+@dataclass
+class StormBasin:
+    """
+    Datos de cuenca para la búsqueda.
+
+    Attributes:
+        area_ha: Área (ha)
+        tc_hr: Tiempo de concentración (h)
+        p3_10: P3,10 (mm)
+        c: Coeficiente C (método racional)
+        cn: Número de curva (SCS-CN)
+        lambda_coef: Coeficiente lambda para Ia
+        x_factor: Factor X del HU triangular (solo con la familia GZ)
+        name: Nombre (para reportes)
+
+    El hidrograma unitario sigue la regla de AnalysisRunner (ver
+    unit_hydrograph): triangular con X para el método racional o la
+    familia GZ, triangular SCS para SCS-CN con las demás familias.
+    """
+    area_ha: float
+    tc_hr: float
+    p3_10: float
+    c: Optional[float] = None
+    cn: Optional[float] = None
+    lambda_coef: float = 0.2
+    x_factor: float = 1.0
+    name: str = ""
+
+    def __post_init__(self):
+        if (self.c is None) == (self.cn is None):
+            raise ValueError("Indicar C (método racional) o CN (SCS-CN), no ambos")
+        if self.area_ha <= 0 or self.tc_hr <= 0:
+            raise ValueError("Área y Tc deben ser > 0")
+
+    @property
+    def runoff(self) -> str:
+        """Método de escorrentía: 'racional' o 'scs-cn'."""
+        return "racional" if self.c is not None else "scs-cn"
+
+    def unit_hydrograph(self, family: str, dt_hr: float) -> NDArray[np.floating]:
+        """Hidrograma unitario (1 x M) para una familia de tormenta."""
+        return unit_hydrograph_batch(
+            self.runoff, family, np.array([self.area_ha]), np.array([self.tc_hr]),
+            dt_hr, np.array([self.x_factor]),
+        )
+
+
+def _evaluate(
+    basin: StormBasin,
+    family: str,
+    tr: int,
+    durations_hr: NDArray[np.floating],
+    dt_min: float,
+) -> tuple[NDArray[np.floating], NDArray[np.floating], NDArray[np.floating]]:
+    """Qp, Tp y volumen de varias duraciones con el mismo dt (una convolución)."""
+    scale = basin.p3_10 * dinagua_ct(tr)
+    patterns = [unit_hyetograph(family, float(d), dt_min) for d in durations_hr]
+    depths = np.zeros((len(patterns), max(len(p) for p in patterns)))
+    for i, pattern in enumerate(patterns):
+        depths[i, :len(pattern)] = scale * pattern
+
+    n = len(patterns)
+    if basin.c is not None:
+        excess = excess_rational(depths, np.full(n, basin.c))
+    else:
+        excess = excess_scs(depths, np.full(n, basin.cn), basin.lambda_coef)
+
+    dt_hr = dt_min / 60
+    uh = basin.unit_hydrograph(family, dt_hr)
+    flow = convolve_batch(excess, np.repeat(uh, n, axis=0))
+
+    peak_idx = np.argmax(flow, axis=1)
+    rows = np.arange(n)
+    return (
+        flow[rows, peak_idx],
+        peak_idx * dt_hr,
+        np.trapezoid(flow, dx=dt_hr * 3600, axis=1),
+    )
+
+
+def _snap(durations_hr: NDArray[np.floating], dt_min: float) -> NDArray[np.floating]:
+    """Duraciones redondeadas a múltiplos de dt (al menos un intervalo), sin repetir."""
+    steps = np.maximum(np.round(np.asarray(durations_hr) * 60 / dt_min), 1)
+    return np.unique(steps) * dt_min / 60
+
+
+@dataclass
+class CriticalStormResult:
+    """
+    Duración crítica de una familia de tormentas para una cuenca y Tr.
+
+    Attributes:
+        family: Familia de tormenta
+        tr: Período de retorno (años)
+        duration_hr: Duración crítica (h)
+        dt_min: Paso de tiempo crítico (min)
+        peak_flow_m3s: Caudal pico con la duración crítica
+        time_to_peak_hr: Tiempo al pico (h)
+        volume_m3: Volumen del hidrograma (m³)
+        scan: Barrido completo (duration_hr, dt_min, peak_flow_m3s por punto)
+        time_hr: Tiempos del hidrograma crítico (h)
+        flow_m3s: Caudales del hidrograma crítico
+        depth_mm: Hietograma crítico (mm por intervalo)
+        n_evaluations: Duraciones evaluadas (barrido + refinamiento)
+        basin: Nombre de la cuenca
+    """
+    family: str
+    tr: int
+    duration_hr: float
+    dt_min: float
+    peak_flow_m3s: float
+    time_to_peak_hr: float
+    volume_m3: float
+    scan: dict[str, NDArray] = field(default_factory=dict)
+    time_hr: NDArray[np.floating] = field(default_factory=lambda: np.zeros(0))
+    flow_m3s: NDArray[np.floating] = field(default_factory=lambda: np.zeros(0))
+    depth_mm: NDArray[np.floating] = field(default_factory=lambda: np.zeros(0))
+    n_evaluations: int = 0
+    basin: str = ""
+
+
+def critical_duration(
+    basin: StormBasin,
+    family: str = "blocks",
+    tr: int = 10,
+    durations_hr: Optional[list[float]] = None,
+    dts_min: Optional[list[float]] = None,
+    refine: bool = True,
+) -> CriticalStormResult:
+    """
+    Busca la duración y el dt que maximizan el caudal pico.
+
+    Args:
+        basin: Datos de la cuenca
+        family: Familia de tormenta (ver CRITICAL_FAMILIES)
+        tr: Período de retorno (años)
+        durations_hr: Duraciones del barrido grueso (por defecto,
+            DEFAULT_DURATIONS_HR); se redondean a múltiplos de cada dt
+        dts_min: Pasos de tiempo a evaluar (por defecto, 5 min)
+        refine: Evaluar todas las duraciones múltiplo de dt entre los
+            vecinos del mejor punto
+
+    Returns:
+        CriticalStormResult con la duración crítica y su hidrograma
+    """
+    if family not in CRITICAL_FAMILIES:
+        raise ValueError(f"Familia '{family}' no soportada (usar {', '.join(CRITICAL_FAMILIES)})")
+    durations = np.asarray(durations_hr or DEFAULT_DURATIONS_HR, dtype=float)
+    dts = [float(dt) for dt in (dts_min or [5.0])]
+    if np.any(durations <= 0) or any(dt <= 0 for dt in dts):
+        raise ValueError("Duraciones y dt deben ser > 0")
+
+    # Barrido grueso: una evaluación por dt
+    scan_d, scan_dt, scan_q = [], [], []
+    for dt in dts:
+        grid = _snap(durations, dt)
+        peaks, _, _ = _evaluate(basin, family, tr, grid, dt)
+        scan_d.append(grid)
+        scan_dt.append(np.full(len(grid), dt))
+        scan_q.append(peaks)
+    scan = {
+        "duration_hr": np.concatenate(scan_d),
+        "dt_min": np.concatenate(scan_dt),
+        "peak_flow_m3s": np.concatenate(scan_q),
+    }
+    n_evaluations = len(scan["duration_hr"])
+
+    best = int(np.argmax(scan["peak_flow_m3s"]))
+    best_dt = float(scan["dt_min"][best])
+    best_duration = float(scan["duration_hr"][best])
+
+    # Refinamiento entre los vecinos del barrido con el mismo dt
+    if refine:
+        grid = scan["duration_hr"][scan["dt_min"] == best_dt]
+        k = int(np.searchsorted(grid, best_duration))
+        low = grid[k - 1] if k > 0 else best_dt / 60
+        high = grid[k + 1] if k + 1 < len(grid) else grid[k]
+        steps = np.arange(round(low * 60 / best_dt), round(high * 60 / best_dt) + 1)
+        fine = steps[steps >= 1] * best_dt / 60
+        fine = fine[~np.isin(np.round(fine, 9), np.round(grid, 9))]
+        if len(fine):
+            peaks, _, _ = _evaluate(basin, family, tr, fine, best_dt)
+            n_evaluations += len(fine)
+            i = int(np.argmax(peaks))
+            if peaks[i] > scan["peak_flow_m3s"][best]:
+                best_duration = float(fine[i])
+
+    return critical_hydrograph(basin, family, tr, best_duration, best_dt, scan, n_evaluations)
+
+
+def critical_hydrograph(
+    basin: StormBasin,
+    family: str,
+    tr: int,
+    duration_hr: float,
+    dt_min: float,
+    scan: Optional[dict[str, NDArray]] = None,
+    n_evaluations: int = 1,
+) -> CriticalStormResult:
+    """Hidrograma completo de una duración (el crítico, tras la búsqueda)."""
+    depth = basin.p3_10 * dinagua_ct(tr) * unit_hyetograph(family, duration_hr, dt_min)
+    if basin.c is not None:
+        excess = excess_rational(depth[None, :], np.array([basin.c]))
+    else:
+        excess = excess_scs(depth[None, :], np.array([basin.cn]), basin.lambda_coef)
+
+    dt_hr = dt_min / 60
+    uh = basin.unit_hydrograph(family, dt_hr)
+    flow = np.maximum(convolve_batch(excess, uh)[0], 0.0)
+    peak_idx = int(np.argmax(flow))
+
+    return CriticalStormResult(
+        family=family,
+        tr=tr,
+        duration_hr=duration_hr,
+        dt_min=dt_min,
+        peak_flow_m3s=float(flow[peak_idx]),
+        time_to_peak_hr=peak_idx * dt_hr,
+        volume_m3=float(np.trapezoid(flow, dx=dt_hr * 3600)),
+        scan=scan or {},
+        time_hr=np.arange(len(flow)) * dt_hr,
+        flow_m3s=flow,
+        depth_mm=depth,
+        n_evaluations=n_evaluations,
+        basin=basin.name,
+    )
+
+
+# ============================================================================
+# Varias cuencas
+# ============================================================================
+
+def _search_args(args: tuple) -> CriticalStormResult:
+    return critical_duration(*args)
+
+
+def critical_durations(
+    cases: list[tuple[StormBasin, int]],
+    families: list[str],
+    durations_hr: Optional[list[float]] = None,
+    dts_min: Optional[list[float]] = None,
+    refine: bool = True,
+    workers: int = 1,
+) -> list[CriticalStormResult]:
+    """
+    Duración crítica para varias cuencas y períodos de retorno.
+
+    Cada combinación es independiente: con workers > 1 se reparten entre
+    procesos.
+
+    Args:
+        cases: Pares (cuenca, Tr); la cuenca puede variar con Tr (C ajustado)
+        families: Familias de tormenta
+        durations_hr: Duraciones del barrido grueso
+        dts_min: Pasos de tiempo
+        refine: Refinar alrededor del mejor punto
+        workers: Procesos de cálculo (1: en este proceso)
+
+    Returns:
+        Resultados en orden caso → familia
+    """
+    jobs = [
+        (basin, family, tr, durations_hr, dts_min, refine)
+        for basin, tr in cases
+        for family in families
+    ]
+
+    if workers > 1 and len(jobs) > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=context) as executor:
+            return list(executor.map(_search_args, jobs))
+    return [_search_args(job) for job in jobs]
@@ -0,0 +1,406 @@
+"""
+Pipeline de hidrogramas vectorizado para conjuntos de muestras.
+
+Evalúa N combinaciones de parámetros (área, Tc, X, P3,10, C o CN) en lote
+con NumPy, reproduciendo el cálculo de AnalysisRunner:
+
+    hietograma DINAGUA -> exceso (C·P o SCS-CN) -> HU -> convolución
+    -> Qp, Tp, volumen
+
+El hidrograma unitario sigue la regla del runner (ver unit_hydrograph_batch):
+triangular con factor X para el método racional o la tormenta GZ (X solo
+se aplica con GZ; el resto usa X = 1) y triangular SCS para SCS-CN con
+las demás tormentas.
+
+Usado por los análisis de incertidumbre (Monte Carlo) y de sensibilidad,
+donde llamar al pipeline escalar miles de veces sería demasiado lento.
+
+Observaciones:
+- La profundidad DINAGUA es proporcional a P3,10 (sin reducción por área,
+  igual que el runner), así que el hietograma se genera una vez con
+  P3,10 = 1 y se escala por muestra.
+- Para tormentas cuya duración depende de Tc (bloques), las muestras se
+  agrupan por cantidad de intervalos.
+- La convolución se hace por FFT en bloques de `chunk_size` muestras para
+  acotar la memoria.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hidropluvial.config import StormMethod
+from hidropluvial.core.idf import dinagua_cd, dinagua_ct
+from hidropluvial.core.temporal import _distribute_alternating_blocks, scs_distribution
+
+
+# Tormentas soportadas por el pipeline vectorizado
+ENSEMBLE_STORMS = ("gz", "blocks", "blocks24", "scs_ii")
+
+# Muestras por bloque de convolución (acota la memoria a ~decenas de MB)
+DEFAULT_CHUNK_SIZE = 8192
+
+
+# ============================================================================
+# Hietogramas
+# ============================================================================
+
+def storm_window(storm_code: str, tc_hr: float, dt_min: float) -> tuple[float, float]:
+    """
+    Duración (h) y paso (min) de la tormenta, con las reglas del runner.
+
+    Args:
+        storm_code: Código de tormenta (gz, blocks, blocks24, scs_ii)
+        tc_hr: Tiempo de concentración (h)
+        dt_min: Paso de tiempo pedido (min)
+
+    Returns:
+        Tupla (duración_hr, dt_min)
+    """
+    if storm_code == "gz":
+        return 6.0, dt_min
+    if storm_code in ("blocks24", "scs_ii"):
+        # Para tormentas de 24h, dt mínimo de 10 min
+        return 24.0, max(dt_min, 10.0)
+    if storm_code == "blocks":
+        return max(tc_hr, 1.0), dt_min
+    raise ValueError(
+        f"Tormenta '{storm_code}' no soportada (usar {', '.join(ENSEMBLE_STORMS)})"
+    )
+
+
+@lru_cache(maxsize=256)
+def unit_storm(storm_code: str, tr: int, duration_hr: float, dt_min: float) -> NDArray[np.floating]:
+    """
+    Profundidades del hietograma para P3,10 = 1 mm.
+
+    El resultado se cachea (solo lectura): las corridas de sensibilidad
+    repiten las mismas combinaciones de tormenta y paso de tiempo.
+
+    Usa los factores Cd y Ct sin el redondeo a 0.01 mm de
+    dinagua_depth, que para P3,10 = 1 anularía los incrementos; el
+    resultado difiere del hietograma escalar solo en ese redondeo.
+
+    Args:
+        storm_code: Código de tormenta
+        tr: Período de retorno (años)
+        duration_hr: Duración (h)
+        dt_min: Paso de tiempo (min)
+
+    Returns:
+        Profundidad por intervalo (mm por mm de P3,10)
+    """
+    ct = dinagua_ct(tr)
+
+    if storm_code in ("gz", "blocks", "blocks24"):
+        dt_hr = dt_min / 60
+        n_intervals = int(duration_hr / dt_hr)
+        cumulative = np.array([dinagua_cd((i + 1) * dt_hr) for i in range(n_intervals)]) * ct
+        increments = np.diff(cumulative, prepend=0.0)
+        peak_position = 1.0 / 6.0 if storm_code == "gz" else 0.5
+        pattern = _distribute_alternating_blocks(np.sort(increments)[::-1], n_intervals, peak_position)
+    elif storm_code == "scs_ii":
+        total = dinagua_cd(duration_hr) * ct
+        hyetograph = scs_distribution(total, duration_hr, dt_min, StormMethod.SCS_TYPE_II)
+        pattern = np.asarray(hyetograph.depth_mm, dtype=float)
+    else:
+        raise ValueError(f"Tormenta '{storm_code}' no soportada")
+
+    pattern.setflags(write=False)
+    return pattern
+
+
+def storm_depths(
+    storm_code: str,
+    tr: int,
+    dt_min: float,
+    p3_10: NDArray[np.floating],
+    tc_hr: NDArray[np.floating],
+) -> tuple[NDArray[np.floating], float]:
+    """
+    Matriz de hietogramas (N x T) para cada muestra.
+
+    Los hietogramas más cortos se completan con ceros (no alteran la
+    convolución).
+
+    Returns:
+        Tupla (profundidades mm, dt_min efectivo)
+    """
+    p3_10 = np.asarray(p3_10, dtype=float)
+    tc_hr = np.broadcast_to(np.asarray(tc_hr, dtype=float), p3_10.shape)
+
+    if storm_code != "blocks":
+        duration_hr, dt = storm_window(storm_code, 0.0, dt_min)
+        pattern = unit_storm(storm_code, tr, duration_hr, dt)
+        return p3_10[:, None] * pattern[None, :], dt
+
+    # Bloques: la duración (y la cantidad de intervalos) depende de Tc
+    dt_hr = dt_min / 60
+    n_intervals = (np.maximum(tc_hr, 1.0) / dt_hr).astype(int)
+    patterns = {
+        n: unit_storm("blocks", tr, max(float(tc_hr[n_intervals == n][0]), 1.0), dt_min)
+        for n in np.unique(n_intervals)
+    }
+    depths = np.zeros((len(p3_10), max(len(p) for p in patterns.values())))
+    for n, pattern in patterns.items():
+        rows = n_intervals == n
+        depths[rows, :len(pattern)] = p3_10[rows, None] * pattern[None, :]
+    return depths, dt_min
+
+
+# ============================================================================
+# Escorrentía y hidrograma unitario
+# ============================================================================
+
+def excess_rational(depths: NDArray[np.floating], c: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Exceso por método racional: Pe = C × P (por muestra)."""
+    return np.asarray(c, dtype=float)[:, None] * depths
+
+
+def excess_scs(
+    depths: NDArray[np.floating],
+    cn: NDArray[np.floating],
+    lambda_coef: NDArray[np.floating] | float = 0.2,
+) -> NDArray[np.floating]:
+    """
+    Exceso incremental SCS-CN por muestra (equivale a rainfall_excess_series).
+    """
+    cumulative = np.cumsum(depths, axis=1)
+    s = 25400.0 / np.asarray(cn, dtype=float) - 254.0
+    ia = np.broadcast_to(np.asarray(lambda_coef, dtype=float), s.shape) * s
+    s, ia = s[:, None], ia[:, None]
+
+    runoff = np.where(cumulative > ia, (cumulative - ia) ** 2 / (cumulative - ia + s), 0.0)
+    excess = np.empty_like(runoff)
+    excess[:, 0] = runoff[:, 0]
+    excess[:, 1:] = np.diff(runoff, axis=1)
+    return excess
+
+
+def triangular_uh_batch(
+    area_ha: NDArray[np.floating],
+    tc_hr: NDArray[np.floating],
+    dt_hr: float,
+    x_factor: NDArray[np.floating],
+) -> NDArray[np.floating]:
+    """
+    Hidrogramas unitarios triangulares con factor X (N x M).
+
+    Reproduce triangular_uh_x muestra a muestra, incluida la grilla de
+    ceil(Tb/dt) + 1 puntos entre 0 y Tb.
+    """
+    area_ha = np.asarray(area_ha, dtype=float)
+    tc_hr = np.asarray(tc_hr, dtype=float)
+    x_factor = np.asarray(x_factor, dtype=float)
+
+    tp = 0.5 * dt_hr + 0.6 * tc_hr
+    qp = 0.278 * (area_ha / 100) / tp * 2 / (1 + x_factor)
+    tb = (1 + x_factor) * tp
+
+    n_points = np.ceil(tb / dt_hr).astype(int) + 1
+    j = np.arange(n_points.max())[None, :]
+    t = j * (tb / (n_points - 1))[:, None]
+
+    rising = qp[:, None] * t / tp[:, None]
+    falling = qp[:, None] * (tb[:, None] - t) / (tb - tp)[:, None]
+    flow = np.where(t <= tp[:, None], rising, falling)
+    flow[j >= n_points[:, None]] = 0.0
+    return np.maximum(flow, 0.0)
+
+
+def scs_triangular_uh_batch(
+    area_ha: NDArray[np.floating],
+    tc_hr: NDArray[np.floating],
+    dt_hr: float,
+) -> NDArray[np.floating]:
+    """
+    Hidrogramas unitarios triangulares SCS (N x M).
+
+    Reproduce scs_triangular_uh muestra a muestra: Tp = dt/2 + 0.6·Tc,
+    Tb = 2.67·Tp, qp = 2.08·A/Tp (A en km²) y la grilla de ceil(Tb/dt) + 1
+    puntos entre 0 y Tb.
+    """
+    area_km2 = np.asarray(area_ha, dtype=float) / 100
+    tc_hr = np.asarray(tc_hr, dtype=float)
+
+    tp = dt_hr / 2 + 0.6 * tc_hr
+    tb = 2.67 * tp
+    recession = 1.67 * tp
+    qp = 2.08 * area_km2 / tp
+
+    n_points = np.ceil(tb / dt_hr).astype(int) + 1
+    j = np.arange(n_points.max())[None, :]
+    t = j * (tb / (n_points - 1))[:, None]
+
+    rising = qp[:, None] * t / tp[:, None]
+    falling = qp[:, None] * (tb[:, None] - t) / recession[:, None]
+    flow = np.where(t <= tp[:, None], rising, falling)
+    flow[j >= n_points[:, None]] = 0.0
+    return np.maximum(flow, 0.0)
+
+
+def unit_hydrograph_batch(
+    runoff: str,
+    storm_code: str,
+    area_ha: NDArray[np.floating],
+    tc_hr: NDArray[np.floating],
+    dt_hr: float,
+    x_factor: NDArray[np.floating],
+) -> NDArray[np.floating]:
+    """
+    Hidrogramas unitarios con la regla de AnalysisRunner.
+
+    - Método racional o tormenta GZ: triangular con factor X (X solo con
+      GZ; con las demás tormentas X = 1).
+    - SCS-CN con otras tormentas: triangular SCS.
+
+    Args:
+        runoff: 'racional' o 'scs-cn'
+        storm_code: Código de tormenta
+        area_ha: Área (ha) por muestra
+        tc_hr: Tiempo de concentración (h) por muestra
+        dt_hr: Paso de tiempo (h)
+        x_factor: Factor X por muestra
+
+    Returns:
+        Hidrogramas unitarios (N x M)
+    """
+    if runoff == "racional" or storm_code == "gz":
+        if storm_code != "gz":
+            x_factor = np.ones_like(np.asarray(x_factor, dtype=float))
+        return triangular_uh_batch(area_ha, tc_hr, dt_hr, x_factor)
+    return scs_triangular_uh_batch(area_ha, tc_hr, dt_hr)
+
+
+def convolve_batch(excess: NDArray[np.floating], uh: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Convolución fila a fila (N x (T + M - 1)) por FFT."""
+    n_out = excess.shape[1] + uh.shape[1] - 1
+    n_fft = 1 << (n_out - 1).bit_length()
+    spectrum = np.fft.rfft(excess, n_fft, axis=1) * np.fft.rfft(uh, n_fft, axis=1)
+    return np.fft.irfft(spectrum, n_fft, axis=1)[:, :n_out]
+
+
+# ============================================================================
+# Pipeline
+# ============================================================================
+
+@dataclass
+class EnsembleResult:
+    """Resultados por muestra del pipeline vectorizado."""
+    peak_flow_m3s: NDArray[np.floating]
+    time_to_peak_hr: NDArray[np.floating]
+    volume_m3: NDArray[np.floating]
+
+    def __len__(self) -> int:
+        return len(self.peak_flow_m3s)
+
+    @classmethod
+    def concat(cls, parts: list["EnsembleResult"]) -> "EnsembleResult":
+        return cls(
+            peak_flow_m3s=np.concatenate([p.peak_flow_m3s for p in parts]),
+            time_to_peak_hr=np.concatenate([p.time_to_peak_hr for p in parts]),
+            volume_m3=np.concatenate([p.volume_m3 for p in parts]),
+        )
+
+
+def _evaluate_chunk(
+    area_ha: NDArray, tc_hr: NDArray, x_factor: NDArray, p3_10: NDArray,
+    coef: NDArray, lambda_coef: NDArray, runoff: str, storm_code: str, tr: int, dt_min: float,
+) -> EnsembleResult:
+    depths, dt = storm_depths(storm_code, tr, dt_min, p3_10, tc_hr)
+    if runoff == "racional":
+        excess = excess_rational(depths, coef)
+    else:
+        excess = excess_scs(depths, coef, lambda_coef)
+
+    dt_hr = dt / 60
+    uh = unit_hydrograph_batch(runoff, storm_code, area_ha, tc_hr, dt_hr, x_factor)
+    flow = convolve_batch(excess, uh)
+
+    peak_idx = np.argmax(flow, axis=1)
+    rows = np.arange(len(flow))
+    return EnsembleResult(
+        peak_flow_m3s=flow[rows, peak_idx],
+        time_to_peak_hr=peak_idx * dt_hr,
+        volume_m3=np.trapezoid(flow, dx=dt_hr * 3600, axis=1),
+    )
+
+
+def _evaluate_chunk_args(args: tuple) -> EnsembleResult:
+    return _evaluate_chunk(*args)
+
+
+def evaluate_ensemble(
+    area_ha: NDArray[np.floating] | float,
+    tc_hr: NDArray[np.floating] | float,
+    x_factor: NDArray[np.floating] | float,
+    p3_10: NDArray[np.floating] | float,
+    c: Optional[NDArray[np.floating] | float] = None,
+    cn: Optional[NDArray[np.floating] | float] = None,
+    lambda_coef: NDArray[np.floating] | float = 0.2,
+    storm_code: str = "gz",
+    tr: int = 10,
+    dt_min: float = 5.0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+) -> EnsembleResult:
+    """
+    Evalúa el pipeline de hidrogramas para N muestras.
+
+    Los parámetros escalares se repiten para todas las muestras. Se usa el
+    método racional si se indica `c` y SCS-CN si se indica `cn`. El
+    hidrograma unitario sigue la regla del runner (unit_hydrograph_batch):
+    X solo se aplica con la tormenta GZ.
+
+    Args:
+        area_ha: Área (ha)
+        tc_hr: Tiempo de concentración (h)
+        x_factor: Factor X del hidrograma triangular (>= 1, solo con GZ)
+        p3_10: P3,10 (mm)
+        c: Coeficiente de escorrentía (método racional)
+        cn: Número de curva (método SCS-CN)
+        lambda_coef: Coeficiente lambda para Ia (SCS-CN)
+        storm_code: Tormenta (gz, blocks, blocks24, scs_ii)
+        tr: Período de retorno (años)
+        dt_min: Paso de tiempo (min)
+        chunk_size: Muestras por bloque
+        workers: Procesos para evaluar los bloques (1: en este proceso)
+
+    Returns:
+        EnsembleResult con Qp, Tp y volumen por muestra
+    """
+    if (c is None) == (cn is None):
+        raise ValueError("Indicar C (método racional) o CN (SCS-CN), no ambos")
+    runoff = "racional" if c is not None else "scs-cn"
+    storm_window(storm_code, 1.0, dt_min)  # valida la tormenta
+
+    arrays = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(v, dtype=float)) for v in
+          (area_ha, tc_hr, x_factor, p3_10, c if c is not None else cn, lambda_coef))
+    )
+    n = len(arrays[0])
+    if np.any(arrays[1] <= 0) or np.any(arrays[0] <= 0):
+        raise ValueError("Área y Tc deben ser > 0")
+    if np.any(arrays[2] < 1.0):
+        raise ValueError("Factor X debe ser >= 1.0")
+
+    chunks = [
+        tuple(np.ascontiguousarray(a[start:start + chunk_size]) for a in arrays)
+        + (runoff, storm_code, tr, dt_min)
+        for start in range(0, n, chunk_size)
+    ]
+
+    if workers > 1 and len(chunks) > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), mp_context=context) as executor:
+            parts = list(executor.map(_evaluate_chunk_args, chunks))
+    else:
+        parts = [_evaluate_chunk(*chunk) for chunk in chunks]
+
+    return EnsembleResult.concat(parts)
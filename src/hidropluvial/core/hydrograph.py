@@ -16,6 +16,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from hidropluvial.config import HydrographMethod, HydrographResult
+from hidropluvial.core import kernels
 
 
 _DATA_DIR = Path(__file__).parent.parent / "data"
@@ -634,9 +635,7 @@ def clark_uh(
     inflow = area_incr * area_km2 * 1000 / (dt_hr * 3600)  # m³/s
 
     # Routing a través del reservorio lineal
-    outflow = np.zeros(n_points)
-    for i in range(1, n_points):
-        outflow[i] = c1 * inflow[i] + c2 * inflow[i-1] + c0 * outflow[i-1]
+    outflow = kernels.linear_reservoir(inflow, c0, c1, c2)
 
     return time, outflow
 
@@ -0,0 +1,312 @@
+"""
+Núcleos numéricos con recurrencias, con backend compilado opcional (Numba).
+
+Backends:
+- 'numpy': implementación de referencia (NumPy, con el bucle temporal en
+  Python donde hay recurrencia)
+- 'numba': el mismo código fuente compilado con numba.njit (sin fastmath),
+  así que las operaciones de punto flotante son las mismas y los
+  resultados idénticos bit a bit
+
+Por defecto se usa Numba si está instalado (extra opcional 'jit'). El
+backend se elige con set_backend() / use_backend() o con la variable de
+entorno HIDROPLUVIAL_KERNELS ('auto', 'numpy', 'numba'); set_backend()
+también la actualiza para que los procesos de trabajo (spawn) usen el
+mismo backend.
+
+Numba se importa recién en la primera llamada compilada, para no agregar
+su tiempo de carga al arranque del CLI.
+"""
+
+import os
+from contextlib import contextmanager
+from importlib.util import find_spec
+from typing import Callable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+# Backends disponibles
+KERNEL_BACKENDS = ("numpy", "numba")
+
+# Variable de entorno con el backend (heredada por los procesos de trabajo)
+BACKEND_ENV = "HIDROPLUVIAL_KERNELS"
+
+NUMBA_AVAILABLE = find_spec("numba") is not None
+
+
+def _resolve(name: str) -> str:
+    """Backend efectivo para un nombre ('auto' elige Numba si está instalado)."""
+    name = name.lower()
+    if name == "auto":
+        return "numba" if NUMBA_AVAILABLE else "numpy"
+    if name not in KERNEL_BACKENDS:
+        raise ValueError(f"Backend '{name}' no soportado (usar auto, numpy o numba)")
+    if name == "numba" and not NUMBA_AVAILABLE:
+        raise ValueError("El backend 'numba' requiere numba (pip install hidropluvial[jit])")
+    return name
+
+
+def _initial_backend() -> str:
+    """Backend inicial según la variable de entorno (inválida: 'auto')."""
+    try:
+        return _resolve(os.environ.get(BACKEND_ENV, "auto"))
+    except ValueError:
+        return _resolve("auto")
+
+
+_backend = _initial_backend()
+
+# Funciones compiladas: función Python -> despachador de Numba
+_compiled: dict[Callable, Callable] = {}
+
+
+def get_backend() -> str:
+    """Backend activo ('numpy' o 'numba')."""
+    return _backend
+
+
+def set_backend(name: str) -> str:
+    """
+    Selecciona el backend de los núcleos.
+
+    Args:
+        name: 'auto', 'numpy' o 'numba'
+
+    Returns:
+        Backend activo
+
+    Raises:
+        ValueError: Si el backend no existe o Numba no está instalado
+    """
+    global _backend
+    _backend = _resolve(name)
+    os.environ[BACKEND_ENV] = _backend
+    return _backend
+
+
+@contextmanager
+def use_backend(name: str) -> Iterator[str]:
+    """
+    Usa un backend dentro de un bloque (ej: para comparar tiempos).
+
+    Ejemplo:
+        with use_backend("numpy"):
+            clark_uh(...)
+    """
+    previous = _backend
+    previous_env = os.environ.get(BACKEND_ENV)
+    try:
+        yield set_backend(name)
+    finally:
+        set_backend(previous)
+        if previous_env is None:
+            os.environ.pop(BACKEND_ENV, None)
+        else:
+            os.environ[BACKEND_ENV] = previous_env
+
+
+def _jit(func: Callable) -> Callable:
+    """Versión compilada de un núcleo (se compila en la primera llamada)."""
+    compiled = _compiled.get(func)
+    if compiled is None:
+        import numba
+
+        compiled = _compiled[func] = numba.njit(cache=True, nogil=True)(func)
+    return compiled
+
+
+# ============================================================================
+# Reservorio lineal (Clark)
+# ============================================================================
+
+def _linear_reservoir_loop(inflow, c0, c1, c2):
+    outflow = np.zeros(inflow.shape[0])
+    for i in range(1, inflow.shape[0]):
+        outflow[i] = c1 * inflow[i] + c2 * inflow[i - 1] + c0 * outflow[i - 1]
+    return outflow
+
+
+def linear_reservoir(
+    inflow: NDArray[np.floating],
+    c0: float,
+    c1: float,
+    c2: float,
+) -> NDArray[np.floating]:
+    """
+    Tránsito por reservorio lineal (Muskingum con X = 0).
+
+    O[i] = c1·I[i] + c2·I[i-1] + c0·O[i-1], con O[0] = 0.
+
+    Args:
+        inflow: Caudal de entrada
+        c0, c1, c2: Coeficientes de tránsito
+
+    Returns:
+        Caudal de salida
+    """
+    inflow = np.ascontiguousarray(inflow, dtype=np.float64)
+    kernel = _jit(_linear_reservoir_loop) if _backend == "numba" else _linear_reservoir_loop
+    return kernel(inflow, float(c0), float(c1), float(c2))
+
+
+def _linear_reservoir_batch_loop(inflow, c0, c1):
+    n_samples, n_steps = inflow.shape
+    outflow = np.zeros((n_samples, n_steps))
+    for k in range(n_samples):
+        for i in range(1, n_steps):
+            outflow[k, i] = c1[k] * (inflow[k, i] + inflow[k, i - 1]) + c0[k] * outflow[k, i - 1]
+    return outflow
+
+
+def linear_reservoir_batch(
+    inflow: NDArray[np.floating],
+    c0: NDArray[np.floating],
+    c1: NDArray[np.floating],
+) -> NDArray[np.floating]:
+    """
+    Tránsito por reservorio lineal de N series a la vez (c2 = c1).
+
+    Con NumPy el bucle recorre el tiempo vectorizado sobre las series; con
+    Numba recorre cada serie completa (mismas operaciones por elemento).
+
+    Args:
+        inflow: Caudales de entrada (N x M)
+        c0, c1: Coeficientes por serie (N)
+
+    Returns:
+        Caudales de salida (N x M)
+    """
+    inflow = np.ascontiguousarray(inflow, dtype=np.float64)
+    c0 = np.ascontiguousarray(c0, dtype=np.float64)
+    c1 = np.ascontiguousarray(c1, dtype=np.float64)
+    if _backend == "numba":
+        return _jit(_linear_reservoir_batch_loop)(inflow, c0, c1)
+
+    outflow = np.zeros_like(inflow)
+    for i in range(1, inflow.shape[1]):
+        outflow[:, i] = c1 * (inflow[:, i] + inflow[:, i - 1]) + c0 * outflow[:, i - 1]
+    return outflow
+
+
+def _muskingum_batch_loop(inflow, c0, c1, c2):
+    n_samples, n_steps = inflow.shape
+    outflow = np.zeros((n_samples, n_steps))
+    for k in range(n_samples):
+        outflow[k, 0] = inflow[k, 0]
+        for i in range(1, n_steps):
+            outflow[k, i] = c1 * inflow[k, i] + c2 * inflow[k, i - 1] + c0 * outflow[k, i - 1]
+    return outflow
+
+
+def muskingum_batch(
+    inflow: NDArray[np.floating],
+    c0: float,
+    c1: float,
+    c2: float,
+) -> NDArray[np.floating]:
+    """
+    Tránsito Muskingum de N series con los mismos coeficientes.
+
+    O[i] = c1·I[i] + c2·I[i-1] + c0·O[i-1], con O[0] = I[0] (estado
+    permanente inicial).
+
+    Args:
+        inflow: Caudales de entrada (N x M)
+        c0, c1, c2: Coeficientes de tránsito
+
+    Returns:
+        Caudales de salida (N x M)
+    """
+    inflow = np.ascontiguousarray(inflow, dtype=np.float64)
+    if _backend == "numba":
+        return _jit(_muskingum_batch_loop)(inflow, float(c0), float(c1), float(c2))
+
+    outflow = np.zeros_like(inflow)
+    outflow[:, 0] = inflow[:, 0]
+    for i in range(1, inflow.shape[1]):
+        outflow[:, i] = c1 * inflow[:, i] + c2 * inflow[:, i - 1] + c0 * outflow[:, i - 1]
+    return outflow
+
+
+# ============================================================================
+# Bloques alternantes
+# ============================================================================
+
+def _alternating_blocks_loop(sorted_increments, n_intervals, peak_index):
+    result_depths = np.zeros(n_intervals)
+
+    left = peak_index
+    right = peak_index + 1
+    toggle = True  # True = izquierda, False = derecha
+
+    for inc in sorted_increments:
+        if toggle and left >= 0:
+            result_depths[left] = inc
+            left -= 1
+        elif not toggle and right < n_intervals:
+            result_depths[right] = inc
+            right += 1
+        elif left >= 0:
+            result_depths[left] = inc
+            left -= 1
+        elif right < n_intervals:
+            result_depths[right] = inc
+            right += 1
+        toggle = not toggle
+
+    return result_depths
+
+
+def alternating_order(n_intervals: int, peak_index: int) -> NDArray[np.intp]:
+    """
+    Posiciones que ocupan los incrementos ordenados en bloques alternantes.
+
+    Pico, izquierda, derecha, izquierda... hasta agotar un lado; luego el
+    resto del otro lado en orden.
+
+    Args:
+        n_intervals: Número de intervalos
+        peak_index: Índice del pico
+
+    Returns:
+        Índices (largo n_intervals)
+    """
+    left = np.arange(peak_index, -1, -1)
+    right = np.arange(peak_index + 1, n_intervals)
+    n_pairs = min(len(left), len(right))
+
+    order = np.empty(len(left) + len(right), dtype=np.intp)
+    order[0:2 * n_pairs:2] = left[:n_pairs]
+    order[1:2 * n_pairs:2] = right[:n_pairs]
+    order[2 * n_pairs:] = left[n_pairs:] if len(left) > n_pairs else right[n_pairs:]
+    return order
+
+
+def alternating_blocks(
+    sorted_increments: NDArray[np.floating],
+    n_intervals: int,
+    peak_index: int,
+) -> NDArray[np.floating]:
+    """
+    Distribuye incrementos ordenados alternando alrededor del pico.
+
+    Args:
+        sorted_increments: Incrementos de mayor a menor
+        n_intervals: Número de intervalos
+        peak_index: Índice del pico (se acota a [0, n_intervals - 1])
+
+    Returns:
+        Profundidad por intervalo
+    """
+    sorted_increments = np.ascontiguousarray(sorted_increments, dtype=np.float64)
+    # El bucle compilado no verifica límites: se acota el pico en ambos backends
+    peak_index = min(max(int(peak_index), 0), int(n_intervals) - 1)
+    if _backend == "numba":
+        return _jit(_alternating_blocks_loop)(sorted_increments, int(n_intervals), peak_index)
+
+    result_depths = np.zeros(n_intervals)
+    order = alternating_order(n_intervals, peak_index)[:len(sorted_increments)]
+    result_depths[order] = sorted_increments[:len(order)]
+    return result_depths
@@ -0,0 +1,344 @@
+"""
+Análisis de incertidumbre por Monte Carlo.
+
+Muestrea P3,10, C, CN, factor X y un factor multiplicativo de Tc desde
+distribuciones indicadas por el usuario, calcula Tc por muestra con el
+método elegido (core/tc.py) y evalúa todas las muestras con el pipeline
+vectorizado de core/ensemble.py. El resultado son cuantiles de caudal
+pico, tiempo al pico y volumen.
+
+Ejemplo:
+    result = run_monte_carlo(
+        area_ha=80, slope_pct=2.5, length_m=900,
+        distributions={"p3_10": parse_distribution("normal:83,8"),
+                       "c": parse_distribution("uniform:0.45,0.65")},
+        n_samples=100_000,
+    )
+    result.quantiles()["peak_flow_m3s"]
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hidropluvial.core.ensemble import DEFAULT_CHUNK_SIZE, EnsembleResult, evaluate_ensemble
+from hidropluvial.core.tc import desbordes, kirpich, temez
+
+
+# Variables muestreables
+SAMPLED_VARIABLES = ("p3_10", "c", "cn", "x", "tc_factor")
+
+# Métodos de Tc soportados
+MC_TC_METHODS = ("kirpich", "temez", "desbordes")
+
+# Cuantiles por defecto (P5, P50, P95)
+DEFAULT_QUANTILES = (0.05, 0.5, 0.95)
+
+# Rangos físicos a los que se recortan las muestras
+_BOUNDS = {
+    "p3_10": (1e-6, np.inf),
+    "c": (1e-6, 1.0),
+    "cn": (30.0, 100.0),
+    "x": (1.0, np.inf),
+    "tc_factor": (1e-6, np.inf),
+}
+
+
+# ============================================================================
+# Distribuciones
+# ============================================================================
+
+@dataclass
+class Distribution:
+    """
+    Distribución de probabilidad de una variable de entrada.
+
+    Tipos y parámetros:
+        const: (valor,)
+        normal: (media, desvío)
+        lognormal: (media, desvío) de la variable, no de su logaritmo
+        uniform: (mínimo, máximo)
+        triangular: (mínimo, moda, máximo)
+    """
+    kind: str
+    params: tuple[float, ...]
+
+    _N_PARAMS = {"const": 1, "normal": 2, "lognormal": 2, "uniform": 2, "triangular": 3}
+
+    def __post_init__(self):
+        if self.kind not in self._N_PARAMS:
+            raise ValueError(
+                f"Distribución '{self.kind}' no soportada (usar {', '.join(self._N_PARAMS)})"
+            )
+        if len(self.params) != self._N_PARAMS[self.kind]:
+            raise ValueError(
+                f"'{self.kind}' requiere {self._N_PARAMS[self.kind]} parámetros, "
+                f"recibidos {len(self.params)}"
+            )
+        if self.kind in ("normal", "lognormal") and self.params[1] < 0:
+            raise ValueError("El desvío debe ser >= 0")
+        if self.kind == "lognormal" and self.params[0] <= 0:
+            raise ValueError("La media de una lognormal debe ser > 0")
+        if self.kind == "uniform" and self.params[0] > self.params[1]:
+            raise ValueError("uniform requiere mínimo <= máximo")
+        if self.kind == "triangular" and not self.params[0] <= self.params[1] <= self.params[2]:
+            raise ValueError("triangular requiere mínimo <= moda <= máximo")
+
+    def sample(self, rng: np.random.Generator, n: int) -> NDArray[np.floating]:
+        """Genera n muestras."""
+        p = self.params
+        if self.kind == "const":
+            return np.full(n, float(p[0]))
+        if self.kind == "normal":
+            return rng.normal(p[0], p[1], n)
+        if self.kind == "lognormal":
+            sigma2 = np.log1p((p[1] / p[0]) ** 2)
+            return rng.lognormal(np.log(p[0]) - sigma2 / 2, np.sqrt(sigma2), n)
+        if self.kind == "uniform":
+            return rng.uniform(p[0], p[1], n)
+        return rng.triangular(p[0], p[1], p[2], n)
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{','.join(f'{v:g}' for v in self.params)}"
+
+
+def parse_distribution(spec: str) -> Distribution:
+    """
+    Interpreta una distribución escrita como texto.
+
+    Args:
+        spec: "tipo:p1,p2[,p3]" (ej: "normal:83,8") o un número (constante)
+
+    Returns:
+        Distribution
+    """
+    spec = spec.strip()
+    kind, sep, params = spec.partition(":")
+    if not sep:
+        kind, params = "const", spec
+    try:
+        values = tuple(float(v) for v in params.split(","))
+    except ValueError:
+        raise ValueError(f"Distribución inválida: '{spec}'") from None
+    return Distribution(kind.strip().lower(), values)
+
+
+# ============================================================================
+# Tiempo de concentración por muestra
+# ============================================================================
+
+def tc_samples(
+    method: str,
+    area_ha: float | NDArray[np.floating],
+    slope_pct: float | NDArray[np.floating],
+    length_m: Optional[float],
+    c: Optional[float | NDArray[np.floating]],
+    n: int,
+    t0_min: float = 5.0,
+) -> NDArray[np.floating]:
+    """
+    Tc (h) por muestra con un método de core/tc.py.
+
+    Área, pendiente y C pueden ser escalares o arrays de n muestras. Las
+    fórmulas escalares se evalúan una vez por combinación distinta de
+    entradas (Kirpich y Témez solo dependen de la pendiente; Desbordes de
+    área, pendiente y C).
+
+    Args:
+        method: kirpich, temez o desbordes
+        area_ha: Área (ha)
+        slope_pct: Pendiente (%)
+        length_m: Longitud del cauce (m), requerida por kirpich y temez
+        c: Coeficiente C, requerido por desbordes
+        n: Cantidad de muestras
+        t0_min: Tiempo de entrada para desbordes (min)
+
+    Returns:
+        Array de Tc en horas
+    """
+    slope_pct = np.broadcast_to(np.asarray(slope_pct, dtype=float), (n,))
+
+    if method in ("kirpich", "temez"):
+        if not length_m:
+            raise ValueError(f"El método {method} requiere la longitud del cauce")
+        if method == "kirpich":
+            return _evaluate_unique(lambda s: kirpich(length_m, s / 100), slope_pct)
+        return _evaluate_unique(lambda s: temez(length_m / 1000, s / 100), slope_pct)
+
+    if method == "desbordes":
+        if c is None:
+            raise ValueError("El método desbordes requiere el coeficiente C")
+        area_ha = np.broadcast_to(np.asarray(area_ha, dtype=float), (n,))
+        c = np.broadcast_to(np.asarray(c, dtype=float), (n,))
+        return _evaluate_unique(
+            lambda a, s, cc: desbordes(a, s, cc, t0_min), area_ha, slope_pct, c
+        )
+
+    raise ValueError(f"Método de Tc '{method}' no soportado (usar {', '.join(MC_TC_METHODS)})")
+
+
+def _evaluate_unique(func, *columns: NDArray[np.floating]) -> NDArray[np.floating]:
+    """Aplica una función escalar a cada fila distinta de las columnas."""
+    rows, inverse = np.unique(np.column_stack(columns), axis=0, return_inverse=True)
+    values = np.array([func(*(float(v) for v in row)) for row in rows])
+    return values[inverse.reshape(-1)]
+
+
+# ============================================================================
+# Monte Carlo
+# ============================================================================
+
+@dataclass
+class MonteCarloResult:
+    """
+    Muestras y resultados de una corrida de Monte Carlo.
+
+    Attributes:
+        samples: Muestras de entrada por variable (incluye "tc_hr")
+        result: Qp, Tp y volumen por muestra
+        seed: Semilla usada
+    """
+    samples: dict[str, NDArray[np.floating]]
+    result: EnsembleResult
+    seed: Optional[int] = None
+    settings: dict = field(default_factory=dict)
+
+    @property
+    def n_samples(self) -> int:
+        return len(self.result)
+
+    def outputs(self) -> dict[str, NDArray[np.floating]]:
+        """Resultados por muestra, por nombre."""
+        return {
+            "peak_flow_m3s": self.result.peak_flow_m3s,
+            "time_to_peak_hr": self.result.time_to_peak_hr,
+            "volume_m3": self.result.volume_m3,
+        }
+
+    def quantiles(
+        self, q: tuple[float, ...] = DEFAULT_QUANTILES,
+    ) -> dict[str, NDArray[np.floating]]:
+        """
+        Cuantiles de Qp, Tp y volumen.
+
+        Args:
+            q: Probabilidades (0-1)
+
+        Returns:
+            Diccionario salida -> array de cuantiles (en el orden de q)
+        """
+        return {name: np.quantile(values, q) for name, values in self.outputs().items()}
+
+    def mean(self) -> dict[str, float]:
+        """Media de Qp, Tp y volumen."""
+        return {name: float(values.mean()) for name, values in self.outputs().items()}
+
+
+def run_monte_carlo(
+    area_ha: float,
+    slope_pct: float,
+    distributions: dict[str, Distribution],
+    length_m: Optional[float] = None,
+    tc_method: str = "kirpich",
+    storm_code: str = "gz",
+    tr: int = 10,
+    dt_min: float = 5.0,
+    runoff: str = "racional",
+    lambda_coef: float = 0.2,
+    t0_min: float = 5.0,
+    n_samples: int = 10_000,
+    seed: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+) -> MonteCarloResult:
+    """
+    Ejecuta un análisis de incertidumbre por Monte Carlo.
+
+    Las variables sin distribución deben indicarse como constantes
+    (Distribution("const", (valor,))). Las muestras se recortan a su rango
+    físico (CN 30-100, 0 < C <= 1, X >= 1, P3,10 > 0).
+
+    Args:
+        area_ha: Área (ha)
+        slope_pct: Pendiente (%)
+        distributions: Distribución por variable (p3_10, c, cn, x, tc_factor)
+        length_m: Longitud del cauce (m)
+        tc_method: Método de Tc (kirpich, temez, desbordes)
+        storm_code: Tormenta (gz, blocks, blocks24, scs_ii)
+        tr: Período de retorno (años)
+        dt_min: Paso de tiempo (min)
+        runoff: Método de escorrentía (racional, scs-cn)
+        lambda_coef: Coeficiente lambda para Ia (SCS-CN)
+        t0_min: Tiempo de entrada para desbordes (min)
+        n_samples: Cantidad de muestras
+        seed: Semilla del generador (reproducibilidad)
+        chunk_size: Muestras por bloque de cálculo
+        workers: Procesos para el cálculo (1: en este proceso)
+
+    Returns:
+        MonteCarloResult
+    """
+    unknown = set(distributions) - set(SAMPLED_VARIABLES)
+    if unknown:
+        raise ValueError(
+            f"Variables desconocidas: {', '.join(sorted(unknown))} "
+            f"(usar {', '.join(SAMPLED_VARIABLES)})"
+        )
+    if runoff not in ("racional", "scs-cn"):
+        raise ValueError(f"Método de escorrentía '{runoff}' no soportado")
+    if n_samples < 1:
+        raise ValueError("n_samples debe ser >= 1")
+
+    coef_name = "c" if runoff == "racional" else "cn"
+    required = ["p3_10", coef_name] + (["c"] if tc_method == "desbordes" else [])
+    missing = [name for name in required if name not in distributions]
+    if missing:
+        raise ValueError(f"Falta distribución para: {', '.join(dict.fromkeys(missing))}")
+
+    defaults = {"x": Distribution("const", (1.0,)), "tc_factor": Distribution("const", (1.0,))}
+    rng = np.random.default_rng(seed)
+
+    # Orden fijo de muestreo: mismo seed -> mismas muestras
+    samples = {}
+    for name in SAMPLED_VARIABLES:
+        dist = distributions.get(name, defaults.get(name))
+        if dist is None:
+            continue
+        low, high = _BOUNDS[name]
+        samples[name] = np.clip(dist.sample(rng, n_samples), low, high)
+
+    tc_hr = tc_samples(
+        tc_method, area_ha, slope_pct, length_m, samples.get("c"), n_samples, t0_min
+    ) * samples["tc_factor"]
+    samples["tc_hr"] = tc_hr
+
+    result = evaluate_ensemble(
+        area_ha,
+        tc_hr,
+        samples["x"],
+        samples["p3_10"],
+        c=samples["c"] if runoff == "racional" else None,
+        cn=samples["cn"] if runoff == "scs-cn" else None,
+        lambda_coef=lambda_coef,
+        storm_code=storm_code,
+        tr=tr,
+        dt_min=dt_min,
+        chunk_size=chunk_size,
+        workers=workers,
+    )
+
+    return MonteCarloResult(
+        samples=samples,
+        result=result,
+        seed=seed,
+        settings={
+            "tc_method": tc_method,
+            "storm": storm_code,
+            "tr": tr,
+            "dt_min": dt_min,
+            "runoff": runoff,
+            "distributions": {name: str(d) for name, d in distributions.items()},
+        },
+    )
@@ -0,0 +1,488 @@
+"""
+Red de drenaje: combinación y tránsito de hidrogramas de subcuencas.
+
+La red es un grafo dirigido acíclico: cada subcuenca descarga en a lo
+sumo una subcuenca aguas abajo a través de un tramo (retardo puro o
+Muskingum); las que no descargan en otra son salidas del sistema.
+
+Cálculo:
+    1. Hidrogramas locales: cada subcuenca es independiente, todos los
+       períodos de retorno en una sola evaluación vectorizada (una fila
+       por Tr). Con workers > 1 las subcuencas se reparten entre procesos.
+    2. Combinación en orden topológico: el caudal a la salida de cada
+       subcuenca es su hidrograma local más los caudales transitados de
+       las subcuencas que descargan en ella. Suma y tránsito operan sobre
+       la matriz Tr × tiempo completa.
+
+Todas las subcuencas usan la misma tormenta de diseño (familia, duración
+y dt) para que los hidrogramas se sumen sobre la misma grilla temporal.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from math import ceil
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hidropluvial.core.critical import StormBasin, unit_hyetograph
+from hidropluvial.core.ensemble import (
+    convolve_batch,
+    excess_rational,
+    excess_scs,
+)
+from hidropluvial.core.idf import dinagua_ct
+from hidropluvial.core.kernels import muskingum_batch
+
+
+# Métodos de tránsito de los tramos
+ROUTING_METHODS = ("lag", "muskingum")
+
+# Largo agregado al hidrograma por un tramo Muskingum, en múltiplos de K
+# (la recesión remanente es del orden de e^-10)
+MUSKINGUM_TAIL_K = 10.0
+
+# Máximo de subpasos de tiempo por paso dt en el tránsito Muskingum
+MUSKINGUM_MAX_SUBSTEPS = 64
+
+
+# ============================================================================
+# Tránsito en tramos
+# ============================================================================
+
+def lag_route(inflow: NDArray[np.floating], lag_min: float, dt_min: float) -> NDArray[np.floating]:
+    """
+    Traslada hidrogramas en el tiempo (retardo puro, sin atenuación).
+
+    Un retardo que no es múltiplo de dt se interpola linealmente entre
+    los dos pasos vecinos; el volumen se conserva.
+
+    Args:
+        inflow: Caudales de entrada (N x M)
+        lag_min: Retardo (min)
+        dt_min: Paso de tiempo (min)
+
+    Returns:
+        Caudales de salida (N x (M + ceil(lag/dt)))
+    """
+    inflow = np.atleast_2d(np.asarray(inflow, dtype=float))
+    shift = lag_min / dt_min
+    steps = int(np.floor(shift))
+    frac = shift - steps
+
+    n_out = inflow.shape[1] + int(ceil(shift))
+    outflow = np.zeros((inflow.shape[0], n_out))
+    outflow[:, steps:steps + inflow.shape[1]] += (1.0 - frac) * inflow
+    if frac > 0:
+        outflow[:, steps + 1:steps + 1 + inflow.shape[1]] += frac * inflow
+    return outflow
+
+
+def muskingum_coefficients(k_hr: float, x: float, dt_hr: float) -> tuple[float, float, float]:
+    """
+    Coeficientes de Muskingum para O[i] = c1·I[i] + c2·I[i-1] + c0·O[i-1].
+
+    Args:
+        k_hr: Tiempo de viaje K (h)
+        x: Factor de ponderación X (0 a 0.5)
+        dt_hr: Paso de tiempo (h)
+
+    Returns:
+        Tupla (c0, c1, c2), con c0 + c1 + c2 = 1
+    """
+    denom = k_hr * (1 - x) + 0.5 * dt_hr
+    c0 = (k_hr * (1 - x) - 0.5 * dt_hr) / denom
+    c1 = (0.5 * dt_hr - k_hr * x) / denom
+    c2 = (0.5 * dt_hr + k_hr * x) / denom
+    return c0, c1, c2
+
+
+def muskingum_steps(k_hr: float, x: float, dt_hr: float) -> tuple[int, int]:
+    """
+    Subtramos y subpasos de tiempo para coeficientes no negativos.
+
+    Con n subtramos de K/n y m subpasos de dt/m los coeficientes son no
+    negativos si 2·(K/n)·X <= dt/m <= 2·(K/n)·(1 - X). Se busca el menor
+    m (y luego el menor n) que lo cumple, hasta MUSKINGUM_MAX_SUBSTEPS.
+
+    Args:
+        k_hr: Tiempo de viaje K (h), > 0
+        x: Factor de ponderación X (0 a 0.5)
+        dt_hr: Paso de tiempo (h)
+
+    Returns:
+        Tupla (n subtramos, m subpasos); si no hay combinación válida
+        (X cercano a 0.5), m = 1 y n = ceil(2·K·X/dt)
+    """
+    ratio = 2 * k_hr / dt_hr
+    for m in range(1, MUSKINGUM_MAX_SUBSTEPS + 1):
+        n = max(1, int(ceil(m * ratio * x - 1e-9)))
+        if n <= m * ratio * (1 - x) + 1e-9:
+            return n, m
+    return max(1, int(ceil(ratio * x - 1e-9))), 1
+
+
+def _refine(flow: NDArray[np.floating], m: int) -> NDArray[np.floating]:
+    """Interpola linealmente cada paso en m subpasos (N x ((M - 1)·m + 1))."""
+    frac = np.arange(m) / m
+    fine = flow[:, :-1, None] * (1 - frac) + flow[:, 1:, None] * frac
+    return np.concatenate([fine.reshape(flow.shape[0], -1), flow[:, -1:]], axis=1)
+
+
+def muskingum_route(
+    inflow: NDArray[np.floating],
+    k_hr: float,
+    x: float,
+    dt_min: float,
+) -> NDArray[np.floating]:
+    """
+    Tránsito Muskingum de hidrogramas (una fila por serie).
+
+    El tramo se divide en n subtramos de K/n y, si K es chico frente a dt,
+    el paso en m subpasos (ver muskingum_steps), para que ningún
+    coeficiente sea negativo: dt >= 2·K·X evita c1 < 0 y
+    dt <= 2·K·(1 - X) evita c0 < 0. Con subpasos, la entrada se interpola
+    linealmente y la salida se muestrea cada dt. Si no hay combinación
+    válida (X cercano a 0.5) los coeficientes negativos se anulan y el
+    resto se renormaliza a suma 1, lo que conserva el volumen.
+
+    Args:
+        inflow: Caudales de entrada (N x M)
+        k_hr: Tiempo de viaje K (h)
+        x: Factor de ponderación X (0 a 0.5)
+        dt_min: Paso de tiempo (min)
+
+    Returns:
+        Caudales de salida (N x (M + ceil(10·K/dt)))
+    """
+    if k_hr < 0 or not 0 <= x <= 0.5:
+        raise ValueError("Muskingum requiere K >= 0 y 0 <= X <= 0.5")
+    inflow = np.atleast_2d(np.asarray(inflow, dtype=float))
+    if k_hr == 0:
+        return inflow.copy()
+
+    dt_hr = dt_min / 60
+    n_out = inflow.shape[1] + int(ceil(MUSKINGUM_TAIL_K * k_hr / dt_hr))
+    flow = np.zeros((inflow.shape[0], n_out))
+    flow[:, :inflow.shape[1]] = inflow
+
+    n_sub, m_sub = muskingum_steps(k_hr, x, dt_hr)
+    coefs = np.maximum(muskingum_coefficients(k_hr / n_sub, x, dt_hr / m_sub), 0.0)
+    c0, c1, c2 = coefs / coefs.sum()
+
+    if m_sub > 1:
+        flow = _refine(flow, m_sub)
+    for _ in range(n_sub):
+        flow = muskingum_batch(flow, c0, c1, c2)
+    return flow[:, ::m_sub]
+
+
+# ============================================================================
+# Red
+# ============================================================================
+
+@dataclass
+class NetworkReach:
+    """
+    Tramo por el que una subcuenca descarga aguas abajo.
+
+    Attributes:
+        method: 'lag' (retardo puro) o 'muskingum'
+        lag_min: Retardo (min), método 'lag'
+        k_hr: Tiempo de viaje K (h), método 'muskingum'
+        x: Factor de ponderación X, método 'muskingum'
+    """
+    method: str = "lag"
+    lag_min: float = 0.0
+    k_hr: float = 0.0
+    x: float = 0.2
+
+    def __post_init__(self):
+        self.method = self.method.lower()
+        if self.method not in ROUTING_METHODS:
+            raise ValueError(f"Tránsito '{self.method}' no soportado (usar {', '.join(ROUTING_METHODS)})")
+        if self.lag_min < 0 or self.k_hr < 0 or not 0 <= self.x <= 0.5:
+            raise ValueError("Tramo inválido: retardo y K deben ser >= 0 y 0 <= X <= 0.5")
+
+    @property
+    def travel_time_hr(self) -> float:
+        """Tiempo de viaje del tramo (h)."""
+        return self.lag_min / 60 if self.method == "lag" else self.k_hr
+
+    def route(self, inflow: NDArray[np.floating], dt_min: float) -> NDArray[np.floating]:
+        """Transita hidrogramas (N x M) por el tramo."""
+        if self.method == "lag":
+            return lag_route(inflow, self.lag_min, dt_min)
+        return muskingum_route(inflow, self.k_hr, self.x, dt_min)
+
+
+@dataclass
+class NetworkNode:
+    """
+    Subcuenca de la red.
+
+    Attributes:
+        basin: Datos de la subcuenca (el nombre identifica el nodo)
+        downstream: Nombre de la subcuenca donde descarga (None: salida)
+        reach: Tramo hasta la subcuenca aguas abajo
+        c_by_tr: Coeficiente C por Tr (ajuste por período de retorno);
+            los Tr ausentes usan basin.c
+    """
+    basin: StormBasin
+    downstream: Optional[str] = None
+    reach: NetworkReach = field(default_factory=NetworkReach)
+    c_by_tr: dict[int, float] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return self.basin.name
+
+
+def topological_order(downstream: dict[str, Optional[str]]) -> list[str]:
+    """
+    Orden de cálculo: cada subcuenca después de todas las que descargan en ella.
+
+    Args:
+        downstream: Destino de cada subcuenca (None: salida)
+
+    Returns:
+        Nombres en orden topológico (estable respecto al orden de entrada)
+
+    Raises:
+        ValueError: Si un destino no existe o hay ciclos
+    """
+    pending = {name: 0 for name in downstream}
+    for name, target in downstream.items():
+        if target is None:
+            continue
+        if target not in pending:
+            raise ValueError(f"La subcuenca '{name}' descarga en '{target}', que no existe")
+        pending[target] += 1
+
+    ready = deque(name for name in downstream if pending[name] == 0)
+    order = []
+    while ready:
+        name = ready.popleft()
+        order.append(name)
+        target = downstream[name]
+        if target is not None:
+            pending[target] -= 1
+            if pending[target] == 0:
+                ready.append(target)
+
+    if len(order) != len(downstream):
+        cycle = sorted(name for name in downstream if pending[name] > 0)
+        raise ValueError(f"La red tiene ciclos entre: {', '.join(cycle)}")
+    return order
+
+
+def _downstream_map(nodes: list[NetworkNode]) -> dict[str, Optional[str]]:
+    """Destino de cada subcuenca (los nombres deben ser únicos)."""
+    downstream = {node.name: node.downstream for node in nodes}
+    if len(downstream) != len(nodes):
+        raise ValueError("Los nombres de las subcuencas de la red deben ser únicos")
+    return downstream
+
+
+def network_duration(nodes: list[NetworkNode], dt_min: float = 5.0) -> float:
+    """
+    Duración de tormenta por defecto para la red.
+
+    El mayor tiempo de llegada a una salida (Tc de la subcuenca más los
+    tiempos de viaje de los tramos aguas abajo), con mínimo 1 h y
+    redondeado hacia arriba a múltiplo de dt.
+
+    Args:
+        nodes: Subcuencas de la red
+        dt_min: Paso de tiempo (min)
+
+    Returns:
+        Duración (h)
+    """
+    by_name = {node.name: node for node in nodes}
+    travel: dict[str, float] = {}
+    for name in reversed(topological_order(_downstream_map(nodes))):
+        node = by_name[name]
+        travel[name] = 0.0 if node.downstream is None else (
+            node.reach.travel_time_hr + travel[node.downstream]
+        )
+    longest = max(node.basin.tc_hr + travel[node.name] for node in nodes)
+    return ceil(max(1.0, longest) * 60 / dt_min - 1e-9) * dt_min / 60
+
+
+def local_hydrographs(
+    node: NetworkNode,
+    return_periods: list[int],
+    family: str,
+    duration_hr: float,
+    dt_min: float,
+) -> NDArray[np.floating]:
+    """
+    Hidrogramas de una subcuenca para todos los Tr (una fila por Tr).
+
+    Hietograma unitario de la familia (ver critical.unit_hyetograph)
+    escalado por P3,10 × Ct(Tr), exceso racional o SCS-CN y el HU que usa
+    el runner (ver StormBasin.unit_hydrograph), en una convolución por lotes.
+
+    Args:
+        node: Subcuenca
+        return_periods: Períodos de retorno (años)
+        family: Familia de tormenta
+        duration_hr: Duración de la tormenta (h)
+        dt_min: Paso de tiempo (min)
+
+    Returns:
+        Caudales (n_tr x M)
+    """
+    basin = node.basin
+    pattern = unit_hyetograph(family, duration_hr, dt_min)
+    scale = basin.p3_10 * np.array([dinagua_ct(tr) for tr in return_periods])
+    depths = scale[:, None] * pattern[None, :]
+
+    n = len(return_periods)
+    if basin.c is not None:
+        excess = excess_rational(depths, np.array([node.c_by_tr.get(tr, basin.c) for tr in return_periods]))
+    else:
+        excess = excess_scs(depths, np.full(n, basin.cn), basin.lambda_coef)
+
+    uh = basin.unit_hydrograph(family, dt_min / 60)
+    return np.maximum(convolve_batch(excess, np.repeat(uh, n, axis=0)), 0.0)
+
+
+def _local_chunk(args: tuple) -> list[NDArray[np.floating]]:
+    nodes, return_periods, family, duration_hr, dt_min = args
+    return [local_hydrographs(node, return_periods, family, duration_hr, dt_min) for node in nodes]
+
+
+@dataclass
+class NetworkResult:
+    """
+    Hidrogramas de la red para un conjunto de Tr.
+
+    Attributes:
+        return_periods: Períodos de retorno (orden de las filas)
+        family: Familia de tormenta
+        duration_hr: Duración de la tormenta (h)
+        dt_min: Paso de tiempo (min)
+        order: Subcuencas en orden topológico
+        outlets: Subcuencas que no descargan en otra
+        downstream: Destino de cada subcuenca (None: salida)
+        local: Hidrograma propio de cada subcuenca (n_tr x M)
+        outflow: Caudal combinado a la salida de cada subcuenca (n_tr x M)
+    """
+    return_periods: list[int]
+    family: str
+    duration_hr: float
+    dt_min: float
+    order: list[str]
+    outlets: list[str]
+    downstream: dict[str, Optional[str]]
+    local: dict[str, NDArray[np.floating]]
+    outflow: dict[str, NDArray[np.floating]]
+
+    def time_hr(self, name: str) -> NDArray[np.floating]:
+        """Tiempos del hidrograma combinado de una subcuenca (h)."""
+        return np.arange(self.outflow[name].shape[1]) * self.dt_min / 60
+
+    def hydrograph(self, name: str, tr: int) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+        """Tiempo (h) y caudal combinado de una subcuenca para un Tr."""
+        return self.time_hr(name), self.outflow[name][self.return_periods.index(tr)]
+
+    def peak_flows(self, name: str) -> NDArray[np.floating]:
+        """Caudal pico combinado por Tr."""
+        return self.outflow[name].max(axis=1)
+
+    def peak_times(self, name: str) -> NDArray[np.floating]:
+        """Tiempo al pico combinado por Tr (h)."""
+        return np.argmax(self.outflow[name], axis=1) * self.dt_min / 60
+
+    def volumes(self, name: str) -> NDArray[np.floating]:
+        """Volumen combinado por Tr (m³)."""
+        return np.trapezoid(self.outflow[name], dx=self.dt_min * 60, axis=1)
+
+
+def compute_network(
+    nodes: list[NetworkNode],
+    return_periods: list[int],
+    family: str = "blocks",
+    duration_hr: Optional[float] = None,
+    dt_min: float = 5.0,
+    workers: int = 1,
+) -> NetworkResult:
+    """
+    Hidrogramas combinados de toda la red para todos los Tr en una pasada.
+
+    Args:
+        nodes: Subcuencas de la red
+        return_periods: Períodos de retorno (años)
+        family: Familia de tormenta (ver critical.CRITICAL_FAMILIES)
+        duration_hr: Duración de la tormenta (por defecto, network_duration)
+        dt_min: Paso de tiempo (min)
+        workers: Procesos para los hidrogramas locales (1: en este proceso)
+
+    Returns:
+        NetworkResult con los hidrogramas local y combinado de cada subcuenca
+
+    Raises:
+        ValueError: Si la red no es válida (nombres repetidos, destinos
+            inexistentes o ciclos)
+    """
+    if not nodes:
+        raise ValueError("La red no tiene subcuencas")
+    if not return_periods:
+        raise ValueError("Indicar al menos un período de retorno")
+    if dt_min <= 0:
+        raise ValueError("dt debe ser > 0")
+    downstream = _downstream_map(nodes)
+    order = topological_order(downstream)
+    if duration_hr is None:
+        duration_hr = network_duration(nodes, dt_min)
+    return_periods = [int(tr) for tr in return_periods]
+
+    # 1. Hidrogramas locales (independientes entre subcuencas)
+    if workers > 1 and len(nodes) > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        n_chunks = min(workers, len(nodes))
+        chunks = [
+            (nodes[i::n_chunks], return_periods, family, duration_hr, dt_min)
+            for i in range(n_chunks)
+        ]
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=n_chunks, mp_context=context) as executor:
+            parts = list(executor.map(_local_chunk, chunks))
+        flows = [None] * len(nodes)
+        for i, part in enumerate(parts):
+            flows[i::n_chunks] = part
+    else:
+        flows = _local_chunk((nodes, return_periods, family, duration_hr, dt_min))
+    local = {node.name: flow for node, flow in zip(nodes, flows)}
+
+    # 2. Combinación en orden topológico
+    by_name = {node.name: node for node in nodes}
+    inflows: dict[str, list[NDArray[np.floating]]] = {name: [] for name in order}
+    outflow: dict[str, NDArray[np.floating]] = {}
+    for name in order:
+        parts = [local[name], *inflows.pop(name)]
+        total = np.zeros((len(return_periods), max(p.shape[1] for p in parts)))
+        for part in parts:
+            total[:, :part.shape[1]] += part
+        outflow[name] = total
+
+        node = by_name[name]
+        if node.downstream is not None:
+            inflows[node.downstream].append(node.reach.route(total, dt_min))
+
+    return NetworkResult(
+        return_periods=return_periods,
+        family=family,
+        duration_hr=duration_hr,
+        dt_min=dt_min,
+        order=order,
+        outlets=[name for name in order if by_name[name].downstream is None],
+        downstream=downstream,
+        local=local,
+        outflow=outflow,
+    )
@@ -0,0 +1,247 @@
+"""
+Cribado de escenarios: solo picos, y hidrogramas para los críticos.
+
+Para tablas de diseño o búsquedas de la tormenta crítica alcanza con Qp,
+Tp y volumen de cada combinación (método de Tc, tormenta, Tr, dt, X,
+escorrentía). Este módulo evalúa grillas grandes de escenarios con el
+pipeline vectorizado de core/ensemble.py, sin guardar ni serializar las
+series, y construye el hidrograma completo solo de los `top_k`
+escenarios más desfavorables.
+
+Los escenarios se describen como columnas (dict de arrays del mismo
+largo); las columnas extra (por ejemplo, el método de Tc) se conservan
+como etiquetas.
+"""
+
+import itertools
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hidropluvial.core.ensemble import (
+    DEFAULT_CHUNK_SIZE,
+    EnsembleResult,
+    convolve_batch,
+    evaluate_ensemble,
+    excess_rational,
+    excess_scs,
+    storm_depths,
+    unit_hydrograph_batch,
+)
+
+
+# Columnas requeridas de un conjunto de escenarios
+SCENARIO_COLUMNS = ("storm", "tr", "dt_min", "tc_hr", "x", "runoff", "coef")
+
+# Salidas por las que se puede ordenar
+SCREENING_OUTPUTS = ("peak_flow_m3s", "volume_m3", "time_to_peak_hr")
+
+# Métodos de escorrentía
+RUNOFF_METHODS = ("racional", "scs-cn")
+
+
+# ============================================================================
+# Escenarios
+# ============================================================================
+
+def scenario_grid(**axes: Any) -> dict[str, NDArray]:
+    """
+    Producto cartesiano de los valores de cada eje.
+
+    Ejemplo:
+        scenario_grid(storm=["gz", "blocks"], tr=[2, 10], x=[1.0, 1.67])
+
+    Args:
+        **axes: Nombre de columna -> valor o lista de valores
+
+    Returns:
+        Columnas con una fila por combinación
+    """
+    names = list(axes)
+    values = [v if isinstance(v, (list, tuple, np.ndarray)) else [v] for v in axes.values()]
+    rows = list(itertools.product(*values))
+    return {name: np.array([row[i] for row in rows]) for i, name in enumerate(names)}
+
+
+def concat_scenarios(parts: list[dict[str, NDArray]]) -> dict[str, NDArray]:
+    """Une conjuntos de escenarios con las mismas columnas."""
+    if not parts:
+        raise ValueError("No hay escenarios")
+    return {name: np.concatenate([p[name] for p in parts]) for name in parts[0]}
+
+
+def _n_rows(scenarios: dict[str, NDArray]) -> int:
+    missing = [c for c in SCENARIO_COLUMNS if c not in scenarios]
+    if missing:
+        raise ValueError(f"Faltan columnas de escenario: {', '.join(missing)}")
+    lengths = {len(np.atleast_1d(v)) for v in scenarios.values()}
+    if len(lengths) != 1:
+        raise ValueError("Las columnas de escenario deben tener el mismo largo")
+    n = lengths.pop()
+    if n == 0:
+        raise ValueError("No hay escenarios")
+    return n
+
+
+def _groups(scenarios: dict[str, NDArray]) -> dict[tuple, NDArray[np.int_]]:
+    """Filas por (tormenta, Tr, dt, escorrentía): comparten hietograma base."""
+    keys = zip(scenarios["storm"], scenarios["tr"], scenarios["dt_min"], scenarios["runoff"])
+    groups: dict[tuple, list[int]] = {}
+    for i, key in enumerate(keys):
+        groups.setdefault((str(key[0]), int(key[1]), float(key[2]), str(key[3])), []).append(i)
+    return {key: np.array(rows) for key, rows in groups.items()}
+
+
+# ============================================================================
+# Cribado
+# ============================================================================
+
+@dataclass
+class ScreeningResult:
+    """
+    Resultado del cribado.
+
+    Attributes:
+        scenarios: Columnas de los escenarios evaluados
+        result: Qp, Tp y volumen por escenario
+        rank_by: Salida usada para ordenar
+        top: Índices de los escenarios críticos (de mayor a menor)
+        hydrographs: Índice -> (tiempo h, caudal m³/s) de los críticos
+    """
+    scenarios: dict[str, NDArray]
+    result: EnsembleResult
+    rank_by: str = "peak_flow_m3s"
+    top: list[int] = field(default_factory=list)
+    hydrographs: dict[int, tuple[NDArray[np.floating], NDArray[np.floating]]] = field(default_factory=dict)
+
+    @property
+    def n_scenarios(self) -> int:
+        return len(self.result)
+
+    def ranking(self) -> NDArray[np.int_]:
+        """Índices de todos los escenarios de mayor a menor salida."""
+        values = getattr(self.result, self.rank_by)
+        return np.argsort(-values, kind="stable")
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Escenario y resultados de una fila."""
+        record = {name: values[index].item() for name, values in self.scenarios.items()}
+        for name in SCREENING_OUTPUTS:
+            record[name] = float(getattr(self.result, name)[index])
+        return record
+
+
+def screen_scenarios(
+    scenarios: dict[str, NDArray],
+    area_ha: float,
+    p3_10: float,
+    lambda_coef: float = 0.2,
+    top_k: int = 5,
+    rank_by: str = "peak_flow_m3s",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+) -> ScreeningResult:
+    """
+    Evalúa Qp, Tp y volumen de todos los escenarios y materializa los críticos.
+
+    Columnas requeridas (ver SCENARIO_COLUMNS): storm, tr, dt_min, tc_hr
+    (h), x (factor X), runoff ('racional' o 'scs-cn') y coef (C o CN ya
+    ajustados por Tr o AMC).
+
+    Args:
+        scenarios: Columnas de escenarios (ver scenario_grid)
+        area_ha: Área de la cuenca (ha)
+        p3_10: P3,10 (mm)
+        lambda_coef: Coeficiente lambda para Ia (SCS-CN)
+        top_k: Escenarios críticos con hidrograma completo
+        rank_by: Salida para ordenar (peak_flow_m3s, volume_m3, time_to_peak_hr)
+        chunk_size: Muestras por bloque de convolución
+        workers: Procesos para evaluar los bloques
+
+    Returns:
+        ScreeningResult
+    """
+    if rank_by not in SCREENING_OUTPUTS:
+        raise ValueError(f"Salida '{rank_by}' no soportada (usar {', '.join(SCREENING_OUTPUTS)})")
+    n = _n_rows(scenarios)
+    scenarios = {name: np.atleast_1d(np.asarray(values)) for name, values in scenarios.items()}
+
+    peak = np.empty(n)
+    time_to_peak = np.empty(n)
+    volume = np.empty(n)
+    for (storm, tr, dt_min, runoff), rows in _groups(scenarios).items():
+        if runoff not in RUNOFF_METHODS:
+            raise ValueError(f"Escorrentía '{runoff}' no soportada (usar {', '.join(RUNOFF_METHODS)})")
+        coef = scenarios["coef"][rows].astype(float)
+        part = evaluate_ensemble(
+            area_ha,
+            scenarios["tc_hr"][rows].astype(float),
+            scenarios["x"][rows].astype(float),
+            p3_10,
+            c=coef if runoff == "racional" else None,
+            cn=coef if runoff == "scs-cn" else None,
+            lambda_coef=lambda_coef,
+            storm_code=storm,
+            tr=tr,
+            dt_min=dt_min,
+            chunk_size=chunk_size,
+            workers=workers,
+        )
+        peak[rows] = part.peak_flow_m3s
+        time_to_peak[rows] = part.time_to_peak_hr
+        volume[rows] = part.volume_m3
+
+    result = ScreeningResult(
+        scenarios=scenarios,
+        result=EnsembleResult(peak, time_to_peak, volume),
+        rank_by=rank_by,
+    )
+    result.top = [int(i) for i in result.ranking()[:max(top_k, 0)]]
+    result.hydrographs = scenario_hydrographs(scenarios, result.top, area_ha, p3_10, lambda_coef)
+    return result
+
+
+def scenario_hydrographs(
+    scenarios: dict[str, NDArray],
+    indices: list[int],
+    area_ha: float,
+    p3_10: float,
+    lambda_coef: float = 0.2,
+) -> dict[int, tuple[NDArray[np.floating], NDArray[np.floating]]]:
+    """
+    Hidrogramas completos de algunos escenarios.
+
+    Usa las mismas funciones que el cribado, así que el pico de cada
+    hidrograma coincide con el informado por screen_scenarios.
+
+    Args:
+        scenarios: Columnas de escenarios
+        indices: Filas a materializar
+        area_ha: Área de la cuenca (ha)
+        p3_10: P3,10 (mm)
+        lambda_coef: Coeficiente lambda para Ia (SCS-CN)
+
+    Returns:
+        Índice -> (tiempo h, caudal m³/s)
+    """
+    hydrographs = {}
+    for i in indices:
+        storm, runoff = str(scenarios["storm"][i]), str(scenarios["runoff"][i])
+        tc_hr = np.array([float(scenarios["tc_hr"][i])])
+        depths, dt = storm_depths(
+            storm, int(scenarios["tr"][i]), float(scenarios["dt_min"][i]), np.array([p3_10]), tc_hr
+        )
+        coef = np.array([float(scenarios["coef"][i])])
+        excess = excess_rational(depths, coef) if runoff == "racional" else excess_scs(depths, coef, lambda_coef)
+        uh = unit_hydrograph_batch(
+            runoff, storm, np.array([area_ha]), tc_hr, dt / 60, np.array([float(scenarios["x"][i])])
+        )
+
+        flow = convolve_batch(excess, uh)[0]
+        # Sin el ruido de la FFT ni la cola de ceros del relleno
+        flow[flow < 1e-12 * flow.max()] = 0.0
+        flow = flow[:min(len(np.trim_zeros(flow, "b")) + 1, len(flow))]
+        hydrographs[i] = (np.arange(len(flow)) * dt / 60, flow)
+    return hydrographs
@@ -0,0 +1,634 @@
+"""
+Análisis de sensibilidad global (Sobol, Morris) y tornado.
+
+Ordena qué entradas dominan el caudal pico (o el volumen, o Tp) de una
+cuenca. Los factores pueden ser continuos (área, pendiente, C, CN, λ,
+factor X) o discretos (AMC, método de Tc, paso de tiempo, tormenta).
+
+Todas las evaluaciones de un diseño se hacen en lote con el pipeline
+vectorizado de core/ensemble.py: las filas se agrupan por tormenta y paso
+de tiempo, y las filas repetidas (frecuentes con factores discretos y en
+trayectorias de Morris) se calculan una sola vez y se cachean en el
+modelo.
+
+Métodos:
+- sobol: índices de primer orden (S1) y totales (ST) con el estimador de
+  Saltelli/Jansen sobre una secuencia Sobol (quasi-aleatoria).
+- morris: efectos elementales (mu*, sigma) con trayectorias en grilla.
+- tornado: variación de la salida llevando cada factor a sus extremos
+  con el resto en el valor base.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from hidropluvial.config import AntecedentMoistureCondition
+from hidropluvial.core.ensemble import DEFAULT_CHUNK_SIZE, ENSEMBLE_STORMS, evaluate_ensemble
+from hidropluvial.core.montecarlo import MC_TC_METHODS, tc_samples
+from hidropluvial.core.runoff import adjust_cn_for_amc
+
+
+# Factores posibles, en el orden de las columnas internas
+FACTOR_NAMES = ("area", "slope", "c", "cn", "lambda", "amc", "tc", "dt", "x", "storm")
+
+# Niveles de los factores categóricos (se codifican por índice)
+CATEGORICAL_LEVELS = {
+    "amc": ("I", "II", "III"),
+    "tc": MC_TC_METHODS,
+    "storm": ENSEMBLE_STORMS,
+}
+
+# Salidas analizables
+SENSITIVITY_OUTPUTS = ("peak_flow_m3s", "volume_m3", "time_to_peak_hr")
+
+SENSITIVITY_METHODS = ("sobol", "morris", "tornado")
+
+
+# ============================================================================
+# Factores
+# ============================================================================
+
+@dataclass
+class Factor:
+    """
+    Factor de entrada del análisis.
+
+    Los factores continuos se recorren entre low y high; los discretos
+    toman uno de `levels` (valores numéricos o nombres categóricos).
+    """
+    name: str
+    low: float = 0.0
+    high: float = 0.0
+    levels: tuple = ()
+
+    def __post_init__(self):
+        if self.name not in FACTOR_NAMES:
+            raise ValueError(
+                f"Factor '{self.name}' desconocido (usar {', '.join(FACTOR_NAMES)})"
+            )
+        if self.name in CATEGORICAL_LEVELS and not self.levels:
+            raise ValueError(f"El factor '{self.name}' requiere niveles")
+        for level in self.levels:
+            encode(self.name, level)
+        if not self.levels and self.low > self.high:
+            raise ValueError(f"Rango inválido para '{self.name}': {self.low} > {self.high}")
+
+    @property
+    def discrete(self) -> bool:
+        return bool(self.levels)
+
+    def values(self, u: NDArray[np.floating]) -> NDArray[np.floating]:
+        """
+        Valores (codificados) para posiciones u en [0, 1].
+
+        Los discretos dividen [0, 1] en tramos iguales por nivel; los
+        categóricos devuelven el índice del nivel en CATEGORICAL_LEVELS.
+        """
+        if not self.discrete:
+            return self.low + u * (self.high - self.low)
+        idx = np.minimum((u * len(self.levels)).astype(int), len(self.levels) - 1)
+        return np.array([encode(self.name, v) for v in self.levels], dtype=float)[idx]
+
+    def extremes(self) -> list[float]:
+        """Valores codificados a probar en el tornado."""
+        if self.discrete:
+            return [encode(self.name, v) for v in self.levels]
+        return [self.low, self.high]
+
+    def describe(self) -> str:
+        if self.discrete:
+            return ",".join(v if isinstance(v, str) else f"{v:g}" for v in self.levels)
+        return f"{self.low:g} - {self.high:g}"
+
+
+def encode(name: str, value) -> float:
+    """Codifica un valor de factor como número (índice si es categórico)."""
+    if name in CATEGORICAL_LEVELS:
+        if value not in CATEGORICAL_LEVELS[name]:
+            raise ValueError(
+                f"Valor '{value}' inválido para '{name}' "
+                f"(usar {', '.join(CATEGORICAL_LEVELS[name])})"
+            )
+        return float(CATEGORICAL_LEVELS[name].index(value))
+    return float(value)
+
+
+def decode(name: str, value: float):
+    """Inversa de encode()."""
+    if name in CATEGORICAL_LEVELS:
+        return CATEGORICAL_LEVELS[name][int(value)]
+    return value
+
+
+def _format_level(name: str, value: float) -> str:
+    level = decode(name, value)
+    return level if isinstance(level, str) else f"{level:g}"
+
+
+def parse_factor(name: str, spec: str) -> Factor:
+    """
+    Interpreta el rango de un factor escrito como texto.
+
+    Args:
+        name: Nombre del factor
+        spec: "mín,máx" para continuos o "n1,n2,..." para discretos
+            (amc, tc, storm, dt)
+
+    Returns:
+        Factor
+    """
+    parts = [p.strip() for p in spec.split(",") if p.strip()]
+    if name in CATEGORICAL_LEVELS:
+        return Factor(name, levels=tuple(p.lower() if name != "amc" else p.upper() for p in parts))
+    try:
+        values = [float(p) for p in parts]
+    except ValueError:
+        raise ValueError(f"Rango inválido para '{name}': '{spec}'") from None
+    if name == "dt":
+        return Factor(name, levels=tuple(values))
+    if len(values) != 2:
+        raise ValueError(f"El factor '{name}' requiere 'mín,máx'")
+    return Factor(name, low=values[0], high=values[1])
+
+
+# ============================================================================
+# Modelo
+# ============================================================================
+
+class SensitivityModel:
+    """
+    Pipeline de una cuenca evaluable en lote sobre diseños de factores.
+
+    Los valores base (todo lo que no es factor) son los datos de la
+    cuenca y la configuración del análisis.
+
+    Args:
+        area_ha: Área (ha)
+        slope_pct: Pendiente (%)
+        p3_10: P3,10 (mm)
+        length_m: Longitud del cauce (m)
+        c: Coeficiente C
+        cn: Número de curva (AMC II)
+        runoff: Método de escorrentía (racional, scs-cn)
+        lambda_coef: Coeficiente lambda para Ia
+        amc: Condición antecedente (I, II, III)
+        tc_method: Método de Tc
+        dt_min: Paso de tiempo (min)
+        x_factor: Factor X
+        storm_code: Tormenta
+        tr: Período de retorno (años)
+        t0_min: Tiempo de entrada para desbordes (min)
+        output: Salida analizada (peak_flow_m3s, volume_m3, time_to_peak_hr)
+        workers: Procesos para el pipeline vectorizado
+    """
+
+    def __init__(
+        self,
+        area_ha: float,
+        slope_pct: float,
+        p3_10: float,
+        length_m: Optional[float] = None,
+        c: Optional[float] = None,
+        cn: Optional[float] = None,
+        runoff: str = "racional",
+        lambda_coef: float = 0.2,
+        amc: str = "II",
+        tc_method: str = "kirpich",
+        dt_min: float = 5.0,
+        x_factor: float = 1.0,
+        storm_code: str = "gz",
+        tr: int = 10,
+        t0_min: float = 5.0,
+        output: str = "peak_flow_m3s",
+        workers: int = 1,
+    ):
+        if runoff not in ("racional", "scs-cn"):
+            raise ValueError(f"Método de escorrentía '{runoff}' no soportado")
+        if runoff == "racional" and not c:
+            raise ValueError("El método racional requiere el coeficiente C")
+        if runoff == "scs-cn" and not cn:
+            raise ValueError("El método SCS-CN requiere CN")
+        if output not in SENSITIVITY_OUTPUTS:
+            raise ValueError(f"Salida '{output}' no soportada (usar {', '.join(SENSITIVITY_OUTPUTS)})")
+
+        self.p3_10 = p3_10
+        self.length_m = length_m
+        self.runoff = runoff
+        self.tr = tr
+        self.t0_min = t0_min
+        self.output = output
+        self.workers = workers
+        self.c_base = c
+
+        base = {
+            "area": area_ha, "slope": slope_pct, "c": c or 0.0, "cn": cn or 0.0,
+            "lambda": lambda_coef, "amc": amc, "tc": tc_method, "dt": dt_min,
+            "x": x_factor, "storm": storm_code,
+        }
+        self.base = {name: encode(name, value) for name, value in base.items()}
+        self.n_evaluations = 0
+        self._cache: dict[tuple, float] = {}
+
+    def base_value(self) -> float:
+        """Salida con todos los factores en su valor base."""
+        row = np.array([[self.base[name] for name in FACTOR_NAMES]])
+        return float(self.evaluate_rows(row)[0])
+
+    def design_rows(
+        self, factors: list[Factor], unit: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        """
+        Filas codificadas (N x len(FACTOR_NAMES)) para un diseño en [0, 1]^k.
+
+        Args:
+            factors: Factores variados (columnas de `unit`)
+            unit: Diseño N x k en el hipercubo unitario
+        """
+        rows = np.tile([self.base[name] for name in FACTOR_NAMES], (len(unit), 1))
+        for j, factor in enumerate(factors):
+            rows[:, FACTOR_NAMES.index(factor.name)] = factor.values(unit[:, j])
+        return rows
+
+    def evaluate(self, factors: list[Factor], unit: NDArray[np.floating]) -> NDArray[np.floating]:
+        """Evalúa la salida para un diseño en el hipercubo unitario."""
+        return self.evaluate_rows(self.design_rows(factors, unit))
+
+    def evaluate_rows(self, rows: NDArray[np.floating]) -> NDArray[np.floating]:
+        """
+        Evalúa filas codificadas, calculando solo las que no están en caché.
+
+        Returns:
+            Salida por fila
+        """
+        unique, inverse = np.unique(rows, axis=0, return_inverse=True)
+        keys = [tuple(row) for row in unique]
+        pending = [i for i, key in enumerate(keys) if key not in self._cache]
+
+        if pending:
+            values = self._compute(unique[pending])
+            self.n_evaluations += len(pending)
+            for i, value in zip(pending, values):
+                self._cache[keys[i]] = float(value)
+
+        return np.array([self._cache[key] for key in keys])[inverse.reshape(-1)]
+
+    def _compute(self, rows: NDArray[np.floating]) -> NDArray[np.floating]:
+        """Calcula la salida de filas únicas con el pipeline vectorizado."""
+        col = {name: rows[:, j] for j, name in enumerate(FACTOR_NAMES)}
+        n = len(rows)
+
+        if self.runoff == "scs-cn":
+            coef = col["cn"].copy()
+            for code in np.unique(col["amc"]):
+                mask = col["amc"] == code
+                amc = AntecedentMoistureCondition(decode("amc", code))
+                coef[mask] = [adjust_cn_for_amc(v, amc) for v in col["cn"][mask]]
+        else:
+            coef = col["c"]
+
+        # Desbordes usa C aunque la escorrentía sea SCS-CN
+        c_tc = col["c"] if self.runoff == "racional" else self.c_base
+        tc_hr = np.empty(n)
+        for code in np.unique(col["tc"]):
+            mask = col["tc"] == code
+            tc_hr[mask] = tc_samples(
+                decode("tc", code),
+                col["area"][mask],
+                col["slope"][mask],
+                self.length_m,
+                c_tc[mask] if isinstance(c_tc, np.ndarray) else c_tc,
+                int(mask.sum()),
+                self.t0_min,
+            )
+
+        out = np.empty(n)
+        groups = np.unique(np.column_stack([col["storm"], col["dt"]]), axis=0)
+        for storm, dt in groups:
+            mask = (col["storm"] == storm) & (col["dt"] == dt)
+            result = evaluate_ensemble(
+                col["area"][mask],
+                tc_hr[mask],
+                col["x"][mask],
+                self.p3_10,
+                c=coef[mask] if self.runoff == "racional" else None,
+                cn=coef[mask] if self.runoff == "scs-cn" else None,
+                lambda_coef=col["lambda"][mask],
+                storm_code=decode("storm", storm),
+                tr=self.tr,
+                dt_min=float(dt),
+                chunk_size=DEFAULT_CHUNK_SIZE,
+                workers=self.workers,
+            )
+            out[mask] = getattr(result, self.output)
+        return out
+
+
+def default_factors(
+    model: SensitivityModel,
+    names: Optional[list[str]] = None,
+    rel_range: float = 0.2,
+) -> list[Factor]:
+    """
+    Factores con rangos por defecto alrededor de los valores base.
+
+    Área, pendiente y C varían ±rel_range; CN ±10 unidades; λ entre 0.05
+    y 0.20; X entre 1.0 y 2.25. Los discretos recorren los niveles
+    aplicables (métodos de Tc según los datos disponibles). Se omiten los
+    factores que no aplican al método de escorrentía.
+
+    Args:
+        model: Modelo de la cuenca
+        names: Factores a incluir (None: todos los aplicables)
+        rel_range: Variación relativa para área, pendiente y C
+
+    Returns:
+        Lista de Factor
+    """
+    base = {name: decode(name, value) for name, value in model.base.items()}
+    scs = model.runoff == "scs-cn"
+
+    tc_levels = tuple(
+        m for m in MC_TC_METHODS
+        if (m != "desbordes" and model.length_m) or (m == "desbordes" and model.c_base)
+    )
+    candidates = {
+        "area": lambda: Factor("area", base["area"] * (1 - rel_range), base["area"] * (1 + rel_range)),
+        "slope": lambda: Factor("slope", base["slope"] * (1 - rel_range), base["slope"] * (1 + rel_range)),
+        "c": lambda: Factor("c", base["c"] * (1 - rel_range), min(base["c"] * (1 + rel_range), 1.0)),
+        "cn": lambda: Factor("cn", max(base["cn"] - 10, 30.0), min(base["cn"] + 10, 100.0)),
+        "lambda": lambda: Factor("lambda", 0.05, 0.20),
+        "amc": lambda: Factor("amc", levels=CATEGORICAL_LEVELS["amc"]),
+        "tc": lambda: Factor("tc", levels=tc_levels),
+        "dt": lambda: Factor("dt", levels=(5.0, 10.0)),
+        "x": lambda: Factor("x", 1.0, 2.25),
+        "storm": lambda: Factor("storm", levels=ENSEMBLE_STORMS),
+    }
+    applicable = {
+        "c": not scs, "cn": scs, "lambda": scs, "amc": scs, "tc": len(tc_levels) > 1,
+    }
+
+    if names is None:
+        names = [n for n in FACTOR_NAMES if applicable.get(n, True)]
+    else:
+        for name in names:
+            if name not in candidates:
+                raise ValueError(f"Factor '{name}' desconocido (usar {', '.join(FACTOR_NAMES)})")
+            if not applicable.get(name, True) and name != "tc":
+                raise ValueError(f"El factor '{name}' no aplica al método {model.runoff}")
+
+    return [candidates[name]() for name in names]
+
+
+# ============================================================================
+# Métodos
+# ============================================================================
+
+@dataclass
+class SensitivityResult:
+    """
+    Índices de sensibilidad por factor.
+
+    Attributes:
+        method: sobol, morris o tornado
+        factors: Factores analizados
+        indices: Índice -> array por factor (S1, ST, ... / mu_star, ... / low, high)
+        rank_by: Índice usado para ordenar
+        base_value: Salida con los factores en su valor base
+        n_evaluations: Evaluaciones del pipeline (sin repeticiones en caché)
+    """
+    method: str
+    factors: list[Factor]
+    indices: dict[str, NDArray[np.floating]]
+    rank_by: str
+    output: str
+    base_value: float
+    n_evaluations: int
+    labels: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def names(self) -> list[str]:
+        return [f.name for f in self.factors]
+
+    def ranking(self) -> list[int]:
+        """Índices de factores ordenados de mayor a menor influencia."""
+        return list(np.argsort(-np.nan_to_num(self.indices[self.rank_by]), kind="stable"))
+
+
+def sobol_indices(
+    model: SensitivityModel,
+    factors: list[Factor],
+    n_samples: int = 1024,
+    seed: Optional[int] = None,
+    n_bootstrap: int = 100,
+) -> SensitivityResult:
+    """
+    Índices de Sobol de primer orden y totales.
+
+    Usa matrices A y B de una secuencia Sobol de dimensión 2k y las k
+    matrices A_B^i (A con la columna i de B): N (k + 2) evaluaciones. El
+    intervalo de confianza (95%) se estima por bootstrap.
+
+    Args:
+        model: Modelo de la cuenca
+        factors: Factores a analizar
+        n_samples: Muestras base N (se redondea a potencia de 2)
+        seed: Semilla del scrambling
+        n_bootstrap: Remuestreos para el intervalo de confianza
+
+    Returns:
+        SensitivityResult con S1, S1_conf, ST, ST_conf
+    """
+    from scipy.stats import qmc
+
+    k = len(factors)
+    m = max(int(np.ceil(np.log2(max(n_samples, 2)))), 1)
+    design = qmc.Sobol(d=2 * k, scramble=True, seed=seed).random_base2(m)
+    a, b = design[:, :k], design[:, k:]
+    n = len(a)
+
+    blocks = [a, b]
+    for i in range(k):
+        ab = a.copy()
+        ab[:, i] = b[:, i]
+        blocks.append(ab)
+    y = model.evaluate(factors, np.vstack(blocks))
+    f_a, f_b = y[:n], y[n:2 * n]
+    f_ab = y[2 * n:].reshape(k, n)
+
+    def estimate(idx):
+        fa, fb, fab = f_a[idx], f_b[idx], f_ab[:, idx]
+        var = np.var(np.concatenate([fa, fb]))
+        if var == 0:
+            return np.zeros(k), np.zeros(k)
+        s1 = np.mean(fb * (fab - fa), axis=1) / var
+        st = 0.5 * np.mean((fa - fab) ** 2, axis=1) / var
+        return s1, st
+
+    s1, st = estimate(np.arange(n))
+    rng = np.random.default_rng(seed)
+    boot = [estimate(rng.integers(0, n, n)) for _ in range(n_bootstrap)]
+    s1_conf = 1.96 * np.std([b[0] for b in boot], axis=0)
+    st_conf = 1.96 * np.std([b[1] for b in boot], axis=0)
+
+    return SensitivityResult(
+        method="sobol",
+        factors=factors,
+        indices={"S1": s1, "S1_conf": s1_conf, "ST": st, "ST_conf": st_conf},
+        rank_by="ST",
+        output=model.output,
+        base_value=model.base_value(),
+        n_evaluations=model.n_evaluations,
+    )
+
+
+def morris_effects(
+    model: SensitivityModel,
+    factors: list[Factor],
+    n_trajectories: int = 20,
+    n_levels: int = 4,
+    seed: Optional[int] = None,
+) -> SensitivityResult:
+    """
+    Efectos elementales de Morris.
+
+    Cada trayectoria parte de un punto de la grilla de `n_levels` niveles y
+    mueve un factor por vez (en orden aleatorio) en ±Δ, con
+    Δ = n_levels / (2 (n_levels - 1)): r (k + 1) evaluaciones.
+
+    Args:
+        model: Modelo de la cuenca
+        factors: Factores a analizar
+        n_trajectories: Cantidad de trayectorias r
+        n_levels: Niveles de la grilla
+        seed: Semilla
+
+    Returns:
+        SensitivityResult con mu, mu_star, sigma (en unidades de la salida)
+    """
+    rng = np.random.default_rng(seed)
+    k = len(factors)
+    delta = n_levels / (2 * (n_levels - 1))
+    grid = np.arange(n_levels) / (n_levels - 1)
+
+    points = []
+    steps = []
+    for _ in range(n_trajectories):
+        x = rng.choice(grid, k)
+        order = rng.permutation(k)
+        points.append(x.copy())
+        for i in order:
+            # Se mueve hacia donde haya lugar dentro de [0, 1]
+            sign = 1.0 if x[i] + delta <= 1.0 + 1e-12 else -1.0
+            x[i] += sign * delta
+            points.append(x.copy())
+            steps.append((i, sign))
+
+    y = model.evaluate(factors, np.clip(np.array(points), 0.0, 1.0))
+
+    effects = [[] for _ in range(k)]
+    step = 0
+    for t in range(n_trajectories):
+        start = t * (k + 1)
+        for j in range(k):
+            i, sign = steps[step]
+            step += 1
+            effects[i].append(sign * (y[start + j + 1] - y[start + j]) / delta)
+
+    effects = np.array(effects)
+    return SensitivityResult(
+        method="morris",
+        factors=factors,
+        indices={
+            "mu": effects.mean(axis=1),
+            "mu_star": np.abs(effects).mean(axis=1),
+            "sigma": effects.std(axis=1, ddof=1) if n_trajectories > 1 else np.zeros(k),
+        },
+        rank_by="mu_star",
+        output=model.output,
+        base_value=model.base_value(),
+        n_evaluations=model.n_evaluations,
+    )
+
+
+def tornado(model: SensitivityModel, factors: list[Factor]) -> SensitivityResult:
+    """
+    Análisis de un factor por vez desde el valor base.
+
+    Para cada factor se evalúan sus extremos (o todos sus niveles si es
+    discreto) con el resto en el valor base.
+
+    Returns:
+        SensitivityResult con low, high y swing (high - low), y las
+        etiquetas de los valores que producen cada extremo
+    """
+    base_row = np.array([model.base[name] for name in FACTOR_NAMES])
+    rows, owner = [], []
+    for j, factor in enumerate(factors):
+        col = FACTOR_NAMES.index(factor.name)
+        for value in factor.extremes():
+            row = base_row.copy()
+            row[col] = value
+            rows.append(row)
+            owner.append((j, value))
+
+    y = model.evaluate_rows(np.array(rows))
+
+    low = np.full(len(factors), np.inf)
+    high = np.full(len(factors), -np.inf)
+    low_labels = [""] * len(factors)
+    high_labels = [""] * len(factors)
+    for (j, value), out in zip(owner, y):
+        label = _format_level(factors[j].name, value)
+        if out < low[j]:
+            low[j], low_labels[j] = out, label
+        if out > high[j]:
+            high[j], high_labels[j] = out, label
+
+    return SensitivityResult(
+        method="tornado",
+        factors=factors,
+        indices={"low": low, "high": high, "swing": high - low},
+        rank_by="swing",
+        output=model.output,
+        base_value=model.base_value(),
+        n_evaluations=model.n_evaluations,
+        labels={"low": low_labels, "high": high_labels},
+    )
+
+
+def run_sensitivity(
+    model: SensitivityModel,
+    factors: list[Factor],
+    method: str = "sobol",
+    n_samples: int = 1024,
+    seed: Optional[int] = None,
+) -> SensitivityResult:
+    """
+    Ejecuta un método de sensibilidad.
+
+    Args:
+        model: Modelo de la cuenca
+        factors: Factores a analizar
+        method: sobol, morris o tornado
+        n_samples: Muestras base (sobol) o trayectorias (morris)
+        seed: Semilla
+
+    Returns:
+        SensitivityResult
+    """
+    if not factors:
+        raise ValueError("No hay factores para analizar")
+    names = [f.name for f in factors]
+    if len(set(names)) != len(names):
+        raise ValueError("Factores repetidos")
+
+    if method == "sobol":
+        return sobol_indices(model, factors, n_samples, seed)
+    if method == "morris":
+        return morris_effects(model, factors, n_samples, seed=seed)
+    if method == "tornado":
+        return tornado(model, factors)
+    raise ValueError(f"Método '{method}' no soportado (usar {', '.join(SENSITIVITY_METHODS)})")
@@ -20,6 +20,7 @@ from hidropluvial.config import (
     ShermanCoefficients,
     StormMethod,
 )
+from hidropluvial.core import kernels
 from hidropluvial.core.idf import (
     depth_from_intensity,
     get_intensity,
@@ -73,29 +74,9 @@ def _distribute_alternating_blocks(
     Returns:
         Array con incrementos distribuidos
     """
-    peak_index = int(peak_position * n_intervals)
-    result_depths = np.zeros(n_intervals)
-
-    left = peak_index
-    right = peak_index + 1
-    toggle = True  # True = izquierda, False = derecha
-
-    for inc in sorted_increments:
-        if toggle and left >= 0:
-            result_depths[left] = inc
-            left -= 1
-        elif not toggle and right < n_intervals:
-            result_depths[right] = inc
-            right += 1
-        elif left >= 0:
-            result_depths[left] = inc
-            left -= 1
-        elif right < n_intervals:
-            result_depths[right] = inc
-            right += 1
-        toggle = not toggle
-
-    return result_depths
+    # Con peak_position = 1 el pico cae en el último intervalo
+    peak_index = min(int(peak_position * n_intervals), n_intervals - 1)
+    return kernels.alternating_blocks(sorted_increments, n_intervals, peak_index)
 
 
 def alternating_blocks(
@@ -780,12 +761,10 @@ def custom_depth_storm(
         peak_idx = n_intervals // 2
 
         # Crear triángulo
-        depths = np.zeros(n_intervals)
-        for i in range(n_intervals):
-            if i <= peak_idx:
-                depths[i] = i / peak_idx if peak_idx > 0 else 1
-            else:
-                depths[i] = (n_intervals - 1 - i) / (n_intervals - 1 - peak_idx)
+        i = np.arange(n_intervals)
+        rise = i / peak_idx if peak_idx > 0 else np.ones(n_intervals)
+        fall = (n_intervals - 1 - i) / max(n_intervals - 1 - peak_idx, 1)
+        depths = np.where(i <= peak_idx, rise, fall)
 
         # Normalizar para que sume total_depth_mm
         depths = depths * total_depth_mm / np.sum(depths)
@@ -797,16 +776,11 @@ def custom_depth_storm(
 
         # Generar profundidades acumuladas sintéticas usando relación potencial
         # P(d) = P_total * (d/D)^0.6 (relación típica)
-        cumulative_depths = np.zeros(n_intervals)
-        for i in range(n_intervals):
-            d_ratio = (i + 1) / n_intervals
-            cumulative_depths[i] = total_depth_mm * (d_ratio ** 0.6)
+        d_ratio = np.arange(1, n_intervals + 1) / n_intervals
+        cumulative_depths = total_depth_mm * (d_ratio ** 0.6)
 
         # Calcular incrementos
-        increments = np.zeros(n_intervals)
-        increments[0] = cumulative_depths[0]
-        for i in range(1, n_intervals):
-            increments[i] = cumulative_depths[i] - cumulative_depths[i - 1]
+        increments = np.diff(cumulative_depths, prepend=0.0)
 
         # Ordenar y distribuir alternando
         sorted_increments = np.sort(increments)[::-1]
@@ -16,6 +16,7 @@ from hidropluvial.models.storm import StormResult
 from hidropluvial.models.hydrograph import HydrographResult
 from hidropluvial.models.analysis import AnalysisRun
 from hidropluvial.models.basin import Basin
+from hidropluvial.models.network import Reach
 from hidropluvial.models.project import Project
 
 __all__ = [
@@ -33,7 +34,8 @@ __all__ = [
     "HydrographResult",
     # Análisis completo
     "AnalysisRun",
-    # Cuenca y proyecto
+    # Cuenca, red y proyecto
     "Basin",
+    "Reach",
     "Project",
 ]
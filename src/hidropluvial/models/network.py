@@ -0,0 +1,22 @@
+"""
+Modelo de los tramos de la red de drenaje de un proyecto.
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class Reach(BaseModel):
+    """
+    Tramo por el que una cuenca descarga en otra cuenca del proyecto.
+
+    Las cuencas sin tramo (o con downstream_id None) son salidas de la red.
+    """
+
+    basin_id: str  # Cuenca aguas arriba
+    downstream_id: Optional[str] = None  # Cuenca donde descarga (None: salida)
+    method: str = "lag"  # "lag" (retardo puro) o "muskingum"
+    lag_min: float = 0.0  # Retardo (min), método lag
+    k_hr: float = 0.0  # Tiempo de viaje K (h), método Muskingum
+    x: float = 0.2  # Factor de ponderación X, método Muskingum
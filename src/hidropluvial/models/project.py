@@ -2,6 +2,7 @@
 Modelo de proyecto hidrológico.
 
 Un proyecto agrupa múltiples cuencas (basins) bajo un mismo estudio.
+Opcionalmente, los tramos (reaches) las conectan en una red de drenaje.
 """
 
 from typing import Optional
@@ -10,6 +11,7 @@ from pydantic import Field
 
 from hidropluvial.models.base import TimestampedModel
 from hidropluvial.models.basin import Basin
+from hidropluvial.models.network import Reach
 
 
 class Project(TimestampedModel):
@@ -28,6 +30,9 @@ class Project(TimestampedModel):
     # Cuencas del proyecto
     basins: list[Basin] = Field(default_factory=list)
 
+    # Red de drenaje: tramo de cada cuenca hacia la cuenca aguas abajo
+    reaches: list[Reach] = Field(default_factory=list)
+
     # Metadatos
     notes: Optional[str] = None
     tags: list[str] = Field(default_factory=list)
@@ -46,14 +51,43 @@ class Project(TimestampedModel):
         return basin
 
     def remove_basin(self, basin_id: str) -> bool:
-        """Elimina una cuenca del proyecto."""
+        """Elimina una cuenca del proyecto (y sus tramos de la red)."""
         for i, basin in enumerate(self.basins):
             if basin.id == basin_id or basin.id.startswith(basin_id):
                 self.basins.pop(i)
+                # Su tramo se elimina; las cuencas que descargaban en ella
+                # pasan a ser salidas de la red
+                self.reaches = [r for r in self.reaches if r.basin_id != basin.id]
+                for reach in self.reaches:
+                    if reach.downstream_id == basin.id:
+                        reach.downstream_id = None
                 self.touch()
                 return True
         return False
 
+    def get_reach(self, basin_id: str) -> Optional[Reach]:
+        """Obtiene el tramo aguas abajo de una cuenca (ID completo)."""
+        for reach in self.reaches:
+            if reach.basin_id == basin_id:
+                return reach
+        return None
+
+    def set_reach(self, reach: Reach) -> Reach:
+        """Agrega o reemplaza el tramo aguas abajo de una cuenca."""
+        self.reaches = [r for r in self.reaches if r.basin_id != reach.basin_id]
+        self.reaches.append(reach)
+        self.touch()
+        return reach
+
+    def remove_reach(self, basin_id: str) -> bool:
+        """Elimina el tramo de una cuenca (pasa a ser salida de la red)."""
+        n_before = len(self.reaches)
+        self.reaches = [r for r in self.reaches if r.basin_id != basin_id]
+        if len(self.reaches) == n_before:
+            return False
+        self.touch()
+        return True
+
     @property
     def n_basins(self) -> int:
         """Número de cuencas en el proyecto."""
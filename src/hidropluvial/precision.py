@@ -0,0 +1,180 @@
+"""
+Política de precisión de las series guardadas.
+
+Los cálculos de core se hacen siempre en float64. Las series que se
+guardan (proyectos, base de datos, caché, exportación Parquet) pueden
+almacenarse en float32: para caudales e intensidades de diseño sobran
+7 cifras significativas y el almacenamiento se reduce a la mitad (binario)
+o a ~60% (texto JSON, con mejor compresión).
+
+Políticas:
+- 'float32' (por defecto): las series se redondean a float32. En binario
+  se guardan como float32; en los modelos (y en JSON) como el decimal de
+  9 cifras del valor float32, que vuelve a dar exactamente ese float32.
+- 'float64': series sin redondeo.
+
+Tolerancia: con 'float32' cada valor guardado v de una serie calculada x
+cumple |v - x| <= FLOAT32_RTOL · |x| (para |x| >= 1.2e-38, el menor float32
+normal; valores menores pueden quedar en 0). Los escalares de resultado
+(caudal pico, volumen, ...) se calculan sobre la serie en float64 y no se
+redondean, así que pueden diferir del máximo de la serie guardada dentro de
+esa tolerancia.
+
+La política se elige con set_series_precision() / use_series_precision()
+o con la variable de entorno HIDROPLUVIAL_PRECISION ('float32', 'float64');
+set_series_precision() también la actualiza para los procesos de trabajo.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+# Políticas disponibles
+SERIES_PRECISIONS = ("float32", "float64")
+
+# Variable de entorno con la política (heredada por los procesos de trabajo)
+PRECISION_ENV = "HIDROPLUVIAL_PRECISION"
+
+# Error relativo máximo de una serie guardada en float32 (épsilon de float32)
+FLOAT32_RTOL = float(np.finfo(np.float32).eps)
+
+# Cifras significativas del decimal que representa un float32 en texto
+_FLOAT32_DIGITS = 9
+
+# Potencias de 10 exactas (float(10**k) está correctamente redondeado)
+_POW10 = np.array([float(10 ** k) for k in range(301)])
+
+
+def _resolve(name: str) -> str:
+    name = name.lower()
+    if name not in SERIES_PRECISIONS:
+        raise ValueError(f"Precisión '{name}' no soportada (usar float32 o float64)")
+    return name
+
+
+def _initial_precision() -> str:
+    """Política inicial según la variable de entorno (inválida: float32)."""
+    try:
+        return _resolve(os.environ.get(PRECISION_ENV, "float32"))
+    except ValueError:
+        return "float32"
+
+
+_precision = _initial_precision()
+
+
+def get_series_precision() -> str:
+    """Política activa ('float32' o 'float64')."""
+    return _precision
+
+
+def set_series_precision(name: str) -> str:
+    """
+    Selecciona la precisión con que se guardan las series.
+
+    Args:
+        name: 'float32' o 'float64'
+
+    Returns:
+        Política activa
+    """
+    global _precision
+    _precision = _resolve(name)
+    os.environ[PRECISION_ENV] = _precision
+    return _precision
+
+
+@contextmanager
+def use_series_precision(name: str) -> Iterator[str]:
+    """Usa una política de precisión dentro de un bloque."""
+    previous = _precision
+    previous_env = os.environ.get(PRECISION_ENV)
+    try:
+        yield set_series_precision(name)
+    finally:
+        set_series_precision(previous)
+        if previous_env is None:
+            os.environ.pop(PRECISION_ENV, None)
+        else:
+            os.environ[PRECISION_ENV] = previous_env
+
+
+def storage_dtype() -> np.dtype:
+    """dtype binario de las series guardadas según la política."""
+    return np.dtype(np.float32 if _precision == "float32" else np.float64)
+
+
+def _round_significant(values: NDArray[np.float64], digits: int) -> NDArray[np.float64]:
+    """Redondea a `digits` cifras significativas (el decimal más cercano)."""
+    out = values.copy()
+    mask = np.isfinite(values) & (values != 0)
+    v = values[mask]
+    magnitude = np.abs(v)
+
+    def scale(shift):
+        power = _POW10[np.abs(shift)]
+        return np.where(shift >= 0, magnitude * power, magnitude / power), power
+
+    # Desplazamiento decimal que deja `digits` cifras enteras; log10 puede
+    # errar en ±1 cerca de las potencias de 10, se corrige contra enteros
+    shift = np.clip(digits - 1 - np.floor(np.log10(magnitude)).astype(np.int64), -300, 300)
+    scaled, _ = scale(shift)
+    shift = np.clip(shift - (scaled >= _POW10[digits]) + (scaled < _POW10[digits - 1]), -300, 300)
+
+    scaled, power = scale(shift)
+    rounded = np.round(scaled)
+    out[mask] = np.copysign(np.where(shift >= 0, rounded / power, rounded * power), v)
+    return out
+
+
+def quantize_series(values: Sequence[float] | NDArray[np.floating]) -> NDArray[np.float64]:
+    """
+    Serie en float64 con la precisión de almacenamiento de la política.
+
+    Con 'float32' el resultado es idempotente (redondear dos veces da lo
+    mismo) y no depende de si la entrada venía en float64 o ya en float32.
+
+    Args:
+        values: Serie calculada
+
+    Returns:
+        Serie redondeada (copia)
+    """
+    values = np.asarray(values)
+    if _precision == "float64":
+        return values.astype(np.float64)
+    return widen_series(values.astype(np.float32))
+
+
+def widen_series(values: NDArray[np.floating]) -> NDArray[np.float64]:
+    """
+    Serie guardada como float64 para calcular con ella.
+
+    Un float32 se convierte al decimal de 9 cifras que lo representa (el
+    mismo valor que quantize_series), no a su expansión binaria exacta:
+    0.1 en float32 vuelve como 0.100000001 y no como 0.10000000149011612.
+
+    Args:
+        values: Serie leída (float32 o float64)
+
+    Returns:
+        Serie en float64 (copia)
+    """
+    values = np.asarray(values)
+    if values.dtype == np.float32:
+        return _round_significant(values.astype(np.float64), _FLOAT32_DIGITS)
+    return values.astype(np.float64)
+
+
+def store_series(values: Sequence[float] | NDArray[np.floating]) -> list[float]:
+    """Serie como lista para los modelos (proyectos, base de datos)."""
+    return quantize_series(values).tolist()
+
+
+def pack_series(values: Sequence[float] | NDArray[np.floating]) -> NDArray[np.floating]:
+    """Serie en el dtype binario de la política (caché, Parquet)."""
+    return np.ascontiguousarray(values, dtype=storage_dtype())
@@ -7,9 +7,11 @@ Estructura jerárquica:
 """
 
 import json
+import os
+from bisect import bisect_left
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from hidropluvial.models import (
     Basin,
@@ -19,6 +21,7 @@ from hidropluvial.models import (
     HydrographResult,
     AnalysisRun,
 )
+from hidropluvial.precision import store_series
 
 
 # ============================================================================
@@ -41,9 +44,14 @@ class ProjectManager:
 
         self.data_dir = Path(data_dir)
         self.projects_dir = self.data_dir / "projects"
+        self.basin_index_path = self.data_dir / "basin_index.json"
 
         self.projects_dir.mkdir(parents=True, exist_ok=True)
 
+        # Índice cuenca -> proyecto (cargado al primer uso)
+        self._basin_index: Optional[dict[str, str]] = None
+        self._basin_keys: Optional[list[str]] = None
+
     def _project_path(self, project_id: str) -> Path:
         """Retorna la ruta del archivo de proyecto."""
         return self.projects_dir / f"{project_id}.json"
@@ -77,6 +85,7 @@ class ProjectManager:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(project.model_dump(), f, indent=2, ensure_ascii=False)
 
+        self._index_project_basins(project.id, [b.id for b in project.basins])
         return path
 
     def load_project(self, project_id: str) -> Project:
@@ -91,14 +100,41 @@ class ProjectManager:
 
         return Project.model_validate(data)
 
-    def get_project(self, project_id: str) -> Optional[Project]:
-        """Obtiene un proyecto por ID (parcial o completo)."""
-        # Buscar por ID exacto o parcial
+    def find_project_id(self, project_id: str) -> Optional[str]:
+        """Resuelve un ID parcial o completo sin cargar el proyecto."""
         for path in self.projects_dir.glob("*.json"):
             if path.stem == project_id or path.stem.startswith(project_id):
-                return self.load_project(path.stem)
+                return path.stem
         return None
 
+    def get_project(self, project_id: str) -> Optional[Project]:
+        """Obtiene un proyecto por ID (parcial o completo)."""
+        # Buscar por ID exacto o parcial
+        full_id = self.find_project_id(project_id)
+        if full_id is None:
+            return None
+        return self.load_project(full_id)
+
+    def iter_basins(self, project_id: str) -> Iterator[Basin]:
+        """
+        Itera las cuencas de un proyecto validándolas de a una.
+
+        A diferencia de `load_project`, no construye todos los modelos
+        Basin (con sus series temporales) a la vez: cada cuenca se valida
+        al pedirla y su JSON crudo se libera al avanzar.
+        """
+        path = self._project_path(project_id)
+
+        if not path.exists():
+            raise FileNotFoundError(f"Proyecto no encontrado: {project_id}")
+
+        with open(path, "r", encoding="utf-8") as f:
+            raw_basins = json.load(f).get("basins", [])
+
+        raw_basins.reverse()
+        while raw_basins:
+            yield Basin.model_validate(raw_basins.pop())
+
     def list_projects(self) -> list[dict]:
         """Lista todos los proyectos disponibles."""
         projects = []
@@ -128,9 +164,122 @@ class ProjectManager:
         if project:
             path = self._project_path(project.id)
             path.unlink()
+            self._index_project_basins(project.id, [])
             return True
         return False
 
+    # ========================================================================
+    # Índice de cuencas (basin_id -> project_id)
+    # ========================================================================
+
+    def _load_basin_index(self) -> dict[str, str]:
+        """Carga el índice de cuencas; lo reconstruye si falta o es inválido."""
+        if self._basin_index is None:
+            try:
+                with open(self.basin_index_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    raise ValueError("Índice de cuencas inválido")
+                self._basin_index = {str(k): str(v) for k, v in data.items()}
+                self._basin_keys = None
+            except (OSError, ValueError):
+                self.rebuild_basin_index()
+        return self._basin_index
+
+    def _write_basin_index(self) -> None:
+        """Escribe el índice de forma atómica (archivo temporal + rename)."""
+        self._basin_keys = None
+        tmp_path = self.basin_index_path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(dict(sorted(self._basin_index.items())), f, indent=0)
+            os.replace(tmp_path, self.basin_index_path)
+        except OSError:
+            # El índice es prescindible: se reconstruye en la próxima búsqueda
+            pass
+
+    def _index_project_basins(self, project_id: str, basin_ids: list[str]) -> None:
+        """Actualiza las entradas del índice correspondientes a un proyecto."""
+        index = self._load_basin_index()
+        current = {b for b, p in index.items() if p == project_id}
+        if current == set(basin_ids):
+            return
+
+        for basin_id in current:
+            del index[basin_id]
+        for basin_id in basin_ids:
+            index[basin_id] = project_id
+        self._write_basin_index()
+
+    def rebuild_basin_index(self) -> dict[str, str]:
+        """
+        Reconstruye el índice de cuencas leyendo todos los proyectos.
+
+        Solo se leen los IDs del JSON crudo (sin validar modelos). Se usa
+        cuando el índice no existe o quedó desactualizado (ej: proyectos
+        copiados o borrados a mano).
+        """
+        index: dict[str, str] = {}
+        for path in self.projects_dir.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                for basin in data.get("basins", []):
+                    index[basin["id"]] = data.get("id", path.stem)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                continue
+
+        self._basin_index = index
+        self._write_basin_index()
+        return index
+
+    def find_basin_project_id(self, basin_id: str) -> Optional[tuple[str, str]]:
+        """
+        Resuelve un ID de cuenca (parcial o completo) usando el índice.
+
+        La búsqueda por prefijo es una bisección sobre las claves ordenadas.
+
+        Returns:
+            Tupla (basin_id completo, project_id) o None si no está indexada
+        """
+        index = self._load_basin_index()
+        if self._basin_keys is None:
+            self._basin_keys = sorted(index)
+
+        keys = self._basin_keys
+        i = bisect_left(keys, basin_id)
+        if i < len(keys) and keys[i].startswith(basin_id):
+            return keys[i], index[keys[i]]
+        return None
+
+    def find_basin(self, basin_id: str) -> Optional[tuple[Project, Basin]]:
+        """
+        Busca una cuenca por ID (parcial o completo) en todos los proyectos.
+
+        Solo carga el proyecto que contiene la cuenca. Si el índice no la
+        encuentra o apunta a un proyecto que ya no la tiene, se reconstruye
+        una vez y se reintenta.
+
+        Returns:
+            Tupla (proyecto, cuenca) o None si no existe
+        """
+        for attempt in range(2):
+            match = self.find_basin_project_id(basin_id)
+            if match is not None:
+                full_id, project_id = match
+                try:
+                    project = self.load_project(project_id)
+                except (FileNotFoundError, ValueError):
+                    project = None
+                basin = project.get_basin(full_id) if project else None
+                if basin is not None:
+                    return project, basin
+
+            if attempt == 0:
+                self.rebuild_basin_index()
+
+        return None
+
     # ========================================================================
     # Operaciones de Cuenca (Basin)
     # ========================================================================
@@ -223,8 +372,8 @@ class ProjectManager:
             total_depth_mm=total_depth_mm,
             peak_intensity_mmhr=peak_intensity_mmhr,
             n_intervals=n_intervals,
-            time_min=storm_time_min or [],
-            intensity_mmhr=storm_intensity_mmhr or [],
+            time_min=store_series(storm_time_min or []),
+            intensity_mmhr=store_series(storm_intensity_mmhr or []),
         )
 
         # Calcular tb (tiempo base) = 2.67 × tp
@@ -246,8 +395,8 @@ class ProjectManager:
             volume_m3=volume_m3,
             total_depth_mm=total_depth_mm,
             runoff_mm=runoff_mm,
-            time_hr=hydrograph_time_hr or [],
-            flow_m3s=hydrograph_flow_m3s or [],
+            time_hr=store_series(hydrograph_time_hr or []),
+            flow_m3s=store_series(hydrograph_flow_m3s or []),
         )
 
         analysis = AnalysisRun(
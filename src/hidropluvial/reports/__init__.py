@@ -15,6 +15,9 @@ from hidropluvial.reports.generator import (
     ReportGenerator,
     ProjectInfo,
     ReportData,
+    get_jinja_env,
+    render_template,
+    CSVStreamWriter,
     export_to_json,
     export_to_csv,
     idf_to_csv,
@@ -55,6 +58,9 @@ __all__ = [
     "ReportGenerator",
     "ProjectInfo",
     "ReportData",
+    "get_jinja_env",
+    "render_template",
+    "CSVStreamWriter",
     "export_to_json",
     "export_to_csv",
     "idf_to_csv",
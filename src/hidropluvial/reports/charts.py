@@ -80,19 +80,53 @@ def _generate_hour_ticks(max_minutes: float, preferred_interval_hr: float = 1.0)
     return ticks_min, labels
 
 
-def _format_coordinates(time_min: Sequence[float], values: Sequence[float], precision: int = 2) -> str:
-    """Formatea coordenadas para TikZ."""
-    coords = []
-    for t, v in zip(time_min, values):
-        coords.append(f"({t:.0f}, {v:.{precision}f})")
+# Coordenadas por línea en los bloques "coordinates" de TikZ
+COORDS_PER_LINE = 5
 
-    # Agrupar en líneas de 5 coordenadas
-    lines = []
-    for i in range(0, len(coords), 5):
-        chunk = coords[i:i+5]
-        lines.append("\t\t\t\t" + " ".join(chunk))
 
-    return "\n".join(lines)
+def _format_coordinates(
+    time_min: Sequence[float] | np.ndarray,
+    values: Sequence[float] | np.ndarray,
+    precision: int = 2,
+    time_precision: int = 0,
+) -> str:
+    """
+    Formatea coordenadas para TikZ.
+
+    Acepta listas o arrays NumPy. En lugar de formatear cada par por
+    separado, arma un único patrón printf para todas las coordenadas y lo
+    aplica de una vez sobre los valores intercalados (t0, v0, t1, v1, ...).
+
+    Args:
+        time_min: Tiempos (minutos)
+        values: Valores del eje Y
+        precision: Decimales de los valores
+        time_precision: Decimales de los tiempos
+
+    Returns:
+        Coordenadas "(t, v)" agrupadas en líneas de COORDS_PER_LINE
+    """
+    t = np.asarray(time_min, dtype=np.float64).ravel()
+    v = np.asarray(values, dtype=np.float64).ravel()
+    n = min(len(t), len(v))
+    if n == 0:
+        return ""
+
+    pair = f"(%.{time_precision}f, %.{precision}f)"
+    n_full, rest = divmod(n, COORDS_PER_LINE)
+    lines = ["\t\t\t\t" + " ".join([pair] * COORDS_PER_LINE)] * n_full
+    if rest:
+        lines.append("\t\t\t\t" + " ".join([pair] * rest))
+
+    flat = np.empty(2 * n, dtype=np.float64)
+    flat[0::2] = t[:n]
+    flat[1::2] = v[:n]
+    return "\n".join(lines) % tuple(flat.tolist())
+
+
+def _hours_to_minutes(time_hr: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Convierte una serie de tiempos de horas a minutos (array)."""
+    return np.asarray(time_hr, dtype=np.float64) * 60
 
 
 def generate_hydrograph_tikz(
@@ -106,6 +140,7 @@ def generate_hydrograph_tikz(
     legend_pos: str = "north east",
     ymax: float | None = None,
     include_figure: bool = True,
+    precision: int = 2,
 ) -> str:
     """
     Genera código TikZ para hidrograma.
@@ -121,6 +156,7 @@ def generate_hydrograph_tikz(
         legend_pos: Posición de la leyenda
         ymax: Valor máximo del eje Y (auto si None)
         include_figure: Si True, envuelve en \\begin{figure}...\\end{figure}
+        precision: Decimales de los caudales en las coordenadas
 
     Returns:
         Código LaTeX/TikZ completo
@@ -129,15 +165,9 @@ def generate_hydrograph_tikz(
         raise ValueError("Se requiere al menos una serie de datos")
 
     # Calcular límites
-    all_times = []
-    all_flows = []
-    for s in series:
-        all_times.extend(s.time_min)
-        all_flows.extend(s.flow_m3s)
-
-    xmax = max(all_times)
+    xmax = max(float(np.max(s.time_min)) for s in series)
     if ymax is None:
-        ymax = max(all_flows) * 1.1  # 10% de margen
+        ymax = max(float(np.max(s.flow_m3s)) for s in series) * 1.1  # 10% de margen
 
     # Generar ticks de hora
     ticks_min, tick_labels = _generate_hour_ticks(xmax)
@@ -147,7 +177,7 @@ def generate_hydrograph_tikz(
     # Construir plots
     plots = []
     for s in series:
-        coords = _format_coordinates(s.time_min, s.flow_m3s)
+        coords = _format_coordinates(s.time_min, s.flow_m3s, precision)
         plot = f"""		% {s.label}
 		\\addplot [
 		{s.color},
@@ -262,6 +292,7 @@ def generate_hyetograph_tikz(
     bar_width: int | None = None,
     ymax: float | None = None,
     include_figure: bool = True,
+    precision: int = 2,
 ) -> str:
     """
     Genera código TikZ para hietograma (barras invertidas).
@@ -279,6 +310,7 @@ def generate_hyetograph_tikz(
         bar_width: Ancho de las barras (auto si None)
         ymax: Valor máximo del eje Y (auto si None)
         include_figure: Si True, envuelve en \\begin{figure}...\\end{figure}
+        precision: Decimales de las intensidades en las coordenadas
 
     Returns:
         Código LaTeX/TikZ completo
@@ -290,9 +322,9 @@ def generate_hyetograph_tikz(
     dt = time_min[1] - time_min[0] if len(time_min) > 1 else 5
 
     # Calcular límites
-    xmax = max(time_min) + dt / 2
+    xmax = float(np.max(time_min)) + dt / 2
     if ymax is None:
-        ymax = max(intensity_mmhr) * 1.1
+        ymax = float(np.max(intensity_mmhr)) * 1.1
 
     # Ancho de barra automático
     if bar_width is None:
@@ -304,7 +336,7 @@ def generate_hyetograph_tikz(
     xticklabels_str = ", ".join(tick_labels)
 
     # Formatear coordenadas
-    coords = _format_coordinates(time_min, intensity_mmhr)
+    coords = _format_coordinates(time_min, intensity_mmhr, precision)
 
     # Título opcional
     title_line = f"title={{{title}}},\n\t\t\t" if title else ""
@@ -411,7 +443,7 @@ def hydrograph_result_to_tikz(
         Código LaTeX/TikZ
     """
     # Convertir tiempo de horas a minutos
-    time_min = [t * 60 for t in result.time_hr]
+    time_min = _hours_to_minutes(result.time_hr)
 
     series = [
         HydrographSeries(
@@ -519,10 +551,10 @@ def generate_methodology_comparison_tikz(
             label_text += f" X={a.hydrograph.x_factor:.2f}"
 
         # Convertir tiempo
-        time_min = [t * 60 for t in a.hydrograph.time_hr] if a.hydrograph.time_hr else []
+        time_min = _hours_to_minutes(a.hydrograph.time_hr or [])
         flow = a.hydrograph.flow_m3s or []
 
-        if time_min and flow:
+        if len(time_min) and flow:
             series.append(HydrographSeries(
                 time_min=time_min,
                 flow_m3s=flow,
@@ -617,13 +649,13 @@ def generate_c_vs_cn_comparison_tikz(
     cn_label = f"SCS-CN (CN={cn_a.tc.parameters.get('cn_adjusted', '?'):.0f})"
 
     # Datos
-    time_min_c = [t * 60 for t in c_a.hydrograph.time_hr] if c_a.hydrograph.time_hr else []
+    time_min_c = _hours_to_minutes(c_a.hydrograph.time_hr or [])
     flow_c = c_a.hydrograph.flow_m3s or []
 
-    time_min_cn = [t * 60 for t in cn_a.hydrograph.time_hr] if cn_a.hydrograph.time_hr else []
+    time_min_cn = _hours_to_minutes(cn_a.hydrograph.time_hr or [])
     flow_cn = cn_a.hydrograph.flow_m3s or []
 
-    if not time_min_c or not flow_c or not time_min_cn or not flow_cn:
+    if not len(time_min_c) or not flow_c or not len(time_min_cn) or not flow_cn:
         return ""
 
     series = [
@@ -4,13 +4,17 @@ Generador de reportes LaTeX para HidroPluvial.
 Genera memorias de cálculo y reportes técnicos en formato LaTeX.
 """
 
+import gzip
 import json
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Sequence
 
-from jinja2 import Environment, FileSystemLoader
+import numpy as np
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from hidropluvial import __version__
 
@@ -18,6 +22,9 @@ from hidropluvial import __version__
 # Directorio de templates
 _TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Caché en disco del bytecode de templates compilados (compartido entre procesos)
+_BYTECODE_CACHE_DIR = Path.home() / ".hidropluvial" / "cache" / "jinja"
+
 
 def _escape_latex(text: str) -> str:
     """Escapa caracteres especiales de LaTeX."""
@@ -40,7 +47,7 @@ def _escape_latex(text: str) -> str:
     return text
 
 
-def _create_jinja_env() -> Environment:
+def _create_jinja_env(bytecode_cache: FileSystemBytecodeCache | None = None) -> Environment:
     """Crea entorno Jinja2 configurado para LaTeX."""
     env = Environment(
         block_start_string=r'\BLOCK{',
@@ -53,11 +60,43 @@ def _create_jinja_env() -> Environment:
         trim_blocks=True,
         autoescape=False,
         loader=FileSystemLoader(str(_TEMPLATE_DIR)),
+        bytecode_cache=bytecode_cache,
+        # Los templates se distribuyen con el paquete: no revisar mtime en cada uso
+        auto_reload=False,
     )
     env.filters['escape_latex'] = _escape_latex
     return env
 
 
+def _create_bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Caché de bytecode en disco; None si el directorio no es escribible."""
+    try:
+        _BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(
+        str(_BYTECODE_CACHE_DIR),
+        pattern=f"hidropluvial_{__version__}_%s.cache",
+    )
+
+
+@lru_cache(maxsize=None)
+def get_jinja_env() -> Environment:
+    """
+    Entorno Jinja2 compartido por todo el proceso.
+
+    Los templates se compilan una sola vez por proceso (caché del entorno)
+    y el bytecode se guarda en ~/.hidropluvial/cache/jinja, de modo que las
+    siguientes ejecuciones de los comandos de reporte no vuelven a parsearlos.
+    """
+    return _create_jinja_env(_create_bytecode_cache())
+
+
+def render_template(name: str, **context: Any) -> str:
+    """Renderiza un template del paquete con el entorno compartido."""
+    return get_jinja_env().get_template(name).render(**context)
+
+
 @dataclass
 class ProjectInfo:
     """Información del proyecto para el reporte."""
@@ -86,7 +125,7 @@ class ReportGenerator:
     """Generador de reportes LaTeX."""
 
     def __init__(self):
-        self.env = _create_jinja_env()
+        self.env = get_jinja_env()
 
     def generate_idf_table_latex(
         self,
@@ -319,36 +358,126 @@ def export_to_json(data: dict[str, Any], filepath: str | Path) -> None:
         json.dump(data, f, indent=2, ensure_ascii=False, default=str)
 
 
+# Filas formateadas por bloque de escritura en los CSV
+CSV_CHUNK_ROWS = 10_000
+
+
+class CSVStreamWriter:
+    """
+    Escritor CSV por bloques, opcionalmente comprimido con gzip.
+
+    Las filas se formatean en bloques de `chunk_rows` con un único patrón
+    printf por bloque y se escriben con una sola llamada, sin armar la
+    tabla completa en memoria. Los valores se escriben como `str(v)`,
+    igual que la exportación fila a fila.
+
+    Uso:
+        with CSVStreamWriter("idf.csv.gz", ["Duracion_hr", "T2_yr"]) as w:
+            w.write_columns(durations, intensities)
+    """
+
+    def __init__(
+        self,
+        filepath: str | Path,
+        headers: Sequence[str],
+        delimiter: str = ",",
+        compress: bool | None = None,
+        chunk_rows: int = CSV_CHUNK_ROWS,
+    ):
+        """
+        Args:
+            filepath: Ruta del archivo
+            headers: Encabezados de columna
+            delimiter: Delimitador (default: coma)
+            compress: Comprimir con gzip (None: según extensión .gz)
+            chunk_rows: Filas por bloque de escritura
+        """
+        filepath = Path(filepath)
+        if compress is None:
+            compress = filepath.suffix == ".gz"
+
+        if compress:
+            self._file = gzip.open(filepath, "wt", encoding="utf-8")
+        else:
+            self._file = open(filepath, "w", encoding="utf-8")
+
+        self.delimiter = delimiter
+        self.chunk_rows = max(1, chunk_rows)
+        self.n_columns = len(headers)
+        self._file.write(delimiter.join(str(h) for h in headers) + "\n")
+
+    def __enter__(self) -> "CSVStreamWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _row_format(self, n_columns: int) -> str:
+        sep = self.delimiter.replace("%", "%%")
+        return sep.join(["%s"] * n_columns) + "\n"
+
+    def write_columns(self, *columns: Sequence[Any] | np.ndarray) -> None:
+        """
+        Escribe filas a partir de columnas (listas o arrays 1D).
+
+        Las columnas más largas se truncan a la longitud de la más corta.
+        """
+        # Las listas se mantienen tal cual para conservar el tipo de cada valor
+        cols = [c if isinstance(c, np.ndarray) else list(c) for c in columns]
+        n = min((len(c) for c in cols), default=0)
+        row_fmt = self._row_format(len(cols))
+
+        for start in range(0, n, self.chunk_rows):
+            stop = min(start + self.chunk_rows, n)
+            block = np.empty((stop - start, len(cols)), dtype=object)
+            for j, c in enumerate(cols):
+                chunk = c[start:stop]
+                block[:, j] = chunk.tolist() if isinstance(chunk, np.ndarray) else chunk
+            self._file.write((row_fmt * (stop - start)) % tuple(block.ravel().tolist()))
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Escribe filas de un iterable (o array 2D), por bloques."""
+        if isinstance(rows, np.ndarray) and rows.ndim == 2:
+            self.write_columns(*rows.T)
+            return
+
+        rows = iter(rows)
+        while chunk := list(islice(rows, self.chunk_rows)):
+            self._file.write("".join(
+                self.delimiter.join(str(v) for v in row) + "\n" for row in chunk
+            ))
+
+
 def export_to_csv(
     headers: list[str],
-    rows: list[list[Any]],
+    rows: Iterable[Sequence[Any]] | np.ndarray,
     filepath: str | Path,
     delimiter: str = ",",
+    compress: bool | None = None,
 ) -> None:
     """
     Exporta datos a CSV.
 
     Args:
         headers: Lista de encabezados
-        rows: Lista de filas (cada fila es una lista de valores)
+        rows: Filas (cada fila es una lista de valores), iterable o array 2D
         filepath: Ruta del archivo
         delimiter: Delimitador (default: coma)
+        compress: Comprimir con gzip (None: según extensión .gz)
     """
-    filepath = Path(filepath)
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        # Encabezados
-        f.write(delimiter.join(str(h) for h in headers) + "\n")
-        # Filas
-        for row in rows:
-            f.write(delimiter.join(str(v) for v in row) + "\n")
+    with CSVStreamWriter(filepath, headers, delimiter, compress) as writer:
+        writer.write_rows(rows)
 
 
 def idf_to_csv(
-    durations_hr: list[float],
-    return_periods_yr: list[int],
-    intensities_mmhr: list[list[float]],
+    durations_hr: Sequence[float] | np.ndarray,
+    return_periods_yr: Sequence[int] | np.ndarray,
+    intensities_mmhr: Sequence[Sequence[float]] | np.ndarray,
     filepath: str | Path,
+    compress: bool | None = None,
 ) -> None:
     """
     Exporta tabla IDF a CSV.
@@ -356,23 +485,22 @@ def idf_to_csv(
     Args:
         durations_hr: Duraciones en horas
         return_periods_yr: Períodos de retorno
-        intensities_mmhr: Matriz de intensidades
+        intensities_mmhr: Matriz de intensidades [Tr x duración]
         filepath: Ruta del archivo
+        compress: Comprimir con gzip (None: según extensión .gz)
     """
     headers = ["Duracion_hr"] + [f"T{T}_yr" for T in return_periods_yr]
+    intensities = list(intensities_mmhr)[:len(return_periods_yr)]
 
-    rows = []
-    for j, d in enumerate(durations_hr):
-        row = [d] + [intensities_mmhr[i][j] for i in range(len(return_periods_yr))]
-        rows.append(row)
-
-    export_to_csv(headers, rows, filepath)
+    with CSVStreamWriter(filepath, headers, compress=compress) as writer:
+        writer.write_columns(durations_hr, *intensities)
 
 
 def hyetograph_to_csv(
-    time_min: list[float],
-    intensity_mmhr: list[float],
+    time_min: Sequence[float] | np.ndarray,
+    intensity_mmhr: Sequence[float] | np.ndarray,
     filepath: str | Path,
+    compress: bool | None = None,
 ) -> None:
     """
     Exporta hietograma a CSV.
@@ -381,16 +509,17 @@ def hyetograph_to_csv(
         time_min: Tiempos en minutos
         intensity_mmhr: Intensidades en mm/hr
         filepath: Ruta del archivo
+        compress: Comprimir con gzip (None: según extensión .gz)
     """
-    headers = ["Tiempo_min", "Intensidad_mmhr"]
-    rows = [[t, i] for t, i in zip(time_min, intensity_mmhr)]
-    export_to_csv(headers, rows, filepath)
+    with CSVStreamWriter(filepath, ["Tiempo_min", "Intensidad_mmhr"], compress=compress) as writer:
+        writer.write_columns(time_min, intensity_mmhr)
 
 
 def hydrograph_to_csv(
-    time_hr: list[float],
-    flow_m3s: list[float],
+    time_hr: Sequence[float] | np.ndarray,
+    flow_m3s: Sequence[float] | np.ndarray,
     filepath: str | Path,
+    compress: bool | None = None,
 ) -> None:
     """
     Exporta hidrograma a CSV.
@@ -399,7 +528,7 @@ def hydrograph_to_csv(
         time_hr: Tiempos en horas
         flow_m3s: Caudales en m³/s
         filepath: Ruta del archivo
+        compress: Comprimir con gzip (None: según extensión .gz)
     """
-    headers = ["Tiempo_hr", "Caudal_m3s"]
-    rows = [[t, q] for t, q in zip(time_hr, flow_m3s)]
-    export_to_csv(headers, rows, filepath)
+    with CSVStreamWriter(filepath, ["Tiempo_hr", "Caudal_m3s"], compress=compress) as writer:
+        writer.write_columns(time_hr, flow_m3s)
@@ -27,3 +27,47 @@ def sample_catchment_params():
 def sample_rainfall_series():
     """Serie de precipitación de ejemplo (mm)."""
     return np.array([0.5, 1.2, 3.5, 8.2, 15.0, 12.0, 6.5, 3.0, 1.5, 0.8])
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path_factory, monkeypatch):
+    """Caché de resultados en un directorio temporal (también en procesos hijos)."""
+    import hidropluvial.cache as cache_module
+
+    home = tmp_path_factory.mktemp("home")
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.setenv("USERPROFILE", str(home))
+    monkeypatch.setattr(cache_module, "_result_cache", None)
+    return home / ".hidropluvial" / "cache" / "results"
+
+
+class CliProject:
+    """Proyecto temporal de los tests de CLI, con la cuenca de prueba 'Cuenca'."""
+
+    def __init__(self, manager, project, basin):
+        self.manager = manager
+        self.project = project
+        self.basin = basin
+
+    def invoke(self, app, args: list[str]):
+        """Ejecuta un comando de la CLI."""
+        from typer.testing import CliRunner
+
+        return CliRunner().invoke(app, args)
+
+
+@pytest.fixture
+def cli_project(tmp_path, monkeypatch):
+    """ProjectManager temporal usado por los comandos basin y project."""
+    import hidropluvial.cli.project.base as project_base
+    import hidropluvial.project as project_module
+    from hidropluvial.project import ProjectManager
+
+    manager = ProjectManager(data_dir=tmp_path / "proyectos")
+    monkeypatch.setattr(project_module, "_project_manager", manager)
+    monkeypatch.setattr(project_base, "_project_manager", manager)
+    project = manager.create_project("Proyecto")
+    basin = manager.create_basin(
+        project, name="Cuenca", area_ha=80.0, slope_pct=2.5, p3_10=83.0, c=0.55, cn=78, length_m=900.0
+    )
+    return CliProject(manager, project, basin)
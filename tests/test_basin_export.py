@@ -0,0 +1,202 @@
+"""
+Tests para exportación de cuencas y proyectos (cli/basin/export.py).
+"""
+
+import pytest
+from openpyxl import load_workbook
+
+from hidropluvial.cli.basin.export import (
+    export_to_excel,
+    export_project_to_excel,
+    export_to_parquet,
+    read_parquet_export,
+    _get_summary_dataframe,
+    _get_hydrographs_dataframe,
+)
+from hidropluvial.models import (
+    AnalysisRun,
+    Basin,
+    HydrographResult,
+    StormResult,
+    TcResult,
+)
+from hidropluvial.precision import store_series
+from hidropluvial.project import ProjectManager
+
+
+def _make_analysis(tr: int, method: str = "kirpich", x: float = None, n: int = 5) -> AnalysisRun:
+    """Crea un análisis con series cortas."""
+    tc = TcResult(method=method, tc_hr=0.5, tc_min=30.0, parameters={"c": 0.55})
+    storm = StormResult(
+        type="gz",
+        return_period=tr,
+        duration_hr=2.0,
+        total_depth_mm=80.0 + tr,
+        peak_intensity_mmhr=60.0,
+        n_intervals=n,
+        time_min=[5.0 * i for i in range(n)],
+        intensity_mmhr=[10.0, 20.0, 60.0, 20.0, 10.0][:n],
+    )
+    hydrograph = HydrographResult(
+        tc_method=method,
+        tc_min=30.0,
+        storm_type="gz",
+        return_period=tr,
+        x_factor=x,
+        peak_flow_m3s=1.5 * tr,
+        time_to_peak_hr=0.75,
+        time_to_peak_min=45.0,
+        volume_m3=12000.0,
+        total_depth_mm=80.0,
+        runoff_mm=30.0,
+        time_hr=[0.1 * i for i in range(n + 2)],
+        flow_m3s=[0.0, 0.5, 1.5 * tr, 1.0, 0.5, 0.2, 0.0][: n + 2],
+    )
+    return AnalysisRun(tc=tc, storm=storm, hydrograph=hydrograph)
+
+
+@pytest.fixture
+def basin():
+    """Cuenca con varios análisis."""
+    b = Basin(name="Cuenca Test", area_ha=100.0, slope_pct=2.0, p3_10=83.0, c=0.55)
+    b.add_analysis(_make_analysis(2))
+    b.add_analysis(_make_analysis(10, x=1.67))
+    b.add_analysis(_make_analysis(25, method="temez", n=4))
+    b.analyses[0].note = "Escenario base"
+    return b
+
+
+class TestExportToExcel:
+    """Tests para export_to_excel (streaming write-only)."""
+
+    def test_creates_expected_sheets(self, basin, tmp_path):
+        path = tmp_path / "cuenca.xlsx"
+        export_to_excel(basin, path)
+
+        wb = load_workbook(path)
+        assert wb.sheetnames == [
+            "Cuenca",
+            "Resumen Analisis",
+            "Por Periodo Retorno",
+            "Tormentas",
+            "Hietogramas",
+            "Hidrogramas",
+            "Notas",
+        ]
+
+    def test_without_timeseries(self, basin, tmp_path):
+        path = tmp_path / "cuenca.xlsx"
+        export_to_excel(basin, path, include_timeseries=False)
+
+        wb = load_workbook(path)
+        assert "Hietogramas" not in wb.sheetnames
+        assert "Hidrogramas" not in wb.sheetnames
+
+    def test_summary_matches_dataframe(self, basin, tmp_path):
+        path = tmp_path / "cuenca.xlsx"
+        export_to_excel(basin, path)
+
+        rows = list(load_workbook(path)["Resumen Analisis"].iter_rows(values_only=True))
+        df = _get_summary_dataframe(basin)
+
+        assert list(rows[0]) == list(df.columns)
+        assert len(rows) - 1 == len(df)
+        assert rows[1][0] == basin.analyses[0].id
+
+    def test_hydrographs_padded_like_dataframe(self, basin, tmp_path):
+        path = tmp_path / "cuenca.xlsx"
+        export_to_excel(basin, path)
+
+        rows = list(load_workbook(path)["Hidrogramas"].iter_rows(values_only=True))
+        df = _get_hydrographs_dataframe(basin)
+
+        assert list(rows[0]) == list(df.columns)
+        assert len(rows) - 1 == len(df)
+        # La serie corta queda rellenada con celdas vacías
+        assert rows[-1][-1] is None
+
+    def test_pivot_sorted_by_method_and_tr(self, basin, tmp_path):
+        path = tmp_path / "cuenca.xlsx"
+        export_to_excel(basin, path)
+
+        rows = list(load_workbook(path)["Por Periodo Retorno"].iter_rows(values_only=True))
+        assert rows[0] == ("Método", "Tr=2", "Tr=10", "Tr=25")
+        methods = [r[0] for r in rows[1:]]
+        assert methods == sorted(methods)
+
+
+class TestExportProjectToExcel:
+    """Tests para export_project_to_excel."""
+
+    def test_long_format_from_generator(self, basin, tmp_path):
+        other = Basin(name="Otra", area_ha=50.0, slope_pct=1.0, p3_10=80.0)
+        other.add_analysis(_make_analysis(5))
+
+        path = tmp_path / "proyecto.xlsx"
+        n = export_project_to_excel((b for b in [basin, other]), path)
+
+        assert n == 2
+        wb = load_workbook(path)
+        assert wb.sheetnames == ["Cuencas", "Resumen Analisis", "Hietogramas", "Hidrogramas"]
+
+        summary = list(wb["Resumen Analisis"].iter_rows(values_only=True))
+        assert len(summary) == 1 + 4
+
+        hydro = list(wb["Hidrogramas"].iter_rows(values_only=True))
+        n_samples = sum(len(a.hydrograph.time_hr) for b in [basin, other] for a in b.analyses)
+        assert len(hydro) == 1 + n_samples
+        assert hydro[-1][:2] == (other.id, other.analyses[0].id)
+
+    def test_iter_basins_from_manager(self, basin, tmp_path):
+        manager = ProjectManager(data_dir=tmp_path)
+        project = manager.create_project(name="Proyecto")
+        project.add_basin(basin)
+        manager.save_project(project)
+
+        full_id = manager.find_project_id(project.id[:4])
+        assert full_id == project.id
+
+        basins = list(manager.iter_basins(full_id))
+        assert [b.id for b in basins] == [basin.id]
+        assert len(basins[0].analyses) == 3
+
+        path = tmp_path / "proyecto.xlsx"
+        assert export_project_to_excel(manager.iter_basins(full_id), path) == 1
+
+
+class TestExportToParquet:
+    """Tests para export_to_parquet / read_parquet_export."""
+
+    @pytest.fixture(autouse=True)
+    def _require_pyarrow(self):
+        pytest.importorskip("pyarrow")
+
+    def test_roundtrip(self, basin, tmp_path):
+        files = export_to_parquet([basin], tmp_path / "pq")
+        assert files["analisis"].exists()
+        assert files["series"].exists()
+
+        analyses, series = read_parquet_export(tmp_path / "pq")
+        assert list(analyses["analysis_id"]) == [a.id for a in basin.analyses]
+        assert analyses["return_period"].tolist() == [2, 10, 25]
+
+        a = basin.analyses[1]
+        flow = series[(series["analysis_id"] == a.id) & (series["variable"] == "flow_m3s")]
+        # Series en la precisión de almacenamiento (float32 por defecto)
+        assert flow["value"].tolist() == store_series(a.hydrograph.flow_m3s)
+        assert flow["step"].tolist() == list(range(len(a.hydrograph.flow_m3s)))
+        assert flow["time_min"].tolist() == pytest.approx([t * 60 for t in a.hydrograph.time_hr])
+
+    def test_small_chunks_and_filter(self, basin, tmp_path):
+        export_to_parquet([basin, basin], tmp_path / "pq", chunk_rows=3)
+
+        analyses, series = read_parquet_export(tmp_path / "pq")
+        n_samples = sum(
+            len(a.storm.time_min) + len(a.hydrograph.time_hr) for a in basin.analyses
+        )
+        assert len(analyses) == 2 * len(basin.analyses)
+        assert len(series) == 2 * n_samples
+
+        target = basin.analyses[2].id
+        _, filtered = read_parquet_export(tmp_path / "pq", analysis_ids=[target])
+        assert set(filtered["analysis_id"].astype(str)) == {target}
@@ -0,0 +1,176 @@
+"""
+Tests para cache.py - Caché persistente de resultados.
+"""
+
+import os
+
+import numpy as np
+
+import hidropluvial.cache as cache_module
+from hidropluvial.cache import ResultCache, get_result_cache, result_key
+from hidropluvial.cli.wizard.config import WizardConfig
+from hidropluvial.cli.wizard.runner import AdditionalAnalysisRunner, run_basin_analyses
+from hidropluvial.precision import use_series_precision
+
+
+def _result(n: int = 50) -> dict:
+    return {
+        "peak_flow_m3s": 12.5,
+        "label": "gz",
+        "missing": None,
+        "flow_m3s": np.linspace(0.0, 1.0, n),
+    }
+
+
+class TestKey:
+    """Tests para la clave de caché."""
+
+    def test_canonical(self):
+        base = {"tr": 10, "coef": 0.55, "storm_params": {"b": [1, 2], "a": None}}
+        same = {"storm_params": {"a": None, "b": (1.0, 2.0)}, "coef": 0.55, "tr": 10.0}
+        assert result_key("analysis", base) == result_key("analysis", same)
+        assert result_key("analysis", base) != result_key("analysis", {**base, "coef": 0.56})
+        assert result_key("analysis", base) != result_key("other", base)
+        key = result_key("analysis", base)
+        with use_series_precision("float64"):
+            assert result_key("analysis", base) != key
+
+    def test_algorithm_version_invalidates(self, monkeypatch):
+        key = result_key("analysis", {"tr": 10})
+        monkeypatch.setitem(cache_module.ALGORITHM_VERSIONS, "convolution", 99)
+        assert result_key("analysis", {"tr": 10}) != key
+
+
+class TestResultCache:
+    """Tests para el almacenamiento en disco."""
+
+    def test_roundtrip(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        assert cache.get("ab" * 32) is None
+
+        cache.put("ab" * 32, _result())
+        result = cache.get("ab" * 32)
+        assert result["peak_flow_m3s"] == 12.5
+        assert result["label"] == "gz"
+        assert result["missing"] is None
+        # Series en la precisión de almacenamiento (float32 por defecto)
+        assert result["flow_m3s"].dtype == np.float32
+        np.testing.assert_array_equal(result["flow_m3s"], np.linspace(0.0, 1.0, 50, dtype=np.float32))
+        assert not result["flow_m3s"].flags.writeable
+
+        with use_series_precision("float64"):
+            cache.put("ef" * 32, _result())
+        np.testing.assert_array_equal(cache.get("ef" * 32)["flow_m3s"], np.linspace(0.0, 1.0, 50))
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_get_or_compute(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return _result()
+
+        cache.get_or_compute("analysis", {"tr": 2}, compute)
+        cache.get_or_compute("analysis", {"tr": 2.0}, compute)
+        cache.get_or_compute("analysis", {"tr": 5}, compute)
+        assert len(calls) == 2
+        assert cache.count() == 2
+
+    def test_corrupt_entry_is_miss(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        key = "cd" * 32
+        cache.put(key, _result())
+        path = cache._path(key)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 8)
+
+        assert cache.get(key) is None
+        assert not os.path.exists(path)
+
+    def test_lru_eviction(self, tmp_path):
+        entry_size = len(cache_module._encode(_result(1000)))
+        cache = ResultCache(tmp_path, max_bytes=int(entry_size * 3.5))
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, _result(1000))
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+
+        # Leer la más vieja la marca como recién usada
+        assert cache.get(keys[0]) is not None
+        cache.put("99" * 32, _result(1000))
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.size_bytes() <= cache.max_bytes
+
+    def test_clear(self, tmp_path):
+        cache = ResultCache(tmp_path)
+        for i in range(3):
+            cache.put(f"{i:02d}" * 32, _result())
+        assert cache.clear() == 3
+        assert cache.count() == 0
+
+    def test_unwritable_dir_ignored(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        cache = ResultCache(blocker / "results")
+        cache.put("ab" * 32, _result())
+        assert cache.get("ab" * 32) is None
+
+
+class TestRunners:
+    """Tests para el uso de la caché en los runners."""
+
+    @staticmethod
+    def _config() -> WizardConfig:
+        return WizardConfig(
+            nombre="Cuenca", area_ha=60.0, slope_pct=2.0, p3_10=83.0, c=0.55, cn=78,
+            length_m=900.0, tc_methods=["kirpich", "desbordes"], storm_codes=["gz", "huff_q2"],
+            return_periods=[2, 25], x_factors=[1.0, 1.67],
+        )
+
+    @staticmethod
+    def _summary(basin) -> list:
+        return [a.model_dump(exclude={"id", "timestamp"}) for a in basin.analyses]
+
+    def test_rerun_reads_cache(self, isolated_result_cache):
+        config = self._config()
+        matrix = [(code, config.return_periods, config.x_factors) for code in config.storm_codes]
+
+        first = run_basin_analyses(config, matrix)
+        cache = get_result_cache()
+        assert cache.cache_dir == isolated_result_cache
+        assert cache.count() == len(first.analyses)
+
+        second = run_basin_analyses(config, matrix)
+        assert cache.hits == len(first.analyses)
+        assert self._summary(second) == self._summary(first)
+
+        # Cambiar un dato físico de la cuenca invalida sus entradas
+        config.area_ha = 61.0
+        run_basin_analyses(config, matrix)
+        assert cache.count() == 2 * len(first.analyses)
+
+    def test_additional_runner(self):
+        config = self._config()
+        basin = run_basin_analyses(config, [("gz", [2], [1.0])])
+        runs = []
+        for use_cache in (True, True, False):
+            runner = AdditionalAnalysisRunner(basin.model_copy(deep=True), c=0.55, cn=78, use_cache=use_cache)
+            runner.run(["kirpich"], "bimodal", [10], [1.0], on_progress=lambda e: None)
+            runs.append(self._summary(runner.basin)[-2:])
+
+        assert runs[0] == runs[1] == runs[2]
+        assert get_result_cache().hits == 2
+
+    def test_disabled(self):
+        config = self._config()
+        run_basin_analyses(config, [("gz", [2], [1.0])])
+        count = get_result_cache().count()
+
+        basin = run_basin_analyses(config, [("gz", [2], [1.0])])
+        runner = AdditionalAnalysisRunner(basin, c=0.55, use_cache=False)
+        assert runner.cache is None
+        runner.run(["kirpich"], "blocks", [100], [1.0], on_progress=lambda e: None)
+        assert get_result_cache().count() == count
@@ -0,0 +1,221 @@
+"""
+Tests para core/calibration.py - Calibración contra eventos observados.
+"""
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from hidropluvial.core import clark_uh, convolve_uh, rainfall_excess_series, triangular_uh_x
+from hidropluvial.core.calibration import (
+    ObservedEvent,
+    calibrate,
+    clark_uh_batch,
+    event_metrics,
+    kge,
+    load_event_csv,
+    nse,
+    simulate_batch,
+)
+from hidropluvial.core.temporal import custom_hyetograph
+
+
+AREA_HA = 250.0
+
+
+def _event(name: str, truth: dict, model: str = "triangular", seed: int = 0, noise: float = 0.0, **kwargs):
+    """Evento sintético generado con parámetros conocidos."""
+    rng = np.random.default_rng(seed)
+    n, dt = 18, 10
+    rain = rng.gamma(1.5, 4.0, n)
+    rain[n // 2:] *= 0.3
+    hyeto = custom_hyetograph(list(np.arange(n) * dt + dt / 2), list(rain))
+    time_hr = np.arange(0, 10 * 60, 15) / 60
+
+    template = ObservedEvent(name, hyeto, time_hr, np.arange(len(time_hr)) + 1.0)
+    values = {k: np.array([v]) for k, v in truth.items()}
+    flow = simulate_batch(template, AREA_HA, model, values, **kwargs)[0]
+    flow = flow * (1 + noise * rng.standard_normal(len(flow)))
+    return ObservedEvent(name, hyeto, time_hr, flow)
+
+
+class TestMetrics:
+    """Tests para las métricas de ajuste."""
+
+    def test_perfect_fit(self):
+        obs = np.array([0.0, 1.0, 3.0, 2.0, 0.5])
+        assert nse(obs, obs) == pytest.approx(1.0)
+        assert kge(obs, obs) == pytest.approx(1.0)
+
+        metrics = event_metrics(obs, obs, np.arange(5.0))
+        assert metrics["peak_error"] == 0
+        assert metrics["volume_error"] == 0
+
+    def test_mean_prediction_nse_zero(self):
+        obs = np.array([0.0, 1.0, 3.0, 2.0, 0.5])
+        assert nse(np.full(5, obs.mean()), obs) == pytest.approx(0.0)
+
+    def test_batched(self):
+        obs = np.array([0.0, 1.0, 3.0, 2.0, 0.5])
+        sim = np.vstack([obs, obs * 2])
+        values = nse(sim, obs)
+        assert values.shape == (2,)
+        assert values[0] > values[1]
+
+
+class TestSimulation:
+    """Tests para la simulación en lote."""
+
+    def test_clark_batch_matches_scalar(self):
+        tc = np.array([0.8, 1.5])
+        r = np.array([0.5, 2.0])
+        batch = clark_uh_batch(2.5, tc, r, 1 / 6)
+        for i in range(2):
+            _, uh = clark_uh(2.5, tc[i], r[i], 1 / 6)
+            np.testing.assert_allclose(batch[i, :len(uh)], uh, atol=1e-12)
+            assert np.all(batch[i, len(uh):] == 0)
+
+    def test_matches_scalar_pipeline(self):
+        event = _event("e", {"cn": 80, "lambda": 0.2, "tc": 1.0, "x": 1.67})
+        params = {"cn": np.array([70.0, 85.0]), "lambda": np.array([0.2, 0.1]),
+                  "tc": np.array([0.8, 1.4]), "x": np.array([1.0, 2.25])}
+        sim = simulate_batch(event, AREA_HA, "triangular", params)
+
+        dt_hr = event.dt_hr
+        for i in range(2):
+            excess = rainfall_excess_series(
+                np.array(event.hyetograph.cumulative_mm), params["cn"][i], params["lambda"][i]
+            )
+            _, uh = triangular_uh_x(AREA_HA, params["tc"][i], dt_hr, params["x"][i])
+            flow = convolve_uh(excess, uh)
+            expected = np.interp(event.time_hr, np.arange(len(flow)) * dt_hr, flow, right=0.0)
+            np.testing.assert_allclose(sim[i], expected, atol=1e-9)
+
+    def test_snyder_requires_lengths(self):
+        event = _event("e", {"cn": 80, "lambda": 0.2, "tc": 1.0, "x": 1.67})
+        params = {"cn": np.array([80.0]), "lambda": np.array([0.2]),
+                  "ct": np.array([2.0]), "cp": np.array([0.6])}
+        with pytest.raises(ValueError, match="Snyder"):
+            simulate_batch(event, AREA_HA, "snyder", params)
+
+
+class TestCalibrate:
+    """Tests para la calibración."""
+
+    def test_recovers_triangular_parameters(self):
+        truth = {"cn": 78.0, "lambda": 0.2, "tc": 1.1, "x": 1.67}
+        events = [_event(f"e{i}", truth, seed=i, noise=0.02) for i in range(3)]
+
+        result = calibrate(events, AREA_HA, "triangular", fixed={"lambda": 0.2}, seed=1)
+
+        assert result.calibrated == ["cn", "tc", "x"]
+        assert result.params["lambda"] == 0.2
+        assert result.params["cn"] == pytest.approx(78.0, abs=1.5)
+        assert result.params["tc"] == pytest.approx(1.1, rel=0.1)
+        assert result.score > 0.99
+        assert set(result.metrics) == {"e0", "e1", "e2"}
+        assert abs(result.metrics["e0"]["peak_error"]) < 0.05
+
+    def test_recovers_clark_kge(self):
+        truth = {"cn": 82.0, "lambda": 0.2, "tc": 1.5, "r": 0.8}
+        events = [_event(f"e{i}", truth, model="clark", seed=i) for i in range(2)]
+
+        result = calibrate(
+            events, AREA_HA, "clark", params=["cn", "r"], fixed={"tc": 1.5},
+            objective="kge", seed=2,
+        )
+        assert result.params["cn"] == pytest.approx(82.0, abs=1.0)
+        assert result.params["r"] == pytest.approx(0.8, rel=0.05)
+        assert result.metrics["e0"]["kge"] > 0.99
+
+    def test_invalid_inputs(self):
+        event = _event("e", {"cn": 80, "lambda": 0.2, "tc": 1.0, "x": 1.67})
+        with pytest.raises(ValueError, match="no válidos"):
+            calibrate([event], AREA_HA, "triangular", params=["r"])
+        with pytest.raises(ValueError, match="fijo"):
+            calibrate([event], AREA_HA, "clark", params=["cn"])
+        with pytest.raises(ValueError):
+            calibrate([event], AREA_HA, "hec")
+        with pytest.raises(ValueError):
+            calibrate([], AREA_HA)
+        with pytest.raises(ValueError, match="repetido"):
+            calibrate([event, event], AREA_HA)
+
+    def test_constant_observation_rejected(self):
+        hyeto = custom_hyetograph([5.0, 15.0], [1.0, 2.0])
+        with pytest.raises(ValueError, match="constante"):
+            ObservedEvent("e", hyeto, np.arange(4.0), np.ones(4))
+
+
+def _write_event_csv(path, event):
+    rain = dict(zip(event.hyetograph.time_min, event.hyetograph.depth_mm))
+    flow = dict(zip(np.round(event.time_hr * 60, 6), event.flow_m3s))
+    times = sorted(set(rain) | set(flow))
+    lines = ["time_min,rain_mm,flow_m3s"]
+    for t in times:
+        r = f"{rain[t]:.6f}" if t in rain else ""
+        q = f"{flow[t]:.6f}" if t in flow else ""
+        lines.append(f"{t},{r},{q}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_load_event_csv(tmp_path):
+    event = _event("e", {"cn": 80, "lambda": 0.2, "tc": 1.0, "x": 1.67})
+    path = tmp_path / "evento.csv"
+    _write_event_csv(path, event)
+
+    loaded = load_event_csv(path)
+    assert loaded.name == "evento"
+    np.testing.assert_allclose(loaded.depth_mm, event.depth_mm, atol=1e-6)
+    np.testing.assert_allclose(loaded.flow_m3s, event.flow_m3s, atol=1e-6)
+    assert loaded.dt_hr == pytest.approx(event.dt_hr)
+
+
+def test_cli_calibrate(tmp_path):
+    from hidropluvial.cli.hydrograph import hydrograph_app
+
+    truth = {"cn": 80.0, "lambda": 0.2, "tc": 1.0, "x": 1.67}
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"ev{i}.csv"
+        _write_event_csv(path, _event(f"ev{i}", truth, seed=i))
+        paths.append(str(path))
+    output = tmp_path / "ajuste.csv"
+
+    result = CliRunner().invoke(hydrograph_app, [
+        "calibrate", *paths, "-a", str(AREA_HA), "--fix", "lambda=0.2",
+        "--bound", "tc=0.3,3", "--seed", "1", "-o", str(output),
+    ])
+    assert result.exit_code == 0, result.output
+    assert "NSE" in result.output
+    assert "ev1" in result.output
+    assert output.read_text(encoding="utf-8").startswith("event,time_hr,observed_m3s,simulated_m3s")
+
+    result = CliRunner().invoke(hydrograph_app, ["calibrate", paths[0], "-a", "250", "--fix", "lambda"])
+    assert result.exit_code == 1
+
+
+def test_cli_calibrate_same_file_names(tmp_path):
+    from hidropluvial.cli.hydrograph import hydrograph_app
+
+    truth = {"cn": 80.0, "lambda": 0.2, "tc": 1.0, "x": 1.67}
+    paths = []
+    for i, folder in enumerate(("marzo", "abril")):
+        (tmp_path / folder).mkdir()
+        path = tmp_path / folder / "evento.csv"
+        _write_event_csv(path, _event("evento", truth, seed=i))
+        paths.append(str(path))
+    output = tmp_path / "ajuste.csv"
+
+    result = CliRunner().invoke(hydrograph_app, [
+        "calibrate", *paths, "-a", str(AREA_HA), "--fix", "lambda=0.2",
+        "--maxiter", "20", "--seed", "1", "-o", str(output),
+    ])
+    assert result.exit_code == 0, result.output
+    events = {line.split(",")[0] for line in output.read_text(encoding="utf-8").splitlines()[1:]}
+    assert events == {"marzo/evento", "abril/evento"}
+
+    # El mismo archivo dos veces no se puede distinguir
+    result = CliRunner().invoke(hydrograph_app, ["calibrate", paths[0], paths[0], "-a", str(AREA_HA)])
+    assert result.exit_code == 1
+    assert "repetido" in result.output
@@ -13,6 +13,7 @@ from hidropluvial.reports.charts import (
     hyetograph_result_to_tikz,
     _minutes_to_hour_label,
     _generate_hour_ticks,
+    _format_coordinates,
 )
 from hidropluvial.config import HydrographResult, HyetographResult, HydrographMethod
 
@@ -356,3 +357,39 @@ class TestOutputFormat:
         # Verificar que las coordenadas están en formato correcto
         assert "(5, 1.50)" in result or "(5, 1.5)" in result
         assert "(10, 2.50)" in result or "(10, 2.5)" in result
+
+
+class TestFormatCoordinates:
+    """Tests para _format_coordinates (formateo vectorizado)."""
+
+    def test_matches_per_pair_format(self):
+        """Mismo resultado que formatear cada par con f-strings."""
+        rng = np.random.default_rng(0)
+        t = rng.random(23) * 500
+        v = rng.normal(size=23) * 10
+
+        expected_pairs = [f"({a:.0f}, {b:.3f})" for a, b in zip(t, v)]
+        expected = "\n".join(
+            "\t\t\t\t" + " ".join(expected_pairs[i:i + 5])
+            for i in range(0, len(expected_pairs), 5)
+        )
+        assert _format_coordinates(t, v, precision=3) == expected
+        assert _format_coordinates(t.tolist(), v.tolist(), precision=3) == expected
+
+    def test_time_precision(self):
+        result = _format_coordinates(np.array([1.25, 2.5]), np.array([1.0, 2.0]), precision=1, time_precision=2)
+        assert result == "\t\t\t\t(1.25, 1.0) (2.50, 2.0)"
+
+    def test_empty_and_mismatched(self):
+        assert _format_coordinates([], []) == ""
+        assert _format_coordinates([0, 5, 10], [1.0, 2.0]) == "\t\t\t\t(0, 1.00) (5, 2.00)"
+
+    def test_array_series_in_hydrograph(self):
+        series = [HydrographSeries(
+            time_min=np.array([0.0, 0.5, 1.0]) * 60,
+            flow_m3s=np.array([0.0, 2.0, 1.0]),
+            label="Array",
+        )]
+        result = generate_hydrograph_tikz(series, precision=1)
+        assert "(30, 2.0)" in result
+        assert "xmax=60" in result
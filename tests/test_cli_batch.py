@@ -0,0 +1,158 @@
+"""
+Tests para cli/batch.py - Ejecución batch de estudios.
+"""
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from hidropluvial.cli import app
+from hidropluvial.cli.batch import (
+    load_study,
+    parse_study,
+    run_study,
+)
+from hidropluvial.project import ProjectManager
+
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[1] / "examples"
+
+
+def _study_data(n_basins: int = 2) -> dict:
+    return {
+        "project": "Estudio Test",
+        "defaults": {"p3_10": 83, "dt_min": 10},
+        "tc_methods": ["kirpich"],
+        "analyses": [
+            {"storm": "gz", "tr": [2, 10], "x": [1.0, 1.25]},
+            {"storm": "blocks", "tr": 10},
+        ],
+        "basins": [
+            {"nombre": f"Sub {i}", "area_ha": 20.0 + i, "slope_pct": 2.0, "c": 0.5, "length_m": 500}
+            for i in range(n_basins)
+        ],
+    }
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Gestor de proyectos en directorio temporal (también para los workers)."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return ProjectManager(data_dir=tmp_path / "data")
+
+
+class TestParseStudy:
+    """Tests para la lectura de estudios."""
+
+    def test_multi_basin_defaults(self):
+        study = parse_study(_study_data())
+
+        assert study.name == "Estudio Test"
+        assert [b.name for b in study.basins] == ["Sub 0", "Sub 1"]
+        assert study.basins[0].params["p3_10"] == 83
+        assert study.basins[0].params["dt_min"] == 10
+        # gz: 2 Tr x 2 X + blocks: 1 Tr
+        assert study.basins[0].n_combinations() == 5
+
+    def test_basin_overrides(self):
+        data = _study_data()
+        data["basins"][1]["p3_10"] = 70
+        data["basins"][1]["analyses"] = [{"storm": "blocks24", "tr": [25]}]
+
+        study = parse_study(data)
+        assert study.basins[1].params["p3_10"] == 70
+        assert [a.storm for a in study.basins[1].analyses] == ["blocks24"]
+
+    def test_example_files(self):
+        single = load_study(EXAMPLES_DIR / "cuenca_ejemplo.yaml")
+        assert single.name == "Cuenca Las Piedras"
+        assert len(single.basins) == 1
+        assert single.basins[0].tc_methods == ["kirpich", "desbordes"]
+
+        multi = load_study(EXAMPLES_DIR / "estudio_batch.yaml")
+        assert len(multi.basins) == 3
+
+    @pytest.mark.parametrize("mutate, message", [
+        (lambda d: d.pop("basins"), "cuencas"),
+        (lambda d: d["basins"][0].pop("area_ha"), "area_ha"),
+        (lambda d: d["analyses"][0].pop("tr"), "tr"),
+        (lambda d: d.pop("tc_methods"), "Tc"),
+    ])
+    def test_invalid(self, mutate, message):
+        data = _study_data()
+        mutate(data)
+        with pytest.raises(ValueError, match=message):
+            parse_study(data)
+
+
+class TestRunStudy:
+    """Tests para run_study."""
+
+    def test_sequential(self, manager):
+        done = []
+        result = run_study(
+            parse_study(_study_data()), manager, workers=1,
+            on_basin_done=lambda sb, basin, error: done.append((sb.name, error)),
+        )
+
+        assert not result.errors
+        assert sorted(done) == [("Sub 0", None), ("Sub 1", None)]
+        # Solo racional (c): 5 combinaciones por cuenca
+        assert [len(b.analyses) for b in result.basins] == [5, 5]
+
+        stored = manager.load_project(result.project.id)
+        assert [b.name for b in stored.basins] == ["Sub 0", "Sub 1"]
+
+    def test_process_pool_matches_sequential(self, manager):
+        study = parse_study(_study_data(3))
+        seq = run_study(study, manager, workers=1)
+        par = run_study(study, manager, workers=2)
+
+        for a, b in zip(seq.basins, par.basins):
+            assert [x.hydrograph.peak_flow_m3s for x in a.analyses] == \
+                [x.hydrograph.peak_flow_m3s for x in b.analyses]
+
+    def test_rerun_replaces_basins(self, manager):
+        study = parse_study(_study_data())
+        first = run_study(study, manager, workers=1)
+        ids = [b.id for b in first.basins]
+
+        second = run_study(study, manager, workers=1)
+        assert second.project.id == first.project.id
+
+        stored = manager.load_project(first.project.id)
+        assert [b.id for b in stored.basins] == ids
+        assert stored.total_analyses == 10
+
+    def test_basin_error_reported(self, manager):
+        data = _study_data()
+        data["basins"][1]["analyses"] = [{"storm": "huff_qx", "tr": [10]}]
+
+        result = run_study(parse_study(data), manager, workers=1)
+        assert list(result.errors) == ["Sub 1"]
+        assert [b.name for b in result.basins] == ["Sub 0"]
+
+
+class TestBatchCommand:
+    """Tests para el comando batch run."""
+
+    def test_run_from_file(self, tmp_path, monkeypatch):
+        import yaml
+        from hidropluvial import project as project_module
+
+        monkeypatch.setattr(project_module, "_project_manager", ProjectManager(data_dir=tmp_path / "data"))
+        study_file = tmp_path / "estudio.yaml"
+        study_file.write_text(yaml.safe_dump(_study_data()), encoding="utf-8")
+
+        result = CliRunner().invoke(app, ["batch", "run", str(study_file), "--workers", "1"])
+
+        assert result.exit_code == 0, result.output
+        assert "2/2 cuencas, 10 análisis" in result.output
+
+    def test_invalid_file(self, tmp_path):
+        study_file = tmp_path / "estudio.json"
+        study_file.write_text('{"project": "X"}', encoding="utf-8")
+
+        result = CliRunner().invoke(app, ["batch", "run", str(study_file)])
+        assert result.exit_code == 1
@@ -565,3 +565,141 @@ class TestHydrographAppCLI:
         assert "--area" in result.output
         assert "--c" in result.output
         assert "Factor X" in result.output
+
+
+class TestVectorizedInputs:
+    """Tests para entradas vectorizadas (listas, rangos y CSV)."""
+
+    def test_parse_values(self):
+        from hidropluvial.cli.hydrograph import parse_values
+
+        assert parse_values(2.5) == [2.5]
+        assert parse_values("1,2,5") == [1.0, 2.0, 5.0]
+        assert parse_values("1:2:0.25") == [1.0, 1.25, 1.5, 1.75, 2.0]
+        assert parse_values("70:90:10", int) == [70, 80, 90]
+        assert parse_values("2,10:12:1", int) == [2, 10, 11, 12]
+        assert parse_values(None) == []
+        with pytest.raises(ValueError):
+            parse_values("5:1:1")
+
+    @pytest.mark.parametrize("value,token", [("2,2.5", "'2.5'"), ("70:75:2.5", "'70:75:2.5'"), (72.5, "'72.5'")])
+    def test_parse_values_rejects_non_integer(self, value, token):
+        from hidropluvial.cli.hydrograph import parse_values
+
+        assert parse_values("2.0,1e1", int) == [2, 10]
+        with pytest.raises(typer.BadParameter, match=token):
+            parse_values(value, int)
+
+    def test_non_integer_csv_value(self, tmp_path):
+        basins = tmp_path / "cuencas.csv"
+        basins.write_text("name,area,cn,tr\nA,1,80,2.5\n")
+        result = runner.invoke(hydrograph_app, ["scs", "--csv", str(basins), "-p", "83", "--tc", "1"])
+        assert result.exit_code == 2
+        assert "'tr'" in result.output
+        assert "'2.5'" in result.output
+
+    def test_tc_sweep(self):
+        import json
+        from hidropluvial.cli.hydrograph import compute_gz, compute_scs
+
+        # Con --tc no hacen falta longitud ni pendiente
+        result = runner.invoke(
+            hydrograph_app,
+            ["scs", "-a", "1", "-p", "83", "--cn", "80", "--tc", "0.5:1:0.25", "--format", "jsonl"],
+        )
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [r["tc"] for r in records] == [0.5, 0.75, 1.0]
+        for record in records:
+            single = compute_scs(1, None, None, 83, 80, tc_hr=record["tc"])
+            assert record["tc_hr"] == record["tc"]
+            assert record["peak_flow_m3s"] == pytest.approx(single.peak_flow_m3s)
+
+        result = runner.invoke(
+            hydrograph_app, ["gz", "-a", "50", "--c", "0.6", "-p", "83", "--tc", "0.4,0.8", "--format", "jsonl"],
+        )
+        assert result.exit_code == 0, result.output
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert records[0]["peak_flow_m3s"] == pytest.approx(compute_gz(50, None, 0.6, 83, tc_hr=0.4).peak_flow_m3s)
+        assert records[1]["peak_flow_m3s"] < records[0]["peak_flow_m3s"]
+
+    def test_expand_rows_csv_has_priority(self):
+        from hidropluvial.cli.hydrograph import expand_rows
+
+        rows = expand_rows(
+            {"area": [1.0, 2.0], "tr": [2, 10]},
+            [{"name": "A", "area": 5.0}, {"name": "B"}],
+        )
+        assert rows == [
+            {"name": "A", "area": 5.0, "tr": 2},
+            {"name": "A", "area": 5.0, "tr": 10},
+            {"name": "B", "area": 1.0, "tr": 2},
+            {"name": "B", "area": 1.0, "tr": 10},
+            {"name": "B", "area": 2.0, "tr": 2},
+            {"name": "B", "area": 2.0, "tr": 10},
+        ]
+
+    def test_scs_jsonl_matches_single_runs(self):
+        import json
+        from hidropluvial.cli.hydrograph import compute_scs
+
+        result = runner.invoke(
+            hydrograph_app,
+            ["scs", "-a", "1,2", "-l", "1000", "-s", "0.02", "-p", "83",
+             "--cn", "75,85", "--tr", "10", "--format", "jsonl"],
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert len(records) == 4
+
+        for record in records:
+            single = compute_scs(record["area"], 1000, 0.02, 83, record["cn"], tr=10)
+            assert record["peak_flow_m3s"] == pytest.approx(single.peak_flow_m3s)
+            assert record["volume_m3"] == pytest.approx(single.volume_m3)
+
+    def test_gz_table_and_csv_output(self, tmp_path):
+        output = tmp_path / "res.csv"
+        result = runner.invoke(
+            hydrograph_app,
+            ["gz", "-a", "10:30:10", "-s", "2", "--c", "0.5", "-p", "83",
+             "--tr", "2,10", "-o", str(output)],
+        )
+        assert result.exit_code == 0
+        assert "6 filas" in result.output
+
+        lines = output.read_text().splitlines()
+        assert lines[0].startswith("area_ha,slope_pct,c,p3_10,tr,x,")
+        assert len(lines) == 7
+
+    def test_gz_csv_basins(self, tmp_path):
+        import json
+
+        basins = tmp_path / "cuencas.csv"
+        basins.write_text("nombre,area_ha,slope_pct,c\nNorte,50,2.0,0.6\nSur,120,1.2,0.45\n")
+        result = runner.invoke(
+            hydrograph_app,
+            ["gz", "--csv", str(basins), "-p", "83", "--x", "1,1.25", "--format", "jsonl"],
+        )
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.output.splitlines()]
+        assert [(r["name"], r["x"]) for r in records] == [
+            ("Norte", 1.0), ("Norte", 1.25), ("Sur", 1.0), ("Sur", 1.25),
+        ]
+        # Mayor X -> hidrograma más tendido, menor pico
+        assert records[1]["peak_flow_m3s"] < records[0]["peak_flow_m3s"]
+
+    def test_missing_required_value(self, tmp_path):
+        basins = tmp_path / "cuencas.csv"
+        basins.write_text("name,area_ha\nA,50\n")
+        result = runner.invoke(hydrograph_app, ["gz", "--csv", str(basins), "-p", "83"])
+        assert result.exit_code == 1
+        assert "--slope" in result.output
+        assert "slope_pct" in result.output
+
+    def test_invalid_row_value(self):
+        result = runner.invoke(
+            hydrograph_app,
+            ["scs", "-a", "1", "-l", "1000", "-s", "0.02", "-p", "83", "--cn", "80,120"],
+        )
+        assert result.exit_code == 1
+        assert "Fila 2" in result.output
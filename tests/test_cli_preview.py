@@ -0,0 +1,121 @@
+"""
+Tests para cli/preview.py - Pipeline de vistas previas en terminal.
+"""
+
+import numpy as np
+import pytest
+
+from hidropluvial.cli import preview
+from hidropluvial.cli.preview import (
+    SPARK_CHARS,
+    analysis_hydrograph_points,
+    analysis_sparkline,
+    bin_peak,
+    downsample_series,
+    sparkline,
+)
+from hidropluvial.models import AnalysisRun, HydrographResult, StormResult, TcResult
+
+
+def _make_analysis(flow: list[float]) -> AnalysisRun:
+    """Crea un análisis con el hidrograma indicado."""
+    n = len(flow)
+    tc = TcResult(method="kirpich", tc_hr=0.5, tc_min=30.0)
+    storm = StormResult(
+        type="gz", return_period=10, duration_hr=2.0, total_depth_mm=80.0,
+        peak_intensity_mmhr=60.0, n_intervals=2,
+        time_min=[0.0, 5.0], intensity_mmhr=[60.0, 20.0],
+    )
+    hydrograph = HydrographResult(
+        tc_method="kirpich", tc_min=30.0, storm_type="gz", return_period=10,
+        peak_flow_m3s=max(flow), time_to_peak_hr=0.5, time_to_peak_min=30.0,
+        volume_m3=1000.0, total_depth_mm=80.0, runoff_mm=30.0,
+        time_hr=[0.1 * i for i in range(n)], flow_m3s=flow,
+    )
+    return AnalysisRun(tc=tc, storm=storm, hydrograph=hydrograph)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    preview.clear_preview_cache()
+    yield
+    preview.clear_preview_cache()
+
+
+class TestBinPeak:
+    """Tests para bin_peak."""
+
+    def test_short_series_unchanged(self):
+        assert bin_peak([1.0, 2.0, 3.0], 5).tolist() == [1.0, 2.0, 3.0]
+
+    def test_bins_keep_peak(self):
+        values = np.zeros(1000)
+        values[517] = 7.5
+        binned = bin_peak(values, 40)
+
+        assert len(binned) == 40
+        assert binned.max() == 7.5
+        assert binned[517 * 40 // 1000] == 7.5
+
+
+class TestSparkline:
+    """Tests para sparkline."""
+
+    def test_levels(self):
+        assert sparkline([0, 1, 2, 3, 4, 5, 6, 7, 8], width=20) == SPARK_CHARS
+        assert sparkline([]) == ""
+        assert sparkline([3.0, 3.0]) == SPARK_CHARS[4] * 2
+
+    def test_narrow_spike_is_visible(self):
+        values = [0.0] * 997 + [10.0] + [0.0] * 2
+        spark = sparkline(values, width=20)
+
+        assert len(spark) == 20
+        assert spark[-1] == SPARK_CHARS[-1]
+
+    def test_analysis_sparkline_cached(self):
+        analysis = _make_analysis([0.0, 1.0, 4.0, 1.0])
+        first = analysis_sparkline(analysis, 10)
+
+        analysis.hydrograph.flow_m3s[1] = 4.0  # sin cambiar el largo: sigue en caché
+        assert analysis_sparkline(analysis, 10) is first
+        assert analysis_sparkline(analysis, 3) != first
+
+        empty = _make_analysis([1.0])
+        empty.hydrograph.flow_m3s = []
+        assert analysis_sparkline(empty, 10) == "-"
+
+
+class TestDownsampleSeries:
+    """Tests para la decimación min-max."""
+
+    def _reference(self, x, y, max_points):
+        """Implementación con bucles, para comparar."""
+        n = len(y)
+        n_buckets = max_points // 2
+        keep = {0, n - 1}
+        for b in range(n_buckets):
+            a, e = b * n // n_buckets, (b + 1) * n // n_buckets
+            keep.add(a + int(np.argmin(y[a:e])))
+            keep.add(a + int(np.argmax(y[a:e])))
+        keep = sorted(keep)
+        return [x[i] for i in keep], [y[i] for i in keep]
+
+    @pytest.mark.parametrize("n, max_points", [(1000, 150), (997, 64), (301, 300)])
+    def test_matches_reference(self, n, max_points):
+        rng = np.random.default_rng(n)
+        x = np.arange(n) * 0.1
+        y = rng.random(n)
+
+        got = downsample_series(x, y, max_points)
+        expected = self._reference(x.tolist(), y, max_points)
+        assert got[0] == expected[0]
+        assert got[1] == expected[1]
+
+    def test_analysis_points_cached(self):
+        analysis = _make_analysis(list(np.sin(np.linspace(0, 3, 2000)) ** 2))
+        t, q = analysis_hydrograph_points(analysis, 60)
+
+        assert len(t) <= 2 * 60 + 2
+        assert max(q) == max(analysis.hydrograph.flow_m3s)
+        assert analysis_hydrograph_points(analysis, 60)[0] is t
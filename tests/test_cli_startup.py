@@ -0,0 +1,103 @@
+"""
+Tests de arranque del CLI: carga diferida de sub-aplicaciones y
+presupuesto de tiempo de importación.
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+import hidropluvial
+from hidropluvial.cli import SUBCOMMANDS, app
+
+
+# Módulos pesados que no deben importarse al arrancar el CLI
+HEAVY_MODULES = ["numpy", "pandas", "scipy", "rich", "questionary", "plotext", "openpyxl", "pydantic"]
+
+# Presupuesto de importación de hidropluvial.cli (incluye typer)
+IMPORT_BUDGET_S = 0.5
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    """Ejecuta código en un intérprete nuevo (sin módulos ya importados)."""
+    src_dir = str(Path(hidropluvial.__file__).resolve().parents[1])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+class TestLazyLoading:
+    """Tests para el grupo de carga diferida."""
+
+    def test_import_does_not_load_heavy_modules(self):
+        code = (
+            "import sys, hidropluvial.cli\n"
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        )
+        assert _run_python(code).stdout.strip() == "[]"
+
+    def test_help_does_not_load_subapps(self):
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from hidropluvial.cli import app\n"
+            "r = CliRunner().invoke(app, ['--help'])\n"
+            "assert r.exit_code == 0, r.output\n"
+            "print([m for m in sys.modules if m.startswith('hidropluvial.cli.') "
+            "and m not in ('hidropluvial.cli.lazy',)])"
+        )
+        assert _run_python(code).stdout.strip() == "[]"
+
+    def test_help_lists_all_subcommands(self):
+        result = CliRunner().invoke(app, ["--help"])
+        assert result.exit_code == 0
+        for name, spec in SUBCOMMANDS.items():
+            assert name in result.output
+            assert spec.help in result.output
+
+    @pytest.mark.parametrize("name", list(SUBCOMMANDS))
+    def test_registered_help_matches_subapp(self, name):
+        import importlib
+        import typer
+
+        spec = SUBCOMMANDS[name]
+        sub_app = getattr(importlib.import_module(spec.module), spec.attr)
+        assert typer.main.get_group(sub_app).help == spec.help
+
+    def test_subcommand_invocation(self):
+        result = CliRunner().invoke(app, ["idf", "uruguay", "78", "2", "--tr", "10"])
+        assert result.exit_code == 0
+        assert "INTENSIDAD" in result.output
+
+    def test_typo_suggestion(self):
+        result = CliRunner().invoke(app, ["hydrogaph"])
+        assert result.exit_code != 0
+        assert "hydrograph" in result.output
+
+    def test_module_getattr(self):
+        from hidropluvial.cli import idf_app
+        from hidropluvial.cli.idf import idf_app as direct
+
+        assert idf_app is direct
+
+
+class TestImportBudget:
+    """Presupuesto de tiempo de importación del CLI."""
+
+    def test_cli_import_time(self):
+        stderr = _run_python("import hidropluvial.cli", "-X", "importtime").stderr
+        match = re.search(r"\|\s*(\d+)\s*\|\s*hidropluvial\.cli$", stderr, re.MULTILINE)
+        assert match, stderr[-500:]
+        cumulative_s = int(match.group(1)) / 1e6
+        assert cumulative_s < IMPORT_BUDGET_S
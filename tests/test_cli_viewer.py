@@ -0,0 +1,327 @@
+"""
+Tests para el visor interactivo (cli/viewer).
+"""
+
+import io
+import threading
+
+import numpy as np
+import pytest
+from rich.console import Console
+
+from hidropluvial.cli.preview import downsample_bars, downsample_series
+from hidropluvial.cli.viewer import main as viewer_main
+from hidropluvial.cli.viewer import table_viewer
+from hidropluvial.cli.viewer.filters import (
+    FacetIndex,
+    build_filter_summary_table,
+    filter_analyses,
+    get_unique_values,
+)
+from hidropluvial.cli.viewer.frames import FrameCache
+from hidropluvial.cli.viewer.table_viewer import (
+    TableModel,
+    build_interactive_table,
+    visible_window,
+)
+from hidropluvial.models import AnalysisRun, HydrographResult, StormResult, TcResult
+
+
+def _make_analysis(
+    tr: int, x: float = None, method: str = "kirpich", storm_type: str = "gz"
+) -> AnalysisRun:
+    """Crea un análisis con series cortas."""
+    tc = TcResult(method=method, tc_hr=0.5, tc_min=30.0, parameters={"c": 0.55})
+    storm = StormResult(
+        type=storm_type,
+        return_period=tr,
+        duration_hr=2.0,
+        total_depth_mm=80.0,
+        peak_intensity_mmhr=60.0,
+        n_intervals=3,
+        time_min=[0.0, 5.0, 10.0],
+        intensity_mmhr=[10.0, 60.0, 20.0],
+    )
+    hydrograph = HydrographResult(
+        tc_method="kirpich",
+        tc_min=30.0,
+        storm_type="gz",
+        return_period=tr,
+        x_factor=x,
+        peak_flow_m3s=1.5 * tr,
+        time_to_peak_hr=0.75,
+        time_to_peak_min=45.0,
+        volume_m3=12000.0,
+        total_depth_mm=80.0,
+        runoff_mm=30.0,
+        time_hr=[0.0, 0.5, 1.0],
+        flow_m3s=[0.0, 1.5 * tr, 0.0],
+    )
+    return AnalysisRun(tc=tc, storm=storm, hydrograph=hydrograph)
+
+
+class TestDownsample:
+    """Tests para la reducción de series al ancho del gráfico."""
+
+    def test_short_series_unchanged(self):
+        x, y = downsample_series([0, 1, 2], [1.0, 3.0, 2.0], 100)
+        assert x == [0, 1, 2]
+        assert y == [1.0, 3.0, 2.0]
+
+    def test_keeps_peak_and_ends(self):
+        t = np.linspace(0, 10, 5000)
+        q = np.exp(-((t - 3.7) ** 2))
+        x, y = downsample_series(t, q, 150)
+
+        assert len(x) <= 150 + 2
+        assert max(y) == q.max()
+        assert x[0] == t[0] and x[-1] == t[-1]
+        assert x == sorted(x)
+
+    def test_bars_keep_peak(self):
+        t = np.arange(300) * 5.0
+        i = np.ones(300)
+        i[123] = 95.0
+        x, y = downsample_bars(t, i, 70)
+
+        assert len(x) <= 70
+        assert max(y) == 95.0
+        assert x == sorted(x)
+
+
+def _facet_analyses() -> list:
+    """Matriz completa: 2 métodos x 2 tormentas x 3 Tr x (sin X, X=1.25)."""
+    return [
+        _make_analysis(tr, x=x, method=method, storm_type=storm)
+        for method in ("kirpich", "temez")
+        for storm in ("gz", "blocks")
+        for tr in (2, 10, 25)
+        for x in (None, 1.25)
+    ]
+
+
+class TestFacetIndex:
+    """Tests para el índice de facetas."""
+
+    def test_values_and_counts(self):
+        index = FacetIndex(_facet_analyses())
+
+        assert index.values("tc_method") == ["kirpich", "temez"]
+        assert index.values("return_period") == [10, 2, 25]
+        assert index.values("x_factor") == [1.25]
+        assert index.counts("storm_type") == {"gz": 12, "blocks": 12}
+        assert index.counts("x_factor") == {None: 12, 1.25: 12}
+
+    def test_select_matches_list_filter(self):
+        analyses = _facet_analyses()
+        filters = {"tc_method": ["temez"], "return_period": [2, 25], "x_factor": [1.25]}
+
+        view = FacetIndex(analyses).select(filters)
+        expected = [
+            a for a in analyses
+            if a.tc.method == "temez"
+            and a.storm.return_period in (2, 25)
+            and a.hydrograph.x_factor == 1.25
+        ]
+
+        assert len(view) == 4
+        assert list(view) == expected
+        assert view[0] is expected[0]
+        assert view[-1] is expected[-1]
+
+    def test_empty_filters_select_all(self):
+        analyses = _facet_analyses()
+        index = FacetIndex(analyses)
+
+        assert len(index.select({})) == len(analyses)
+        assert len(index.select({"storm_type": []})) == len(analyses)
+        assert len(index.select({"storm_type": ["huff"]})) == 0
+
+    def test_compat_functions(self):
+        analyses = _facet_analyses()
+
+        assert get_unique_values(analyses, "storm_type") == ["blocks", "gz"]
+        assert filter_analyses(analyses, {}) is analyses
+        filtered = filter_analyses(analyses, {"storm_type": ["gz"]})
+        assert all(a.storm.type == "gz" for a in filtered)
+
+    def test_summary_table_counts(self):
+        table = build_filter_summary_table(_facet_analyses(), {"tc_method": ["kirpich"]})
+        tc_cells = [c.plain for c in table.columns[0]._cells]
+        assert tc_cells == ["Kirpich (12)", "Temez (12)", ""]
+
+
+class TestFrameCache:
+    """Tests para el caché de fichas."""
+
+    def test_lru_eviction(self):
+        calls = []
+        cache = FrameCache(lambda a: calls.append(a.id) or a.id, maxsize=2)
+        a, b, c = (_make_analysis(tr) for tr in (2, 10, 25))
+
+        cache.get(a)
+        cache.get(b)
+        cache.get(a)  # a pasa a ser el más reciente
+        cache.get(c)
+
+        assert a.id in cache and c.id in cache
+        assert b.id not in cache
+        assert calls == [a.id, b.id, c.id]
+
+    def test_prefetch_neighbours(self):
+        analyses = [_make_analysis(tr) for tr in range(1, 8)]
+        calls = []
+        cache = FrameCache(lambda a: calls.append(a.id) or a.id)
+
+        cache.prefetch(analyses, 0, radius=2)
+        # Circular: 1, 6, 2, 5 (los más cercanos primero)
+        neighbours = [analyses[i] for i in (1, 6, 2, 5)]
+        for a in neighbours:
+            cache.get(a)
+        cache.close()
+
+        assert calls == [a.id for a in neighbours]
+
+    def test_get_waits_for_pending_render(self):
+        analysis = _make_analysis(2)
+        release = threading.Event()
+        calls = []
+
+        def render(a):
+            release.wait(5)
+            calls.append(a.id)
+            return "frame"
+
+        cache = FrameCache(render)
+        cache.prefetch([_make_analysis(1), analysis], 0, radius=1)
+        release.set()
+
+        assert cache.get(analysis).plain == "frame"
+        cache.close()
+        assert calls == [analysis.id]
+
+    def test_failed_prefetch_falls_back(self):
+        analysis = _make_analysis(2)
+        release = threading.Event()
+        calls = []
+
+        def render(a):
+            calls.append(a.id)
+            if len(calls) == 1:
+                release.wait(5)
+                raise RuntimeError("plotext")
+            return "frame"
+
+        cache = FrameCache(render)
+        cache.prefetch([_make_analysis(1), analysis], 0, radius=1)
+        future = cache._pending[analysis.id]
+        release.set()
+        assert isinstance(future.exception(5), RuntimeError)
+
+        # El futuro fallido no queda pendiente y se renderiza de nuevo
+        assert analysis.id not in cache._pending
+        assert cache.get(analysis).plain == "frame"
+        assert cache.get(analysis).plain == "frame"
+        cache.close()
+        assert calls == [analysis.id, analysis.id]
+
+    def test_invalidate(self):
+        analysis = _make_analysis(2)
+        cache = FrameCache(lambda a: "x")
+        cache.get(analysis)
+        cache.invalidate(analysis.id)
+        assert len(cache) == 0
+
+
+class TestInteractiveViewer:
+    """Tests para el bucle del visor con teclas simuladas."""
+
+    @pytest.fixture
+    def run_viewer(self, monkeypatch):
+        rendered = []
+
+        def render(analysis, **kwargs):
+            rendered.append(analysis.id)
+            return f"GRAFICO {analysis.id}"
+
+        output = io.StringIO()
+        monkeypatch.setattr(viewer_main, "render_combined", render)
+        monkeypatch.setattr(
+            viewer_main, "Console", lambda: Console(file=output, width=100, force_terminal=False)
+        )
+
+        def _run(analyses, keys, **kwargs):
+            key_iter = iter(keys)
+            monkeypatch.setattr(viewer_main, "get_key", lambda: next(key_iter))
+            result = viewer_main.interactive_hydrograph_viewer(analyses, "Cuenca", **kwargs)
+            return result, rendered, output.getvalue()
+
+        return _run
+
+    def test_navigation_renders_each_frame_once(self, run_viewer):
+        analyses = [_make_analysis(tr) for tr in (2, 10, 25)]
+        _, rendered, output = run_viewer(analyses, ["right", "right", "right", "left", "q"])
+
+        assert sorted(rendered) == sorted(a.id for a in analyses)
+        assert "Visor cerrado. Cuenca: Cuenca" in output
+
+    def test_delete_all(self, run_viewer):
+        analyses = [_make_analysis(2)]
+        result, _, output = run_viewer(analyses, ["d"], on_delete=lambda aid: True)
+
+        assert result == []
+        assert "Todos los análisis han sido eliminados" in output
+
+
+class TestTableViewer:
+    """Tests para la tabla resumen virtualizada."""
+
+    def test_visible_window_scrolls_only_when_needed(self):
+        assert visible_window(100, 0, 10) == (0, 10)
+        assert visible_window(100, 5, 10, start=0) == (0, 10)
+        assert visible_window(100, 12, 10, start=0) == (3, 13)
+        assert visible_window(100, 2, 10, start=3) == (2, 12)
+        assert visible_window(100, 99, 10, start=0) == (90, 100)
+        assert visible_window(5, 4, 10) == (0, 5)
+
+    def test_model_caches_stats_and_orders(self):
+        analyses = [_make_analysis(tr) for tr in (10, 2, 25, 10)]
+        model = TableModel(analyses)
+
+        assert model.max_qp == 1.5 * 25
+        assert model.order("qp").tolist() == [2, 0, 3, 1]
+        assert model.order("tr").tolist() == [1, 0, 3, 2]
+        assert model.order("qp") is model.order("qp")
+        assert [a.storm.return_period for a in model.rows("tr")] == [2, 10, 10, 25]
+
+        model.remove(analyses[2].id)
+        assert model.max_qp == 1.5 * 10
+        assert model.order("qp").tolist() == [0, 2, 1]
+
+    def test_table_builds_only_window(self):
+        analyses = [_make_analysis(tr) for tr in range(1, 201)]
+        model = TableModel(analyses)
+
+        table = build_interactive_table(analyses, 50, window=(45, 60), model=model)
+        assert table.row_count == 15
+        assert table.columns[0]._cells[5].plain == ">50"
+
+    def test_viewer_sort_keeps_selection(self, monkeypatch):
+        analyses = [_make_analysis(tr) for tr in (10, 2, 25)]
+        viewed = []
+        keys = iter(["down", "s", "enter", "end", "enter", "q"])
+
+        monkeypatch.setattr(table_viewer, "get_key", lambda: next(keys))
+        monkeypatch.setattr(
+            table_viewer, "Console",
+            lambda: Console(file=io.StringIO(), width=120, height=30, force_terminal=False),
+        )
+
+        result = table_viewer.interactive_table_viewer(
+            analyses, "Cuenca", on_view_detail=viewed.append
+        )
+
+        # Tr=2 (posición 1) sigue seleccionado tras ordenar por Qp; al final
+        # del orden por Qp queda el mismo Tr=2
+        assert viewed == [1, 1]
+        assert result == analyses
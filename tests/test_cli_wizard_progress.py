@@ -0,0 +1,191 @@
+"""
+Tests para progreso, cancelación y reanudación de los runners del wizard.
+"""
+
+import pytest
+
+import hidropluvial.project as project_module
+from hidropluvial.cli.wizard.config import WizardConfig
+from hidropluvial.cli.wizard.progress import CancelToken, ProgressTracker
+from hidropluvial.cli.wizard.runner import (
+    AdditionalAnalysisRunner,
+    AnalysisRunner,
+    run_basin_analyses,
+)
+from hidropluvial.project import ProjectManager
+
+
+def _config() -> WizardConfig:
+    return WizardConfig(
+        nombre="Cuenca Test",
+        area_ha=35.0,
+        slope_pct=2.5,
+        p3_10=83.0,
+        c=0.55,
+        length_m=800.0,
+        tc_methods=["kirpich", "temez"],
+        storm_codes=["gz", "blocks"],
+        return_periods=[2, 10],
+        x_factors=[1.0, 1.25],
+    )
+
+
+def _summary(basin) -> list[tuple]:
+    return [
+        (a.tc.method, a.storm.type, a.storm.return_period,
+         a.hydrograph.x_factor, a.hydrograph.peak_flow_m3s)
+        for a in basin.analyses
+    ]
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    manager = ProjectManager(data_dir=tmp_path)
+    monkeypatch.setattr(project_module, "_project_manager", manager)
+    return manager
+
+
+class TestProgressTracker:
+    """Tests para el contador de progreso."""
+
+    def test_events_and_eta(self):
+        events = []
+        tracker = ProgressTracker(4, events.append)
+
+        with tracker.stage("analisis"):
+            for i in range(2):
+                with tracker.step(f"a{i}"):
+                    pass
+
+        assert [e.done for e in events] == [0, 1, 2]
+        assert events[0].eta_s is None
+        assert events[-1].eta_s is not None and events[-1].eta_s >= 0
+        assert events[-1].label == "a1"
+        assert events[-1].fraction == 0.5
+        assert "analisis" in tracker.stage_times
+
+    def test_resumed_count(self):
+        tracker = ProgressTracker(0)
+        tracker.set_total(10, done=6)
+        assert tracker.done == 6
+        assert tracker.eta_s() is None
+
+    def test_cancel_token(self):
+        token = CancelToken()
+        tracker = ProgressTracker(1, cancel=token)
+        assert not tracker.cancelled
+        token.cancel()
+        assert tracker.cancelled
+
+
+class TestAnalysisRunnerCancel:
+    """Tests para cancelar y reanudar AnalysisRunner."""
+
+    def _cancel_after(self, n: int):
+        token = CancelToken()
+
+        def on_progress(event):
+            if event.done >= n:
+                token.cancel()
+
+        return token, on_progress
+
+    def test_cancel_keeps_completed(self, manager):
+        token, on_progress = self._cancel_after(3)
+        runner = AnalysisRunner(_config(), on_progress=on_progress, cancel=token)
+        project, basin = runner.run()
+
+        assert runner.cancelled
+        assert len(basin.analyses) == 3
+        saved = manager.get_project(project.id).get_basin(basin.id)
+        assert len(saved.analyses) == 3
+
+    def test_keyboard_interrupt_is_cancel(self, manager, monkeypatch):
+        original = AnalysisRunner._run_single_analysis
+        calls = []
+
+        def interrupted(self, *args):
+            calls.append(args)
+            if len(calls) == 5:
+                raise KeyboardInterrupt
+            original(self, *args)
+
+        monkeypatch.setattr(AnalysisRunner, "_run_single_analysis", interrupted)
+        runner = AnalysisRunner(_config(), on_progress=lambda e: None)
+        _, basin = runner.run()
+
+        assert runner.cancelled
+        assert len(basin.analyses) == 4
+
+    def test_resume_completes_run(self, manager):
+        config = _config()
+        token, on_progress = self._cancel_after(5)
+        first = AnalysisRunner(config, on_progress=on_progress, cancel=token)
+        project, basin = first.run()
+
+        events = []
+        second = AnalysisRunner(
+            config, project_id=project.id, on_progress=events.append, resume_basin_id=basin.id
+        )
+        project, resumed = second.run()
+
+        matrix = [(s, config.return_periods, config.x_factors) for s in config.storm_codes]
+        expected = run_basin_analyses(config, matrix)
+
+        assert not second.cancelled
+        assert resumed.id == basin.id
+        assert sorted(_summary(resumed)) == sorted(_summary(expected))
+        # La reanudación arranca con los 5 ya guardados
+        assert events[0].done == 5
+        assert events[-1].done == events[-1].total == 12
+        assert len(manager.get_project(project.id).basins) == 1
+
+    def test_resume_unknown_basin(self, manager):
+        project = manager.create_project("P")
+        runner = AnalysisRunner(
+            _config(), project_id=project.id, on_progress=lambda e: None, resume_basin_id="nope"
+        )
+        with pytest.raises(ValueError):
+            runner.run()
+
+
+class TestAdditionalRunnerProgress:
+    """Tests para progreso y reanudación de AdditionalAnalysisRunner."""
+
+    def test_progress_and_skip_existing(self):
+        config = _config()
+        basin = run_basin_analyses(config, [("gz", [2], [1.0])])
+        runner = AdditionalAnalysisRunner(basin, c=config.c)
+
+        events = []
+        added = runner.run(
+            ["kirpich", "temez"], "gz", [2, 10], [1.0, 1.25],
+            on_progress=events.append, skip_existing=True,
+        )
+
+        # 2 Tc x 2 Tr x 2 X = 8, de los cuales 2 (Tr=2, X=1.0) ya existían
+        assert added == 6
+        assert events[0].done == 2
+        assert events[-1].done == events[-1].total == 8
+
+    def test_every_x_for_every_storm(self):
+        config = _config()
+        basin = run_basin_analyses(config, [("gz", [2], [1.0])])
+
+        # Como en la versión original: un análisis por X también fuera de GZ
+        added = AdditionalAnalysisRunner(basin, c=config.c).run(
+            ["kirpich"], "blocks", [10], [1.0, 1.25], on_progress=lambda e: None,
+        )
+        assert added == 2
+
+    def test_cancel(self):
+        config = _config()
+        basin = run_basin_analyses(config, [("gz", [2], [1.0])])
+        token = CancelToken()
+        token.cancel()
+
+        added = AdditionalAnalysisRunner(basin, c=config.c).run(
+            ["kirpich"], "blocks", [10, 25], [1.0], on_progress=lambda e: None, cancel=token,
+        )
+        assert added == 0
+        assert len(basin.analyses) == 2
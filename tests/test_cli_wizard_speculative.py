@@ -0,0 +1,150 @@
+"""
+Tests para cli/wizard/speculative.py - Cálculo anticipado del wizard.
+"""
+
+import pytest
+
+import hidropluvial.project as project_module
+from hidropluvial.cli.wizard.config import WizardConfig
+from hidropluvial.cli.wizard.runner import AnalysisRunner, run_basin_analyses
+from hidropluvial.cli.wizard.speculative import (
+    SpeculativeRun,
+    config_fingerprint,
+    is_ready,
+)
+from hidropluvial.cli.wizard.steps.base import (
+    StepResult,
+    WizardNavigator,
+    WizardState,
+    WizardStep,
+)
+from hidropluvial.project import ProjectManager
+
+
+def _state(**overrides) -> WizardState:
+    state = WizardState(
+        nombre="Cuenca Test",
+        area_ha=35.0,
+        slope_pct=2.5,
+        p3_10=83.0,
+        c=0.55,
+        length_m=800.0,
+        tc_methods=["kirpich", "temez"],
+        storm_codes=["gz", "blocks"],
+        return_periods=[2, 10],
+        x_factors=[1.0, 1.25],
+    )
+    for name, value in overrides.items():
+        setattr(state, name, value)
+    return state
+
+
+def _summary(basin) -> list[tuple]:
+    return [
+        (a.tc.method, a.storm.type, a.storm.return_period,
+         a.hydrograph.x_factor, a.hydrograph.peak_flow_m3s)
+        for a in basin.analyses
+    ]
+
+
+class TestFingerprint:
+    """Tests para la huella de configuración."""
+
+    def test_ignores_name_and_output(self):
+        a = WizardConfig.from_state(_state())
+        b = WizardConfig.from_state(_state(nombre="Otra", output_name="reporte"))
+        assert config_fingerprint(a) == config_fingerprint(b)
+
+    def test_changes_with_inputs(self):
+        a = WizardConfig.from_state(_state())
+        b = WizardConfig.from_state(_state(return_periods=[2, 25]))
+        assert config_fingerprint(a) != config_fingerprint(b)
+
+    def test_is_ready(self):
+        assert is_ready(WizardConfig.from_state(_state()))
+        assert not is_ready(WizardConfig.from_state(_state(return_periods=[])))
+        assert not is_ready(WizardConfig.from_state(_state(c=None)))
+
+
+class TestSpeculativeRun:
+    """Tests para el cálculo en segundo plano."""
+
+    def test_take_matches_direct_run(self):
+        speculative = SpeculativeRun()
+        speculative.update(_state())
+        config = WizardConfig.from_state(_state(nombre="Final"))
+
+        basin = speculative.take(config)
+        speculative.close()
+
+        matrix = [(s, config.return_periods, config.x_factors) for s in config.storm_codes]
+        expected = run_basin_analyses(config, matrix)
+        assert basin is not None
+        assert _summary(basin) == _summary(expected)
+
+    def test_stale_result_discarded(self):
+        speculative = SpeculativeRun()
+        speculative.update(_state())
+
+        changed = WizardConfig.from_state(_state(p3_10=90.0))
+        assert speculative.take(changed) is None
+        speculative.close()
+
+    def test_incomplete_state_not_started(self):
+        speculative = SpeculativeRun()
+        speculative.update(_state(tc_methods=[]))
+        assert speculative.take(WizardConfig.from_state(_state(tc_methods=[]))) is None
+        speculative.close()
+
+    def test_state_mutation_after_update(self):
+        speculative = SpeculativeRun()
+        state = _state()
+        speculative.update(state)
+        # El wizard puede seguir modificando el estado (volver atrás)
+        state.return_periods.append(25)
+
+        assert speculative.take(WizardConfig.from_state(state)) is None
+        speculative.close()
+
+
+class _NextStep(WizardStep):
+    """Paso que solo avanza."""
+
+    @property
+    def title(self) -> str:
+        return "Paso"
+
+    def execute(self) -> StepResult:
+        return StepResult.NEXT
+
+
+def test_navigator_notifies_each_step():
+    calls = []
+    navigator = WizardNavigator(
+        steps=[_NextStep(WizardState()) for _ in range(3)],
+        on_step_done=calls.append,
+    )
+    for step in navigator.steps:
+        step.state = navigator.state
+
+    state = navigator.run()
+    assert calls == [state] * 3
+
+
+def test_runner_uses_precomputed(tmp_path, monkeypatch):
+    monkeypatch.setattr(project_module, "_project_manager", ProjectManager(data_dir=tmp_path))
+    config = WizardConfig.from_state(_state())
+
+    speculative = SpeculativeRun()
+    speculative.update(config)
+
+    runner = AnalysisRunner(config, speculative=speculative)
+    monkeypatch.setattr(runner, "_calculate_tc", pytest.fail)
+    project, basin = runner.run()
+    speculative.close()
+
+    # 2 Tc x (gz: 2 Tr x 2 X + blocks: 2 Tr)
+    assert len(basin.analyses) == 12
+    assert [t.method for t in basin.tc_results] == ["kirpich", "temez"]
+    saved = ProjectManager(data_dir=tmp_path).get_project(project.id)
+    assert len(saved.basins[0].analyses) == 12
@@ -0,0 +1,196 @@
+"""
+Tests para core/continuous.py - Simulación continua por bloques.
+"""
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from hidropluvial.core import convolve_uh, scs_runoff, triangular_uh_x
+from hidropluvial.core.continuous import (
+    EventExcess,
+    OverlapAddRouter,
+    gumbel_quantiles,
+    read_rainfall_csv,
+    simulate_continuous,
+)
+
+
+DT = np.timedelta64(5, "m")
+
+
+def _record(n: int, seed: int = 0, start: str = "2000-01-01T00:00"):
+    """Registro sintético de lluvia intermitente cada 5 minutos."""
+    rng = np.random.default_rng(seed)
+    times = np.datetime64(start) + np.arange(n) * DT
+    rain = np.where(rng.random(n) < 0.03, rng.gamma(0.8, 2.5, n), 0.0)
+    return times, rain
+
+
+def _chunks(times, rain, size):
+    for i in range(0, len(rain), size):
+        yield times[i:i + size], rain[i:i + size]
+
+
+def _reference_excess(rain, cn, gap_steps, lambda_coef=0.2):
+    """Exceso paso a paso con reinicio por evento (sin AMC)."""
+    excess = np.zeros(len(rain))
+    event_p = event_q = 0.0
+    dry = np.inf
+    for i, p in enumerate(rain):
+        if p > 0:
+            if dry >= gap_steps:
+                event_p = event_q = 0.0
+            event_p += p
+            q = float(scs_runoff(event_p, cn, lambda_coef))
+            excess[i] = q - event_q
+            event_q = q
+            dry = 0
+        else:
+            dry += 1
+    return excess
+
+
+class TestEventExcess:
+    """Tests para el exceso por eventos."""
+
+    def test_matches_reference(self):
+        _, rain = _record(5000)
+        stream = EventExcess(80, 5, inter_event_hr=2, amc_thresholds_mm=None)
+        expected = _reference_excess(rain, 80, 24)
+        np.testing.assert_allclose(stream.process(rain), expected, atol=1e-12)
+
+    def test_chunk_invariant(self):
+        _, rain = _record(20000, seed=1)
+        whole = EventExcess(75, 5).process(rain)
+
+        stream = EventExcess(75, 5)
+        parts = np.concatenate([stream.process(rain[i:i + 777]) for i in range(0, len(rain), 777)])
+        np.testing.assert_allclose(parts, whole, atol=1e-10)
+
+    def test_event_separation_resets_abstraction(self):
+        # Dos pulsos iguales separados más que el umbral: mismo exceso
+        rain = np.zeros(200)
+        rain[10:16] = 10.0
+        rain[150:156] = 10.0
+        stream = EventExcess(80, 5, inter_event_hr=6, amc_thresholds_mm=None)
+        excess = stream.process(rain)
+        assert stream.n_events == 2
+        assert excess[150:156].sum() == pytest.approx(excess[10:16].sum())
+
+        # Con separación menor al umbral es un solo evento
+        stream = EventExcess(80, 5, inter_event_hr=12, amc_thresholds_mm=None)
+        excess = stream.process(rain)
+        assert stream.n_events == 1
+        assert excess[150:156].sum() > excess[10:16].sum()
+
+    def test_amc_wet_increases_runoff(self):
+        rain = np.zeros(2000)
+        rain[100:112] = 6.0
+        rain[1000:1006] = 10.0
+        amc = EventExcess(70, 5).process(rain)
+        fixed = EventExcess(70, 5, amc_thresholds_mm=None).process(rain)
+        # Primer evento sin lluvia antecedente (AMC I), segundo húmedo (AMC III)
+        assert amc[100:112].sum() < fixed[100:112].sum()
+        assert amc[1000:1006].sum() > fixed[1000:1006].sum()
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            EventExcess(20, 5)
+        with pytest.raises(ValueError):
+            EventExcess(80, 5, inter_event_hr=0)
+
+
+def test_overlap_add_matches_convolution():
+    rng = np.random.default_rng(2)
+    excess = rng.random(3000) * (rng.random(3000) < 0.1)
+    _, uh = triangular_uh_x(250, 1.2, 5 / 60, 1.67)
+    expected = convolve_uh(excess, uh)
+
+    router = OverlapAddRouter(uh)
+    flow = np.concatenate([router.process(excess[i:i + 250]) for i in range(0, 3000, 250)] + [router.flush()])
+    np.testing.assert_allclose(flow, expected, atol=1e-10)
+
+
+class TestSimulation:
+    """Tests para la simulación continua."""
+
+    def test_chunking_does_not_change_result(self):
+        times, rain = _record(3 * 365 * 288, seed=3, start="2001-01-01T00:00")
+        whole = simulate_continuous([(times, rain)], 250, 80, 1.2)
+        chunked = simulate_continuous(_chunks(times, rain, 10_007), 250, 80, 1.2)
+
+        assert [m.year for m in chunked.annual_maxima] == [2001, 2002, 2003]
+        np.testing.assert_allclose(chunked.peaks, whole.peaks, rtol=1e-10)
+        assert chunked.n_events == whole.n_events
+        assert chunked.n_steps == len(rain)
+        assert chunked.total_runoff_mm == pytest.approx(whole.total_runoff_mm)
+
+    def test_peak_matches_design_pipeline(self):
+        times, _ = _record(600)
+        rain = np.zeros(600)
+        rain[50:62] = 5.0
+        result = simulate_continuous([(times, rain)], 100, 85, 1.0, amc_thresholds_mm=None)
+
+        excess = _reference_excess(rain, 85, 72)
+        _, uh = triangular_uh_x(100, 1.0, 5 / 60, 1.67)
+        assert result.annual_maxima[0].peak_flow_m3s == pytest.approx(convolve_uh(excess, uh).max())
+        assert result.annual_maxima[0].rain_mm == pytest.approx(60.0)
+
+    def test_irregular_record(self):
+        times, rain = _record(100)
+        times = times.copy()
+        times[50:] += DT
+        with pytest.raises(ValueError, match="irregular"):
+            simulate_continuous([(times, rain)], 100, 80, 1.0)
+        with pytest.raises(ValueError, match="vacío"):
+            simulate_continuous([], 100, 80, 1.0)
+
+
+def test_gumbel_quantiles():
+    peaks = np.array([10.0, 12.0, 15.0, 9.0, 20.0, 14.0])
+    q = gumbel_quantiles(peaks, [2, 100])
+    # Q(2) queda levemente bajo la media; Q crece con Tr
+    assert q[2] < peaks.mean() < q[100]
+    with pytest.raises(ValueError):
+        gumbel_quantiles(peaks[:1])
+
+
+def _write_rain_csv(path, times, rain):
+    lines = ["timestamp,rain_mm"] + [f"{t},{r:.4f}" for t, r in zip(times.astype(str), rain)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_read_rainfall_csv(tmp_path):
+    times, rain = _record(1000)
+    path = tmp_path / "lluvia.csv"
+    _write_rain_csv(path, times, rain)
+
+    blocks = list(read_rainfall_csv(path, chunk_rows=300))
+    assert [len(r) for _, r in blocks] == [300, 300, 300, 100]
+    np.testing.assert_array_equal(np.concatenate([t for t, _ in blocks]), times.astype("datetime64[s]"))
+    np.testing.assert_allclose(np.concatenate([r for _, r in blocks]), rain, atol=1e-4)
+
+
+def test_cli_continuous(tmp_path):
+    from hidropluvial.cli.hydrograph import hydrograph_app
+
+    times, rain = _record(90 * 288, seed=4, start="2010-12-01T00:00")
+    path = tmp_path / "lluvia.csv"
+    _write_rain_csv(path, times, rain)
+    output = tmp_path / "maximos.csv"
+    series = tmp_path / "serie.csv"
+
+    result = CliRunner().invoke(hydrograph_app, [
+        "continuous", str(path), "-a", "250", "--cn", "80", "--tc", "1.2",
+        "--chunk", "5000", "-o", str(output), "--series", str(series),
+    ])
+    assert result.exit_code == 0, result.output
+    assert "Gumbel" in result.output
+    assert output.read_text(encoding="utf-8").startswith("year,peak_flow_m3s")
+    assert len(series.read_text(encoding="utf-8").splitlines()) > len(rain)
+
+    result = CliRunner().invoke(hydrograph_app, [
+        "continuous", str(tmp_path / "no_existe.csv"), "-a", "250", "--cn", "80", "--tc", "1.2",
+    ])
+    assert result.exit_code == 1
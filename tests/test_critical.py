@@ -0,0 +1,169 @@
+"""
+Tests para core/critical.py - Duración crítica de tormenta.
+"""
+
+import numpy as np
+import pytest
+
+from hidropluvial.config import StormMethod
+from hidropluvial.core import dinagua_ct, huff_distribution, scs_distribution
+from hidropluvial.core.idf import dinagua_cd
+from hidropluvial.core.critical import (
+    CRITICAL_FAMILIES,
+    StormBasin,
+    critical_duration,
+    critical_durations,
+    critical_hydrograph,
+    unit_hyetograph,
+)
+from hidropluvial.core.ensemble import unit_storm
+
+
+def _basin(**overrides) -> StormBasin:
+    kwargs = dict(area_ha=150.0, tc_hr=0.8, p3_10=83.0, c=0.6, name="A")
+    kwargs.update(overrides)
+    return StormBasin(**kwargs)
+
+
+class TestUnitHyetograph:
+    """Tests para los hietogramas memorizados."""
+
+    @pytest.mark.parametrize("family,storm,duration,dt", [
+        ("blocks", "blocks", 2.0, 5.0),
+        ("gz", "gz", 6.0, 5.0),
+        ("scs_ii", "scs_ii", 24.0, 10.0),
+    ])
+    def test_matches_ensemble_storms(self, family, storm, duration, dt):
+        expected = unit_storm(storm, 10, duration, dt) / dinagua_ct(10)
+        np.testing.assert_allclose(unit_hyetograph(family, duration, dt), expected, atol=1e-12)
+
+    def test_matches_temporal_functions(self):
+        huff = huff_distribution(dinagua_cd(3.0), 3.0, 5.0, quartile=2)
+        np.testing.assert_allclose(unit_hyetograph("huff_q2", 3.0, 5.0), huff.depth_mm, atol=1e-12)
+
+        scs = scs_distribution(dinagua_cd(12.0), 12.0, 10.0, StormMethod.SCS_TYPE_II)
+        np.testing.assert_allclose(unit_hyetograph("scs_ii", 12.0, 10.0), scs.depth_mm, atol=1e-12)
+
+    def test_chicago_respects_idf(self):
+        depth = unit_hyetograph("chicago", 6.0, 5.0)
+        assert depth.sum() == pytest.approx(dinagua_cd(6.0))
+        assert np.all(depth >= 0)
+        # Pico en r × duración
+        assert np.argmax(depth) * 5 / 60 == pytest.approx(0.375 * 6.0, abs=5 / 60)
+        # La ventana de 1 h alrededor del pico tiene la lámina IDF de 1 h
+        peak = int(round(0.375 * 6.0 * 12))
+        window = depth[peak - round(0.375 * 12):peak + round(0.625 * 12)].sum()
+        assert window == pytest.approx(dinagua_cd(1.0), rel=0.02)
+
+    def test_cached_read_only(self):
+        first = unit_hyetograph("huff_q1", 2.0, 5.0)
+        assert unit_hyetograph("huff_q1", 2.0, 5.0) is first
+        with pytest.raises(ValueError):
+            first[0] = 1.0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            unit_hyetograph("bimodal", 2.0, 5.0)
+        with pytest.raises(ValueError):
+            unit_hyetograph("blocks", 0.05, 5.0)
+
+
+class TestSearch:
+    """Tests para la búsqueda."""
+
+    def test_refined_optimum_is_exhaustive_max(self):
+        basin = _basin()
+        result = critical_duration(basin, "huff_q2", 10, dts_min=[5.0])
+
+        # Búsqueda exhaustiva: todas las duraciones múltiplo de 5 min hasta 6 h
+        best = max(
+            (critical_duration(basin, "huff_q2", 10, durations_hr=[d], refine=False).peak_flow_m3s, d)
+            for d in np.arange(1, 73) * 5 / 60
+        )
+        assert result.peak_flow_m3s == pytest.approx(best[0])
+        assert result.duration_hr == pytest.approx(best[1])
+        assert result.n_evaluations < 72
+
+    def test_hydrograph_consistent(self):
+        result = critical_duration(_basin(cn=80, c=None), "chicago", 25, dts_min=[5.0, 10.0])
+        assert result.flow_m3s.max() == pytest.approx(result.peak_flow_m3s)
+        assert result.depth_mm.sum() == pytest.approx(
+            83.0 * dinagua_ct(25) * dinagua_cd(result.duration_hr)
+        )
+        assert len(result.scan["duration_hr"]) == len(result.scan["peak_flow_m3s"])
+        assert set(result.scan["dt_min"]) == {5.0, 10.0}
+
+    def test_families_run(self):
+        for family in CRITICAL_FAMILIES:
+            result = critical_duration(_basin(), family, 10)
+            assert result.peak_flow_m3s > 0
+            assert result.duration_hr > 0
+
+    def test_many_basins(self):
+        cases = [(_basin(name="A"), 2), (_basin(name="B", area_ha=300.0, tc_hr=1.5), 10)]
+        results = critical_durations(cases, ["blocks", "huff_q3"])
+        assert [(r.basin, r.family, r.tr) for r in results] == [
+            ("A", "blocks", 2), ("A", "huff_q3", 2), ("B", "blocks", 10), ("B", "huff_q3", 10),
+        ]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            critical_duration(_basin(), "bimodal")
+        with pytest.raises(ValueError):
+            critical_duration(_basin(), "blocks", dts_min=[0.0])
+        with pytest.raises(ValueError):
+            _basin(cn=80)
+
+
+def test_cli_project_critical(cli_project, tmp_path):
+    from hidropluvial.cli.project import project_app
+
+    project = cli_project.project
+    cli_project.manager.create_basin(
+        project, name="Sur", area_ha=200.0, slope_pct=1.5, p3_10=83.0, cn=78, length_m=1800.0
+    )
+    output = tmp_path / "criticas.csv"
+    hydrographs = tmp_path / "hidrogramas.csv"
+
+    result = cli_project.invoke(project_app, [
+        "critical", project.id, "-f", "blocks,huff_q2", "--tr", "2,25", "--dt", "5,10",
+        "-o", str(output), "--hydrographs", str(hydrographs),
+    ])
+    assert result.exit_code == 0, result.output
+    assert "Duración crítica" in result.output
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1 + 2 * 2 * 2
+    assert hydrographs.read_text(encoding="utf-8").startswith("basin,family,tr,time_hr,flow_m3s")
+
+    result = cli_project.invoke(project_app, ["critical", project.id, "-f", "bimodal"])
+    assert result.exit_code == 1
+    result = cli_project.invoke(project_app, ["critical", "nope"])
+    assert result.exit_code == 1
+
+
+@pytest.mark.parametrize("storm", ["blocks", "gz"])
+def test_scs_cn_matches_runner(storm):
+    from hidropluvial.cli.basin.screening import basin_scenarios
+    from hidropluvial.cli.wizard.config import WizardConfig
+    from hidropluvial.cli.wizard.runner import run_basin_analyses
+    from hidropluvial.core.ensemble import storm_window
+    from hidropluvial.core.screening import screen_scenarios
+
+    # SCS-CN con bloques usa el HU triangular SCS, como el runner y el cribado
+    config = WizardConfig(
+        nombre="Cuenca", area_ha=100.0, slope_pct=2.0, p3_10=83.0, cn=80, length_m=1500.0,
+        tc_methods=["kirpich"], return_periods=[10], x_factors=[1.0],
+    )
+    basin = run_basin_analyses(config, [(storm, [10], [1.0])])
+    analysis = basin.analyses[0]
+    tc_hr = basin.get_tc("kirpich").tc_hr
+    duration_hr, dt_min = storm_window(storm, tc_hr, 5.0)
+
+    result = critical_hydrograph(
+        StormBasin(area_ha=100.0, tc_hr=tc_hr, p3_10=83.0, cn=80), storm, 10, duration_hr, dt_min
+    )
+    assert result.peak_flow_m3s == pytest.approx(analysis.hydrograph.peak_flow_m3s, rel=0.01)
+
+    scenarios = basin_scenarios(basin, ["kirpich"], [storm], [10], [5.0], [1.0], ["scs-cn"])
+    screened = screen_scenarios(scenarios, 100.0, 83.0, top_k=0).result.peak_flow_m3s[0]
+    assert result.peak_flow_m3s == pytest.approx(screened, rel=0.01)
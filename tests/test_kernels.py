@@ -0,0 +1,131 @@
+"""
+Tests para core/kernels.py - Núcleos con backend NumPy / Numba.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from hidropluvial.core import clark_uh, kernels
+from hidropluvial.core.calibration import clark_uh_batch
+from hidropluvial.core.kernels import (
+    _alternating_blocks_loop,
+    _linear_reservoir_loop,
+    _muskingum_batch_loop,
+    alternating_blocks,
+    linear_reservoir,
+    muskingum_batch,
+    use_backend,
+)
+from hidropluvial.core.temporal import _distribute_alternating_blocks, custom_depth_storm
+
+
+@pytest.fixture
+def numpy_backend():
+    with use_backend("numpy"):
+        yield
+
+
+class TestNumpyBackend:
+    """El backend NumPy reproduce el bucle de referencia."""
+
+    @pytest.mark.parametrize("n", [1, 2, 5, 12, 73])
+    def test_alternating_blocks_matches_loop(self, numpy_backend, n):
+        rng = np.random.default_rng(n)
+        increments = np.sort(rng.random(n))[::-1]
+        for peak in range(n):
+            for incs in (increments, increments[: n // 2], np.r_[increments, increments]):
+                np.testing.assert_array_equal(
+                    alternating_blocks(incs, n, peak), _alternating_blocks_loop(incs, n, peak)
+                )
+
+    def test_linear_reservoir_matches_loop(self, numpy_backend):
+        inflow = np.random.default_rng(0).random(200)
+        np.testing.assert_array_equal(
+            linear_reservoir(inflow, 0.8, 0.1, 0.1), _linear_reservoir_loop(inflow, 0.8, 0.1, 0.1)
+        )
+
+    def test_muskingum_batch_matches_loop(self, numpy_backend):
+        inflow = np.random.default_rng(1).random((4, 120))
+        np.testing.assert_array_equal(
+            muskingum_batch(inflow, 0.6, 0.1, 0.3), _muskingum_batch_loop(inflow, 0.6, 0.1, 0.3)
+        )
+
+    def test_custom_depth_storm_vectorized(self, numpy_backend):
+        storm = custom_depth_storm(50.0, 1.0, 5.0, distribution="triangular")
+        assert storm.depth_mm[6] == max(storm.depth_mm)
+        assert sum(storm.depth_mm) == pytest.approx(50.0)
+
+        storm = custom_depth_storm(50.0, 2.0, 10.0, distribution="alternating_blocks", peak_position=0.5)
+        depths = np.array(storm.depth_mm)
+        # P(d) = P·(d/D)^0.6: el mayor incremento es el primero
+        assert depths.max() == pytest.approx(50.0 * (1 / 12) ** 0.6)
+        assert np.argmax(depths) == 6
+
+
+@pytest.mark.parametrize(
+    "backend",
+    ["numpy", pytest.param("numba", marks=pytest.mark.skipif(
+        not kernels.NUMBA_AVAILABLE, reason="numba no instalado"
+    ))],
+)
+@pytest.mark.parametrize("peak_position, peak_index", [(0.0, 0), (1.0, 11)])
+def test_alternating_blocks_peak_at_edges(backend, peak_position, peak_index):
+    increments = np.arange(12, 0, -1, dtype=float)
+    with use_backend(backend):
+        depths = _distribute_alternating_blocks(increments, 12, peak_position)
+        clamped = alternating_blocks(increments, 12, 12)
+    assert np.argmax(depths) == peak_index
+    assert depths.sum() == pytest.approx(increments.sum())
+    assert np.argmax(clamped) == 11
+
+
+class TestBackendSwitch:
+    """Tests para la selección de backend."""
+
+    def test_use_backend_restores(self, monkeypatch):
+        monkeypatch.delenv(kernels.BACKEND_ENV, raising=False)
+        before = kernels.get_backend()
+        with use_backend("numpy") as backend:
+            assert backend == "numpy"
+            assert kernels.get_backend() == "numpy"
+            assert os.environ[kernels.BACKEND_ENV] == "numpy"
+        assert kernels.get_backend() == before
+        assert kernels.BACKEND_ENV not in os.environ
+
+    def test_invalid(self, monkeypatch):
+        with pytest.raises(ValueError, match="no soportado"):
+            kernels.set_backend("cuda")
+        monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+        with pytest.raises(ValueError, match="requiere numba"):
+            kernels.set_backend("numba")
+        assert kernels._resolve("auto") == "numpy"
+
+
+@pytest.mark.skipif(not kernels.NUMBA_AVAILABLE, reason="numba no instalado")
+class TestNumbaBackend:
+    """El backend compilado da resultados idénticos al de NumPy."""
+
+    @staticmethod
+    def _both(func):
+        with use_backend("numpy"):
+            expected = func()
+        with use_backend("numba"):
+            result = func()
+        np.testing.assert_array_equal(result, expected)
+
+    def test_clark(self):
+        self._both(lambda: clark_uh(12.0, 1.3, 0.8, 0.05)[1])
+        rng = np.random.default_rng(3)
+        tc, r = rng.uniform(0.5, 2.0, 50), rng.uniform(0.2, 1.5, 50)
+        self._both(lambda: clark_uh_batch(12.0, tc, r, 0.05))
+
+    def test_muskingum_batch(self):
+        inflow = np.random.default_rng(5).random((3, 200))
+        self._both(lambda: muskingum_batch(inflow, 0.6, 0.1, 0.3))
+
+    def test_alternating_blocks(self):
+        increments = np.sort(np.random.default_rng(4).random(97))[::-1]
+        for peak in (0, 16, 48, 96):
+            self._both(lambda: alternating_blocks(increments, 97, peak))
@@ -0,0 +1,236 @@
+"""
+Tests para core/ensemble.py y core/montecarlo.py - Pipeline vectorizado
+y análisis de incertidumbre.
+"""
+
+import numpy as np
+import pytest
+
+from hidropluvial.cli.wizard.runner import _simulate
+from hidropluvial.config import StormMethod
+from hidropluvial.core import (
+    alternating_blocks_dinagua,
+    dinagua_depth,
+    kirpich,
+    scs_distribution,
+    scs_triangular_uh,
+    triangular_uh_x,
+)
+from hidropluvial.core.ensemble import (
+    evaluate_ensemble,
+    scs_triangular_uh_batch,
+    storm_window,
+    triangular_uh_batch,
+    unit_hydrograph_batch,
+)
+from hidropluvial.core.montecarlo import (
+    Distribution,
+    parse_distribution,
+    run_monte_carlo,
+    tc_samples,
+)
+
+
+def _scalar_pipeline(storm, area, tc, x, p3_10, tr, dt_min, c=None, cn=None):
+    """Pipeline escalar de referencia (simulación de AnalysisRunner)."""
+    duration, dt = storm_window(storm, tc, dt_min)
+    if storm == "scs_ii":
+        hyeto = scs_distribution(
+            dinagua_depth(p3_10, tr, duration, None), duration, dt, StormMethod.SCS_TYPE_II
+        )
+    else:
+        peak = 1 / 6 if storm == "gz" else 0.5
+        hyeto = alternating_blocks_dinagua(p3_10, tr, duration, dt, None, peak)
+
+    runoff = "racional" if c is not None else "scs-cn"
+    result = _simulate(hyeto, area, tc, dt, storm, x, runoff, c if c is not None else cn, 0.2)
+    return result["peak_flow_m3s"], result["volume_m3"]
+
+
+class TestEnsemble:
+    """Tests para el pipeline vectorizado."""
+
+    def test_uh_batch_matches_scalar(self):
+        area = np.array([10.0, 150.0, 800.0])
+        tc = np.array([0.2, 0.9, 2.3])
+        x = np.array([1.0, 1.67, 2.25])
+        batch = triangular_uh_batch(area, tc, 5 / 60, x)
+
+        for i in range(3):
+            _, uh = triangular_uh_x(area[i], tc[i], 5 / 60, x[i])
+            np.testing.assert_allclose(batch[i, :len(uh)], uh, atol=1e-12)
+            assert np.all(batch[i, len(uh):] == 0)
+
+    def test_scs_uh_batch_matches_scalar(self):
+        area = np.array([10.0, 150.0, 800.0])
+        tc = np.array([0.2, 0.9, 2.3])
+        batch = scs_triangular_uh_batch(area, tc, 5 / 60)
+
+        for i in range(3):
+            _, uh = scs_triangular_uh(area[i] / 100, tc[i], 5 / 60)
+            np.testing.assert_allclose(batch[i, :len(uh)], uh, atol=1e-12)
+            assert np.all(batch[i, len(uh):] == 0)
+
+    def test_uh_rule(self):
+        area, tc, x = np.array([50.0]), np.array([0.5]), np.array([2.0])
+        gz = unit_hydrograph_batch("scs-cn", "gz", area, tc, 5 / 60, x)
+        np.testing.assert_array_equal(gz, triangular_uh_batch(area, tc, 5 / 60, x))
+        blocks = unit_hydrograph_batch("racional", "blocks", area, tc, 5 / 60, x)
+        np.testing.assert_array_equal(blocks, triangular_uh_batch(area, tc, 5 / 60, np.ones(1)))
+        scs = unit_hydrograph_batch("scs-cn", "blocks", area, tc, 5 / 60, x)
+        np.testing.assert_array_equal(scs, scs_triangular_uh_batch(area, tc, 5 / 60))
+
+    @pytest.mark.parametrize("storm", ["gz", "blocks", "blocks24", "scs_ii"])
+    @pytest.mark.parametrize("runoff", ["racional", "scs-cn"])
+    def test_matches_scalar_pipeline(self, storm, runoff):
+        rng = np.random.default_rng(3)
+        n = 6
+        area = rng.uniform(5, 300, n)
+        tc = rng.uniform(0.2, 2.5, n)
+        x = rng.uniform(1, 2.5, n)
+        p3_10 = rng.uniform(70, 95, n)
+        coef = rng.uniform(0.3, 0.8, n) if runoff == "racional" else rng.uniform(70, 92, n)
+        kwargs = {"c": coef} if runoff == "racional" else {"cn": coef}
+
+        result = evaluate_ensemble(
+            area, tc, x, p3_10, storm_code=storm, tr=25, dt_min=5.0, chunk_size=4, **kwargs
+        )
+
+        for i in range(n):
+            key = "c" if runoff == "racional" else "cn"
+            qp, volume = _scalar_pipeline(
+                storm, area[i], tc[i], x[i], p3_10[i], 25, 5.0, **{key: coef[i]}
+            )
+            # Solo difiere por el redondeo a 0.01 mm del hietograma escalar
+            assert result.peak_flow_m3s[i] == pytest.approx(qp, rel=0.03)
+            assert result.volume_m3[i] == pytest.approx(volume, rel=0.03)
+
+    def test_requires_one_coefficient(self):
+        with pytest.raises(ValueError):
+            evaluate_ensemble(10, 0.5, 1.0, 83)
+        with pytest.raises(ValueError):
+            evaluate_ensemble(10, 0.5, 1.0, 83, c=0.5, cn=80)
+
+    def test_invalid_storm(self):
+        with pytest.raises(ValueError, match="no soportada"):
+            evaluate_ensemble(10, 0.5, 1.0, 83, c=0.5, storm_code="chicago")
+
+
+class TestDistribution:
+    """Tests para distribuciones de entrada."""
+
+    @pytest.mark.parametrize("spec,kind,params", [
+        ("normal:83,8", "normal", (83.0, 8.0)),
+        ("triangular:75, 80, 85", "triangular", (75.0, 80.0, 85.0)),
+        ("0.55", "const", (0.55,)),
+    ])
+    def test_parse(self, spec, kind, params):
+        dist = parse_distribution(spec)
+        assert dist.kind == kind
+        assert dist.params == params
+
+    @pytest.mark.parametrize("spec", ["normal:83", "gamma:1,2", "uniform:5,1", "normal:a,b"])
+    def test_parse_invalid(self, spec):
+        with pytest.raises(ValueError):
+            parse_distribution(spec)
+
+    def test_lognormal_moments(self):
+        samples = Distribution("lognormal", (80.0, 10.0)).sample(np.random.default_rng(0), 200_000)
+        assert samples.mean() == pytest.approx(80.0, rel=0.01)
+        assert samples.std() == pytest.approx(10.0, rel=0.02)
+
+
+class TestMonteCarlo:
+    """Tests para run_monte_carlo."""
+
+    def _run(self, **overrides):
+        kwargs = dict(
+            area_ha=80.0,
+            slope_pct=2.5,
+            length_m=900.0,
+            distributions={
+                "p3_10": parse_distribution("normal:83,8"),
+                "c": parse_distribution("uniform:0.45,0.65"),
+                "x": parse_distribution("triangular:1,1.25,1.67"),
+            },
+            n_samples=2000,
+            seed=42,
+        )
+        kwargs.update(overrides)
+        return run_monte_carlo(**kwargs)
+
+    def test_reproducible(self):
+        a, b = self._run(), self._run()
+        np.testing.assert_array_equal(a.result.peak_flow_m3s, b.result.peak_flow_m3s)
+
+    def test_quantiles_ordered(self):
+        mc = self._run()
+        q = mc.quantiles((0.05, 0.5, 0.95))
+        for values in q.values():
+            assert values[0] <= values[1] <= values[2]
+        assert mc.n_samples == 2000
+
+    def test_constant_inputs_match_scalar(self):
+        mc = self._run(
+            distributions={"p3_10": Distribution("const", (83.0,)), "c": Distribution("const", (0.55,))},
+            n_samples=3,
+        )
+        tc = kirpich(900.0, 0.025)
+        qp, _ = _scalar_pipeline("gz", 80.0, tc, 1.0, 83.0, 10, 5.0, c=0.55)
+        assert np.all(mc.samples["tc_hr"] == tc)
+        assert mc.result.peak_flow_m3s == pytest.approx([qp] * 3, rel=0.01)
+
+    def test_scs_cn_clipped(self):
+        mc = self._run(
+            distributions={"p3_10": Distribution("const", (83.0,)), "cn": parse_distribution("normal:95,10")},
+            runoff="scs-cn",
+        )
+        assert mc.samples["cn"].max() <= 100.0
+
+    def test_desbordes_uses_sampled_c(self):
+        c = np.array([0.4, 0.6, 0.4])
+        tc = tc_samples("desbordes", 80.0, 2.5, None, c, 3)
+        assert tc[0] == tc[2] > tc[1]
+
+    def test_chunks_and_workers_equivalent(self):
+        base = self._run()
+        chunked = self._run(chunk_size=300, workers=2)
+        np.testing.assert_allclose(chunked.result.peak_flow_m3s, base.result.peak_flow_m3s)
+
+    def test_missing_distribution(self):
+        with pytest.raises(ValueError, match="cn"):
+            self._run(runoff="scs-cn")
+
+    def test_unknown_variable(self):
+        with pytest.raises(ValueError, match="desconocidas"):
+            self._run(distributions={"area": Distribution("const", (1.0,))})
+
+
+def test_basin_distributions_adjusted():
+    from hidropluvial.cli.basin.uncertainty import basin_distributions
+    from hidropluvial.models import Basin
+
+    basin = Basin(name="Cuenca", area_ha=80.0, slope_pct=2.5, p3_10=83.0, c=0.55, cn=78, length_m=900.0)
+    # C por Tr (Tr base 2) y CN por AMC, como en los análisis guardados
+    dists = basin_distributions(basin, None, "scs-cn", 10, "III")
+    assert dists["c"].params[0] == pytest.approx(0.7315)
+    assert dists["cn"].params[0] == pytest.approx(89.25, abs=0.01)
+    assert basin_distributions(basin, None, "racional", 2)["c"].params[0] == pytest.approx(0.55)
+    # Las distribuciones indicadas no se ajustan
+    assert basin_distributions(basin, ["c=0.5"], "racional", 10)["c"].params == (0.5,)
+
+
+def test_cli_basin_uncertainty(cli_project):
+    from hidropluvial.cli.basin import basin_app
+
+    basin_id = cli_project.basin.id
+    result = cli_project.invoke(basin_app, [
+        "uncertainty", basin_id, "-n", "500", "--seed", "1",
+        "-d", "p3_10=normal:83,8", "-d", "x=uniform:1,2",
+    ])
+    assert result.exit_code == 0, result.output
+    assert "Qp" in result.output
+    assert "P95" in result.output
+
+    result = cli_project.invoke(basin_app, ["uncertainty", basin_id, "-d", "cn=80x"])
+    assert result.exit_code == 1
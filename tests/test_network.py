@@ -0,0 +1,256 @@
+"""
+Tests para core/network.py - Red de drenaje de subcuencas.
+"""
+
+import numpy as np
+import pytest
+
+from hidropluvial.core.critical import StormBasin, critical_hydrograph
+from hidropluvial.core.network import (
+    NetworkNode,
+    NetworkReach,
+    compute_network,
+    lag_route,
+    local_hydrographs,
+    muskingum_coefficients,
+    muskingum_route,
+    muskingum_steps,
+    network_duration,
+    topological_order,
+)
+from hidropluvial.models import Reach
+from hidropluvial.project import ProjectManager
+
+
+def _node(name: str, downstream=None, reach=None, **overrides) -> NetworkNode:
+    kwargs = dict(area_ha=40.0, tc_hr=0.4, p3_10=83.0, c=0.6, name=name)
+    kwargs.update(overrides)
+    return NetworkNode(StormBasin(**kwargs), downstream, reach or NetworkReach())
+
+
+def _hydrograph(n: int = 60) -> np.ndarray:
+    t = np.arange(n)
+    return np.vstack([np.exp(-((t - 15) / 5.0) ** 2) * q for q in (10.0, 25.0)])
+
+
+class TestRouting:
+    """Tests para el tránsito en tramos."""
+
+    def test_lag_integer_shift(self):
+        inflow = _hydrograph()
+        routed = lag_route(inflow, 15.0, 5.0)
+        assert routed.shape == (2, inflow.shape[1] + 3)
+        np.testing.assert_array_equal(routed[:, 3:], inflow)
+        assert not routed[:, :3].any()
+
+    def test_lag_fractional_conserves_volume(self):
+        inflow = _hydrograph()
+        routed = lag_route(inflow, 7.5, 5.0)
+        np.testing.assert_allclose(routed.sum(axis=1), inflow.sum(axis=1))
+        assert np.argmax(routed[0]) == np.argmax(inflow[0]) + 1
+
+    def test_muskingum_attenuates_and_conserves(self):
+        inflow = _hydrograph()
+        routed = muskingum_route(inflow, 0.5, 0.2, 5.0)
+        np.testing.assert_allclose(routed.sum(axis=1), inflow.sum(axis=1), rtol=1e-4)
+        assert np.all(routed.max(axis=1) < inflow.max(axis=1))
+        assert np.argmax(routed[0]) > np.argmax(inflow[0])
+        assert routed.min() >= -1e-12
+
+    def test_muskingum_subreaches(self):
+        # 2·K·X > dt: se divide en subtramos y no hay caudales negativos
+        routed = muskingum_route(_hydrograph(), 1.0, 0.4, 5.0)
+        assert routed.min() >= -1e-12
+
+    @pytest.mark.parametrize("k_hr,x", [(0.02, 0.2), (0.001, 0.0), (0.05, 0.45), (0.1234, 0.5)])
+    def test_muskingum_small_k(self, k_hr, x):
+        # K·(1 - X) < dt/2: se divide también el paso de tiempo
+        inflow = _hydrograph()
+        routed = muskingum_route(inflow, k_hr, x, 5.0)
+        assert routed.min() >= -1e-12
+        np.testing.assert_allclose(routed.sum(axis=1), inflow.sum(axis=1), rtol=1e-4)
+        assert np.all(routed.max(axis=1) <= inflow.max(axis=1) + 1e-9)
+
+    def test_muskingum_steps(self):
+        dt_hr = 5 / 60
+        for k_hr, x in [(0.02, 0.2), (0.5, 0.2), (1.0, 0.4), (0.001, 0.0)]:
+            n, m = muskingum_steps(k_hr, x, dt_hr)
+            assert min(muskingum_coefficients(k_hr / n, x, dt_hr / m)) >= -1e-12
+        assert muskingum_steps(0.5, 0.2, dt_hr) == (3, 1)
+        assert muskingum_steps(0.02, 0.2, dt_hr)[1] > 1
+
+    def test_muskingum_zero_k(self):
+        inflow = _hydrograph()
+        np.testing.assert_array_equal(muskingum_route(inflow, 0.0, 0.2, 5.0), inflow)
+
+    def test_invalid_reach(self):
+        with pytest.raises(ValueError):
+            NetworkReach("kinematic")
+        with pytest.raises(ValueError):
+            NetworkReach("muskingum", k_hr=0.5, x=0.7)
+
+
+class TestTopology:
+    """Tests para el orden de cálculo."""
+
+    def test_order(self):
+        order = topological_order({"C": None, "A": "C", "B": "C", "D": "A"})
+        assert order.index("D") < order.index("A") < order.index("C")
+        assert order.index("B") < order.index("C")
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="no existe"):
+            topological_order({"A": "Z"})
+        with pytest.raises(ValueError, match="ciclos"):
+            topological_order({"A": "B", "B": "C", "C": "A", "D": None})
+        with pytest.raises(ValueError, match="únicos"):
+            compute_network([_node("A"), _node("A")], [10])
+
+    def test_default_duration(self):
+        nodes = [
+            _node("A", "B", NetworkReach("lag", lag_min=30.0), tc_hr=0.8),
+            _node("B", None, tc_hr=0.3),
+        ]
+        # 0.8 h + 0.5 h de tránsito, redondeado a 80 min
+        assert network_duration(nodes, 5.0) == pytest.approx(80 / 60)
+        assert network_duration([_node("A", tc_hr=0.2)], 5.0) == 1.0
+
+
+class TestComputeNetwork:
+    """Tests para la combinación de hidrogramas."""
+
+    def test_local_matches_critical_hydrograph(self):
+        node = _node("A", cn=78, c=None)
+        flows = local_hydrographs(node, [2, 25], "huff_q2", 2.0, 5.0)
+        for i, tr in enumerate([2, 25]):
+            expected = critical_hydrograph(node.basin, "huff_q2", tr, 2.0, 5.0).flow_m3s
+            np.testing.assert_allclose(flows[i], expected, atol=1e-9)
+
+    def test_scs_cn_node_matches_runner(self):
+        from hidropluvial.cli.wizard.config import WizardConfig
+        from hidropluvial.cli.wizard.runner import run_basin_analyses
+        from hidropluvial.core.ensemble import storm_window
+
+        config = WizardConfig(
+            nombre="A", area_ha=100.0, slope_pct=2.0, p3_10=83.0, cn=80, length_m=1500.0,
+            tc_methods=["kirpich"], return_periods=[10], x_factors=[1.0],
+        )
+        basin = run_basin_analyses(config, [("blocks", [10], [1.0])])
+        tc_hr = basin.get_tc("kirpich").tc_hr
+        duration_hr, dt_min = storm_window("blocks", tc_hr, 5.0)
+
+        node = _node("A", area_ha=100.0, tc_hr=tc_hr, c=None, cn=80)
+        result = compute_network([node], [10], "blocks", duration_hr, dt_min)
+        expected = basin.analyses[0].hydrograph.peak_flow_m3s
+        assert result.peak_flows("A")[0] == pytest.approx(expected, rel=0.01)
+
+    def test_combination(self):
+        nodes = [
+            _node("A", "C", NetworkReach("lag", lag_min=10.0)),
+            _node("B", "C", NetworkReach("muskingum", k_hr=0.3, x=0.2), area_ha=80.0, tc_hr=0.6),
+            _node("C", None, area_ha=20.0, tc_hr=0.2),
+        ]
+        trs = [2, 10, 100]
+        result = compute_network(nodes, trs, duration_hr=1.0)
+        assert result.outlets == ["C"]
+        assert result.order[-1] == "C"
+
+        expected = [
+            result.local["C"],
+            lag_route(result.outflow["A"], 10.0, 5.0),
+            muskingum_route(result.outflow["B"], 0.3, 0.2, 5.0),
+        ]
+        total = np.zeros((3, max(e.shape[1] for e in expected)))
+        for e in expected:
+            total[:, :e.shape[1]] += e
+        np.testing.assert_allclose(result.outflow["C"], total)
+
+        # Volumen en la salida = suma de los volúmenes locales
+        local = sum(np.trapezoid(f, dx=300, axis=1) for f in result.local.values())
+        np.testing.assert_allclose(result.volumes("C"), local, rtol=1e-4)
+        assert np.all(np.diff(result.peak_flows("C")) > 0)
+
+        time_hr, flow = result.hydrograph("C", 10)
+        assert len(time_hr) == len(flow)
+        assert flow.max() == pytest.approx(result.peak_flows("C")[1])
+
+    def test_c_by_tr(self):
+        node = _node("A")
+        node.c_by_tr = {100: 0.75}
+        result = compute_network([node], [10, 100], duration_hr=1.0)
+        base = compute_network([_node("A")], [100], duration_hr=1.0)
+        assert result.peak_flows("A")[1] == pytest.approx(base.peak_flows("A")[0] * 0.75 / 0.6)
+
+    def test_parallel_matches_serial(self):
+        rng = np.random.default_rng(1)
+        nodes = [
+            _node(f"S{i}", None if i == 0 else f"S{rng.integers(0, i)}",
+                  NetworkReach("lag", lag_min=float(rng.uniform(0, 20))),
+                  area_ha=float(rng.uniform(5, 50)), tc_hr=float(rng.uniform(0.2, 0.8)))
+            for i in range(12)
+        ]
+        serial = compute_network(nodes, [2, 25])
+        parallel = compute_network(nodes, [2, 25], workers=2)
+        for name in serial.order:
+            np.testing.assert_array_equal(parallel.outflow[name], serial.outflow[name])
+
+
+class TestProjectReaches:
+    """Tests para los tramos guardados en el proyecto."""
+
+    def test_remove_basin_cleans_reaches(self, tmp_path):
+        manager = ProjectManager(data_dir=tmp_path)
+        project = manager.create_project("Red")
+        a = manager.create_basin(project, name="A", area_ha=10.0, slope_pct=2.0, p3_10=83.0, c=0.5)
+        b = manager.create_basin(project, name="B", area_ha=10.0, slope_pct=2.0, p3_10=83.0, c=0.5)
+        c = manager.create_basin(project, name="C", area_ha=10.0, slope_pct=2.0, p3_10=83.0, c=0.5)
+        project.set_reach(Reach(basin_id=a.id, downstream_id=b.id, lag_min=5.0))
+        project.set_reach(Reach(basin_id=b.id, downstream_id=c.id))
+        project.set_reach(Reach(basin_id=a.id, downstream_id=c.id, lag_min=8.0))
+        assert len(project.reaches) == 2
+        assert project.get_reach(a.id).lag_min == 8.0
+
+        manager.save_project(project)
+        loaded = manager.get_project(project.id)
+        assert loaded.reaches == project.reaches
+
+        loaded.remove_basin(c.id)
+        assert [(r.basin_id, r.downstream_id) for r in loaded.reaches] == [(b.id, None), (a.id, None)]
+        assert loaded.remove_reach(a.id)
+        assert not loaded.remove_reach(a.id)
+
+
+def test_cli_project_network(cli_project, tmp_path):
+    from hidropluvial.cli.project import project_app
+
+    manager, project = cli_project.manager, cli_project.project
+    for name, area in (("Media", 90.0), ("Baja", 40.0)):
+        manager.create_basin(project, name=name, area_ha=area, slope_pct=2.0, p3_10=83.0, c=0.55, length_m=900.0)
+
+    result = cli_project.invoke(project_app, ["link", project.id, "Cuenca", "--to", "Media", "--lag", "10"])
+    assert result.exit_code == 0, result.output
+    result = cli_project.invoke(project_app, [
+        "link", project.id, "Media", "--to", "Baja", "-m", "muskingum", "--k", "0.3", "--x", "0.2",
+    ])
+    assert result.exit_code == 0, result.output
+
+    # Un ciclo no se guarda
+    result = cli_project.invoke(project_app, ["link", project.id, "Baja", "--to", "Cuenca"])
+    assert result.exit_code == 1
+    assert len(manager.get_project(project.id).reaches) == 2
+
+    output = tmp_path / "red.csv"
+    result = cli_project.invoke(project_app, ["network", project.id, "--tr", "2,25", "-o", str(output), "--all"])
+    assert result.exit_code == 0, result.output
+    assert "Red de drenaje" in result.output
+    assert "210.0" in result.output
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "basin,basin_id,tr,time_hr,flow_m3s"
+    assert {line.split(",")[0] for line in lines[1:]} == {"Cuenca", "Media", "Baja"}
+
+    result = cli_project.invoke(project_app, ["unlink", project.id, "Media"])
+    assert result.exit_code == 0, result.output
+    result = cli_project.invoke(project_app, ["unlink", project.id, "Media"])
+    assert result.exit_code == 1
+    result = cli_project.invoke(project_app, ["network", "nope"])
+    assert result.exit_code == 1
@@ -0,0 +1,108 @@
+"""
+Tests para precision.py - Precisión de almacenamiento de las series.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from hidropluvial.cli.wizard.config import WizardConfig
+from hidropluvial.cli.wizard.runner import run_basin_analyses
+from hidropluvial.precision import (
+    FLOAT32_RTOL,
+    PRECISION_ENV,
+    get_series_precision,
+    pack_series,
+    quantize_series,
+    set_series_precision,
+    store_series,
+    use_series_precision,
+    widen_series,
+)
+
+
+def _series(n: int = 5000) -> np.ndarray:
+    rng = np.random.default_rng(42)
+    return rng.lognormal(0.0, 4.0, n) * rng.choice([-1.0, 1.0], n)
+
+
+class TestQuantize:
+    """Tests para el redondeo a float32."""
+
+    def test_tolerance(self):
+        x = _series()
+        q = quantize_series(x)
+        assert q.dtype == np.float64
+        np.testing.assert_allclose(q, x, rtol=FLOAT32_RTOL, atol=0)
+
+    def test_same_float32(self):
+        x = np.concatenate([_series(), [0.0, -0.0, 1000.0, 1e-3, 1e9, 0.1, 3.0e38]])
+        q = quantize_series(x)
+        np.testing.assert_array_equal(q.astype(np.float32), x.astype(np.float32))
+
+    def test_idempotent(self):
+        x = _series()
+        q = quantize_series(x)
+        np.testing.assert_array_equal(quantize_series(q), q)
+        np.testing.assert_array_equal(quantize_series(x.astype(np.float32)), q)
+        np.testing.assert_array_equal(widen_series(pack_series(x)), q)
+
+    def test_short_decimals(self):
+        assert store_series([0.1, 0.2, 12.5, 0.0]) == [0.100000001, 0.200000003, 12.5, 0.0]
+        x = np.abs(_series())
+        assert len(json.dumps(store_series(x))) < 0.7 * len(json.dumps(x.tolist()))
+
+    def test_non_finite(self):
+        q = quantize_series([np.nan, np.inf, -np.inf, 2.0])
+        assert np.isnan(q[0])
+        assert q[1:].tolist() == [np.inf, -np.inf, 2.0]
+
+
+class TestPolicy:
+    """Tests para la selección de la política."""
+
+    def test_default(self):
+        assert get_series_precision() == "float32"
+        assert pack_series([1.0, 2.0]).dtype == np.float32
+
+    def test_float64(self):
+        x = _series()
+        with use_series_precision("float64"):
+            np.testing.assert_array_equal(quantize_series(x), x)
+            assert pack_series(x).dtype == np.float64
+        assert get_series_precision() == "float32"
+
+    def test_env(self, monkeypatch):
+        monkeypatch.delenv(PRECISION_ENV, raising=False)
+        with use_series_precision("FLOAT64") as name:
+            assert name == "float64"
+            assert os.environ[PRECISION_ENV] == "float64"
+        assert PRECISION_ENV not in os.environ
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            set_series_precision("float16")
+
+
+def test_analysis_series_stored_float32():
+    config = WizardConfig(
+        nombre="Cuenca", area_ha=60.0, slope_pct=2.0, p3_10=83.0, c=0.55,
+        length_m=900.0, tc_methods=["kirpich"], storm_codes=["gz"],
+        return_periods=[10], x_factors=[1.0],
+    )
+    single = run_basin_analyses(config, [("gz", [10], [1.0])]).analyses[0]
+    with use_series_precision("float64"):
+        double = run_basin_analyses(config, [("gz", [10], [1.0])]).analyses[0]
+
+    # Escalares iguales; series dentro de la tolerancia documentada
+    assert single.hydrograph.peak_flow_m3s == double.hydrograph.peak_flow_m3s
+    assert single.hydrograph.volume_m3 == double.hydrograph.volume_m3
+    assert single.hydrograph.flow_m3s == store_series(double.hydrograph.flow_m3s)
+    np.testing.assert_allclose(
+        single.hydrograph.flow_m3s, double.hydrograph.flow_m3s, rtol=FLOAT32_RTOL, atol=0,
+    )
+    assert max(single.hydrograph.flow_m3s) == pytest.approx(
+        single.hydrograph.peak_flow_m3s, rel=FLOAT32_RTOL,
+    )
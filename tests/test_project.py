@@ -2,6 +2,7 @@
 Tests para el módulo de proyectos hidrológicos.
 """
 
+import json
 import pytest
 import tempfile
 from pathlib import Path
@@ -259,3 +260,87 @@ class TestProjectManager:
         assert loaded.basins[0].name == "Cuenca 1"
         assert loaded.basins[0].c == 0.55
         assert loaded.basins[0].cn == 75
+
+
+class TestBasinIndex:
+    """Tests para el índice cuenca -> proyecto de ProjectManager."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Crea directorio temporal para tests."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def _make(self, manager, name, n_basins=2):
+        project = manager.create_project(name=name)
+        for i in range(n_basins):
+            manager.create_basin(project, f"{name} C{i}", area_ha=10.0, slope_pct=1.0, p3_10=80.0)
+        return project
+
+    def test_find_basin_by_prefix(self, temp_dir):
+        """Encuentra cuencas por ID completo o parcial."""
+        manager = ProjectManager(data_dir=temp_dir)
+        p1 = self._make(manager, "P1")
+        p2 = self._make(manager, "P2")
+
+        target = p2.basins[1]
+        project, basin = manager.find_basin(target.id[:5])
+        assert project.id == p2.id
+        assert basin.id == target.id
+
+        project, basin = manager.find_basin(p1.basins[0].id)
+        assert project.id == p1.id
+
+        assert manager.find_basin("zzzzzzzz") is None
+
+    def test_index_persisted_and_updated(self, temp_dir):
+        """El índice se mantiene al guardar y eliminar."""
+        manager = ProjectManager(data_dir=temp_dir)
+        project = self._make(manager, "P1")
+        removed = project.basins[0]
+
+        project.remove_basin(removed.id)
+        manager.save_project(project)
+
+        # Un nuevo manager lee el índice desde disco
+        other = ProjectManager(data_dir=temp_dir)
+        assert other.find_basin_project_id(removed.id) is None
+        assert other.find_basin_project_id(project.basins[0].id) == (project.basins[0].id, project.id)
+
+        other.delete_project(project.id)
+        assert ProjectManager(data_dir=temp_dir).find_basin_project_id(project.basins[0].id) is None
+
+    def test_loads_only_owning_project(self, temp_dir, monkeypatch):
+        """Con el índice al día solo se carga el proyecto de la cuenca."""
+        manager = ProjectManager(data_dir=temp_dir)
+        projects = [self._make(manager, f"P{i}") for i in range(4)]
+
+        loaded = []
+        original = ProjectManager.load_project
+        monkeypatch.setattr(
+            ProjectManager, "load_project",
+            lambda self, pid: loaded.append(pid) or original(self, pid),
+        )
+
+        fresh = ProjectManager(data_dir=temp_dir)
+        fresh.find_basin(projects[2].basins[0].id)
+        assert loaded == [projects[2].id]
+
+    def test_stale_or_missing_index_rebuilt(self, temp_dir):
+        """Un índice ausente o desactualizado se reconstruye."""
+        manager = ProjectManager(data_dir=temp_dir)
+        project = self._make(manager, "P1")
+
+        manager.basin_index_path.unlink()
+        fresh = ProjectManager(data_dir=temp_dir)
+        assert fresh.find_basin(project.basins[1].id)[0].id == project.id
+
+        # Proyecto copiado a mano: no está en el índice
+        data = json.loads(manager._project_path(project.id).read_text(encoding="utf-8"))
+        data["id"] = "copia001"
+        data["basins"][0]["id"] = "nueva001"
+        (temp_dir / "projects" / "copia001.json").write_text(json.dumps(data), encoding="utf-8")
+
+        found = fresh.find_basin("nueva")
+        assert found is not None
+        assert found[0].id == "copia001"
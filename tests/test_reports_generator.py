@@ -0,0 +1,149 @@
+"""
+Tests para reports/generator.py: entorno de templates, fichas y escritores CSV.
+"""
+
+import gzip
+
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+
+from hidropluvial.cli.export import export_app
+from hidropluvial.cli.project.report import _generate_sec_fichas
+from hidropluvial.models import (
+    AnalysisRun,
+    Basin,
+    HydrographResult,
+    StormResult,
+    TcResult,
+)
+from hidropluvial.reports import generator
+from hidropluvial.reports.generator import (
+    CSVStreamWriter,
+    ReportGenerator,
+    export_to_csv,
+    get_jinja_env,
+    hyetograph_to_csv,
+    idf_to_csv,
+    render_template,
+)
+
+
+@pytest.fixture(autouse=True)
+def jinja_cache(tmp_path, monkeypatch):
+    """Redirige la caché de bytecode a un directorio temporal."""
+    cache_dir = tmp_path / "jinja"
+    monkeypatch.setattr(generator, "_BYTECODE_CACHE_DIR", cache_dir)
+    get_jinja_env.cache_clear()
+    yield cache_dir
+    get_jinja_env.cache_clear()
+
+
+def _make_analysis(tr: int, x: float = None) -> AnalysisRun:
+    tc = TcResult(method="kirpich", tc_hr=0.5, tc_min=30.0)
+    storm = StormResult(
+        type="gz", return_period=tr, duration_hr=6.0, total_depth_mm=95.25,
+        peak_intensity_mmhr=60.0, n_intervals=2,
+        time_min=[0.0, 5.0], intensity_mmhr=[10.0, 20.0],
+    )
+    hydrograph = HydrographResult(
+        tc_method="kirpich", tc_min=30.0, storm_type="gz", return_period=tr,
+        x_factor=x, peak_flow_m3s=12.3456, time_to_peak_hr=0.75,
+        time_to_peak_min=45.0, volume_m3=123456.0, total_depth_mm=95.25,
+        runoff_mm=40.0, time_hr=[0.0, 0.5], flow_m3s=[0.0, 12.3456],
+    )
+    return AnalysisRun(tc=tc, storm=storm, hydrograph=hydrograph)
+
+
+class TestJinjaEnvironment:
+    """Tests para el entorno Jinja2 compartido."""
+
+    def test_env_is_shared(self):
+        assert get_jinja_env() is get_jinja_env()
+        assert ReportGenerator().env is ReportGenerator().env
+
+    def test_compiled_template_reused(self):
+        env = get_jinja_env()
+        assert env.get_template("sec_fichas.tex") is env.get_template("sec_fichas.tex")
+
+    def test_bytecode_cached_on_disk(self, jinja_cache):
+        render_template("sec_fichas.tex", fichas=[])
+        assert list(jinja_cache.glob("hidropluvial_*.cache"))
+
+    def test_unwritable_cache_dir(self, tmp_path, monkeypatch):
+        blocker = tmp_path / "archivo"
+        blocker.write_text("x")
+        monkeypatch.setattr(generator, "_BYTECODE_CACHE_DIR", blocker / "jinja")
+        get_jinja_env.cache_clear()
+
+        assert get_jinja_env().bytecode_cache is None
+        assert "Análisis Individuales" in render_template("sec_fichas.tex", fichas=[])
+
+
+class TestSecFichas:
+    """Tests para _generate_sec_fichas (template sec_fichas.tex)."""
+
+    def test_ficha_content(self):
+        basin = Basin(name="C", area_ha=10.0, slope_pct=1.0, p3_10=80.0)
+        basin.add_analysis(_make_analysis(2))
+        basin.add_analysis(_make_analysis(10, x=1.67))
+
+        generated = {
+            "hyetographs": ["hietograma_kirpich_gz_Tr2.tex"],
+            "hydrographs": ["hidrograma_kirpich_gz_Tr10_X167.tex"],
+        }
+        content = _generate_sec_fichas(basin, generated, "cuenca_c/")
+
+        assert "\\subsubsection{Análisis 1: Kirpich + GZ Tr=2}\n" in content
+        assert "\\subsubsection{Análisis 2: Kirpich + GZ Tr=10 (X=1.67)}\n" in content
+        assert "Duración & 360 min \\\\\n" in content
+        assert "Caudal pico & 12.346 m³/s \\\\\n" in content
+        assert "Volumen total & 0.1235 hm³ \\\\\n" in content
+        assert content.count("Factor X & 1.67 \\\\\n") == 1
+        assert "\\input{cuenca_c/hietogramas/hietograma_kirpich_gz_Tr2.tex}\n" in content
+        assert "\\input{cuenca_c/hidrogramas/hidrograma_kirpich_gz_Tr10_X167.tex}\n" in content
+        assert content.count("\\begin{figure}[H]") == 2
+        assert content.count("\\clearpage") == 2
+
+
+class TestCSVStreamWriter:
+    """Tests para los escritores CSV por bloques."""
+
+    def test_columns_match_row_format(self, tmp_path):
+        t = np.arange(0.0, 60.0, 5.0)
+        i = np.linspace(10.0, 1.0, len(t))
+        hyetograph_to_csv(t, i, tmp_path / "a.csv")
+        export_to_csv(
+            ["Tiempo_min", "Intensidad_mmhr"],
+            [[a, b] for a, b in zip(t.tolist(), i.tolist())],
+            tmp_path / "b.csv",
+        )
+        assert (tmp_path / "a.csv").read_text() == (tmp_path / "b.csv").read_text()
+
+    def test_chunks_and_list_types(self, tmp_path):
+        path = tmp_path / "c.csv"
+        with CSVStreamWriter(path, ["n", "v"], delimiter=";", chunk_rows=2) as w:
+            w.write_columns([1, 2, 3], [0.5, 1, 2.25, 99])
+            w.write_rows(np.array([[4.0, 5.0]]))
+        assert path.read_text() == "n;v\n1;0.5\n2;1\n3;2.25\n4.0;5.0\n"
+
+    def test_idf_layout_gzip(self, tmp_path):
+        path = tmp_path / "idf.csv.gz"
+        intensities = np.array([[10.0, 5.0, 2.5], [20.0, 10.0, 5.0]])
+        idf_to_csv(np.array([0.5, 1.0, 2.0]), [2, 10], intensities, path)
+
+        lines = gzip.open(path, "rt", encoding="utf-8").read().splitlines()
+        assert lines == [
+            "Duracion_hr,T2_yr,T10_yr",
+            "0.5,10.0,20.0",
+            "1.0,5.0,10.0",
+            "2.0,2.5,5.0",
+        ]
+
+    def test_cli_idf_csv_gzip(self, tmp_path):
+        output = tmp_path / "idf.csv"
+        result = CliRunner().invoke(export_app, ["idf-csv", "78", "-o", str(output), "--gzip"])
+
+        assert result.exit_code == 0
+        text = gzip.open(str(output) + ".gz", "rt", encoding="utf-8").read()
+        assert text.startswith("Duracion_hr,T2_yr,")
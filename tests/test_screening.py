@@ -0,0 +1,143 @@
+"""
+Tests para core/screening.py - Cribado de escenarios por picos.
+"""
+
+import numpy as np
+import pytest
+
+from hidropluvial.core.ensemble import evaluate_ensemble
+from hidropluvial.core.screening import (
+    concat_scenarios,
+    scenario_grid,
+    screen_scenarios,
+)
+
+
+def _grid(**overrides):
+    axes = dict(
+        storm=["gz", "blocks"], tr=[2, 25], dt_min=[5.0, 10.0], tc_hr=[0.6, 1.4],
+        x=[1.0, 2.25], runoff="racional", coef=0.55,
+    )
+    axes.update(overrides)
+    return scenario_grid(**axes)
+
+
+class TestGrid:
+    """Tests para la construcción de escenarios."""
+
+    def test_cartesian_product(self):
+        grid = _grid()
+        assert len(grid["storm"]) == 2 ** 5
+        assert set(grid["runoff"]) == {"racional"}
+
+    def test_concat(self):
+        grid = concat_scenarios([_grid(storm="gz"), _grid(storm="scs_ii", x=1.0)])
+        assert len(grid["storm"]) == 16 + 8
+
+
+class TestScreen:
+    """Tests para el cribado."""
+
+    def test_matches_ensemble(self):
+        grid = _grid()
+        result = screen_scenarios(grid, 120.0, 83.0, top_k=0)
+
+        for i in (0, 7, 21, 31):
+            expected = evaluate_ensemble(
+                120.0, grid["tc_hr"][i], grid["x"][i], 83.0, c=0.55,
+                storm_code=str(grid["storm"][i]), tr=int(grid["tr"][i]), dt_min=grid["dt_min"][i],
+            )
+            assert result.result.peak_flow_m3s[i] == pytest.approx(expected.peak_flow_m3s[0])
+            assert result.result.volume_m3[i] == pytest.approx(expected.volume_m3[0])
+
+    def test_top_hydrographs_consistent(self):
+        result = screen_scenarios(_grid(), 120.0, 83.0, top_k=3)
+
+        peaks = result.result.peak_flow_m3s
+        assert result.top[0] == int(np.argmax(peaks))
+        assert peaks[result.top[0]] >= peaks[result.top[1]] >= peaks[result.top[2]]
+        assert set(result.hydrographs) == set(result.top)
+        for i in result.top:
+            time_hr, flow = result.hydrographs[i]
+            assert flow.max() == pytest.approx(peaks[i])
+            assert time_hr[np.argmax(flow)] == pytest.approx(result.result.time_to_peak_hr[i])
+            volume = np.trapezoid(flow, time_hr * 3600)
+            assert volume == pytest.approx(result.result.volume_m3[i], rel=1e-6)
+
+    def test_rank_by_volume(self):
+        result = screen_scenarios(_grid(), 120.0, 83.0, top_k=1, rank_by="volume_m3")
+        assert result.top[0] == int(np.argmax(result.result.volume_m3))
+        record = result.row(result.top[0])
+        assert record["tr"] == 25
+
+    def test_scs_rows(self):
+        grid = concat_scenarios([_grid(), _grid(runoff="scs-cn", coef=82.0)])
+        result = screen_scenarios(grid, 120.0, 83.0, top_k=0)
+        scs = grid["runoff"] == "scs-cn"
+        # Con Tr = 25 la lluvia supera Ia en todos los escenarios
+        assert np.all(result.result.peak_flow_m3s[scs & (grid["tr"] == 25)] > 0)
+        assert result.result.peak_flow_m3s[scs].max() != result.result.peak_flow_m3s[~scs].max()
+
+    @pytest.mark.parametrize("kwargs,match", [
+        ({"rank_by": "mean"}, "no soportada"),
+        ({"scenarios": {"storm": np.array(["gz"])}}, "Faltan"),
+        ({"scenarios": _grid(runoff="horton")}, "horton"),
+    ])
+    def test_invalid(self, kwargs, match):
+        args = {"scenarios": _grid(), "area_ha": 120.0, "p3_10": 83.0}
+        args.update(kwargs)
+        with pytest.raises(ValueError, match=match):
+            screen_scenarios(**args)
+
+
+def test_basin_scenarios_match_runner():
+    from hidropluvial.cli.basin.screening import basin_scenarios
+    from hidropluvial.cli.wizard.config import WizardConfig
+    from hidropluvial.cli.wizard.runner import run_basin_analyses
+
+    # SCS-CN con tormentas no GZ usa el HU triangular SCS, como el runner
+    config = WizardConfig(
+        nombre="Cuenca", area_ha=80.0, slope_pct=2.5, p3_10=83.0, cn=78, length_m=900.0,
+        tc_methods=["kirpich"], return_periods=[2, 10], x_factors=[1.0, 1.67], amc="III",
+    )
+    basin = run_basin_analyses(config, [
+        ("blocks", [2, 10], [1.0]), ("scs_ii", [10], [1.0]), ("gz", [10], [1.0, 1.67]),
+    ])
+    scenarios = basin_scenarios(
+        basin, ["kirpich"], ["blocks", "scs_ii", "gz"], [2, 10], [5.0], [1.0, 1.67], ["scs-cn"], amc="III",
+    )
+    result = screen_scenarios(scenarios, basin.area_ha, basin.p3_10, top_k=0)
+
+    peaks = {
+        (str(storm), int(tr), float(x)): q
+        for storm, tr, x, q in zip(scenarios["storm"], scenarios["tr"], scenarios["x"], result.result.peak_flow_m3s)
+    }
+    for analysis in basin.analyses:
+        key = (analysis.storm.type, analysis.storm.return_period, analysis.hydrograph.x_factor or 1.0)
+        assert peaks[key] == pytest.approx(analysis.hydrograph.peak_flow_m3s, rel=0.01)
+
+
+def test_cli_basin_screen(cli_project, tmp_path):
+    from hidropluvial.cli.basin import basin_app
+
+    basin_id = cli_project.basin.id
+    table = tmp_path / "escenarios.csv"
+    hydrographs = tmp_path / "criticos.csv"
+
+    result = cli_project.invoke(basin_app, [
+        "screen", basin_id, "--tc", "kirpich,temez", "-s", "gz,blocks",
+        "--tr", "2,10", "--dt", "5,10", "--runoff", "racional,scs-cn", "-k", "3",
+        "-o", str(table), "--hydrographs", str(hydrographs),
+    ])
+    assert result.exit_code == 0, result.output
+    assert "Escenarios críticos" in result.output
+
+    # (4 X en GZ + 1 en bloques) × 2 Tc × 2 Tr × 2 dt × 2 escorrentías
+    lines = table.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1 + 5 * 2 * 2 * 2 * 2
+    assert lines[0].startswith("tc_method,storm,tr")
+    ranks = {line.split(",")[0] for line in hydrographs.read_text(encoding="utf-8").splitlines()[1:]}
+    assert ranks == {"1", "2", "3"}
+
+    result = cli_project.invoke(basin_app, ["screen", basin_id, "--tc", "nrcs"])
+    assert result.exit_code == 1
@@ -0,0 +1,173 @@
+"""
+Tests para core/sensitivity.py - Sobol, Morris y tornado.
+"""
+
+import numpy as np
+import pytest
+
+from hidropluvial.core import adjust_cn_for_amc, kirpich
+from hidropluvial.config import AntecedentMoistureCondition
+from hidropluvial.core.ensemble import evaluate_ensemble
+from hidropluvial.core.sensitivity import (
+    Factor,
+    SensitivityModel,
+    default_factors,
+    parse_factor,
+    run_sensitivity,
+)
+
+
+def _model(**overrides) -> SensitivityModel:
+    kwargs = dict(area_ha=80.0, slope_pct=2.5, p3_10=83.0, length_m=900.0, c=0.55, cn=80)
+    kwargs.update(overrides)
+    return SensitivityModel(**kwargs)
+
+
+class TestFactors:
+    """Tests para definición de factores."""
+
+    def test_parse_continuous(self):
+        factor = parse_factor("area", "70, 90")
+        assert (factor.low, factor.high, factor.discrete) == (70.0, 90.0, False)
+
+    def test_parse_discrete(self):
+        assert parse_factor("storm", "GZ,blocks").levels == ("gz", "blocks")
+        assert parse_factor("amc", "i,iii").levels == ("I", "III")
+        assert parse_factor("dt", "5,10").levels == (5.0, 10.0)
+
+    @pytest.mark.parametrize("name,spec", [
+        ("area", "70"), ("storm", "chicago"), ("x", "2,1"), ("slope", "a,b"),
+    ])
+    def test_parse_invalid(self, name, spec):
+        with pytest.raises(ValueError):
+            parse_factor(name, spec)
+
+    def test_discrete_values_cover_levels(self):
+        factor = Factor("tc", levels=("kirpich", "temez"))
+        values = factor.values(np.array([0.0, 0.49, 0.5, 1.0]))
+        assert list(values) == [0.0, 0.0, 1.0, 1.0]
+
+    def test_default_factors_by_runoff(self):
+        rational = [f.name for f in default_factors(_model())]
+        scs = [f.name for f in default_factors(_model(runoff="scs-cn"))]
+        assert "c" in rational and "cn" not in rational and "amc" not in rational
+        assert {"cn", "lambda", "amc"} <= set(scs) and "c" not in scs
+
+    def test_default_factor_not_applicable(self):
+        with pytest.raises(ValueError, match="no aplica"):
+            default_factors(_model(), ["cn"])
+
+
+class TestModel:
+    """Tests para la evaluación en lote."""
+
+    def test_base_matches_ensemble(self):
+        tc = kirpich(900.0, 0.025)
+        expected = evaluate_ensemble(80.0, tc, 1.0, 83.0, c=0.55).peak_flow_m3s[0]
+        assert _model().base_value() == pytest.approx(expected)
+
+    def test_amc_applied(self):
+        model = _model(runoff="scs-cn", amc="III")
+        cn_iii = adjust_cn_for_amc(80, AntecedentMoistureCondition.WET)
+        tc = kirpich(900.0, 0.025)
+        expected = evaluate_ensemble(80.0, tc, 1.0, 83.0, cn=cn_iii).peak_flow_m3s[0]
+        assert model.base_value() == pytest.approx(expected)
+
+    def test_repeated_rows_cached(self):
+        model = _model()
+        factors = [Factor("storm", levels=("gz", "blocks"))]
+        unit = np.random.default_rng(0).random((50, 1))
+        first = model.evaluate(factors, unit)
+        assert model.n_evaluations == 2
+
+        again = model.evaluate(factors, unit[::-1])
+        assert model.n_evaluations == 2
+        np.testing.assert_array_equal(again, first[::-1])
+
+    def test_invalid_base(self):
+        with pytest.raises(ValueError):
+            _model(storm_code="chicago")
+        with pytest.raises(ValueError):
+            _model(runoff="scs-cn", cn=None)
+
+
+class TestMethods:
+    """Tests para Sobol, Morris y tornado."""
+
+    def _factors(self):
+        # λ no interviene en el método racional: índice nulo
+        return [Factor("c", 0.4, 0.7), Factor("x", 1.0, 2.0), Factor("lambda", 0.05, 0.2)]
+
+    def test_sobol_ranks_inputs(self):
+        result = run_sensitivity(_model(), self._factors(), "sobol", 256, seed=1)
+        st = dict(zip(result.names, result.indices["ST"]))
+        assert st["lambda"] == pytest.approx(0.0, abs=1e-12)
+        assert st["c"] > st["x"] > 0
+        assert result.names[result.ranking()[0]] == "c"
+        # N (k + 2) filas
+        assert result.n_evaluations <= 256 * 5 + 1
+
+    def test_sobol_reproducible(self):
+        a = run_sensitivity(_model(), self._factors(), "sobol", 128, seed=3)
+        b = run_sensitivity(_model(), self._factors(), "sobol", 128, seed=3)
+        np.testing.assert_array_equal(a.indices["ST"], b.indices["ST"])
+
+    def test_morris(self):
+        result = run_sensitivity(_model(), self._factors(), "morris", 10, seed=1)
+        mu_star = dict(zip(result.names, result.indices["mu_star"]))
+        assert mu_star["lambda"] == 0.0
+        assert mu_star["c"] > 0
+        # Qp crece con C y decrece con X
+        mu = dict(zip(result.names, result.indices["mu"]))
+        assert mu["c"] > 0 > mu["x"]
+
+    def test_tornado(self):
+        model = _model()
+        result = run_sensitivity(model, [Factor("c", 0.4, 0.7), Factor("storm", levels=("gz", "blocks"))], "tornado")
+        i = result.names.index("c")
+        assert result.labels["low"][i] == "0.4"
+        assert result.labels["high"][i] == "0.7"
+        # Qp es proporcional a C
+        assert result.indices["high"][i] / result.indices["low"][i] == pytest.approx(0.7 / 0.4)
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError):
+            run_sensitivity(_model(), self._factors(), "fast")
+        with pytest.raises(ValueError):
+            run_sensitivity(_model(), [Factor("c", 0.4, 0.7)] * 2, "tornado")
+
+
+@pytest.mark.parametrize("runoff,storm", [("racional", "gz"), ("scs-cn", "blocks")])
+def test_model_for_basin_matches_screening(runoff, storm):
+    from hidropluvial.cli.basin.screening import basin_scenarios
+    from hidropluvial.cli.basin.sensitivity import model_for_basin
+    from hidropluvial.core.screening import screen_scenarios
+    from hidropluvial.models import Basin
+
+    # C por Tr y CN por AMC, como en los análisis guardados
+    basin = Basin(name="Cuenca", area_ha=80.0, slope_pct=2.5, p3_10=83.0, c=0.55, cn=78, length_m=900.0)
+    model = model_for_basin(basin, runoff, amc="III", storm_code=storm, tr=10)
+    scenarios = basin_scenarios(basin, ["kirpich"], [storm], [10], [5.0], [1.0], [runoff], amc="III")
+    expected = screen_scenarios(scenarios, basin.area_ha, basin.p3_10, top_k=0).result.peak_flow_m3s[0]
+    assert model.base_value() == pytest.approx(expected)
+    if runoff == "racional":
+        assert model.c_base == pytest.approx(0.7315)
+
+
+def test_cli_basin_sensitivity(cli_project):
+    from hidropluvial.cli.basin import basin_app
+
+    basin_id = cli_project.basin.id
+    result = cli_project.invoke(basin_app, [
+        "sensitivity", basin_id, "-n", "64", "--seed", "1",
+        "-f", "area,c,storm", "-r", "storm=gz,blocks",
+    ])
+    assert result.exit_code == 0, result.output
+    assert "ST" in result.output
+    assert "storm" in result.output
+
+    result = cli_project.invoke(basin_app, ["sensitivity", basin_id, "-m", "tornado"])
+    assert result.exit_code == 0, result.output
+
+    result = cli_project.invoke(basin_app, ["sensitivity", basin_id, "-f", "cn"])
+    assert result.exit_code == 1